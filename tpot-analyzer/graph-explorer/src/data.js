@@ -431,6 +431,17 @@ const _globalClusterInflight = (() => {
   return new Map();
 })();
 
+// Stable per-tab id sent as clientId, so the server can cancel this tab's
+// older view build when a newer request arrives. Kept on window to survive HMR.
+const _clusterClientId = (() => {
+  const makeId = () => (globalThis.crypto?.randomUUID?.() || Math.random().toString(36).slice(2, 14));
+  if (typeof window !== 'undefined') {
+    window.__clusterClientId = window.__clusterClientId || makeId();
+    return window.__clusterClientId;
+  }
+  return makeId();
+})();
+
 // Clear controller registry on module load (HMR safety) without aborting
 if (typeof window !== 'undefined') {
   window.__clusterAbortControllers = window.__clusterAbortControllers || new Map();
@@ -503,6 +514,7 @@ export const fetchClusterView = async (options = {}) => {
   }
   const reqId = options.reqId || Math.random().toString(36).slice(2, 8);
   params.set('reqId', reqId);
+  params.set('clientId', _clusterClientId);
 
   const url = `${API_BASE_URL}/api/clusters?${params.toString()}`;
 
@@ -563,8 +575,8 @@ export const fetchClusterView = async (options = {}) => {
   } catch (error) {
     const duration = performance.now() - startTime;
     // Don't log aborts as errors - they're expected when requests are superseded
-    if (error.name === 'AbortError') {
-      console.debug('[API] fetchClusterView aborted (expected)', { duration: Math.round(duration), ego: options.ego, cacheKey });
+    if (error.name === 'AbortError' || error.status === 409) {
+      console.debug('[API] fetchClusterView aborted (expected)', { duration: Math.round(duration), ego: options.ego, cacheKey, status: error.status });
     } else {
       performanceLog.log('fetchClusterView [ERROR]', duration, { error: error.message });
     }
@@ -730,6 +730,21 @@ describe('data.js API client', () => {
       expect(params.get('expand_depth')).toBe('0.80')
     })
 
+    it('sends the same clientId on every request from this tab', async () => {
+      fetchWithRetry
+        .mockResolvedValueOnce(mockResponse(clusterBody))
+        .mockResolvedValueOnce(mockResponse(clusterBody))
+
+      await fetchClusterView({ n: 25 })
+      await fetchClusterView({ n: 30 })
+
+      const ids = fetchWithRetry.mock.calls.map(
+        ([url]) => new URLSearchParams(url.split('?')[1]).get('clientId'),
+      )
+      expect(ids[0]).toBeTruthy()
+      expect(ids[1]).toBe(ids[0])
+    })
+
     it('clamps wl to [0, 1]', async () => {
       fetchWithRetry.mockResolvedValueOnce(mockResponse(clusterBody))
 
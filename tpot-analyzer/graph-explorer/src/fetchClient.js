@@ -5,6 +5,7 @@
  * - Configurable retry count and exponential backoff
  * - Per-request timeout via AbortController
  * - External AbortSignal propagation (caller can cancel)
+ * - No retry on 409 (request superseded server-side)
  * - Debug logging for each attempt
  */
 
@@ -51,7 +52,9 @@ export const fetchWithRetry = async (url, options = {}, { retries = 2, backoffMs
       externalSignal?.removeEventListener('abort', externalAbortHandler)
       const dur = Math.round(performance.now() - attemptStart)
       if (!res.ok) {
-        throw new Error(`HTTP ${res.status} ${res.statusText}`)
+        const err = new Error(`HTTP ${res.status} ${res.statusText}`)
+        err.status = res.status
+        throw err
       }
       console.debug('[API] fetch ok', { url, attempt: attempt + 1, durationMs: dur, totalMs: Math.round(performance.now() - start) })
       attemptsMeta.push({ attempt: attempt + 1, durationMs: dur, totalMs: Math.round(performance.now() - start), success: true, aborted: false, error: null })
@@ -72,6 +75,13 @@ export const fetchWithRetry = async (url, options = {}, { retries = 2, backoffMs
         throw err
       }
 
+      // 409 = the server dropped this build for a newer request from the same
+      // client; retrying would in turn cancel that newer build
+      if (err.status === 409) {
+        console.debug('[API] fetch superseded', { url, attempt: attempt + 1, durationMs: dur, totalMs: total })
+        throw err
+      }
+
       if (attempt === retries) {
         console.error('[API] fetch failed (no retries left)', { url, attempt: attempt + 1, durationMs: dur, totalMs: total, error: err.message, aborted: err.name === 'AbortError' })
         break
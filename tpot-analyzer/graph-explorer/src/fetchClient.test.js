@@ -80,6 +80,14 @@ describe('fetchWithRetry — HTTP errors', () => {
     // 1 initial + 1 retry = 2 calls
     expect(mockFetch).toHaveBeenCalledTimes(2)
   })
+
+  it('does not retry a 409 (superseded) response', async () => {
+    mockFetch.mockResolvedValue(mockResponse(null, { ok: false, status: 409, statusText: 'Conflict' }))
+    await expect(
+      fetchWithRetry('http://example.com/api', {}, { retries: 2, backoffMs: 1 })
+    ).rejects.toMatchObject({ status: 409 })
+    expect(mockFetch).toHaveBeenCalledTimes(1)
+  })
 })
 
 // ---------------------------------------------------------------------------
@@ -13,6 +13,7 @@ import networkx as nx
 
 from src.config import get_cache_settings
 from src.data.fetcher import CachedDataFetcher
+from src.data.lazy_json import to_plain
 from src.data.shadow_store import get_shadow_store
 from src.graph import (
     GraphBuildResult,
@@ -182,7 +183,7 @@ def run_metrics(graph: GraphBuildResult, seeds: List[str], args: argparse.Namesp
                 "mutual": directed.has_edge(v, u),
                 "provenance": data.get("provenance", "archive"),
                 "shadow": data.get("shadow", False),
-                "metadata": data.get("metadata"),
+                "metadata": to_plain(data.get("metadata")),
                 "direction_label": data.get("direction_label"),
                 "fetched_at": _serialize_datetime(data.get("fetched_at")),
             }
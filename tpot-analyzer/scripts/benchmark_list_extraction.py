@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Benchmark bulk UserCell extraction on saved list-page snapshots.
+
+Parses HTML captured by SeleniumWorker._save_page_snapshot (or any saved
+page_source of a followers/following page) with parse_user_cells and
+reports cells found and parse time per file. No browser is needed.
+
+Usage:
+    python -m scripts.benchmark_list_extraction logs/snapshot_*.html [--repeat 5] [--show 3]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.shadow.user_cells import parse_user_cells
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark offline UserCell extraction")
+    parser.add_argument("snapshots", nargs="+", type=Path, help="Saved page_source HTML files")
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Parses per file; the best time is reported (default: 5)",
+    )
+    parser.add_argument(
+        "--show",
+        type=int,
+        default=0,
+        help="Print the first N extracted cells of each file (default: 0)",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if args.repeat <= 0:
+        print("--repeat must be positive", file=sys.stderr)
+        return 2
+
+    total_cells = 0
+    total_seconds = 0.0
+    for path in args.snapshots:
+        html = path.read_text(encoding="utf-8", errors="replace")
+        best = float("inf")
+        cells = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            cells = parse_user_cells(html)
+            best = min(best, time.perf_counter() - start)
+        total_cells += len(cells)
+        total_seconds += best
+        print(f"{path.name}: {len(cells)} cells, {len(html) / 1024:.0f} KiB, {best * 1000:.1f} ms")
+        for cell in cells[:args.show]:
+            print(f"    @{cell.handle} ({cell.display_name or 'no name'}) - {' '.join((cell.bio or 'no bio').split())[:60]}")
+
+    if total_cells:
+        print(
+            f"\n{total_cells} cells in {total_seconds * 1000:.1f} ms "
+            f"({total_seconds * 1e6 / total_cells:.0f} µs/cell)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,8 +21,11 @@ from src.graph.community_affinity import (
 )
 from src.graph.metrics import compute_louvain_communities
 from src.graph.spectral import (
+    EIGENSOLVERS,
+    PRECONDITIONERS,
     SpectralConfig,
     compute_spectral_embedding,
+    load_spectral_result,
     save_spectral_result,
 )
 
@@ -79,10 +82,14 @@ def main() -> None:
     parser.add_argument("--output-prefix", type=Path, default=None, help="Base path for spectral output (default data/graph_snapshot)")
     parser.add_argument("--limit-nodes", type=int, default=None, help="Limit nodes for fixture generation")
     parser.add_argument("--stability-runs", type=int, default=1, help="Number of stability runs (ARI) >=1")
+    parser.add_argument("--stability-workers", type=int, default=1, help="Processes for stability re-clustering (default 1 = serial)")
     parser.add_argument("--birch-threshold", type=float, default=0.3, help="BIRCH clustering threshold (lower = more micro-clusters, default 0.3)")
     parser.add_argument("--max-linkage-nodes", type=int, default=12000, help="Max nodes for direct Ward linkage (default 12000)")
     parser.add_argument("--alpha", type=float, default=0.0, help="Community blending weight [0,1]. 0=pure topology (default)")
     parser.add_argument("--propagation", type=Path, default=None, help="Path to community_propagation.npz (required if alpha>0)")
+    parser.add_argument("--eigensolver", choices=EIGENSOLVERS, default="arpack", help="Eigensolver backend (default arpack)")
+    parser.add_argument("--preconditioner", choices=PRECONDITIONERS, default="jacobi", help="LOBPCG preconditioner; amg needs pyamg (default jacobi)")
+    parser.add_argument("--no-warm-start", action="store_true", help="Ignore the previous spectral output instead of seeding the eigensolver with it")
     args = parser.parse_args()
 
     data_dir = args.data_dir
@@ -148,10 +155,19 @@ def main() -> None:
         eigensolver_tol=args.tol,
         eigensolver_maxiter=args.maxiter,
         stability_runs=max(1, args.stability_runs),
+        stability_workers=max(1, args.stability_workers),
         birch_threshold=args.birch_threshold,
         max_linkage_nodes=args.max_linkage_nodes,
+        eigensolver=args.eigensolver,
+        preconditioner=args.preconditioner,
     )
-    result = compute_spectral_embedding(adjacency, node_ids, cfg)
+    previous = None
+    if not args.no_warm_start and Path(out_prefix).with_suffix(".spectral.npz").exists():
+        try:
+            previous = load_spectral_result(Path(out_prefix))
+        except Exception as exc:  # corrupt or older output: just start cold
+            logger.warning("Could not load previous spectral result for warm start: %s", exc)
+    result = compute_spectral_embedding(adjacency, node_ids, cfg, previous=previous)
     save_spectral_result(result, Path(out_prefix))
 
     logger.info("Computing Louvain communities (resolution=%s)...", args.resolution)
@@ -19,7 +19,14 @@ from src.logging_utils import setup_enrichment_logging
 from src.data.fetcher import CachedDataFetcher
 from src.data.shadow_store import get_shadow_store
 from src.graph.seeds import load_seed_candidates
-from src.shadow import HybridShadowEnricher, SeedAccount, ShadowEnrichmentConfig, EnrichmentPolicy
+from src.shadow import (
+    EnrichmentPolicy,
+    EnrichmentScheduler,
+    HybridShadowEnricher,
+    SchedulerConfig,
+    SeedAccount,
+    ShadowEnrichmentConfig,
+)
 
 
 def parse_args() -> argparse.Namespace:
@@ -34,6 +41,29 @@ def parse_args() -> argparse.Namespace:
         default=Path("secrets/twitter_cookies.pkl"),
         help="Path to Chrome cookies pickle (default: secrets/twitter_cookies.pkl). If the file is missing, you'll be prompted to choose from secrets/*.pkl.",
     )
+    parser.add_argument(
+        "--session-cookies",
+        type=Path,
+        nargs="+",
+        default=[],
+        metavar="PATH",
+        help=(
+            "Extra cookie jars; each adds a parallel browser session alongside --cookies"
+            " that pulls seeds from a shared queue."
+        ),
+    )
+    parser.add_argument(
+        "--session-visits-per-hour",
+        type=float,
+        default=None,
+        help="Per-session cap on page visits (profile/list fetches) when running parallel sessions.",
+    )
+    parser.add_argument(
+        "--global-visits-per-hour",
+        type=float,
+        default=None,
+        help="Cap on page visits summed over all parallel sessions.",
+    )
     parser.add_argument(
         "--seeds",
         nargs="*",
@@ -103,6 +133,14 @@ def parse_args() -> argparse.Namespace:
         default=6,
         help="Max consecutive scrolls with no height change before stopping (default 6). Applies to following, followers, verified_followers, and followers_you_follow lists. Increase to 20+ for accounts with 1000+ following/followers.",
     )
+    parser.add_argument(
+        "--bulk-dom-extraction",
+        action="store_true",
+        help=(
+            "Read follower/following list cells from one page_source snapshot per scroll "
+            "and parse them locally, instead of querying every cell over WebDriver."
+        ),
+    )
     parser.add_argument(
         "--delay-min",
         type=float,
@@ -224,6 +262,16 @@ def parse_args() -> argparse.Namespace:
         metavar="RUN_ID",
         help="NMF run_id to use for community membership signals (default: latest run).",
     )
+    parser.add_argument(
+        "--acquisition-novelty",
+        choices=["auto", "exact", "approximate"],
+        default="auto",
+        help=(
+            "Novelty computation against the scraped set: exact similarity product,"
+            " approximate KD-tree nearest neighbour, or auto by scraped-set size"
+            " (default: auto)."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -393,6 +441,9 @@ def main() -> None:
                     run_id=args.acquisition_run_id or None,
                     top_k=args.acquisition_k or None,
                     lambda_mmr=args.mmr_lambda,
+                    approximate_novelty={"auto": None, "exact": False, "approximate": True}[
+                        args.acquisition_novelty
+                    ],
                 )
                 community_conn.close()
                 LOGGER.info(
@@ -422,6 +473,7 @@ def main() -> None:
             selenium_scroll_delay_max=args.delay_max,
             selenium_max_no_change_scrolls=args.max_scrolls,
             selenium_retry_delays=retry_delays,
+            selenium_bulk_dom_extraction=args.bulk_dom_extraction,
             user_pause_seconds=args.pause,
             action_delay_min=args.delay_min,
             action_delay_max=args.delay_max,
@@ -576,7 +628,20 @@ def main() -> None:
                 LOGGER.info("=" * 80 + "\n")
 
             # Run the main enrichment loop
-            summary = enricher.enrich(seeds)
+            if args.session_cookies:
+                scheduler = EnrichmentScheduler(
+                    store,
+                    config,
+                    SchedulerConfig(
+                        cookie_paths=[args.cookies, *args.session_cookies],
+                        session_visits_per_hour=args.session_visits_per_hour,
+                        global_visits_per_hour=args.global_visits_per_hour,
+                    ),
+                    policy,
+                )
+                summary = scheduler.run(seeds)
+            else:
+                summary = enricher.enrich(seeds)
         except KeyboardInterrupt:
             logging.getLogger(__name__).warning("Interrupted by user; shutting down enrichment cleanly")
             summary = {"status": "interrupted"}
@@ -11,6 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.api.snapshot_loader import SnapshotLoader
+from src.data.lazy_json import to_plain
 
 def _serialize_datetime(dt):
     """Helper to serialize datetime."""
@@ -57,7 +58,7 @@ def profile_serialization():
             "mutual": directed.has_edge(v, u),
             "provenance": data.get("provenance", "archive"),
             "shadow": data.get("shadow", False),
-            "metadata": data.get("metadata"),
+            "metadata": to_plain(data.get("metadata")),
             "direction_label": data.get("direction_label"),
             "fetched_at": _serialize_datetime(data.get("fetched_at")),
         })
@@ -76,7 +76,7 @@ from src.config import DEFAULT_DATA_DIR, DEFAULT_ARCHIVE_DB
 from src.data.adjacency import load_adjacency_cache
 from src.propagation import PropagationConfig, propagate
 from src.propagation.diagnostics import print_diagnostics
-from src.propagation.io import save_results, build_adjacency_from_archive
+from src.propagation.io import save_results, build_adjacency_from_archive, load_warm_state
 
 DATA_DIR = DEFAULT_DATA_DIR
 DB_PATH = DEFAULT_ARCHIVE_DB
@@ -119,6 +119,10 @@ def main():
                         help="Propagation mode: classic (zero-sum) or independent (multi-label)")
     parser.add_argument("--bootstrap", type=int, default=0,
                         help="Number of bootstrap iterations for stability (default: 0)")
+    parser.add_argument("--bootstrap-workers", type=int, default=1,
+                        help="Worker processes for bootstrap iterations (default: 1 = serial)")
+    parser.add_argument("--no-warm-start", action="store_true",
+                        help="Ignore the saved PPR warm state and solve from scratch")
     args = parser.parse_args()
 
     if args.use_spectral_graph:
@@ -162,6 +166,10 @@ def main():
         adjacency = load_adjacency_cache()
     print(f"Adjacency: {adjacency.shape[0]:,} nodes, {adjacency.nnz:,} edges")
 
+    warm_state = None if args.no_warm_start else load_warm_state(DATA_DIR)
+    if warm_state is not None:
+        print(f"Warm start: {len(warm_state.class_ids)} classes from previous run")
+
     # Run propagation
     print("\n--- Running Propagation ---")
     result, holdout_info = propagate(
@@ -170,6 +178,8 @@ def main():
         holdout_seed=args.holdout_seed,
         seed_eligibility=not args.no_seed_eligibility,
         n_bootstrap=args.bootstrap,
+        n_workers=args.bootstrap_workers,
+        warm_state=warm_state,
     )
 
     # Diagnostics
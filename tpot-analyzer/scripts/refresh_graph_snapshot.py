@@ -30,6 +30,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config import get_cache_settings, get_snapshot_dir
 from src.data.fetcher import CachedDataFetcher
+from src.data.lazy_json import LazyJSONDict
 from src.data.shadow_store import get_shadow_store
 from src.graph import (
     build_graph,
@@ -125,6 +126,13 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _serialize_metadata(value) -> str | None:
+    """JSON text for edge metadata, reusing the raw string of unread shadow metadata."""
+    if isinstance(value, LazyJSONDict):
+        return value.to_json()
+    return json.dumps(value) if value else None
+
+
 def _serialize_datetime(value) -> str | None:
     """Serialize datetime to ISO format."""
     if value is None:
@@ -279,7 +287,7 @@ def main():
                     "mutual": directed.has_edge(v, u),
                     "provenance": edge_data.get("provenance", "archive"),
                     "shadow": edge_data.get("shadow", False),
-                    "metadata": json.dumps(edge_data.get("metadata")) if edge_data.get("metadata") else None,
+                    "metadata": _serialize_metadata(edge_data.get("metadata")),
                     "direction_label": edge_data.get("direction_label"),
                     "fetched_at": _serialize_datetime(edge_data.get("fetched_at")),
                 })
@@ -0,0 +1,263 @@
+"""Bounded, coalescing executor for cluster-view builds.
+
+/api/clusters used to build views on the request thread. Rapid expand
+clicks or slider drags then queued one full build per intermediate state,
+and the response the user actually wanted waited behind all of them.
+
+ViewBuildExecutor runs builds on a small worker pool instead:
+
+- Coalescing: requests for a cache key that is already queued or running
+  share that build's future rather than starting another one.
+- Supersession: each client (the ``clientId`` query param or X-Client-Id
+  header) has at most one build it is waiting for. Submitting a new key
+  detaches the client from its previous build; a build nobody waits for
+  any more is dropped from the queue, or has its cancel event set so
+  build_hierarchical_view stops at its next checkpoint.
+- Back-pressure: at most ``max_queue`` builds wait for a worker; beyond
+  that submit raises ViewQueueFull and the route answers 503.
+
+stats() reports queue depth, outcome counters and latency histograms for
+the /api/clusters/metrics endpoint.
+"""
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, List, Optional, Set
+
+from src.graph.hierarchy import BuildCancelled
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_QUEUE = 16
+# Upper bounds (ms) of the latency histogram buckets; the last one is open.
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, float("inf"))
+
+BuildFn = Callable[[threading.Event], object]
+
+
+class ViewQueueFull(RuntimeError):
+    """Raised by submit when max_queue builds are already waiting."""
+
+
+class LatencyHistogram:
+    """Per-bucket counts (not cumulative) plus observation count and sum."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.total_ms = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value_ms <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.total_ms += value_ms
+
+    def to_dict(self) -> Dict:
+        return {
+            "buckets": [
+                {"le": "inf" if bound == float("inf") else bound, "count": n}
+                for bound, n in zip(self.buckets, self.counts)
+            ],
+            "count": self.count,
+            "sum_ms": round(self.total_ms, 3),
+        }
+
+
+@dataclass
+class _Build:
+    key: Hashable
+    fn: BuildFn
+    future: Future = field(default_factory=Future)
+    clients: Set[str] = field(default_factory=set)
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    task: Optional[Future] = None
+
+
+class ViewBuildExecutor:
+    """Worker pool for view builds keyed by cache key.
+
+    Usage:
+        executor = ViewBuildExecutor()
+        future = executor.submit(cache_key, lambda cancel: build(cancel), client_id="tab-1")
+        payload = future.result()   # CancelledError if superseded
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS, max_queue: int = DEFAULT_MAX_QUEUE):
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        if max_queue <= 0:
+            raise ValueError("max_queue must be positive")
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cluster-view")
+        self._lock = threading.Lock()
+        self._builds: Dict[Hashable, _Build] = {}
+        self._client_keys: Dict[str, Hashable] = {}
+        self._anonymous = itertools.count()
+        self._queued = 0
+        self._running = 0
+        self._counters = {
+            "submitted": 0,
+            "coalesced": 0,
+            "superseded": 0,
+            "cancelled": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+        }
+        self._queue_wait = LatencyHistogram()
+        self._build_latency = LatencyHistogram()
+
+    def submit(self, key: Hashable, fn: BuildFn, client_id: Optional[str] = None) -> Future:
+        """Run fn(cancel_event) for key, or join the build already in flight.
+
+        The returned future is cancelled if this client later submits a
+        different key and no other client is waiting on this one.
+        """
+        with self._lock:
+            # Anonymous callers cannot be superseded, so they only hold a
+            # place in build.clients and never enter _client_keys (which
+            # release() could not clear for them).
+            anonymous = client_id is None
+            if anonymous:
+                client_id = f"anon-{next(self._anonymous)}"
+            else:
+                previous = self._client_keys.get(client_id)
+                if previous is not None and previous != key:
+                    self._detach(client_id, previous)
+
+            build = self._builds.get(key)
+            if build is not None:
+                build.clients.add(client_id)
+                if not anonymous:
+                    self._client_keys[client_id] = key
+                self._counters["coalesced"] += 1
+                return build.future
+
+            if self._queued >= self.max_queue:
+                self._counters["rejected"] += 1
+                raise ViewQueueFull(f"{self._queued} cluster view builds already queued")
+
+            build = _Build(key=key, fn=fn, clients={client_id})
+            self._builds[key] = build
+            if not anonymous:
+                self._client_keys[client_id] = key
+            self._queued += 1
+            self._counters["submitted"] += 1
+            build.task = self._pool.submit(self._run, build)
+            return build.future
+
+    def release(self, key: Hashable, client_id: Optional[str]) -> None:
+        """Forget that client_id waits on key (once its response is sent)."""
+        if client_id is None:
+            return
+        with self._lock:
+            if self._client_keys.get(client_id) == key:
+                self._client_keys.pop(client_id, None)
+
+    def supersede(self, client_id: Optional[str]) -> None:
+        """Abandon whatever client_id is waiting for, e.g. after a cache hit."""
+        if client_id is None:
+            return
+        with self._lock:
+            key = self._client_keys.get(client_id)
+            if key is not None:
+                self._detach(client_id, key)
+
+    def _detach(self, client_id: str, key: Hashable) -> None:
+        """Drop client_id from key's build; cancel it if nobody is left. Lock held."""
+        self._client_keys.pop(client_id, None)
+        build = self._builds.get(key)
+        if build is None:
+            return
+        build.clients.discard(client_id)
+        if build.clients:
+            return
+        self._counters["superseded"] += 1
+        build.cancel_event.set()
+        build.future.cancel()
+        if build.task is not None and build.task.cancel():
+            # Never reached a worker, so _run will not decrement for it.
+            self._queued -= 1
+        self._builds.pop(key, None)
+
+    def _run(self, build: _Build) -> None:
+        with self._lock:
+            self._queued -= 1
+            if build.cancel_event.is_set():
+                return
+            self._running += 1
+            build.started_at = time.time()
+            self._queue_wait.observe((build.started_at - build.submitted_at) * 1000)
+
+        outcome = "completed"
+        try:
+            result = build.fn(build.cancel_event)
+        except BuildCancelled:
+            outcome = "cancelled"
+            build.future.cancel()
+        except BaseException as exc:
+            outcome = "failed"
+            logger.exception("cluster view build failed key=%s", build.key)
+            _settle(build.future, exc=exc)
+        else:
+            if build.cancel_event.is_set():
+                # Finished after being superseded; nobody is waiting for it.
+                outcome = "cancelled"
+            _settle(build.future, result=result)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._counters[outcome] += 1
+                if outcome != "cancelled":
+                    self._build_latency.observe((time.time() - build.started_at) * 1000)
+                if self._builds.get(build.key) is build:
+                    self._builds.pop(build.key, None)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queue_depth": self._queued,
+                "running": self._running,
+                "in_flight_keys": len(self._builds),
+                "clients": len(self._client_keys),
+                **self._counters,
+                "queue_wait_ms": self._queue_wait.to_dict(),
+                "build_ms": self._build_latency.to_dict(),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            builds: List[_Build] = list(self._builds.values())
+            self._builds.clear()
+            self._client_keys.clear()
+        for build in builds:
+            build.cancel_event.set()
+            build.future.cancel()
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def _settle(future: Future, result=None, exc: Optional[BaseException] = None) -> None:
+    """Set a future's outcome unless it was already cancelled."""
+    try:
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
+
@@ -5,7 +5,6 @@ import functools
 import json
 import logging
 import os
-import pickle  # used for cached adjacency matrix (local files only, not user input)
 import time
 import hashlib
 from collections import OrderedDict
@@ -19,11 +18,16 @@ import scipy.sparse as sp
 from flask import Blueprint, jsonify, request
 
 from src.api.responses import error_response
+from src.api.cluster.executor import DEFAULT_MAX_QUEUE, DEFAULT_WORKERS, ViewBuildExecutor
 
 from src.data.account_tags import AccountTagStore
+from src.data.adjacency import load_adjacency_mmap, save_adjacency_mmap
 from src.graph.clusters import ClusterLabelStore
 from src.graph.hierarchy import (
+    ViewSessionStore,
     build_hierarchical_view,
+    configure_expansion_cache,
+    configure_local_expansion_store,
     get_collapse_preview,
     get_expand_preview,
 )
@@ -64,8 +68,6 @@ class ClusterCache:
         self.max_entries = max_entries
         self.ttl_seconds = ttl_seconds
         self._entries: OrderedDict[Tuple, CacheEntry] = OrderedDict()
-        self._inflight: Dict[Tuple, "concurrent.futures.Future"] = {}
-        self._inflight: Dict[Tuple, "asyncio.Future"] = {}
 
     def get(self, key: Tuple) -> Optional[dict]:
         now = time.time()
@@ -86,15 +88,6 @@ class ClusterCache:
         if len(self._entries) > self.max_entries:
             self._entries.popitem(last=False)
 
-    def inflight_get(self, key: Tuple):
-        return self._inflight.get(key)
-
-    def inflight_set(self, key: Tuple, future) -> None:
-        self._inflight[key] = future
-
-    def inflight_clear(self, key: Tuple) -> None:
-        self._inflight.pop(key, None)
-
 
 # Global state
 _spectral_result = None
@@ -117,6 +110,13 @@ _observation_config = ObservationWeightingConfig()
 _observation_stats: Dict[str, object] = {}
 _graph_settings: Dict[str, object] = {}
 _cache = ClusterCache()
+# Incremental view state per (ego, lens, granularity, alpha); see hierarchy/session.py
+_view_sessions = ViewSessionStore()
+# Worker pool for /api/clusters builds (coalescing + per-client supersession)
+_view_executor = ViewBuildExecutor(
+    max_workers=int(os.getenv("CLUSTER_VIEW_WORKERS", DEFAULT_WORKERS)),
+    max_queue=int(os.getenv("CLUSTER_VIEW_MAX_QUEUE", DEFAULT_MAX_QUEUE)),
+)
 _membership_cache = ClusterCache(max_entries=16, ttl_seconds=300)
 
 
@@ -213,38 +213,56 @@ def _build_adjacency(
     return adjacency, stats
 
 
+def _file_signature(path: Path) -> Optional[Dict[str, object]]:
+    if not path.exists():
+        return None
+    stat = path.stat()
+    return {"name": path.name, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _adjacency_fingerprint(
+    source_paths: list[Path],
+    node_ids: np.ndarray,
+    obs_config: ObservationWeightingConfig,
+) -> Dict[str, object]:
+    """Identity of the inputs an adjacency cache was built from."""
+    node_digest = hashlib.sha1("\n".join(str(n) for n in node_ids).encode()).hexdigest()
+    return {
+        "sources": [_file_signature(Path(p)) for p in source_paths],
+        "n_nodes": int(len(node_ids)),
+        "node_ids_sha1": node_digest,
+        "observation": {
+            "mode": obs_config.mode,
+            "p_min": obs_config.p_min,
+            "completeness_floor": obs_config.completeness_floor,
+        },
+    }
+
+
 def _load_or_build_adjacency(
-    edges_df: pd.DataFrame,
+    edges_path: Path,
     node_ids: np.ndarray,
-    cache_path: Path,
+    cache_dir: Path,
     *,
     obs_config: ObservationWeightingConfig,
     expected_following: Optional[Dict[str, float]] = None,
+    extra_sources: Tuple[Path, ...] = (),
 ) -> Tuple[sp.csr_matrix, Dict[str, object]]:
-    """Load adjacency matrix from cache or build it (with caching)."""
-    if cache_path.exists():
-        try:
-            logger.info("Loading cached adjacency matrix from %s", cache_path)
-            with open(cache_path, 'rb') as f:
-                cached_payload = pickle.load(f)  # noqa: S301 — local cache files only
-                if isinstance(cached_payload, dict) and "adjacency" in cached_payload:
-                    adjacency = cached_payload["adjacency"]
-                    stats = cached_payload.get("stats", {})
-                else:
-                    # Backward compatibility: old cache contained only CSR matrix.
-                    adjacency = cached_payload
-                    stats = {
-                        "mode": obs_config.mode,
-                        "cache_format": "legacy",
-                    }
-                logger.info("Cached adjacency loaded: %s edges", adjacency.count_nonzero())
-                if isinstance(stats, dict):
-                    stats["cache_hit"] = True
-                return adjacency, stats
-        except Exception as e:
-            logger.warning("Failed to load adjacency cache (%s), rebuilding...", e)
-
-    # Build fresh adjacency matrix
+    """Load adjacency matrix from its memory-mapped cache or build it (with caching).
+
+    The cache is a CSR directory (see src.data.adjacency) keyed by a
+    fingerprint of the edge parquet (plus extra_sources), the node order and
+    the observation config; the edges are only read on a miss.
+    """
+    fingerprint = _adjacency_fingerprint([edges_path, *extra_sources], node_ids, obs_config)
+    cached = load_adjacency_mmap(cache_dir, fingerprint)
+    if cached is not None:
+        adjacency, stats = cached
+        logger.info("Memory-mapped cached adjacency from %s: %s edges", cache_dir, adjacency.nnz)
+        stats["cache_hit"] = True
+        return adjacency, stats
+
+    edges_df = pd.read_parquet(edges_path)
     logger.info("Building adjacency matrix from %s edges...", len(edges_df))
     start_time = time.time()
     adjacency, stats = _build_adjacency(
@@ -259,12 +277,13 @@ def _load_or_build_adjacency(
         stats["build_seconds"] = round(duration, 4)
         stats["cache_hit"] = False
 
-    # Save to cache
     try:
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(cache_path, 'wb') as f:
-            pickle.dump({"adjacency": adjacency, "stats": stats}, f)
-        logger.info("Adjacency matrix cached to %s", cache_path)
+        save_adjacency_mmap(adjacency, cache_dir, stats=stats, fingerprint=fingerprint)
+        logger.info("Adjacency matrix cached to %s", cache_dir)
+        # Serve the mapped copy so workers forked from here share its pages.
+        reloaded = load_adjacency_mmap(cache_dir, fingerprint)
+        if reloaded is not None:
+            adjacency = reloaded[0]
     except Exception as e:
         logger.warning("Failed to cache adjacency matrix: %s", e)
 
@@ -406,7 +425,6 @@ def init_cluster_routes(data_dir: Path = Path("data")) -> None:
             return
         _spectral_result = load_spectral_result(base)
         nodes_df = pd.read_parquet(data_dir / "graph_snapshot.nodes.parquet")
-        edges_df = pd.read_parquet(data_dir / "graph_snapshot.edges.parquet")
         _node_metadata = _load_metadata(nodes_df)
         node_ids = _spectral_result.node_ids
 
@@ -427,21 +445,32 @@ def init_cluster_routes(data_dir: Path = Path("data")) -> None:
                 )
             )
 
-        # Use cached adjacency matrix (saves ~12 seconds on startup)
+        # Use memory-mapped cached adjacency matrix (saves ~12 seconds on startup)
         if _observation_config.mode == "off":
-            adjacency_cache_path = data_dir / "adjacency_matrix_cache.pkl"
+            adjacency_cache_dir = data_dir / "adjacency_matrix_cache.csr"
         else:
             p_tag = f"{_observation_config.p_min:.4f}".replace(".", "p")
-            adjacency_cache_path = data_dir / f"adjacency_matrix_cache.{_observation_config.mode}.{p_tag}.pkl"
+            adjacency_cache_dir = data_dir / f"adjacency_matrix_cache.{_observation_config.mode}.{p_tag}.csr"
         _adjacency, _observation_stats = _load_or_build_adjacency(
-            edges_df,
+            data_dir / "graph_snapshot.edges.parquet",
             node_ids,
-            adjacency_cache_path,
+            adjacency_cache_dir,
             obs_config=_observation_config,
             expected_following=expected_following,
+            # IPW weights depend on num_following from the nodes parquet.
+            extra_sources=(data_dir / "graph_snapshot.nodes.parquet",) if _observation_config.mode != "off" else (),
         )
         _membership_cache._entries.clear()
-        _membership_cache._inflight.clear()
+        _view_sessions.clear()
+
+        # Persist expansion strategy results across restarts/deploys.
+        expansion_version = json.dumps({
+            "spectral": _file_signature(spectral_sidecar),
+            "adjacency_nnz": int(_adjacency.nnz),
+            "observation": [_observation_config.mode, _observation_config.p_min],
+        }, sort_keys=True)
+        configure_expansion_cache(data_dir / "expansion_cache", expansion_version)
+        configure_local_expansion_store(data_dir / "local_expansions.db", expansion_version)
 
         _label_store = ClusterLabelStore(data_dir / "clusters.db")
 
@@ -492,11 +521,10 @@ def init_cluster_routes(data_dir: Path = Path("data")) -> None:
                     # Build TPOT adjacency from edges
                     tpot_edges_path = data_dir / "graph_snapshot_tpot.edges.parquet"
                     if tpot_edges_path.exists():
-                        tpot_edges_df = pd.read_parquet(tpot_edges_path)
                         tpot_node_ids = _tpot_spectral.node_ids
-                        tpot_adj_cache = data_dir / "adjacency_matrix_cache.tpot.pkl"
+                        tpot_adj_cache = data_dir / "adjacency_matrix_cache.tpot.csr"
                         _tpot_adjacency, _tpot_obs_stats = _load_or_build_adjacency(
-                            tpot_edges_df, tpot_node_ids, tpot_adj_cache,
+                            tpot_edges_path, tpot_node_ids, tpot_adj_cache,
                             obs_config=ObservationWeightingConfig(),  # default for TPOT
                         )
 
@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import time
+from concurrent.futures import CancelledError
 from typing import Set
 from uuid import uuid4
 
@@ -20,7 +22,8 @@ from src.api.cluster.state import (
     _serialize_hierarchical_view,
 )
 from src.api.cluster import state
-from src.graph.hierarchy import build_hierarchical_view
+from src.api.cluster.executor import ViewQueueFull
+from src.graph.hierarchy import build_hierarchical_view, resolve_session
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +34,10 @@ def get_clusters():
     """Return hierarchical cluster view with expand/collapse support."""
     req_arg = request.args.get("reqId", type=str)
     req_id = req_arg if req_arg else uuid4().hex[:8]
+    # graph-explorer sends a stable per-tab clientId, so a newer request from
+    # the same tab supersedes this one's build (requests without one never do)
+    client_id = request.args.get("clientId", type=str) or request.headers.get("X-Client-Id") or None
     start_total = time.time()
-    import concurrent.futures
 
     granularity = request.args.get("n", 25, type=int)
     granularity = max(5, min(500, granularity))
@@ -83,45 +88,6 @@ def get_clusters():
 
     cache_key = _make_cache_key(granularity, ego, expanded_ids, collapsed_ids, louvain_weight, expand_depth, focus_leaf, active_alpha, lens)
 
-    # Deduplicate identical in-flight builds
-    inflight = state._cache.inflight_get(cache_key)
-    if inflight:
-        logger.info(
-            "clusters inflight hit req=%s waiting_for=%s",
-            req_id,
-            getattr(inflight, "req_id", "unknown"),
-        )
-        wait_start = time.time()
-        try:
-            payload = inflight.result()
-            if not isinstance(payload, dict):
-                logger.info("clusters inflight payload not dict; serializing req=%s type=%s", req_id, type(payload))
-                payload = _serialize_hierarchical_view(payload)
-            wait_ms = int((time.time() - wait_start) * 1000)
-            total_ms = int((time.time() - start_total) * 1000)
-            server_timing = (payload.get("server_timing") or {}).copy()
-            server_timing.update(
-                {
-                    "req_id": req_id,
-                    "source_req_id": getattr(inflight, "req_id", None),
-                    "served_from": "inflight",
-                    "inflight_wait_ms": wait_ms,
-                    "t_total_ms": total_ms,
-                }
-            )
-            payload = {**payload, "server_timing": server_timing}
-            logger.info(
-                "clusters inflight resolved req=%s waited_ms=%d visible=%d budget_rem=%s total_ms=%d",
-                req_id,
-                wait_ms,
-                len((payload or {}).get("clusters", [])),
-                (payload or {}).get("meta", {}).get("budget_remaining"),
-                total_ms,
-            )
-            return jsonify(payload | {"cache_hit": True, "deduped": True, "inflight_wait_ms": wait_ms})
-        except Exception as exc:  # pragma: no cover
-            logger.warning("clusters inflight failed req=%s err=%s", req_id, exc)
-            # fall through to rebuild
     cached = state._cache.get(cache_key)
     if cached:
         server_timing = (cached.get("server_timing") or {}).copy()
@@ -146,37 +112,48 @@ def get_clusters():
             (payload or {}).get("meta", {}).get("budget_remaining"),
             total_ms,
         )
+        # The client moved on to a view that is already cached.
+        state._view_executor.supersede(client_id)
         return jsonify(payload | {"cache_hit": True})
 
-    start_build = time.time()
-
-    def _compute_view():
-        return build_hierarchical_view(
+    session_key = (ego, lens, granularity, active_alpha)
+
+    def _compute_view(cancel_event: threading.Event) -> dict:
+        start_build = time.time()
+        micro_labels = active_spectral.micro_labels if active_spectral.micro_labels is not None else np.arange(len(active_spectral.node_ids))
+        micro_centroids = active_spectral.micro_centroids if active_spectral.micro_centroids is not None else active_spectral.embedding
+        # Reuse the previous build's base cut, cluster aggregates and edge counts
+        session = resolve_session(
+            state._view_sessions.get(session_key),
+            active_spectral.linkage_matrix,
+            micro_labels,
+            micro_centroids,
+            active_spectral.node_ids,
+            active_adjacency,
+            active_metadata,
+            ego,
+        )
+        state._view_sessions.put(session_key, session)
+        view = build_hierarchical_view(
             linkage_matrix=active_spectral.linkage_matrix,
-            micro_labels=active_spectral.micro_labels if active_spectral.micro_labels is not None else np.arange(len(active_spectral.node_ids)),
-            micro_centroids=active_spectral.micro_centroids if active_spectral.micro_centroids is not None else active_spectral.embedding,
+            micro_labels=micro_labels,
+            micro_centroids=micro_centroids,
             node_ids=active_spectral.node_ids,
             adjacency=active_adjacency,
             node_metadata=active_metadata,
             base_granularity=granularity,
-                expanded_ids=expanded_ids,
-                collapsed_ids=collapsed_ids,
-                focus_leaf_id=focus_leaf,
-                ego_node_id=ego,
-                budget=budget,
-                label_store=state._label_store,
+            expanded_ids=expanded_ids,
+            collapsed_ids=collapsed_ids,
+            focus_leaf_id=focus_leaf,
+            ego_node_id=ego,
+            budget=budget,
+            label_store=state._label_store,
             louvain_communities=state._louvain_communities,
             louvain_weight=louvain_weight,
             expand_depth=expand_depth,
+            session=session,
+            cancel_event=cancel_event,
         )
-
-    future = concurrent.futures.Future()
-    future.req_id = req_id  # type: ignore[attr-defined]
-    state._cache.inflight_set(cache_key, future)
-
-    build_duration = serialize_duration = total_duration = None
-    try:
-        view = _compute_view()
         build_duration = time.time() - start_build
 
         start_serialize = time.time()
@@ -186,28 +163,57 @@ def get_clusters():
             payload["meta"]["activeAlpha"] = active_alpha
             payload["meta"]["activeLens"] = lens
         serialize_duration = time.time() - start_serialize
-        total_duration = time.time() - start_total
+        payload["server_timing"] = {
+            "req_id": req_id,
+            "t_build_ms": int(build_duration * 1000),
+            "t_serialize_ms": int(serialize_duration * 1000),
+        }
+        state._cache.set(cache_key, payload)
+        return payload
+
+    executor = state._view_executor
+    try:
+        future = executor.submit(cache_key, _compute_view, client_id=client_id)
+    except ViewQueueFull:
+        logger.warning("clusters queue full req=%s stats=%s", req_id, executor.stats())
+        return error_response("cluster view queue is full; retry shortly", status=503, details={"req_id": req_id})
 
-        future.set_result(payload)
+    wait_start = time.time()
+    try:
+        payload = future.result()
+    except CancelledError:
+        logger.info("clusters superseded req=%s client=%s", req_id, client_id)
+        return error_response(
+            "cluster view superseded by a newer request", status=409, details={"req_id": req_id},
+        )
     except Exception as exc:
-        logger.exception("clusters build failed req=%s expanded=%s collapsed=%s: %s", req_id, expanded_ids, collapsed_ids, exc)
-        state._cache.inflight_clear(cache_key)
+        logger.error("clusters build failed req=%s expanded=%s collapsed=%s: %s", req_id, expanded_ids, collapsed_ids, exc)
         return error_response("cluster build failed", status=500, details={"req_id": req_id})
     finally:
-        state._cache.inflight_clear(cache_key)
-
-    server_timing = {
-        "req_id": req_id,
-        "served_from": "build",
-        "t_build_ms": int(build_duration * 1000) if build_duration is not None else None,
-        "t_serialize_ms": int(serialize_duration * 1000) if serialize_duration is not None else None,
-        "t_total_ms": int(total_duration * 1000) if total_duration is not None else None,
-    }
+        executor.release(cache_key, client_id)
+
+    wait_ms = int((time.time() - wait_start) * 1000)
+    total_ms = int((time.time() - start_total) * 1000)
+    server_timing = dict(payload.get("server_timing") or {})
+    source_req_id = server_timing.get("req_id")
+    deduped = source_req_id != req_id
+    server_timing.update(
+        {
+            "req_id": req_id,
+            "source_req_id": source_req_id,
+            "served_from": "inflight" if deduped else "build",
+            "inflight_wait_ms": wait_ms,
+            "t_total_ms": total_ms,
+        }
+    )
     payload = {**payload, "server_timing": server_timing}
+    if deduped:
+        payload = payload | {"cache_hit": True, "deduped": True, "inflight_wait_ms": wait_ms}
 
     logger.info(
-        "clusters built req=%s n=%d expanded=%d visible=%d budget_rem=%s wl=%.2f depth=%.2f "
-        "t_build=%.3fs t_serialize=%.3fs t_total=%.3fs",
+        "clusters %s req=%s n=%d expanded=%d visible=%d budget_rem=%s wl=%.2f depth=%.2f "
+        "t_build_ms=%s t_serialize_ms=%s waited_ms=%d t_total_ms=%d",
+        "inflight resolved" if deduped else "built",
         req_id,
         granularity,
         len(expanded_ids),
@@ -215,9 +221,10 @@ def get_clusters():
         payload.get("meta", {}).get("budget_remaining"),
         louvain_weight,
         expand_depth,
-        build_duration,
-        serialize_duration,
-        total_duration,
+        server_timing.get("t_build_ms"),
+        server_timing.get("t_serialize_ms"),
+        wait_ms,
+        total_ms,
     )
     try:
         logger.info(
@@ -232,5 +239,10 @@ def get_clusters():
         )
     except Exception:
         logger.warning("clusters response logging failed for req=%s", req_id)
-    state._cache.set(cache_key, payload)
     return jsonify(payload)
+
+
+@cluster_bp.route("/metrics", methods=["GET"])
+def get_cluster_metrics():
+    """Queue depth, outcome counters and latency histograms of the view executor."""
+    return jsonify(state._view_executor.stats())
@@ -13,8 +13,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import networkx as nx
 import pandas as pd
 
+from src.graph.discovery_engine import DiscoveryEngine
 from src.graph.scoring import (
-    score_candidate,
     process_weights,
     DEFAULT_WEIGHTS
 )
@@ -459,44 +459,23 @@ def discover_subgraph(
             }
         }
 
-    # Create undirected version for path computation
-    undirected = subgraph.to_undirected()
-
-    # Precompute SSSP from each seed once (O(seeds × BFS)) so that per-candidate
-    # distance lookups are O(1) instead of O(candidates × seeds × BFS).
-    # cutoff=3 matches the default max_distance in compute_path_distance_score.
-    _DISTANCE_CUTOFF = 3
+    # Score every candidate in one batch: overlap via sparse products,
+    # distances via a single multi-source BFS over the subgraph.
+    # max_distance=3 matches the default in compute_path_distance_score.
     t0 = time.time()
-    precomputed_distances: Dict[str, Dict[str, int]] = {
-        seed: dict(nx.single_source_shortest_path_length(undirected, seed, cutoff=_DISTANCE_CUTOFF))
-        for seed in valid_seeds
-        if seed in undirected
-    }
+    engine = DiscoveryEngine(subgraph, valid_seeds, pagerank_scores, max_distance=3)
     timing['sssp_precompute_ms'] = int((time.time() - t0) * 1000)
     logger.info(
-        "SSSP precomputed for %d seeds in %dms (cutoff=%d)",
-        len(precomputed_distances), timing['sssp_precompute_ms'], _DISTANCE_CUTOFF,
+        "Multi-source BFS for %d seeds in %dms (cutoff=%d)",
+        len(valid_seeds), timing['sssp_precompute_ms'], engine.max_distance,
     )
 
-    # Score all candidates
     t0 = time.time()
-    scored_candidates = []
-
-    for candidate in candidate_nodes:
-        if candidate in valid_seeds:
-            continue  # Skip seeds themselves
-
-        score_result = score_candidate(
-            subgraph,
-            candidate,
-            valid_seeds,
-            pagerank_scores,
-            request.weights,
-            undirected,
-            precomputed_distances=precomputed_distances,
-        )
-
-        scored_candidates.append(score_result)
+    seed_set = set(valid_seeds)
+    scored_candidates = engine.score_candidates(
+        [c for c in candidate_nodes if c not in seed_set],
+        request.weights,
+    )
 
     timing['scoring_ms'] = int((time.time() - t0) * 1000)
 
@@ -0,0 +1,220 @@
+"""Build, encode and compress /api/graph-data payloads.
+
+The filtered views (shadow inclusion, mutual-only, min-followers) are derived
+from the in-memory snapshot CSRGraph with array operations instead of
+rebuilding a NetworkX graph from cache.db per filter combination. Payloads
+are serialized once (orjson when installed) and compressed once per cache
+entry, so cache hits only pick the body matching Accept-Encoding.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+import pyarrow as pa
+
+from src.graph.csr_graph import CSRGraph
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+# Bodies smaller than this are not worth compressing.
+MIN_COMPRESS_BYTES = 1024
+
+
+def _present(value) -> bool:
+    return value is not None and not (isinstance(value, float) and math.isnan(value))
+
+
+def _bool_mask(column: pa.Array) -> np.ndarray:
+    return column.cast(pa.bool_()).fill_null(False).to_numpy(zero_copy_only=False).astype(bool)
+
+
+def snapshot_view(
+    graph: CSRGraph,
+    *,
+    include_shadow: bool,
+    mutual_only: bool,
+    min_followers: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Apply the graph-data filters to a snapshot graph.
+
+    Mirrors build_graph's semantics: shadow nodes/edges are dropped unless
+    include_shadow, mutual_only keeps reciprocated edges only, and archive
+    nodes whose in-degree over archive edges is below min_followers are
+    pruned (single pass, like _filter_min_followers). build_graph prunes
+    before shadow data is injected, so shadow edges neither count towards
+    the threshold nor get pruned, and their endpoints stay in the view.
+
+    Returns:
+        (node_idx, edge_src, edge_dst, edge_mutual) — kept node indices and
+        the kept edges as node-index arrays with a reciprocity flag.
+    """
+    n = graph.n
+    src, dst = graph.edge_arrays()
+    node_keep = np.ones(n, dtype=bool)
+    edge_keep = np.ones(len(src), dtype=bool)
+
+    node_shadow_column = graph.node_column("shadow")
+    edge_shadow_column = graph.edge_column("shadow")
+    node_shadow = (
+        _bool_mask(node_shadow_column) if node_shadow_column is not None else np.zeros(n, dtype=bool)
+    )
+    edge_shadow = (
+        _bool_mask(edge_shadow_column) if edge_shadow_column is not None
+        else np.zeros(len(src), dtype=bool)
+    )
+
+    if not include_shadow:
+        node_keep &= ~node_shadow
+        edge_keep &= ~edge_shadow
+    edge_keep &= node_keep[src] & node_keep[dst]
+
+    src, dst, edge_shadow = src[edge_keep], dst[edge_keep], edge_shadow[edge_keep]
+    forward = src * n + dst
+    mutual = np.isin(dst * n + src, forward)
+    if mutual_only:
+        src, dst, mutual, edge_shadow = src[mutual], dst[mutual], mutual[mutual], edge_shadow[mutual]
+
+    if min_followers > 0:
+        shadow_edge = edge_shadow | node_shadow[src] | node_shadow[dst]
+        in_degree = np.bincount(dst[~shadow_edge], minlength=n)
+        passes = node_shadow | (in_degree >= min_followers)
+        keep = shadow_edge | (passes[src] & passes[dst])
+        src, dst, mutual = src[keep], dst[keep], mutual[keep]
+        endpoint = np.zeros(n, dtype=bool)
+        endpoint[src] = True
+        endpoint[dst] = True
+        node_keep &= passes | endpoint
+
+    return np.flatnonzero(node_keep), src, dst, mutual
+
+
+def payload_from_snapshot(
+    graph: CSRGraph,
+    *,
+    include_shadow: bool,
+    mutual_only: bool,
+    min_followers: int,
+    generated_at: str,
+) -> dict:
+    """graph-data response dict for a filtered snapshot view."""
+    node_idx, src, dst, mutual = snapshot_view(
+        graph, include_shadow=include_shadow, mutual_only=mutual_only, min_followers=min_followers,
+    )
+    ids = np.array(graph.node_ids, dtype=object)
+    names = graph.node_attribute_names
+    take = pa.array(node_idx, type=pa.int64())
+    columns = [graph.node_column(name).take(take).to_pylist() for name in names]
+
+    nodes = []
+    for nid, values in zip(ids[node_idx].tolist(), zip(*columns) if columns else ((),) * len(take)):
+        data = {k: v for k, v in zip(names, values) if _present(v)}
+        nodes.append({
+            "id": str(nid),
+            "label": data.get("username", str(nid)),
+            "group": data.get("community", 0),
+            "value": data.get("pagerank", 1.0) * 100,
+            **data,
+        })
+
+    # Snapshot edges are unweighted.
+    links = [
+        {"source": str(u), "target": str(v), "value": 1.0, "mutual": m}
+        for u, v, m in zip(ids[src].tolist(), ids[dst].tolist(), mutual.tolist())
+    ]
+    return _response(nodes, links, generated_at)
+
+
+def payload_from_graph(graph, *, mutual_only: bool, generated_at: str) -> dict:
+    """graph-data response dict for an already-filtered nx.DiGraph."""
+    nodes = []
+    for n, data in graph.nodes(data=True):
+        nodes.append({
+            "id": str(n),
+            "label": data.get("username", str(n)),
+            "group": data.get("community", 0),
+            "value": data.get("pagerank", 1.0) * 100,  # Scale for visibility
+            **data
+        })
+
+    links = []
+    for u, v, data in graph.edges(data=True):
+        links.append({
+            "source": str(u),
+            "target": str(v),
+            "value": data.get("weight", 1.0),
+            "mutual": True if mutual_only else data.get("mutual", False)
+        })
+    return _response(nodes, links, generated_at)
+
+
+def _response(nodes: list, links: list, generated_at: str) -> dict:
+    return {
+        "nodes": nodes,
+        "edges": links,
+        "directed_nodes": nodes,  # Alias for backward compatibility if needed
+        "directed_edges": links,  # Alias for backward compatibility if needed
+        "meta": {
+            "node_count": len(nodes),
+            "edge_count": len(links),
+            "generated_at": generated_at,
+        }
+    }
+
+
+def dumps(payload: Any) -> bytes:
+    """Serialize to JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(payload, default=str).encode("utf-8")
+
+
+@dataclass(frozen=True)
+class EncodedPayload:
+    """A serialized body plus its precompressed variants."""
+
+    body: bytes
+    gzip: Optional[bytes] = None
+    brotli: Optional[bytes] = None
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.body) + len(self.gzip or b"") + len(self.brotli or b"")
+
+    def select(self, accept_encodings) -> tuple[bytes, Optional[str]]:
+        """Pick (body, content-encoding) for a werkzeug Accept-Encoding header."""
+        if self.brotli is not None and accept_encodings.quality("br") > 0:
+            return self.brotli, "br"
+        if self.gzip is not None and accept_encodings.quality("gzip") > 0:
+            return self.gzip, "gzip"
+        return self.body, None
+
+
+def encode_payload(payload: Any) -> EncodedPayload:
+    body = dumps(payload)
+    if len(body) < MIN_COMPRESS_BYTES:
+        return EncodedPayload(body)
+    return EncodedPayload(
+        body=body,
+        gzip=gzip.compress(body, compresslevel=GZIP_LEVEL),
+        brotli=brotli.compress(body, quality=BROTLI_QUALITY) if BROTLI_AVAILABLE else None,
+    )
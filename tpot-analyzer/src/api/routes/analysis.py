@@ -134,11 +134,19 @@ def get_performance_metrics():
             "cache": {
                 "graph_entries": cache_manager.graph_cache_size(),
                 "discovery_entries": cache_manager.discovery_cache_size(),
+                "total_bytes": cache_manager.stats()["total_bytes"],
             },
         }
     )
 
 
+@analysis_bp.route("/metrics/cache", methods=["GET"])
+def get_cache_metrics():
+    """Return hit/miss/eviction/byte counters for the response caches."""
+    cache_manager: CacheManager = current_app.config["CACHE_MANAGER"]
+    return jsonify(cache_manager.stats())
+
+
 def _parse_signal_feedback_payload(payload):
     if not isinstance(payload, dict):
         return None, "Request body must be a JSON object"
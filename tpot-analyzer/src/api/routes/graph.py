@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import logging
-import json
+from typing import Optional
+
 from flask import Blueprint, jsonify, request, current_app, Response
 
 from src.graph import (
@@ -11,7 +12,10 @@ from src.graph import (
     update_graph_settings,
 )
 from src.data.fetcher import CachedDataFetcher
+from src.api import snapshot_loader
+from src.api.graph_payload import EncodedPayload, encode_payload, payload_from_graph, payload_from_snapshot
 from src.api.services.cache_manager import CacheManager
+from src.graph.csr_graph import CSRGraph
 from src.config import get_snapshot_dir
 
 logger = logging.getLogger(__name__)
@@ -19,6 +23,28 @@ logger = logging.getLogger(__name__)
 graph_bp = Blueprint("graph", __name__, url_prefix="/api")
 
 
+def _load_snapshot_graph() -> Optional[CSRGraph]:
+    """The in-memory snapshot graph, loading it on first use (None if unavailable)."""
+    graph_result = current_app.config.get("SNAPSHOT_GRAPH")
+    if graph_result is None:
+        graph_result = snapshot_loader.get_snapshot_loader().load_graph()
+        if graph_result is None:
+            return None
+        current_app.config["SNAPSHOT_GRAPH"] = graph_result
+    directed = getattr(graph_result, "directed", None)
+    return directed if isinstance(directed, CSRGraph) else None
+
+
+def _encoded_response(encoded: EncodedPayload) -> Response:
+    body, encoding = encoded.select(request.accept_encodings)
+    response = Response(body, mimetype="application/json")
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    if encoded.gzip is not None:
+        response.vary.add("Accept-Encoding")
+    return response
+
+
 @graph_bp.route("/graph-data", methods=["GET"])
 def get_graph_data():
     """Return the current graph structure for visualization."""
@@ -33,62 +59,43 @@ def get_graph_data():
     cached_data = cache_manager.get_graph_response(cache_key)
 
     if cached_data:
+        if isinstance(cached_data, EncodedPayload):
+            return _encoded_response(cached_data)
         # If it's a pre-serialized Response object or string, return it directly
         if isinstance(cached_data, (str, bytes)):
              return Response(cached_data, mimetype='application/json')
         return jsonify(cached_data)
 
-    # Build the graph
-    snapshot_dir = get_snapshot_dir()
-    fetcher = CachedDataFetcher(cache_db=snapshot_dir / "cache.db")
-    
-    graph_result = build_graph(
-        fetcher=fetcher,
-        include_shadow=include_shadow,
-        min_followers=min_followers,
-        mutual_only=mutual_only
-    )
-    G = graph_result.directed
-
-    # Convert to JSON-serializable format
-
-    # Convert to JSON-serializable format
-    nodes = []
-    for n, data in G.nodes(data=True):
-        nodes.append({
-            "id": str(n),
-            "label": data.get("username", str(n)),
-            "group": data.get("community", 0),
-            "value": data.get("pagerank", 1.0) * 100,  # Scale for visibility
-            **data
-        })
-
-    links = []
-    for u, v, data in G.edges(data=True):
-        links.append({
-            "source": str(u),
-            "target": str(v),
-            "value": data.get("weight", 1.0),
-            "mutual": True if mutual_only else data.get("mutual", False)
-        })
-
-    response_data = {
-        "nodes": nodes,
-        "edges": links,
-        "directed_nodes": nodes,  # Alias for backward compatibility if needed
-        "directed_edges": links,  # Alias for backward compatibility if needed
-        "meta": {
-            "node_count": len(nodes),
-            "edge_count": len(links),
-            "generated_at": str(current_app.config.get("STARTUP_TIME"))
-        }
-    }
-    
-    # Serialize once and cache
-    json_str = json.dumps(response_data)
-    cache_manager.set_graph_response(cache_key, json_str)
-
-    return Response(json_str, mimetype='application/json')
+    generated_at = str(current_app.config.get("STARTUP_TIME"))
+    snapshot_graph = _load_snapshot_graph()
+    if snapshot_graph is not None:
+        # Filter the in-memory snapshot instead of rebuilding from cache.db.
+        response_data = payload_from_snapshot(
+            snapshot_graph,
+            include_shadow=include_shadow,
+            mutual_only=mutual_only,
+            min_followers=min_followers,
+            generated_at=generated_at,
+        )
+    else:
+        snapshot_dir = get_snapshot_dir()
+        fetcher = CachedDataFetcher(cache_db=snapshot_dir / "cache.db")
+
+        graph_result = build_graph(
+            fetcher=fetcher,
+            include_shadow=include_shadow,
+            min_followers=min_followers,
+            mutual_only=mutual_only
+        )
+        response_data = payload_from_graph(
+            graph_result.directed, mutual_only=mutual_only, generated_at=generated_at,
+        )
+
+    # Serialize and compress once, then cache every encoding
+    encoded = encode_payload(response_data)
+    cache_manager.set_graph_response(cache_key, encoded)
+
+    return _encoded_response(encoded)
 
 
 @graph_bp.route("/graph/settings", methods=["GET"])
@@ -138,7 +138,16 @@ def create_app(config_overrides: Optional[dict] = None) -> Flask:
     # 2. Initialize Services (State Injection)
     # These replace the old module-level globals
     app.config["ANALYSIS_MANAGER"] = AnalysisManager()
-    app.config["CACHE_MANAGER"] = CacheManager()
+    def _drop_loaded_snapshot(old_version, new_version) -> None:
+        # Responses cached under the new version must be built from the new
+        # snapshot, not the graph still held in memory.
+        snapshot_loader.get_snapshot_loader().clear_cache()
+        app.config.pop("SNAPSHOT_GRAPH", None)
+
+    app.config["CACHE_MANAGER"] = CacheManager(
+        version_provider=lambda: snapshot_loader.get_snapshot_loader().snapshot_version(),
+        on_version_change=_drop_loaded_snapshot,
+    )
     app.config["SIGNAL_FEEDBACK_STORE"] = SignalFeedbackStore()
 
     # 2b. Snapshot graph is loaded lazily on first discovery/search request.
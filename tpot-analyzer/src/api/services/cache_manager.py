@@ -5,62 +5,259 @@ Intentionally in-memory only — these are ephemeral caches of computed results
 data on disk.  Losing them on restart costs one re-computation per unique
 request, which is the expected and acceptable behaviour.  There is no user
 data here that would benefit from persistence.
+
+Each namespace is a byte-budgeted LRU with its own TTL. /api/graph-data stores
+multi-megabyte serialized JSON per (include_shadow, mutual_only, min_followers)
+combination, so capping by entry count alone is not enough. Entries are tagged
+with the snapshot version current when they were stored and dropped once a
+newer snapshot is on disk. on_version_change lets the owner drop whatever
+it built from the old snapshot (the server discards the loaded snapshot
+graph), so entries rebuilt under the new version come from the new data.
 """
 from __future__ import annotations
 
+import json
 import logging
-from typing import Dict, Any, Optional
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+GRAPH_NAMESPACE = "graph"
+DISCOVERY_NAMESPACE = "discovery"
+
+DEFAULT_GRAPH_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_GRAPH_TTL_SECONDS = 3600
+DEFAULT_DISCOVERY_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_DISCOVERY_TTL_SECONDS = 600
+VERSION_CHECK_INTERVAL_SECONDS = 5.0
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate payload size in bytes (exact for str/bytes and objects with nbytes)."""
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    nbytes: int
+    created_at: float
+    version: Optional[str]
+
+
+class LRUNamespace:
+    """Byte-budgeted LRU with TTL. Not thread-safe; CacheManager locks."""
+
+    def __init__(self, max_bytes: int, ttl_seconds: float, max_entries: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.rejections = 0
+
+    def get(self, key: str, version: Optional[str]) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if time.time() - entry.created_at > self.ttl_seconds:
+            self._drop(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        if entry.version != version:
+            self._drop(key)
+            self.invalidations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def set(self, key: str, value: Any, version: Optional[str]) -> None:
+        nbytes = estimate_size(value)
+        if key in self._entries:
+            self._drop(key)
+        if nbytes > self.max_bytes:
+            # A single oversized payload would flush everything else.
+            self.rejections += 1
+            logger.warning("Cache entry %s (%d bytes) exceeds namespace budget", key, nbytes)
+            return
+        self._entries[key] = _Entry(value, nbytes, time.time(), version)
+        self.bytes += nbytes
+        while self.bytes > self.max_bytes or (
+            self.max_entries is not None and len(self._entries) > self.max_entries
+        ):
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self.bytes -= entry.nbytes
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "rejections": self.rejections,
+        }
+
 
 class CacheManager:
     """Centralized manager for in-memory caches."""
 
-    def __init__(self):
-        # Cache for /api/graph-data responses
-        # Key: "{include_shadow}_{mutual_only}_{min_followers}"
-        self._graph_response_cache: Dict[str, Any] = {}
-        
-        # Cache for subgraph discovery results
-        # Key: query hash
-        self._discovery_cache: Dict[str, Any] = {}
+    def __init__(
+        self,
+        graph_max_bytes: int = DEFAULT_GRAPH_MAX_BYTES,
+        graph_ttl_seconds: float = DEFAULT_GRAPH_TTL_SECONDS,
+        discovery_max_bytes: int = DEFAULT_DISCOVERY_MAX_BYTES,
+        discovery_ttl_seconds: float = DEFAULT_DISCOVERY_TTL_SECONDS,
+        version_provider: Optional[Callable[[], Optional[str]]] = None,
+        version_check_interval: float = VERSION_CHECK_INTERVAL_SECONDS,
+        on_version_change: Optional[Callable[[Optional[str], Optional[str]], None]] = None,
+    ):
+        """
+        Args:
+            version_provider: Returns the current snapshot version (e.g.
+                SnapshotLoader.snapshot_version). Entries stored under an
+                older version are treated as misses. Polled at most every
+                version_check_interval seconds.
+            on_version_change: Called as (old, new) when a poll sees a
+                different version than the previous one, before the
+                request that noticed it reads or writes the cache.
+        """
+        self._lock = threading.RLock()
+        self._namespaces: Dict[str, LRUNamespace] = {
+            # Graph responses: key "{include_shadow}_{mutual_only}_{min_followers}"
+            GRAPH_NAMESPACE: LRUNamespace(graph_max_bytes, graph_ttl_seconds),
+            # Subgraph discovery results: key is a query hash
+            DISCOVERY_NAMESPACE: LRUNamespace(discovery_max_bytes, discovery_ttl_seconds),
+        }
+        self._version_provider = version_provider
+        self._on_version_change = on_version_change
+        self._version_check_interval = version_check_interval
+        self._version: Optional[str] = None
+        self._version_checked_at = float("-inf")
+
+    def _current_version(self) -> Optional[str]:
+        if self._version_provider is None:
+            return None
+        now = time.monotonic()
+        if now - self._version_checked_at >= self._version_check_interval:
+            self._version_checked_at = now
+            try:
+                version = self._version_provider()
+            except Exception as exc:  # provider reads files; never fail a request over it
+                logger.warning("Snapshot version check failed: %s", exc)
+                return self._version
+            previous, self._version = self._version, version
+            if version != previous and previous is not None:
+                logger.info("Snapshot version changed (%s -> %s); cached responses invalidated",
+                            previous, version)
+                if self._on_version_change is not None:
+                    try:
+                        self._on_version_change(previous, version)
+                    except Exception as exc:
+                        logger.warning("Snapshot version change handler failed: %s", exc)
+        return self._version
+
+    def _get(self, namespace: str, key: str) -> Optional[Any]:
+        with self._lock:
+            return self._namespaces[namespace].get(key, self._current_version())
+
+    def _set(self, namespace: str, key: str, data: Any) -> None:
+        with self._lock:
+            self._namespaces[namespace].set(key, data, self._current_version())
+
+    def _clear(self, namespace: str) -> None:
+        with self._lock:
+            self._namespaces[namespace].clear()
 
     def get_graph_response(self, key: str) -> Optional[Any]:
         """Retrieve a cached graph data response."""
-        return self._graph_response_cache.get(key)
+        return self._get(GRAPH_NAMESPACE, key)
 
     def set_graph_response(self, key: str, data: Any) -> None:
         """Cache a graph data response."""
-        self._graph_response_cache[key] = data
+        self._set(GRAPH_NAMESPACE, key, data)
 
     def clear_graph_cache(self) -> None:
         """Invalidate the entire graph response cache."""
-        self._graph_response_cache.clear()
+        self._clear(GRAPH_NAMESPACE)
         logger.info("Graph response cache cleared")
 
     def get_discovery_result(self, key: str) -> Optional[Any]:
         """Retrieve a cached discovery result."""
-        return self._discovery_cache.get(key)
+        return self._get(DISCOVERY_NAMESPACE, key)
 
     def set_discovery_result(self, key: str, data: Any) -> None:
         """Cache a discovery result."""
-        self._discovery_cache[key] = data
-        
+        self._set(DISCOVERY_NAMESPACE, key, data)
+
     def clear_discovery_cache(self) -> None:
         """Invalidate discovery cache."""
-        self._discovery_cache.clear()
+        self._clear(DISCOVERY_NAMESPACE)
         logger.info("Discovery cache cleared")
 
     def graph_cache_size(self) -> int:
         """Return number of graph response entries currently cached."""
-        return len(self._graph_response_cache)
+        with self._lock:
+            return len(self._namespaces[GRAPH_NAMESPACE])
 
     def discovery_cache_size(self) -> int:
         """Return number of discovery entries currently cached."""
-        return len(self._discovery_cache)
+        with self._lock:
+            return len(self._namespaces[DISCOVERY_NAMESPACE])
 
     def clear_all(self) -> None:
         """Clear all caches."""
         self.clear_graph_cache()
         self.clear_discovery_cache()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction/byte counters per namespace, plus totals."""
+        with self._lock:
+            namespaces = {name: ns.stats() for name, ns in self._namespaces.items()}
+            return {
+                "snapshot_version": self._version,
+                "total_bytes": sum(ns["bytes"] for ns in namespaces.values()),
+                "namespaces": namespaces,
+            }
@@ -15,9 +15,12 @@ from pathlib import Path
 from typing import Optional
 
 import networkx as nx
-import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
+from src.data.lazy_json import LazyJSONDict
 from src.graph import GraphBuildResult
+from src.graph.csr_graph import CSRGraph
 from src.config import get_snapshot_dir
 
 logger = logging.getLogger(__name__)
@@ -152,8 +155,103 @@ class SnapshotManifest:
         return False, "Cache DB file not modified"
 
 
+# Node attribute name -> snapshot column. display_name is exposed twice for
+# compatibility with graphs built live (account_display_name).
+_NODE_ATTR_COLUMNS = (
+    ("username", "username"),
+    ("account_display_name", "display_name"),
+    ("display_name", "display_name"),
+    ("num_followers", "num_followers"),
+    ("num_following", "num_following"),
+    ("num_likes", "num_likes"),
+    ("num_tweets", "num_tweets"),
+    ("bio", "bio"),
+    ("location", "location"),
+    ("website", "website"),
+    ("profile_image_url", "profile_image_url"),
+    ("provenance", "provenance"),
+    ("shadow", "shadow"),
+    ("fetched_at", "fetched_at"),
+)
+_EDGE_ATTR_COLUMNS = ("provenance", "shadow", "direction_label", "fetched_at")
+_COLUMN_DEFAULTS = {"provenance": "archive", "shadow": False}
+
+
+def _column(table: pa.Table, name: str) -> list:
+    """Column as Python values; missing columns are filled with the default."""
+    if name in table.column_names:
+        return table.column(name).to_pylist()
+    return [_COLUMN_DEFAULTS.get(name)] * table.num_rows
+
+
+def _present(value) -> bool:
+    # Parquet nulls arrive as None; float NaN can still appear for numerics
+    # written without null conversion, and serialises to invalid JSON "NaN".
+    return value is not None and not (isinstance(value, float) and math.isnan(value))
+
+
+def _iter_node_records(table: pa.Table, communities: dict):
+    """Yield (node_id, attrs) tuples for nx.DiGraph.add_nodes_from."""
+    node_ids = _column(table, "node_id")
+    columns = {col: _column(table, col) for _, col in _NODE_ATTR_COLUMNS}
+    # Columns are transposed once; each row then only builds its attr dict.
+    attr_names = [attr for attr, _ in _NODE_ATTR_COLUMNS]
+    rows = zip(*(columns[col] for _, col in _NODE_ATTR_COLUMNS))
+    for node_id, values in zip(node_ids, rows):
+        attrs = {k: v for k, v in zip(attr_names, values) if _present(v)}
+        if node_id in communities:
+            attrs["community"] = communities[node_id]
+        yield node_id, attrs
+
+
+def _iter_edge_records(table: pa.Table):
+    """Yield (source, target, attrs) tuples for nx.DiGraph.add_edges_from."""
+    sources = _column(table, "source")
+    targets = _column(table, "target")
+    rows = zip(*(_column(table, col) for col in _EDGE_ATTR_COLUMNS))
+    metadata = _column(table, "metadata")
+    for source, target, values, raw_meta in zip(sources, targets, rows, metadata):
+        attrs = {k: v for k, v in zip(_EDGE_ATTR_COLUMNS, values) if v is not None}
+        if raw_meta:
+            attrs["metadata"] = LazyJSONDict(raw_meta, label=f"{source}→{target}")
+        yield source, target, attrs
+
+
+def _with_default_columns(table: pa.Table, columns) -> pa.Table:
+    """Append constant default columns for any the snapshot does not have."""
+    for name in columns:
+        if name not in table.column_names and name in _COLUMN_DEFAULTS:
+            table = table.append_column(name, pa.array([_COLUMN_DEFAULTS[name]] * table.num_rows))
+    return table
+
+
+def _decode_edge_metadata(raw: str) -> LazyJSONDict:
+    return LazyJSONDict(raw, label="edge")
+
+
+def _build_csr_graph(nodes_table: pa.Table, edges_table: pa.Table, communities: dict) -> CSRGraph:
+    nodes_table = _with_default_columns(nodes_table, [col for _, col in _NODE_ATTR_COLUMNS])
+    edges_table = _with_default_columns(edges_table, _EDGE_ATTR_COLUMNS)
+    graph = CSRGraph.from_arrow(
+        nodes_table,
+        edges_table,
+        node_attr_columns=dict(_NODE_ATTR_COLUMNS),
+        edge_attr_columns=(*_EDGE_ATTR_COLUMNS, "metadata"),
+        edge_decoders={"metadata": _decode_edge_metadata},
+    )
+    if communities:
+        graph.with_node_column("community", communities)
+    return graph
+
+
 class SnapshotLoader:
-    """Loads precomputed graph snapshots from disk."""
+    """Loads precomputed graph snapshots from disk.
+
+    Edge ``metadata`` is returned as a read-only LazyJSONDict rather than a
+    plain dict; call ``.to_dict()`` before re-serializing it. Malformed
+    metadata JSON reads as ``{}`` and a non-object JSON value is wrapped as
+    ``{"value": ...}``.
+    """
 
     def __init__(self, snapshot_dir: Path | None = None):
         if snapshot_dir is None:
@@ -164,7 +262,10 @@ class SnapshotLoader:
         self.manifest_path = self.snapshot_dir / "graph_snapshot.meta.json"
 
         self._cached_graph: Optional[GraphBuildResult] = None
+        self._cached_backend: Optional[str] = None
         self._cached_manifest: Optional[SnapshotManifest] = None
+        self._version_mtime_ns: Optional[int] = None
+        self._version: Optional[str] = None
 
     def snapshot_exists(self) -> bool:
         """Check if all snapshot files exist."""
@@ -189,6 +290,26 @@ class SnapshotLoader:
             logger.exception(f"Failed to load snapshot manifest: {e}")
             return None
 
+    def snapshot_version(self) -> Optional[str]:
+        """generated_at of the snapshot on disk, or None if there is none.
+
+        Cheap enough to poll: the manifest is only re-read when its mtime
+        changes.
+        """
+        try:
+            mtime_ns = self.manifest_path.stat().st_mtime_ns
+        except OSError:
+            self._version_mtime_ns = self._version = None
+            return None
+        if mtime_ns != self._version_mtime_ns:
+            try:
+                self._version = json.loads(self.manifest_path.read_text()).get("generated_at")
+            except (OSError, ValueError) as exc:
+                logger.warning("Could not read snapshot manifest version: %s", exc)
+                self._version = None
+            self._version_mtime_ns = mtime_ns
+        return self._version
+
     def should_use_snapshot(
         self,
         max_age_seconds: int = 10_368_000,  # ~120 days
@@ -228,7 +349,8 @@ class SnapshotLoader:
         force_reload: bool = False,
         max_age_seconds: int = 10_368_000,  # ~120 days
         min_account_diff: int = 100,
-        load_communities: bool = True
+        load_communities: bool = True,
+        backend: str = "csr",
     ) -> Optional[GraphBuildResult]:
         """Load graph from snapshot.
 
@@ -237,11 +359,16 @@ class SnapshotLoader:
             max_age_seconds: Maximum snapshot age before considering stale
             min_account_diff: Minimum new accounts to trigger regeneration
             load_communities: Load community assignments from analysis output
+            backend: "csr" for the compact read-only CSRGraph used by the API,
+                or "networkx" for a mutable nx.DiGraph
 
         Returns:
             GraphBuildResult or None if snapshot unavailable/stale
         """
-        if not force_reload and self._cached_graph:
+        if backend not in ("csr", "networkx"):
+            raise ValueError(f"Unknown graph backend: {backend!r}")
+
+        if not force_reload and self._cached_graph and self._cached_backend == backend:
             logger.debug("Returning cached graph from memory")
             return self._cached_graph
 
@@ -254,9 +381,9 @@ class SnapshotLoader:
         try:
             logger.info(f"Loading graph snapshot from {self.snapshot_dir}")
 
-            # Load Parquet files
-            nodes_df = pd.read_parquet(self.nodes_path)
-            edges_df = pd.read_parquet(self.edges_path)
+            # Load Parquet files (columnar — no per-row pandas objects)
+            nodes_table = pq.read_table(self.nodes_path)
+            edges_table = pq.read_table(self.edges_path)
 
             # Load community assignments if available
             communities = {}
@@ -271,60 +398,14 @@ class SnapshotLoader:
                     except Exception as e:
                         logger.warning(f"Failed to load community data: {e}")
 
-            logger.info(f"Loaded {len(nodes_df)} nodes and {len(edges_df)} edges from snapshot")
-
-            # Reconstruct NetworkX directed graph
-            directed = nx.DiGraph()
-
-            # Add nodes with attributes
-            for _, row in nodes_df.iterrows():
-                node_id = row["node_id"]
-                node_attrs = {
-                    "username": row.get("username"),
-                    "account_display_name": row.get("display_name"),
-                    "display_name": row.get("display_name"),
-                    "num_followers": row.get("num_followers"),
-                    "num_following": row.get("num_following"),
-                    "num_likes": row.get("num_likes"),
-                    "num_tweets": row.get("num_tweets"),
-                    "bio": row.get("bio"),
-                    "location": row.get("location"),
-                    "website": row.get("website"),
-                    "profile_image_url": row.get("profile_image_url"),
-                    "provenance": row.get("provenance", "archive"),
-                    "shadow": row.get("shadow", False),
-                    "fetched_at": row.get("fetched_at"),
-                }
-
-                # Add community assignment if available
-                if node_id in communities:
-                    node_attrs["community"] = communities[node_id]
-
-                # Filter out None and NaN (pandas uses float NaN for missing numerics,
-                # which is not None and serialises to invalid JSON "NaN").
-                node_attrs = {
-                    k: v for k, v in node_attrs.items()
-                    if v is not None and not (isinstance(v, float) and math.isnan(v))
-                }
-                directed.add_node(node_id, **node_attrs)
-
-            # Add edges with attributes
-            for _, row in edges_df.iterrows():
-                edge_attrs = {
-                    "provenance": row.get("provenance", "archive"),
-                    "shadow": row.get("shadow", False),
-                    "direction_label": row.get("direction_label"),
-                    "fetched_at": row.get("fetched_at"),
-                }
-                # Parse metadata JSON if present
-                if row.get("metadata"):
-                    try:
-                        edge_attrs["metadata"] = json.loads(row["metadata"])
-                    except (json.JSONDecodeError, TypeError) as exc:
-                        logger.warning("Malformed edge metadata for %s→%s: %s", row["source"], row["target"], exc)
+            logger.info(f"Loaded {nodes_table.num_rows} nodes and {edges_table.num_rows} edges from snapshot")
 
-                edge_attrs = {k: v for k, v in edge_attrs.items() if v is not None}
-                directed.add_edge(row["source"], row["target"], **edge_attrs)
+            if backend == "csr":
+                directed = _build_csr_graph(nodes_table, edges_table, communities)
+            else:
+                directed = nx.DiGraph()
+                directed.add_nodes_from(_iter_node_records(nodes_table, communities))
+                directed.add_edges_from(_iter_edge_records(edges_table))
 
             # Skip building the undirected copy at load time — it would duplicate ~300 MB
             # of NetworkX memory for a field nobody reads via GraphBuildResult.undirected.
@@ -333,6 +414,7 @@ class SnapshotLoader:
 
             # Cache in memory
             self._cached_graph = graph_result
+            self._cached_backend = backend
 
             logger.info(f"Snapshot loaded successfully: {directed.number_of_nodes()} nodes, {directed.number_of_edges()} edges")
             return graph_result
@@ -363,6 +445,7 @@ class SnapshotLoader:
     def clear_cache(self):
         """Clear in-memory cache."""
         self._cached_graph = None
+        self._cached_backend = None
         self._cached_manifest = None
         logger.info("Snapshot cache cleared")
 
@@ -3,33 +3,184 @@
 Consolidates the load_adjacency() function that was duplicated across
 propagate_community_labels.py, calibrate_tpot_threshold.py, and build_tpot_spectral.py.
 
-SECURITY NOTE: pickle is used intentionally here to load our own precomputed
-sparse matrices from data/adjacency_matrix_cache.pkl. This file is generated
-by cluster_routes.py from parquet data we control — never from untrusted sources.
+The cluster routes persist their adjacency as a memory-mapped CSR directory:
+
+    adjacency_matrix_cache[.<variant>].csr/
+        header.json     format version, shape, nnz, stats, source fingerprint
+        indptr.npy      CSR arrays, one .npy each so they can be
+        indices.npy     memory-mapped on load; every gunicorn worker then
+        data.npy        shares the same pages through the OS page cache
+
+SECURITY NOTE: pickle is still read for legacy adjacency_matrix_cache.pkl files.
+These are our own precomputed sparse matrices built from parquet data we
+control — never from untrusted sources.
 """
 from __future__ import annotations
 
+import errno
+import json
 import logging
+import os
 import pickle  # noqa: S403 — loading our own cached adjacency, not untrusted data
+import shutil
+import tempfile
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 import scipy.sparse as sp
 
 from src.config import DEFAULT_ADJACENCY_CACHE
 
 logger = logging.getLogger(__name__)
 
+MMAP_FORMAT = "csr-mmap"
+MMAP_FORMAT_VERSION = 1
+MMAP_SUFFIX = ".csr"
+_CSR_PARTS = ("indptr", "indices", "data")
+
+
+def mmap_cache_path(path: Path) -> Path:
+    """Memory-mapped cache directory for a (legacy) .pkl cache path."""
+    path = Path(path)
+    return path if path.suffix == MMAP_SUFFIX else path.with_suffix(MMAP_SUFFIX)
+
+
+def save_array_dir(
+    cache_dir: Path,
+    arrays: Dict[str, np.ndarray],
+    header_name: str,
+    header: Dict[str, object],
+) -> None:
+    """Write <name>.npy per array plus a JSON header, then swap the directory in.
+
+    Each call stages in its own mkdtemp directory next to cache_dir, so
+    concurrent writers never touch each other's files; the old copy is moved
+    aside under a unique name before the rename, and when two writers finish
+    together the later rename loses and its copy is discarded.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(dir=cache_dir.parent, prefix=cache_dir.name + "."))
+    try:
+        for name, array in arrays.items():
+            np.save(tmp_dir / f"{name}.npy", array)
+        (tmp_dir / header_name).write_text(json.dumps(header, indent=2, default=str))
+
+        if cache_dir.exists():
+            stale_dir = Path(tempfile.mkdtemp(dir=cache_dir.parent, prefix=cache_dir.name + ".old."))
+            try:
+                os.replace(cache_dir, stale_dir)
+            except FileNotFoundError:
+                pass
+            shutil.rmtree(stale_dir, ignore_errors=True)
+        try:
+            os.replace(tmp_dir, cache_dir)
+        except OSError as exc:
+            if exc.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                raise
+            logger.info("Cache directory %s was published by another writer", cache_dir)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def save_adjacency_mmap(
+    adjacency: sp.spmatrix,
+    cache_dir: Path,
+    *,
+    stats: Optional[Dict[str, object]] = None,
+    fingerprint: Optional[Dict[str, object]] = None,
+) -> None:
+    """Write adjacency as raw CSR arrays + header atomically (see save_array_dir)."""
+    adjacency = sp.csr_matrix(adjacency)
+    adjacency.sum_duplicates()
+    adjacency.sort_indices()
+
+    header = {
+        "format": MMAP_FORMAT,
+        "version": MMAP_FORMAT_VERSION,
+        "shape": list(adjacency.shape),
+        "nnz": int(adjacency.nnz),
+        "dtypes": {part: str(getattr(adjacency, part).dtype) for part in _CSR_PARTS},
+        "fingerprint": fingerprint,
+        "stats": stats or {},
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+    arrays = {part: getattr(adjacency, part) for part in _CSR_PARTS}
+    save_array_dir(cache_dir, arrays, "header.json", header)
+
+
+def load_adjacency_mmap(
+    cache_dir: Path,
+    fingerprint: Optional[Dict[str, object]] = None,
+    mmap: bool = True,
+) -> Optional[Tuple[sp.csr_matrix, Dict[str, object]]]:
+    """Load (adjacency, stats) from a CSR cache directory.
+
+    Returns None when the directory is missing, unreadable, of another format
+    version, or (if fingerprint is given) built from different source data.
+    With mmap=True the arrays are mapped copy-on-write, so loading does not
+    read the matrix and untouched pages stay shared between processes.
+    """
+    cache_dir = Path(cache_dir)
+    header_path = cache_dir / "header.json"
+    if not header_path.exists():
+        return None
+    try:
+        header = json.loads(header_path.read_text())
+    except (OSError, ValueError) as exc:
+        logger.warning("Unreadable adjacency cache header %s: %s", header_path, exc)
+        return None
+    if header.get("format") != MMAP_FORMAT or header.get("version") != MMAP_FORMAT_VERSION:
+        return None
+    if fingerprint is not None and header.get("fingerprint") != fingerprint:
+        logger.info("Adjacency cache %s is stale (source fingerprint changed)", cache_dir)
+        return None
+
+    mmap_mode = "c" if mmap else None
+    try:
+        parts = {
+            part: np.load(cache_dir / f"{part}.npy", mmap_mode=mmap_mode)
+            for part in _CSR_PARTS
+        }
+        adjacency = sp.csr_matrix(
+            (parts["data"], parts["indices"], parts["indptr"]),
+            shape=tuple(header["shape"]),
+            copy=False,
+        )
+    except (OSError, ValueError, KeyError) as exc:
+        logger.warning("Corrupt adjacency cache %s: %s", cache_dir, exc)
+        return None
+    if adjacency.nnz != header.get("nnz"):
+        logger.warning("Corrupt adjacency cache %s: nnz mismatch", cache_dir)
+        return None
+    return adjacency, dict(header.get("stats") or {})
+
 
 def load_adjacency_cache(path: Path | None = None) -> sp.csr_matrix:
     """Load the cached adjacency matrix (built by cluster_routes.py on startup).
 
+    Prefers the memory-mapped .csr directory next to path and falls back to
+    the legacy pickle.
+
     Args:
         path: Path to the adjacency cache. Defaults to data/adjacency_matrix_cache.pkl.
     """
     if path is None:
         path = DEFAULT_ADJACENCY_CACHE
+    path = Path(path)
+    loaded = load_adjacency_mmap(mmap_cache_path(path))
+    if loaded is not None:
+        return loaded[0]
     with open(path, "rb") as f:  # noqa: S301
         cached = pickle.load(f)  # noqa: S301
     if isinstance(cached, dict) and "adjacency" in cached:
         return cached["adjacency"].tocsr()
     return cached.tocsr()
+
+
+def adjacency_cache_exists(path: Path) -> bool:
+    """True if either the .csr directory or the legacy pickle is present."""
+    path = Path(path)
+    return (mmap_cache_path(path) / "header.json").exists() or path.exists()
@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 import json
-import pickle
 from pathlib import Path
 from typing import Dict
 
 import numpy as np
 import scipy.sparse as sp
 
+from src.data.adjacency import adjacency_cache_exists, load_adjacency_cache
+
 
 class SnapshotArtifacts:
     """Lazy loader for graph-side evaluation artifacts."""
@@ -57,10 +58,7 @@ class SnapshotArtifacts:
         if self._adjacency is not None:
             return self._adjacency
         path = self.snapshot_dir / "adjacency_matrix_cache.pkl"
-        if not path.exists():
+        if not adjacency_cache_exists(path):
             raise FileNotFoundError(f"Missing adjacency artifact: {path}")
-        with open(path, "rb") as handle:
-            cached = pickle.load(handle)
-        adjacency = cached["adjacency"] if isinstance(cached, dict) and "adjacency" in cached else cached
-        self._adjacency = adjacency.tocsr()
+        self._adjacency = load_adjacency_cache(path)
         return self._adjacency
@@ -0,0 +1,72 @@
+"""Lazily decoded JSON column values."""
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Mapping
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LazyJSONDict(Mapping):
+    """Read-only mapping over a JSON object string, decoded on first access.
+
+    Edge metadata is rarely read, so the snapshot loader and the shadow
+    graph injection keep the raw string and only pay for json.loads when
+    someone actually looks.
+    Malformed JSON is logged once and behaves as an empty mapping.
+    """
+
+    __slots__ = ("_raw", "_data", "_label")
+
+    def __init__(self, raw: str, label: str = ""):
+        self._raw = raw
+        self._data: Optional[dict] = None
+        self._label = label
+
+    def _load(self) -> dict:
+        if self._data is None:
+            try:
+                data = json.loads(self._raw)
+            except (json.JSONDecodeError, TypeError) as exc:
+                logger.warning("Malformed edge metadata for %s: %s", self._label, exc)
+                data = {}
+            self._data = data if isinstance(data, dict) else {"value": data}
+            self._raw = None
+        return self._data
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def to_dict(self) -> dict:
+        return dict(self._load())
+
+    def __repr__(self) -> str:
+        state = "unparsed" if self._data is None else repr(self._data)
+        return f"LazyJSONDict({state})"
+
+    def to_json(self) -> Optional[str]:
+        """JSON text for re-serialization, or None for an empty mapping.
+
+        An undecoded raw string is reused only when it cheaply looks like a
+        non-empty JSON object; anything else (malformed, ``{}``, non-object)
+        is decoded so the output matches what reads would have seen.
+        """
+        if self._raw is not None:
+            stripped = self._raw.strip() if isinstance(self._raw, str) else ""
+            if stripped.startswith("{") and stripped.endswith("}") and stripped[1:-1].strip():
+                return self._raw
+        data = self._load()
+        return json.dumps(data) if data else None
+
+
+def to_plain(value):
+    """value with any LazyJSONDict decoded to a plain dict, for json.dumps."""
+    return value.to_dict() if isinstance(value, LazyJSONDict) else value
@@ -1,6 +1,7 @@
 """Utilities to build graphs from Community Archive data."""
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Iterable, Optional
@@ -8,6 +9,7 @@ from typing import Iterable, Optional
 import networkx as nx
 import pandas as pd
 
+from src.data.lazy_json import LazyJSONDict
 from src.data.shadow_store import ShadowStore
 from src.performance_profiler import profile_phase, profile_operation
 
@@ -190,47 +192,60 @@ def _inject_shadow_data(graph: nx.DiGraph, store: ShadowStore) -> None:
     n_remapped_accounts = 0
     n_remapped_edges = 0
 
-    accounts = store.fetch_accounts()
-    for record in accounts:
-        raw_id = str(record["account_id"])
-        node_id = remap.get(raw_id, raw_id)
-        if node_id != raw_id:
-            n_remapped_accounts += 1
-        if graph.has_node(node_id):
-            graph.nodes[node_id].setdefault("provenance", "archive")
-            continue
-        graph.add_node(
-            node_id,
-            username=record.get("username"),
-            account_display_name=record.get("display_name"),
-            bio=record.get("bio"),
-            location=record.get("location"),
-            num_followers=record.get("followers_count"),
-            num_following=record.get("following_count"),
-            provenance=record.get("source_channel", "shadow"),
-            shadow=True,
-            shadow_scrape_stats=record.get("scrape_stats"),
-            fetched_at=record.get("fetched_at", now),
-        )
+    # Stream both tables in Arrow batches: only the graph's own attribute
+    # dicts are built, and edge metadata stays raw JSON until read.
+    for batch in store.iter_account_batches():
+        columns = batch.to_pydict()
+        for raw_id, username, display_name, bio, location, followers, following, channel, stats, fetched_at in zip(
+            columns["account_id"], columns["username"], columns["display_name"], columns["bio"],
+            columns["location"], columns["followers_count"], columns["following_count"],
+            columns["source_channel"], columns["scrape_stats"], columns["fetched_at"],
+        ):
+            raw_id = str(raw_id)
+            node_id = remap.get(raw_id, raw_id)
+            if node_id != raw_id:
+                n_remapped_accounts += 1
+            if graph.has_node(node_id):
+                graph.nodes[node_id].setdefault("provenance", "archive")
+                continue
+            graph.add_node(
+                node_id,
+                username=username,
+                account_display_name=display_name,
+                bio=bio,
+                location=location,
+                num_followers=followers,
+                num_following=following,
+                provenance=channel or "shadow",
+                shadow=True,
+                shadow_scrape_stats=_decode_json(stats),
+                fetched_at=fetched_at or now,
+            )
 
-    edges = store.fetch_edges()
-    for record in edges:
-        source = remap.get(str(record["source_id"]), str(record["source_id"]))
-        target = remap.get(str(record["target_id"]), str(record["target_id"]))
-        if source != str(record["source_id"]) or target != str(record["target_id"]):
-            n_remapped_edges += 1
-        if not graph.has_node(source):
-            graph.add_node(source, provenance="shadow", shadow=True)
-        if not graph.has_node(target):
-            graph.add_node(target, provenance="shadow", shadow=True)
-        attributes = {
-            "provenance": record.get("source_channel", "shadow"),
-            "direction_label": record.get("direction"),
-            "shadow": True,
-            "metadata": record.get("metadata"),
-            "fetched_at": record.get("fetched_at") or now,
-        }
-        graph.add_edge(source, target, **attributes)
+    for batch in store.iter_edge_batches():
+        columns = batch.to_pydict()
+        for raw_source, raw_target, direction, channel, metadata, fetched_at in zip(
+            columns["source_id"], columns["target_id"], columns["direction"],
+            columns["source_channel"], columns["metadata"], columns["fetched_at"],
+        ):
+            raw_source, raw_target = str(raw_source), str(raw_target)
+            source = remap.get(raw_source, raw_source)
+            target = remap.get(raw_target, raw_target)
+            if source != raw_source or target != raw_target:
+                n_remapped_edges += 1
+            if not graph.has_node(source):
+                graph.add_node(source, provenance="shadow", shadow=True)
+            if not graph.has_node(target):
+                graph.add_node(target, provenance="shadow", shadow=True)
+            graph.add_edge(
+                source,
+                target,
+                provenance=channel or "shadow",
+                direction_label=direction,
+                shadow=True,
+                metadata=LazyJSONDict(metadata, label=f"{source}→{target}") if metadata else None,
+                fetched_at=fetched_at or now,
+            )
 
     if n_remapped_accounts > 0 or n_remapped_edges > 0:
         import logging
@@ -240,6 +255,16 @@ def _inject_shadow_data(graph: nx.DiGraph, store: ShadowStore) -> None:
         )
 
 
+def _decode_json(raw: Optional[str]):
+    """Decoded JSON column value (None when empty or malformed)."""
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return None
+
+
 def _add_edges(
     graph: nx.DiGraph,
     *,
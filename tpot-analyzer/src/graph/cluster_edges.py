@@ -0,0 +1,188 @@
+"""Cluster-to-cluster edge aggregation through sparse indicator matrices.
+
+Every cluster view needs the same reduction: how many edges run between
+(and within) the clusters of a partition. With a node→cluster indicator
+matrix C (n_nodes × k, one 1 per assigned node) that is one sparse product
+
+    counts = Cᵀ A C
+
+whose cost scales with nnz(A) instead of clusters² × members. Off-diagonal
+entries are inter-cluster edge counts, the diagonal holds intra-cluster
+edges; densities divide those by the number of possible node pairs.
+
+Used by compute_cluster_edges (src/graph/clusters.py), compute_hierarchical_edges
+(hierarchy/layout.py), the view-session edge state (hierarchy/session.py) and
+compute_edge_separation_fast (hierarchy/expansion_scoring.py).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+
+def as_csr(adjacency) -> sp.csr_matrix:
+    """CSR view of a sparse or dense adjacency (no copy for CSR input)."""
+    if sp.issparse(adjacency):
+        return adjacency.tocsr()
+    return sp.csr_matrix(np.asarray(adjacency, dtype=np.float64))
+
+
+def cluster_indicator(labels: np.ndarray, n_clusters: int) -> sp.csr_matrix:
+    """Sparse (n_nodes × n_clusters) membership matrix; labels < 0 are unassigned."""
+    labels = np.asarray(labels, dtype=np.int64)
+    assigned = np.flatnonzero(labels >= 0)
+    return sp.csr_matrix(
+        (np.ones(len(assigned)), (assigned, labels[assigned])),
+        shape=(len(labels), n_clusters),
+    )
+
+
+def community_edge_factors(
+    adjacency: sp.csr_matrix,
+    communities: np.ndarray,
+    weight: float,
+) -> sp.csr_matrix:
+    """Louvain fusion weights on adjacency's sparsity pattern.
+
+    Each stored edge gets 1 + weight when both endpoints share a community
+    (community -1 means unlabeled and never matches) and max(0, 1 - weight)
+    otherwise. Edge values are ignored, as in the per-edge counting loops
+    this replaces.
+    """
+    coo = adjacency.tocoo()
+    same = (communities[coo.row] == communities[coo.col]) & (communities[coo.row] != -1)
+    factors = np.where(same, 1.0 + weight, max(0.0, 1.0 - weight))
+    return sp.csr_matrix((factors, (coo.row, coo.col)), shape=adjacency.shape)
+
+
+@dataclass
+class ClusterConnectivity:
+    """Aggregated edges between the clusters of one partition.
+
+    counts[a, b] is the number of stored edges (i, j) with i in a and j in b;
+    weights is the same product over an edge-weight matrix (equal to counts
+    when no weights were given). Both are directed; see undirected_pairs.
+    """
+
+    counts: sp.csr_matrix
+    weights: sp.csr_matrix
+    sizes: np.ndarray
+
+    @property
+    def n_clusters(self) -> int:
+        return len(self.sizes)
+
+    @property
+    def intra_edges(self) -> int:
+        return int(round(self.counts.diagonal().sum()))
+
+    @property
+    def inter_edges(self) -> int:
+        return int(round(self.counts.sum())) - self.intra_edges
+
+    @property
+    def separation(self) -> float:
+        """Fraction of edges that stay inside a cluster (0.5 when there are none)."""
+        total = self.intra_edges + self.inter_edges
+        return self.intra_edges / total if total else 0.5
+
+    def intra_density(self) -> np.ndarray:
+        """Per-cluster edges over possible ordered member pairs."""
+        possible = self.sizes * (self.sizes - 1)
+        intra = self.counts.diagonal()
+        return np.divide(intra, possible, out=np.zeros(len(intra)), where=possible > 0)
+
+    def inter_density(self) -> sp.csr_matrix:
+        """Off-diagonal counts over size_a * size_b."""
+        off = sp.coo_matrix(self.counts - sp.diags(self.counts.diagonal()))
+        off.eliminate_zeros()
+        product = self.sizes[off.row] * self.sizes[off.col]
+        data = np.divide(off.data, product, out=np.zeros(len(off.data)), where=product > 0)
+        return sp.csr_matrix((data, (off.row, off.col)), shape=self.counts.shape)
+
+    def undirected_pairs(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(a, b, weight, count) for cluster pairs a < b joined in either direction."""
+        counts = sp.triu(self.counts + self.counts.T, k=1).tocsr()
+        weights = (self.weights + self.weights.T).tocsr()
+        coo = counts.tocoo()
+        # A pair exists if any edge joins it, even when fusion weighted it to 0.
+        pair_weights = np.asarray(weights[coo.row, coo.col]).ravel()
+        return coo.row, coo.col, pair_weights, coo.data
+
+
+def cluster_connectivity(
+    adjacency,
+    labels: np.ndarray,
+    n_clusters: Optional[int] = None,
+    *,
+    edge_weights: Optional[sp.spmatrix] = None,
+    upper: bool = False,
+) -> ClusterConnectivity:
+    """Cᵀ A C for a partition given as per-node cluster indices.
+
+    Args:
+        adjacency: (n × n) sparse or dense adjacency; every stored entry
+            counts as one edge.
+        labels: Cluster index per node, -1 for nodes outside every cluster.
+            Unassigned rows are sliced away before the product.
+        n_clusters: Number of clusters (defaults to labels.max() + 1).
+        edge_weights: Optional (n × n) matrix on the same pattern whose
+            aggregate is returned as weights (e.g. community_edge_factors).
+        upper: Count each stored entry (i, j) only when i < j, i.e. every
+            undirected edge of a symmetric adjacency once.
+    """
+    labels = np.asarray(labels, dtype=np.int64)
+    if n_clusters is None:
+        n_clusters = int(labels.max()) + 1 if len(labels) else 0
+    if adjacency.shape[0] != len(labels):
+        raise ValueError(
+            f"labels has {len(labels)} entries but adjacency has {adjacency.shape[0]} rows"
+        )
+
+    pattern = as_csr(adjacency)
+    nodes = np.flatnonzero(labels >= 0)
+    if len(nodes) < len(labels):
+        # Ascending node order keeps i < j meaningful after slicing.
+        pattern = pattern[nodes][:, nodes]
+        if edge_weights is not None:
+            edge_weights = as_csr(edge_weights)[nodes][:, nodes]
+        labels = labels[nodes]
+    if upper:
+        pattern = sp.triu(pattern, k=1)
+        if edge_weights is not None:
+            edge_weights = sp.triu(edge_weights, k=1)
+    pattern = _ones_like(pattern)
+
+    indicator = cluster_indicator(labels, n_clusters)
+    indicator_t = indicator.T.tocsr()
+    counts = (indicator_t @ pattern @ indicator).tocsr()
+    if edge_weights is None:
+        weights = counts
+    else:
+        weights = (indicator_t @ as_csr(edge_weights) @ indicator).tocsr()
+    sizes = np.bincount(labels[labels >= 0], minlength=n_clusters)
+    return ClusterConnectivity(counts=counts, weights=weights, sizes=sizes)
+
+
+def _ones_like(matrix: sp.spmatrix) -> sp.csr_matrix:
+    """The sparsity pattern of matrix with every stored entry set to 1."""
+    if sp.isspmatrix_csr(matrix):
+        return sp.csr_matrix((np.ones(matrix.nnz), matrix.indices, matrix.indptr), shape=matrix.shape)
+    coo = sp.coo_matrix(matrix)
+    return sp.csr_matrix((np.ones(coo.nnz), (coo.row, coo.col)), shape=coo.shape)
+
+
+def labels_from_members(
+    members: Sequence[Sequence[str]],
+    node_id_to_idx: Dict[str, int],
+    n_nodes: int,
+) -> np.ndarray:
+    """Per-node cluster index for clusters given as member-id lists (last one wins)."""
+    labels = np.full(n_nodes, -1, dtype=np.int64)
+    for cluster_idx, ids in enumerate(members):
+        idx = [node_id_to_idx[nid] for nid in ids if nid in node_id_to_idx]
+        labels[idx] = cluster_idx
+    return labels
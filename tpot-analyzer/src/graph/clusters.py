@@ -10,6 +10,8 @@ from typing import Dict, List, Optional
 import numpy as np
 from scipy.cluster.hierarchy import fcluster
 
+from src.graph.cluster_edges import cluster_connectivity
+
 logger = logging.getLogger(__name__)
 
 MIN_CLUSTER_SIZE = 4
@@ -92,9 +94,7 @@ def compute_cluster_edges(
     min_weight: float = 0.0,
 ) -> List[ClusterEdge]:
     """Compute weighted edges between clusters using membership-weighted counts."""
-    unique_labels = np.unique(cluster_labels)
-    n_clusters = len(unique_labels)
-    label_to_idx = {label: i for i, label in enumerate(unique_labels)}
+    unique_labels, label_idx = np.unique(cluster_labels, return_inverse=True)
 
     # Weighted edges: soft.T @ A @ soft
     if hasattr(adjacency, "dot"):
@@ -106,16 +106,7 @@ def compute_cluster_edges(
         weighted = soft.T @ (A @ soft)
 
     # Raw counts from hard labels
-    raw_counts = np.zeros((n_clusters, n_clusters), dtype=int)
-    if hasattr(adjacency, "tocoo"):
-        coo = adjacency.tocoo()
-        rows, cols = coo.row, coo.col
-    else:
-        rows, cols = np.nonzero(adjacency)
-    for i, j in zip(rows, cols):
-        ci = label_to_idx[cluster_labels[i]]
-        cj = label_to_idx[cluster_labels[j]]
-        raw_counts[ci, cj] += 1
+    raw_counts = cluster_connectivity(adjacency, label_idx, len(unique_labels)).counts.toarray()
 
     edges: List[ClusterEdge] = []
     for i, label_i in enumerate(unique_labels):
@@ -377,9 +368,7 @@ def _compute_cluster_edges_with_fusion(
     min_weight: float = 0.0,
 ) -> List[ClusterEdge]:
     """Compute cluster edges with optional Louvain fusion."""
-    unique_labels = np.unique(cluster_labels)
-    n_clusters = len(unique_labels)
-    label_to_idx = {label: i for i, label in enumerate(unique_labels)}
+    unique_labels, label_idx = np.unique(cluster_labels, return_inverse=True)
 
     # Build modified adjacency for weighted edges
     if hasattr(adjacency, "tocoo"):
@@ -387,10 +376,8 @@ def _compute_cluster_edges_with_fusion(
         factors = _louvain_factors(louvain_labels, louvain_weight, coo.row, coo.col)
         data = coo.data if factors is None else coo.data * factors
         adj_mod = adjacency.__class__((data, (coo.row, coo.col)), shape=adjacency.shape).tocsr()
-        rows, cols = coo.row, coo.col
     else:
         A = np.asarray(adjacency, dtype=float)
-        rows, cols = np.nonzero(A)
         if louvain_labels is not None and louvain_weight > 0:
             same = louvain_labels[:, None] == louvain_labels[None, :]
             factors = np.where(same, 1.0 + louvain_weight, np.maximum(0.0, 1.0 - louvain_weight))
@@ -402,11 +389,7 @@ def _compute_cluster_edges_with_fusion(
     weighted = soft.T @ (adj_mod @ soft)
 
     # Raw counts from hard labels (unmodified adjacency)
-    raw_counts = np.zeros((n_clusters, n_clusters), dtype=int)
-    for i, j in zip(rows, cols):
-        ci = label_to_idx[cluster_labels[i]]
-        cj = label_to_idx[cluster_labels[j]]
-        raw_counts[ci, cj] += 1
+    raw_counts = cluster_connectivity(adjacency, label_idx, len(unique_labels)).counts.toarray()
 
     edges: List[ClusterEdge] = []
     for i, label_i in enumerate(unique_labels):
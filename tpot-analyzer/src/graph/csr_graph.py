@@ -0,0 +1,371 @@
+"""Compact read-only directed graph for the API serving path.
+
+The snapshot loader used to materialise the whole archive as an nx.DiGraph,
+which costs several hundred bytes per edge in nested dicts. CSRGraph keeps
+the same data as:
+
+- node IDs interned once (object array + id -> index dict)
+- out-edges as a CSR matrix and in-edges as its transpose (CSR of A^T), so
+  successors/predecessors are contiguous index slices
+- node and edge attributes as Arrow columns aligned with the node index and
+  the CSR edge order
+
+It implements the slice of the NetworkX DiGraph API that discovery and
+scoring use (nodes/edges views, successors, predecessors, degrees,
+has_edge, subgraph). subgraph() returns a real nx.DiGraph, so code that
+needs full NetworkX algorithms runs them on the small extracted piece.
+
+Attribute dicts returned by ``graph.nodes[n]`` are built on access; mutating
+them does not change the graph.
+"""
+from __future__ import annotations
+
+import math
+from itertools import repeat
+from typing import Callable, Iterable, Iterator, Optional
+
+import networkx as nx
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import scipy.sparse as sp
+
+
+def _present(value) -> bool:
+    return value is not None and not (isinstance(value, float) and math.isnan(value))
+
+
+def _combine(column) -> pa.Array:
+    return column.combine_chunks() if isinstance(column, pa.ChunkedArray) else column
+
+
+class _NodeView:
+    """Minimal stand-in for nx.classes.reportviews.NodeView."""
+
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph: CSRGraph):
+        self._graph = graph
+
+    def __call__(self, data: bool = False):
+        if not data:
+            return iter(self._graph._node_ids.tolist())
+        return self._graph._iter_node_data()
+
+    def __getitem__(self, node) -> dict:
+        return self._graph._node_attrs(self._graph._require(node))
+
+    def __iter__(self) -> Iterator:
+        return iter(self._graph._node_ids.tolist())
+
+    def __len__(self) -> int:
+        return self._graph.n
+
+    def __contains__(self, node) -> bool:
+        return node in self._graph._index
+
+
+class CSRGraph:
+    """Read-only directed graph over CSR/CSC index arrays.
+
+    Usage:
+        graph = CSRGraph.from_arrow(nodes_table, edges_table)
+        graph.successors("123")           # list of node IDs
+        graph.nodes["123"]["username"]    # attributes from Arrow columns
+        sub = graph.subgraph(ids)         # nx.DiGraph for further analysis
+    """
+
+    def __init__(
+        self,
+        node_ids: list,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        node_columns: Optional[dict[str, pa.Array]] = None,
+        edge_columns: Optional[dict[str, pa.Array]] = None,
+        edge_decoders: Optional[dict[str, Callable]] = None,
+    ):
+        """Build from node IDs and edge endpoint indices.
+
+        Args:
+            node_ids: Node IDs; position i is node index i. Must be unique.
+            sources, targets: Edge endpoint indices into node_ids.
+            node_columns: Attribute name -> array aligned with node_ids.
+            edge_columns: Attribute name -> array aligned with sources/targets.
+            edge_decoders: Attribute name -> callable applied to the raw
+                value when an edge's data is read (e.g. lazy JSON).
+
+        Duplicate (source, target) pairs keep the last occurrence, matching
+        repeated nx.DiGraph.add_edge calls.
+        """
+        self._node_ids = np.empty(len(node_ids), dtype=object)
+        self._node_ids[:] = list(node_ids)
+        self._index = {nid: i for i, nid in enumerate(self._node_ids.tolist())}
+        if len(self._index) != len(node_ids):
+            raise ValueError("node_ids must be unique")
+        n = len(node_ids)
+
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        if sources.shape != targets.shape:
+            raise ValueError("sources and targets must have the same length")
+
+        # Row-major edge order; among duplicates keep the last-inserted one.
+        order = np.lexsort((-np.arange(len(sources)), targets, sources))
+        s, t = sources[order], targets[order]
+        keep = np.ones(len(order), dtype=bool)
+        keep[1:] = (s[1:] != s[:-1]) | (t[1:] != t[:-1])
+        order, s, t = order[keep], s[keep], t[keep]
+
+        self._out = sp.csr_matrix(
+            (np.ones(len(s), dtype=bool), t.astype(np.int32), np.searchsorted(s, np.arange(n + 1))),
+            shape=(n, n),
+        )
+        self._in = self._out.T.tocsr()
+        self._in.sort_indices()
+
+        self._node_columns = {k: _combine(v) for k, v in (node_columns or {}).items()}
+        take = pa.array(order)
+        self._edge_columns = {k: _combine(v).take(take) for k, v in (edge_columns or {}).items()}
+        self._edge_decoders = dict(edge_decoders or {})
+        self.nodes = _NodeView(self)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_arrow(
+        cls,
+        nodes: pa.Table,
+        edges: pa.Table,
+        node_attr_columns: Optional[dict[str, str]] = None,
+        edge_attr_columns: Iterable[str] = (),
+        edge_decoders: Optional[dict[str, Callable]] = None,
+        id_column: str = "node_id",
+    ) -> CSRGraph:
+        """Build from snapshot-style node/edge tables.
+
+        node_attr_columns maps attribute name -> column in ``nodes`` (several
+        attributes may share a column). Edge endpoints that are missing from
+        the node table become attribute-less nodes, as with add_edges_from.
+        """
+        edges = edges.filter(pc.and_(pc.is_valid(edges.column("source")), pc.is_valid(edges.column("target"))))
+        node_ids = _combine(nodes.column(id_column)).cast(pa.string())
+        src = _combine(edges.column("source")).cast(pa.string())
+        dst = _combine(edges.column("target")).cast(pa.string())
+
+        extra = pc.unique(pa.concat_arrays([src, dst]))
+        extra = extra.filter(pc.invert(pc.is_in(extra, value_set=node_ids)))
+        all_ids = pa.concat_arrays([node_ids, extra])
+
+        sources = pc.index_in(src, value_set=all_ids).to_numpy(zero_copy_only=False)
+        targets = pc.index_in(dst, value_set=all_ids).to_numpy(zero_copy_only=False)
+
+        pad = len(extra)
+        node_columns = {}
+        for attr, col in (node_attr_columns or {}).items():
+            if col not in nodes.column_names:
+                continue
+            values = _combine(nodes.column(col))
+            if pad:
+                values = pa.concat_arrays([values, pa.nulls(pad, type=values.type)])
+            node_columns[attr] = values
+        edge_columns = {c: edges.column(c) for c in edge_attr_columns if c in edges.column_names}
+
+        return cls(all_ids.to_pylist(), sources, targets, node_columns, edge_columns, edge_decoders)
+
+    @classmethod
+    def from_networkx(cls, graph: nx.DiGraph) -> CSRGraph:
+        """Convert a DiGraph (node attributes are kept; edge attributes are not)."""
+        node_ids = list(graph.nodes())
+        index = {nid: i for i, nid in enumerate(node_ids)}
+        edges = np.array([(index[u], index[v]) for u, v in graph.edges()], dtype=np.int64).reshape(-1, 2)
+        attrs = sorted({k for _, data in graph.nodes(data=True) for k in data})
+        node_columns = {
+            k: pa.array([data.get(k) for _, data in graph.nodes(data=True)], from_pandas=True)
+            for k in attrs
+        }
+        return cls(node_ids, edges[:, 0], edges[:, 1], node_columns)
+
+    def with_node_column(self, name: str, values: dict) -> CSRGraph:
+        """Attach a node attribute from an id -> value mapping (in place)."""
+        self._node_columns[name] = pa.array([values.get(nid) for nid in self._node_ids.tolist()])
+        return self
+
+    # ------------------------------------------------------------------
+    # NetworkX-compatible queries
+    # ------------------------------------------------------------------
+
+    @property
+    def n(self) -> int:
+        return len(self._node_ids)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __iter__(self) -> Iterator:
+        return iter(self._node_ids.tolist())
+
+    def __contains__(self, node) -> bool:
+        return node in self._index
+
+    def has_node(self, node) -> bool:
+        return node in self._index
+
+    def number_of_nodes(self) -> int:
+        return self.n
+
+    def number_of_edges(self) -> int:
+        return int(self._out.nnz)
+
+    def is_directed(self) -> bool:
+        return True
+
+    def successors(self, node) -> list:
+        i = self._require(node)
+        return self._node_ids[self._out.indices[self._out.indptr[i]:self._out.indptr[i + 1]]].tolist()
+
+    def predecessors(self, node) -> list:
+        i = self._require(node)
+        return self._node_ids[self._in.indices[self._in.indptr[i]:self._in.indptr[i + 1]]].tolist()
+
+    neighbors = successors
+
+    def out_degree(self, node=None):
+        degrees = np.diff(self._out.indptr)
+        return int(degrees[self._require(node)]) if node is not None else self._degree_pairs(degrees)
+
+    def in_degree(self, node=None):
+        degrees = np.diff(self._in.indptr)
+        return int(degrees[self._require(node)]) if node is not None else self._degree_pairs(degrees)
+
+    def has_edge(self, u, v) -> bool:
+        return self._edge_position(u, v) is not None
+
+    def get_edge_data(self, u, v, default=None):
+        pos = self._edge_position(u, v)
+        return default if pos is None else self._edge_attrs(pos)
+
+    def edges(self, data: bool = False) -> Iterator:
+        rows, cols = self.edge_arrays()
+        ids = self._node_ids
+        for pos, (i, j) in enumerate(zip(rows.tolist(), cols.tolist())):
+            yield (ids[i], ids[j], self._edge_attrs(pos)) if data else (ids[i], ids[j])
+
+    def subgraph(self, nodes: Iterable) -> nx.DiGraph:
+        """Induced subgraph as a standalone nx.DiGraph (node attributes only)."""
+        idx = np.array(sorted({self._index[n] for n in nodes if n in self._index}), dtype=np.int64)
+        sub = nx.DiGraph()
+        sub.add_nodes_from((self._node_ids[i], self._node_attrs(i)) for i in idx.tolist())
+        if len(idx):
+            block = self._out[idx][:, idx].tocoo()
+            ids = self._node_ids[idx]
+            sub.add_edges_from(zip(ids[block.row].tolist(), ids[block.col].tolist()))
+        return sub
+
+    def to_scipy(self) -> sp.csr_matrix:
+        """Unweighted adjacency (row = source) in node-index order."""
+        return self._out.astype(np.float64)
+
+    def pagerank(
+        self,
+        alpha: float = 0.85,
+        personalization: Optional[dict] = None,
+        max_iter: int = 100,
+        tol: float = 1.0e-6,
+    ) -> dict:
+        """Unweighted PageRank with nx.pagerank's semantics.
+
+        Dangling mass is redistributed by the personalization vector and
+        convergence uses the same L1 test (err < n * tol). Raises
+        nx.PowerIterationFailedConvergence like NetworkX.
+        """
+        n = self.n
+        if n == 0:
+            return {}
+        if personalization:
+            p = np.array([personalization.get(nid, 0.0) for nid in self._node_ids.tolist()], dtype=np.float64)
+            if p.sum() <= 0:
+                raise ZeroDivisionError("personalization vector sums to zero")
+            p /= p.sum()
+        else:
+            p = np.full(n, 1.0 / n)
+
+        out_deg = np.diff(self._out.indptr).astype(np.float64)
+        dangling = out_deg == 0
+        inv_deg = np.divide(1.0, out_deg, out=np.zeros(n), where=~dangling)
+        transpose = self._in.astype(np.float64)
+
+        x = np.full(n, 1.0 / n)
+        for _ in range(max_iter):
+            last = x
+            x = alpha * (transpose @ (last * inv_deg) + last[dangling].sum() * p) + (1 - alpha) * p
+            if np.abs(x - last).sum() < n * tol:
+                return dict(zip(self._node_ids.tolist(), x.tolist()))
+        raise nx.PowerIterationFailedConvergence(max_iter)
+
+    @property
+    def node_ids(self) -> list:
+        return self._node_ids.tolist()
+
+    @property
+    def node_attribute_names(self) -> list[str]:
+        return list(self._node_columns)
+
+    def node_column(self, name: str) -> Optional[pa.Array]:
+        """Raw Arrow column for a node attribute (None if absent)."""
+        return self._node_columns.get(name)
+
+    def edge_column(self, name: str) -> Optional[pa.Array]:
+        """Raw Arrow column for an edge attribute, in edge_arrays() order."""
+        return self._edge_columns.get(name)
+
+    def edge_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """(sources, targets) node indices of every edge, sorted by source."""
+        rows = np.repeat(np.arange(self.n, dtype=np.int64), np.diff(self._out.indptr))
+        return rows, self._out.indices.astype(np.int64)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _require(self, node) -> int:
+        try:
+            return self._index[node]
+        except KeyError:
+            raise nx.NetworkXError(f"The node {node} is not in the graph.") from None
+
+    def _degree_pairs(self, degrees: np.ndarray) -> Iterator:
+        return zip(self._node_ids.tolist(), degrees.tolist())
+
+    def _edge_position(self, u, v) -> Optional[int]:
+        i, j = self._index.get(u), self._index.get(v)
+        if i is None or j is None:
+            return None
+        start, end = self._out.indptr[i], self._out.indptr[i + 1]
+        k = start + int(np.searchsorted(self._out.indices[start:end], j))
+        return k if k < end and self._out.indices[k] == j else None
+
+    def _node_attrs(self, i: int) -> dict:
+        attrs = {}
+        for name, col in self._node_columns.items():
+            value = col[i].as_py()
+            if _present(value):
+                attrs[name] = value
+        return attrs
+
+    def _iter_node_data(self) -> Iterator[tuple]:
+        names = list(self._node_columns)
+        columns = [col.to_pylist() for col in self._node_columns.values()]
+        for nid, values in zip(self._node_ids.tolist(), zip(*columns) if columns else repeat(())):
+            yield nid, {k: v for k, v in zip(names, values) if _present(v)}
+
+    def _edge_attrs(self, pos: int) -> dict:
+        attrs = {}
+        for name, col in self._edge_columns.items():
+            value = col[pos].as_py()
+            decode = self._edge_decoders.get(name)
+            if value is None or (decode and not value):
+                continue
+            attrs[name] = decode(value) if decode else value
+        return attrs
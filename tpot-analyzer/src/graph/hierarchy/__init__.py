@@ -5,15 +5,26 @@ from src.graph.hierarchy.models import (
     HierarchicalViewData,
 )
 from src.graph.hierarchy.builder import (
+    BuildCancelled,
     build_hierarchical_view,
     get_expand_preview,
     get_collapse_preview,
 )
+from src.graph.hierarchy.session import (
+    ClusterAggregate,
+    ViewSession,
+    ViewSessionStore,
+    resolve_session,
+)
 from src.graph.hierarchy.local_expand import (
     expand_cluster_locally,
     should_use_local_expansion,
     LocalExpansionResult,
+    LocalExpansionStore,
+    configure_local_expansion_store,
+    get_local_expansion_stats,
 )
+from src.graph.hierarchy.local_subgraph import LocalSubgraph
 from src.graph.hierarchy.expansion_strategy import (
     ExpansionStrategy,
     ExpansionDecision,
@@ -37,8 +48,11 @@ from src.graph.hierarchy.expansion_scoring import (
 )
 from src.graph.hierarchy.expansion_cache import (
     ExpansionCache,
+    ExpansionDiskCache,
     CachedExpansion,
     ExpansionPrecomputer,
+    configure_expansion_cache,
+    expansion_key,
     get_expansion_cache,
     reset_expansion_cache,
     compute_and_cache_expansion,
@@ -2,18 +2,18 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from typing import Dict, List, Optional, Set, Tuple
 
 import numpy as np
-from scipy.cluster.hierarchy import fcluster
 
 from src.graph.hierarchy.models import (
     HierarchicalCluster,
     HierarchicalViewData,
 )
+from src.graph.hierarchy.session import ClusterAggregate, ViewSession, resolve_session
 from src.graph.hierarchy.traversal import (
-    find_cluster_leaders,
     get_children,
     get_dendrogram_id,
     get_node_idx,
@@ -23,10 +23,7 @@ from src.graph.hierarchy.traversal import (
     subtree_size,
 )
 from src.graph.hierarchy.focus import reveal_leaf_in_visible_set
-from src.graph.hierarchy.layout import (
-    compute_hierarchical_edges,
-    compute_positions,
-)
+from src.graph.hierarchy.layout import compute_positions
 from src.graph.hierarchy.local_expand import (
     expand_cluster_locally,
     should_use_local_expansion,
@@ -39,6 +36,15 @@ from src.graph.hierarchy.expansion_cache import (
 logger = logging.getLogger(__name__)
 
 
+class BuildCancelled(Exception):
+    """Raised when a view build's cancel_event is set before it finishes."""
+
+
+def _check_cancelled(cancel_event: Optional[threading.Event], stage: str) -> None:
+    if cancel_event is not None and cancel_event.is_set():
+        raise BuildCancelled(f"view build cancelled during {stage}")
+
+
 def build_hierarchical_view(
     linkage_matrix: np.ndarray,
     micro_labels: np.ndarray,  # (n_nodes,) micro-cluster assignment for each node
@@ -56,6 +62,8 @@ def build_hierarchical_view(
     louvain_communities: Optional[Dict[str, int]] = None,
     louvain_weight: float = 0.0,
     expand_depth: float = 0.5,  # 0.0 = conservative (size^0.4), 1.0 = aggressive (size^0.7)
+    session: Optional[ViewSession] = None,
+    cancel_event: Optional[threading.Event] = None,
 ) -> HierarchicalViewData:
     """Build hierarchical cluster view with expand/collapse support.
     
@@ -75,6 +83,12 @@ def build_hierarchical_view(
         louvain_communities: Optional dict mapping node_id -> Louvain community ID
         louvain_weight: Weight for Louvain fusion (0.0 = pure spectral, 1.0 = heavily favor Louvain)
         expand_depth: Controls expansion aggressiveness (0.0 = size^0.4, 1.0 = size^0.7)
+        session: ViewSession from a previous build of this view. Its base cut,
+            cluster aggregates and edge counts are reused, so only clusters
+            that became visible since are recomputed. Ignored if it was built
+            for different inputs; a throwaway session is used when None.
+        cancel_event: Checked between expansions and build steps; once set,
+            BuildCancelled is raised so a superseded build stops early.
     """
     expanded_ids = expanded_ids or set()
     collapsed_ids = collapsed_ids or set()
@@ -89,6 +103,10 @@ def build_hierarchical_view(
             % (expected_rows, n_micro, linkage_matrix.shape[0], n_leaves_in_linkage)
         )
     t_start = time.time()
+    session = resolve_session(
+        session, linkage_matrix, micro_labels, micro_centroids, node_ids, adjacency, node_metadata, ego_node_id
+    )
+    session.builds += 1
     
     logger.info(
         "Building hierarchical view: %d micro-clusters, base_granularity=%d, expanded=%s",
@@ -97,16 +115,14 @@ def build_hierarchical_view(
     
     # Step 1: Get base cut
     base_granularity = min(base_granularity, n_micro, budget)
+    # Step 2: Find dendrogram nodes for each base cluster (cached per session)
     t0 = time.time()
-    base_labels = fcluster(linkage_matrix, t=base_granularity, criterion="maxclust")
+    base_leaders = session.base_cut(base_granularity)
     t_fcluster_ms = int((time.time() - t0) * 1000)
     logger.info("hierarchy timing: fcluster=%dms granularity=%d", t_fcluster_ms, base_granularity)
     
-    # Step 2: Find dendrogram nodes for each base cluster
-    label_to_leader = find_cluster_leaders(linkage_matrix, base_labels, n_micro)
-    
     # Step 3: Build visible set by starting with base clusters, then expanding
-    visible_nodes: Set[int] = set(label_to_leader.values())
+    visible_nodes: Set[int] = base_leaders
     subtree_cache: Dict[int, int] = {}
     
     logger.info(
@@ -138,7 +154,7 @@ def build_hierarchical_view(
             logger.warning("Failed to apply focus leaf %s: %s", focus_leaf_id, exc)
     
     # Build node_id_to_idx early for local expansion
-    node_id_to_idx = {str(nid): i for i, nid in enumerate(node_ids)}
+    node_id_to_idx = session.node_id_to_idx
 
     # Track locally-expanded clusters (their sub-clusters are stored separately)
     # Maps original exp_id -> list of LocalExpansionResult sub-cluster node lists
@@ -152,16 +168,13 @@ def build_hierarchical_view(
     # Maps local_cluster_id -> member_node_ids
     pending_local_expansions: Dict[str, List[str]] = {}
 
-    # Build micro_to_nodes once here; reused inside the expansion loop and in
-    # Step 4 below. Previously this was rebuilt O(expanded_ids) + 1 times.
-    micro_to_nodes: Dict[int, List[int]] = {}
-    for node_i, micro_i in enumerate(micro_labels):
-        if micro_i not in micro_to_nodes:
-            micro_to_nodes[micro_i] = []
-        micro_to_nodes[micro_i].append(node_i)
+    # micro_to_nodes is built once per session; reused inside the expansion
+    # loop and in Step 4 below.
+    micro_to_nodes = session.micro_to_nodes
 
     t_expansion_phase = time.time()
     for exp_id in expanded_ids:
+        _check_cancelled(cancel_event, "expansion")
         t_exp_start = time.time()
 
         # Check if this is a local cluster ID (e.g., "d_179_local_0")
@@ -303,58 +316,29 @@ def build_hierarchical_view(
     logger.info("Visible nodes after collapse: %d", len(visible_nodes))
 
     # Step 4: Build cluster info for each visible node
+    _check_cancelled(cancel_event, "cluster info")
     t_cluster_info = time.time()
     # micro_to_nodes was built once before the expansion loop above; reused here.
     
-    # Find ego's micro-cluster
-    ego_micro = None
-    if ego_node_id is not None:
-        ego_indices = np.where(node_ids == ego_node_id)[0]
-        if len(ego_indices):
-            ego_micro = micro_labels[ego_indices[0]]
-    
     # node_id_to_idx already created above for local expansion
-    in_degrees = None
-    if adjacency is not None:
-        try:
-            in_degrees = np.array(adjacency.sum(axis=0)).ravel()
-        except Exception:
-            in_degrees = None
+    in_degrees = session.in_degrees
     
     clusters: List[HierarchicalCluster] = []
     user_labels = label_store.get_all_labels() if label_store else {}
     
     for dend_node in sorted(visible_nodes):
-        # Get all micro-cluster leaves under this dendrogram node
-        micro_leaves = get_subtree_leaves(linkage_matrix, dend_node, n_micro)
-        
-        # Get all original nodes in these micro-clusters
-        member_node_indices = []
-        for micro_idx in micro_leaves:
-            member_node_indices.extend(micro_to_nodes.get(micro_idx, []))
-        member_node_ids_list = node_ids[member_node_indices].tolist()
-        
-        # Compute centroid from micro-cluster centroids
-        if micro_leaves:
-            centroid = micro_centroids[micro_leaves].mean(axis=0)
-        else:
-            centroid = np.zeros(micro_centroids.shape[1])
+        aggregate = session.get_aggregate(dend_node)
+        if aggregate is None:
+            aggregate = _aggregate_dendrogram_node(
+                session, dend_node, in_degrees, micro_to_nodes, node_id_to_idx,
+            )
+            session.put_aggregate(dend_node, aggregate)
+        reps = aggregate.representative_handles
         
         # Get parent and children
         parent_idx = get_parent(linkage_matrix, dend_node, n_micro)
         children = get_children(linkage_matrix, dend_node, n_micro)
         
-        # Check if contains ego
-        contains_ego = ego_micro is not None and ego_micro in micro_leaves
-        
-        # Representative handles (uses in-degree as fallback for missing follower counts)
-        reps = _get_representative_handles(
-            member_node_ids_list, 
-            node_metadata,
-            in_degrees=in_degrees,
-            node_id_to_idx=node_id_to_idx,
-        )
-        
         # Label
         dend_id = get_dendrogram_id(dend_node)
         user_label = user_labels.get(dend_id)
@@ -367,14 +351,14 @@ def build_hierarchical_view(
             dendrogram_node=dend_node,
             parent_id=get_dendrogram_id(parent_idx) if parent_idx is not None else None,
             children_ids=(get_dendrogram_id(children[0]), get_dendrogram_id(children[1])) if children else None,
-            member_micro_indices=micro_leaves,
-            member_node_ids=member_node_ids_list,
-            centroid=centroid,
-            size=len(member_node_ids_list),
+            member_micro_indices=aggregate.member_micro_indices,
+            member_node_ids=aggregate.member_node_ids,
+            centroid=aggregate.centroid,
+            size=len(aggregate.member_node_ids),
             label=user_label or auto_label,
             label_source="user" if user_label else "auto",
             representative_handles=reps,
-            contains_ego=contains_ego,
+            contains_ego=aggregate.contains_ego,
             is_leaf=is_leaf,
         ))
 
@@ -392,6 +376,7 @@ def build_hierarchical_view(
 
     # Now handle any pending recursive local expansions
     for local_exp_id in list(pending_local_expansions.keys()):
+        _check_cancelled(cancel_event, "local expansion")
         # Find the member list for this local cluster
         # It might be from a previous expansion in this same request, or from an earlier request
         if local_exp_id in local_cluster_members:
@@ -515,16 +500,11 @@ def build_hierarchical_view(
     t_cluster_info_ms = int((time.time() - t_cluster_info) * 1000)
     logger.info("hierarchy timing: cluster_info=%dms clusters=%d", t_cluster_info_ms, len(clusters))
 
-    # Step 5: Compute edges with connectivity metric (with optional Louvain fusion)
+    # Step 5: Compute edges with connectivity metric (with optional Louvain fusion);
+    # the session only computes edge rows for clusters that are newly visible.
+    _check_cancelled(cancel_event, "edges")
     t0 = time.time()
-    edges = compute_hierarchical_edges(
-        clusters,
-        micro_labels,
-        adjacency,
-        node_ids,
-        louvain_communities,
-        louvain_weight,
-    )
+    edges = session.edges(clusters, louvain_communities, louvain_weight)
     t_edges_ms = int((time.time() - t0) * 1000)
     logger.info("hierarchy timing: compute_edges=%dms", t_edges_ms)
 
@@ -564,6 +544,46 @@ def build_hierarchical_view(
     )
 
 
+def _aggregate_dendrogram_node(
+    session: ViewSession,
+    dend_node: int,
+    in_degrees,
+    micro_to_nodes: Dict[int, List[int]],
+    node_id_to_idx: Dict[str, int],
+) -> ClusterAggregate:
+    """Members, centroid, representative handles and ego flag for a dendrogram node."""
+    # Get all micro-cluster leaves under this dendrogram node
+    micro_leaves = get_subtree_leaves(session.linkage_matrix, dend_node, session.n_micro)
+
+    # Get all original nodes in these micro-clusters
+    member_node_indices = []
+    for micro_idx in micro_leaves:
+        member_node_indices.extend(micro_to_nodes.get(micro_idx, []))
+    member_node_ids_list = session.node_ids[member_node_indices].tolist()
+
+    # Compute centroid from micro-cluster centroids
+    if micro_leaves:
+        centroid = session.micro_centroids[micro_leaves].mean(axis=0)
+    else:
+        centroid = np.zeros(session.micro_centroids.shape[1])
+
+    ego_micro = session.ego_micro
+    # Representative handles (uses in-degree as fallback for missing follower counts)
+    reps = _get_representative_handles(
+        member_node_ids_list,
+        session.node_metadata,
+        in_degrees=in_degrees,
+        node_id_to_idx=node_id_to_idx,
+    )
+    return ClusterAggregate(
+        member_micro_indices=micro_leaves,
+        member_node_ids=member_node_ids_list,
+        centroid=centroid,
+        representative_handles=reps,
+        contains_ego=ego_micro is not None and ego_micro in micro_leaves,
+    )
+
+
 def get_collapse_preview(
     linkage_matrix: np.ndarray,
     n_micro: int,
@@ -8,15 +8,26 @@ expansion strategies and their scores so the user can:
 2. Choose from ranked alternatives
 3. Understand WHY a particular strategy was recommended
 
-The cache uses LRU eviction and TTL-based expiry to manage memory.
+The cache uses LRU eviction and TTL-based expiry to manage memory. When an
+ExpansionDiskCache is attached, results are also written through to disk,
+keyed by (spectral version, cluster member digest), so a restart or deploy
+does not start cold. Disk entries record when they were written and are
+subject to the same TTL as memory entries.
 """
 from __future__ import annotations
 
+import hashlib
+import heapq
+import itertools
+import json
 import logging
+import os
 import threading
 import time
 from collections import OrderedDict
-from dataclasses import dataclass, field
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Callable
 
 import numpy as np
@@ -28,6 +39,33 @@ logger = logging.getLogger(__name__)
 MAX_CACHE_ENTRIES = 100  # Maximum clusters to cache
 CACHE_TTL_SECONDS = 3600  # 1 hour TTL
 PRECOMPUTE_BATCH_SIZE = 5  # How many clusters to precompute at once
+DISK_CACHE_FORMAT_VERSION = 1
+
+# Precompute priority tiers (higher = sooner). Within a tier, lower rank wins.
+PRIORITY_VISIBLE = 3
+PRIORITY_NEAR_POINTER = 2
+PRIORITY_SPECULATIVE = 1
+_TIER_SPAN = 1_000_000
+
+
+def precompute_priority(tier: int, rank: int = 0) -> int:
+    """Priority for the rank-th cluster of a tier (0 = most urgent)."""
+    return tier * _TIER_SPAN - min(rank, _TIER_SPAN - 1)
+
+
+def expansion_key(member_node_ids: List[str], adjacency: Optional[sparse.spmatrix] = None) -> str:
+    """Digest of a cluster's members (order-independent).
+
+    Adjacency shape and nnz are folded in so lenses with different graphs
+    (full vs TPOT) never share entries for the same member set.
+    """
+    digest = hashlib.sha1()
+    if adjacency is not None:
+        digest.update(f"{adjacency.shape[0]}x{adjacency.shape[1]}:{adjacency.nnz}\n".encode())
+    for node_id in sorted(str(n) for n in member_node_ids):
+        digest.update(node_id.encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
 
 
 @dataclass
@@ -59,6 +97,112 @@ class CachedExpansion:
         return self.ranked_strategies[1:] if len(self.ranked_strategies) > 1 else []
 
 
+class ExpansionDiskCache:
+    """Write-through JSON store for expansion results.
+
+    Layout: <root>/<spectral version digest>/<member digest>.json. A new
+    spectral version gets a fresh directory, so stale results are never
+    served; old version directories can simply be deleted. Each entry stores
+    its write time; get() with a TTL treats older entries as misses and
+    removes them.
+    """
+
+    def __init__(self, root: Path, spectral_version: str):
+        self.spectral_version = spectral_version
+        version_dir = hashlib.sha1(spectral_version.encode()).hexdigest()[:16]
+        self.directory = Path(root) / version_dir
+        self._writes = 0
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._errors = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str, ttl_seconds: Optional[float] = None) -> Optional[CachedExpansion]:
+        """Stored entry for key; None if missing, unreadable or older than ttl_seconds.
+
+        The returned entry's computed_at is its disk write time, so the
+        memory tier keeps counting the TTL from there after promotion.
+        """
+        path = self._path(key)
+        if not path.exists():
+            self._misses += 1
+            return None
+        try:
+            payload = json.loads(path.read_text())
+            if payload.get("format") != DISK_CACHE_FORMAT_VERSION:
+                self._misses += 1
+                return None
+            entry = _expansion_from_dict(payload["entry"])
+            # Entries written before written_at was recorded fall back to computed_at.
+            entry.computed_at = float(payload.get("written_at", entry.computed_at))
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            self._errors += 1
+            logger.warning("Unreadable expansion cache entry %s: %s", path, exc)
+            return None
+        if ttl_seconds is not None and entry.is_expired(ttl_seconds):
+            self._expired += 1
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+        self._hits += 1
+        return entry
+
+    def put(self, key: str, entry: CachedExpansion) -> None:
+        payload = {
+            "format": DISK_CACHE_FORMAT_VERSION,
+            "spectral_version": self.spectral_version,
+            "written_at": time.time(),
+            "entry": asdict(entry),
+        }
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload))
+            os.replace(tmp_path, path)
+            self._writes += 1
+        except OSError as exc:
+            self._errors += 1
+            logger.warning("Failed to write expansion cache entry %s: %s", path, exc)
+
+    def get_stats(self) -> Dict:
+        return {
+            "directory": str(self.directory),
+            "spectral_version": self.spectral_version,
+            "hits": self._hits,
+            "misses": self._misses,
+            "expired": self._expired,
+            "writes": self._writes,
+            "errors": self._errors,
+        }
+
+
+def _expansion_from_dict(data: Dict) -> CachedExpansion:
+    from src.graph.hierarchy.expansion_scoring import ScoredStrategy, StructureScoreBreakdown
+
+    strategies = [
+        ScoredStrategy(
+            strategy_name=s["strategy_name"],
+            sub_clusters=s["sub_clusters"],
+            score=StructureScoreBreakdown(**s["score"]),
+            execution_time_ms=s.get("execution_time_ms", 0),
+        )
+        for s in data["ranked_strategies"]
+    ]
+    return CachedExpansion(
+        cluster_id=data["cluster_id"],
+        member_count=data["member_count"],
+        ranked_strategies=strategies,
+        computed_at=data["computed_at"],
+        computation_ms=data["computation_ms"],
+    )
+
+
 class ExpansionCache:
     """LRU cache for precomputed expansion strategies.
 
@@ -70,30 +214,37 @@ class ExpansionCache:
         self,
         max_entries: int = MAX_CACHE_ENTRIES,
         ttl_seconds: float = CACHE_TTL_SECONDS,
+        disk: Optional[ExpansionDiskCache] = None,
     ):
         self._cache: OrderedDict[str, CachedExpansion] = OrderedDict()
         self._max_entries = max_entries
         self._ttl_seconds = ttl_seconds
         self._lock = threading.RLock()
+        self.disk = disk
 
         # Stats for monitoring
         self._hits = 0
         self._misses = 0
         self._evictions = 0
+        self._disk_hits = 0
 
-    def get(self, cluster_id: str) -> Optional[CachedExpansion]:
+    def get(self, cluster_id: str, disk_key: Optional[str] = None) -> Optional[CachedExpansion]:
         """Get cached expansion for a cluster.
 
         Args:
             cluster_id: The cluster ID to look up
+            disk_key: expansion_key() of the cluster; on a memory miss the
+                disk cache (if attached) is consulted and hits are promoted
 
         Returns:
             CachedExpansion if found and not expired, None otherwise
         """
         with self._lock:
             if cluster_id not in self._cache:
-                self._misses += 1
-                return None
+                entry = self._get_from_disk(cluster_id, disk_key)
+                if entry is None:
+                    self._misses += 1
+                return entry
 
             entry = self._cache[cluster_id]
 
@@ -109,12 +260,32 @@ class ExpansionCache:
 
             return entry
 
+    def _get_from_disk(self, cluster_id: str, disk_key: Optional[str]) -> Optional[CachedExpansion]:
+        if self.disk is None or disk_key is None:
+            return None
+        entry = self.disk.get(disk_key, self._ttl_seconds)
+        if entry is None:
+            return None
+        # The same members may sit under another dendrogram id in this view.
+        entry.cluster_id = cluster_id
+        self._insert(cluster_id, entry)
+        self._disk_hits += 1
+        return entry
+
+    def _insert(self, cluster_id: str, entry: CachedExpansion) -> None:
+        self._cache.pop(cluster_id, None)
+        while len(self._cache) >= self._max_entries:
+            self._cache.popitem(last=False)  # Remove oldest
+            self._evictions += 1
+        self._cache[cluster_id] = entry
+
     def put(
         self,
         cluster_id: str,
         member_count: int,
         ranked_strategies: List["ScoredStrategy"],
         computation_ms: int = 0,
+        disk_key: Optional[str] = None,
     ) -> None:
         """Store expansion result in cache.
 
@@ -123,20 +294,20 @@ class ExpansionCache:
             member_count: Number of members in the cluster
             ranked_strategies: Strategies ranked by score (best first)
             computation_ms: How long the computation took
+            disk_key: expansion_key() of the cluster; written through to the
+                disk cache when one is attached
         """
+        entry = CachedExpansion(
+            cluster_id=cluster_id,
+            member_count=member_count,
+            ranked_strategies=ranked_strategies,
+            computed_at=time.time(),
+            computation_ms=computation_ms,
+        )
         with self._lock:
-            # Evict if at capacity
-            while len(self._cache) >= self._max_entries:
-                self._cache.popitem(last=False)  # Remove oldest
-                self._evictions += 1
-
-            self._cache[cluster_id] = CachedExpansion(
-                cluster_id=cluster_id,
-                member_count=member_count,
-                ranked_strategies=ranked_strategies,
-                computed_at=time.time(),
-                computation_ms=computation_ms,
-            )
+            self._insert(cluster_id, entry)
+        if self.disk is not None and disk_key is not None:
+            self.disk.put(disk_key, entry)
 
     def invalidate(self, cluster_id: str) -> bool:
         """Remove a specific cluster from cache.
@@ -170,14 +341,18 @@ class ExpansionCache:
             total_requests = self._hits + self._misses
             hit_rate = self._hits / total_requests if total_requests > 0 else 0
 
-            return {
+            stats = {
                 "entries": len(self._cache),
                 "max_entries": self._max_entries,
                 "hits": self._hits,
                 "misses": self._misses,
                 "hit_rate": hit_rate,
                 "evictions": self._evictions,
+                "disk_hits": self._disk_hits,
             }
+            if self.disk is not None:
+                stats["disk"] = self.disk.get_stats()
+            return stats
 
     def get_cached_cluster_ids(self) -> List[str]:
         """Get list of currently cached cluster IDs."""
@@ -200,6 +375,19 @@ def get_expansion_cache() -> ExpansionCache:
         return _expansion_cache
 
 
+def configure_expansion_cache(disk_dir: Optional[Path], spectral_version: str) -> ExpansionCache:
+    """Attach (or with disk_dir=None, detach) the write-through disk cache.
+
+    Call when a spectral result is loaded; memory entries from a previous
+    spectral result are dropped.
+    """
+    cache = get_expansion_cache()
+    with cache._lock:
+        cache.disk = ExpansionDiskCache(disk_dir, spectral_version) if disk_dir is not None else None
+    cache.invalidate_all()
+    return cache
+
+
 def reset_expansion_cache() -> None:
     """Reset the global expansion cache (useful for testing)."""
     global _expansion_cache
@@ -218,14 +406,47 @@ class PrecomputeRequest:
     member_node_ids: List[str]
     priority: int = 0  # Higher = more urgent
     requested_at: float = field(default_factory=time.time)
+    disk_key: Optional[str] = None
+
+
+# Per-process evaluation context for pool workers (set by the initializer so
+# the adjacency is shipped once per worker, not once per task).
+_worker_context: Optional[Tuple[sparse.spmatrix, Dict[str, int], Optional[Dict[str, Set[str]]]]] = None
+
+
+def _init_precompute_worker(adjacency, node_id_to_idx, node_tags) -> None:
+    global _worker_context
+    _worker_context = (adjacency, node_id_to_idx, node_tags)
+
+
+def _evaluate_expansion(
+    member_node_ids: List[str],
+    context: Optional[Tuple] = None,
+) -> Tuple[List["ScoredStrategy"], int]:
+    """Run evaluate_all_strategies; returns (ranked strategies, elapsed ms)."""
+    from src.graph.hierarchy.expansion_strategy import evaluate_all_strategies
+
+    adjacency, node_id_to_idx, node_tags = context if context is not None else _worker_context
+    start = time.time()
+    ranked = evaluate_all_strategies(
+        member_node_ids=member_node_ids,
+        adjacency=adjacency,
+        node_id_to_idx=node_id_to_idx,
+        node_tags=node_tags,
+        max_sub_clusters=50,
+    )
+    return ranked, int((time.time() - start) * 1000)
 
 
 class ExpansionPrecomputer:
     """Background precomputation of expansion strategies.
 
     When clusters become visible, add them to the precompute queue.
-    This runs in a background thread to prepare expansions before
-    the user clicks.
+    A dispatcher thread pops the highest-priority request and hands it to
+    a worker pool (processes by default, since strategy evaluation is
+    CPU-bound Python), keeping at most max_workers evaluations in flight so
+    late, more urgent requests are not stuck behind a long backlog.
+    Results go into the cache, and through it to disk when attached.
     """
 
     def __init__(
@@ -234,17 +455,30 @@ class ExpansionPrecomputer:
         node_id_to_idx: Dict[str, int],
         node_tags: Optional[Dict[str, Set[str]]] = None,
         cache: Optional[ExpansionCache] = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
     ):
         self._adjacency = adjacency
         self._node_id_to_idx = node_id_to_idx
         self._node_tags = node_tags
         self._cache = cache or get_expansion_cache()
+        self._max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self._use_processes = use_processes
+
+        # Max-heap via negated priority; seq keeps FIFO order within a priority.
+        # Re-prioritized requests are pushed again and stale heap entries skipped.
+        self._heap: List[Tuple[int, int, PrecomputeRequest]] = []
+        self._queued: Dict[str, PrecomputeRequest] = {}
+        self._seq = itertools.count()
+        self._queue_lock = threading.Condition()
 
-        self._queue: List[PrecomputeRequest] = []
-        self._queue_lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._completed = 0
+        self._failed = 0
 
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[Executor] = None
 
     def enqueue(
         self,
@@ -260,105 +494,160 @@ class ExpansionPrecomputer:
             priority: Higher priority = computed sooner
 
         Returns:
-            True if added, False if already cached or queued
+            True if added (or re-queued at a higher priority), False if
+            already cached, running, or queued at this priority or higher
         """
+        disk_key = expansion_key(member_node_ids, self._adjacency) if self._cache.disk is not None else None
         # Skip if already cached
-        if self._cache.get(cluster_id) is not None:
+        if self._cache.get(cluster_id, disk_key) is not None:
             return False
 
         with self._queue_lock:
-            # Skip if already queued
-            if any(r.cluster_id == cluster_id for r in self._queue):
+            if cluster_id in self._inflight:
+                return False
+            existing = self._queued.get(cluster_id)
+            if existing is not None and existing.priority >= priority:
                 return False
 
-            self._queue.append(PrecomputeRequest(
+            request = PrecomputeRequest(
                 cluster_id=cluster_id,
                 member_node_ids=member_node_ids,
                 priority=priority,
-            ))
-
-            # Sort by priority (highest first)
-            self._queue.sort(key=lambda r: r.priority, reverse=True)
-
+                disk_key=disk_key,
+            )
+            self._queued[cluster_id] = request
+            heapq.heappush(self._heap, (-priority, next(self._seq), request))
+            self._queue_lock.notify_all()
             return True
 
     def start(self) -> None:
-        """Start the background precomputation thread."""
+        """Start the worker pool and dispatcher thread."""
         if self._running:
             return
 
+        if self._use_processes:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                initializer=_init_precompute_worker,
+                initargs=(self._adjacency, self._node_id_to_idx, self._node_tags),
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="expansion-precompute",
+            )
         self._running = True
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
-        logger.info("Expansion precomputer started")
+        logger.info(
+            "Expansion precomputer started (%d %s workers)",
+            self._max_workers, "process" if self._use_processes else "thread",
+        )
 
     def stop(self) -> None:
-        """Stop the background precomputation thread."""
-        self._running = False
+        """Stop dispatching and shut the pool down (running tasks are dropped)."""
+        with self._queue_lock:
+            self._running = False
+            self._queue_lock.notify_all()
         if self._thread is not None:
             self._thread.join(timeout=1.0)
             self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
         logger.info("Expansion precomputer stopped")
 
     def _run(self) -> None:
-        """Background thread main loop."""
-        from src.graph.hierarchy.expansion_strategy import evaluate_all_strategies
-
-        while self._running:
-            request = self._get_next_request()
-
-            if request is None:
-                # No work, sleep briefly
-                time.sleep(0.1)
-                continue
-
-            try:
-                start = time.time()
-
-                ranked = evaluate_all_strategies(
-                    member_node_ids=request.member_node_ids,
-                    adjacency=self._adjacency,
-                    node_id_to_idx=self._node_id_to_idx,
-                    node_tags=self._node_tags,
-                    max_sub_clusters=50,
-                )
-
-                elapsed_ms = int((time.time() - start) * 1000)
-
-                self._cache.put(
-                    cluster_id=request.cluster_id,
-                    member_count=len(request.member_node_ids),
-                    ranked_strategies=ranked,
-                    computation_ms=elapsed_ms,
-                )
-
-                logger.debug(
-                    "Precomputed expansion for cluster %s (%d members) in %dms, "
-                    "found %d strategies",
-                    request.cluster_id,
-                    len(request.member_node_ids),
-                    elapsed_ms,
-                    len(ranked),
-                )
-
-            except Exception as e:
-                logger.warning(
-                    "Failed to precompute expansion for cluster %s: %s",
-                    request.cluster_id,
-                    e,
-                )
+        """Dispatcher loop: keep up to max_workers evaluations in flight."""
+        while True:
+            with self._queue_lock:
+                while self._running and (
+                    not self._queued or len(self._inflight) >= self._max_workers
+                ):
+                    self._queue_lock.wait()
+                if not self._running:
+                    return
+                request = self._pop_locked()
+                if request is None:
+                    continue
+                if self._use_processes:
+                    future = self._executor.submit(_evaluate_expansion, request.member_node_ids)
+                else:
+                    context = (self._adjacency, self._node_id_to_idx, self._node_tags)
+                    future = self._executor.submit(_evaluate_expansion, request.member_node_ids, context)
+                self._inflight[request.cluster_id] = future
+            future.add_done_callback(lambda f, r=request: self._on_done(r, f))
+
+    def _on_done(self, request: PrecomputeRequest, future: Future) -> None:
+        try:
+            ranked, elapsed_ms = future.result()
+        except Exception as e:
+            self._failed += 1
+            logger.warning(
+                "Failed to precompute expansion for cluster %s: %s",
+                request.cluster_id,
+                e,
+            )
+        else:
+            self._cache.put(
+                cluster_id=request.cluster_id,
+                member_count=len(request.member_node_ids),
+                ranked_strategies=ranked,
+                computation_ms=elapsed_ms,
+                disk_key=request.disk_key,
+            )
+            self._completed += 1
+            logger.debug(
+                "Precomputed expansion for cluster %s (%d members) in %dms, "
+                "found %d strategies",
+                request.cluster_id,
+                len(request.member_node_ids),
+                elapsed_ms,
+                len(ranked),
+            )
+        finally:
+            with self._queue_lock:
+                self._inflight.pop(request.cluster_id, None)
+                self._queue_lock.notify_all()
+
+    def _pop_locked(self) -> Optional[PrecomputeRequest]:
+        while self._heap:
+            _, _, request = heapq.heappop(self._heap)
+            if self._queued.get(request.cluster_id) is request:
+                del self._queued[request.cluster_id]
+                return request
+        return None
 
     def _get_next_request(self) -> Optional[PrecomputeRequest]:
         """Get the next request from the queue."""
         with self._queue_lock:
-            if not self._queue:
-                return None
-            return self._queue.pop(0)
+            return self._pop_locked()
 
     def get_queue_size(self) -> int:
         """Get number of pending precompute requests."""
         with self._queue_lock:
-            return len(self._queue)
+            return len(self._queued)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until the queue is drained and nothing is in flight."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue_lock:
+            while self._queued or self._inflight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue_lock.wait(remaining)
+            return True
+
+    def get_stats(self) -> Dict:
+        with self._queue_lock:
+            return {
+                "queued": len(self._queued),
+                "inflight": len(self._inflight),
+                "completed": self._completed,
+                "failed": self._failed,
+                "max_workers": self._max_workers,
+                "use_processes": self._use_processes,
+            }
 
 
 def compute_and_cache_expansion(
@@ -393,8 +682,15 @@ def compute_and_cache_expansion(
     if cache is None:
         cache = get_expansion_cache()
 
+    # Custom weights change the ranking, so those results stay memory-only.
+    disk_key = (
+        expansion_key(member_node_ids, adjacency)
+        if cache.disk is not None and weights is None
+        else None
+    )
+
     # Check cache first
-    cached = cache.get(cluster_id)
+    cached = cache.get(cluster_id, disk_key)
     if cached is not None:
         return cached
 
@@ -428,6 +724,7 @@ def compute_and_cache_expansion(
         member_count=len(member_node_ids),
         ranked_strategies=ranked,
         computation_ms=elapsed_ms,
+        disk_key=disk_key,
     )
 
     return cache.get(cluster_id)
@@ -437,30 +734,42 @@ def trigger_precompute_for_visible_clusters(
     visible_cluster_ids: List[str],
     cluster_members: Dict[str, List[str]],
     precomputer: ExpansionPrecomputer,
+    near_pointer_cluster_ids: Optional[List[str]] = None,
+    speculative_cluster_ids: Optional[List[str]] = None,
 ) -> int:
     """Trigger precomputation for clusters that become visible.
 
     Call this when the view changes and new clusters become visible.
+    Visible clusters are queued first, then clusters near the pointer,
+    then speculative ones (e.g. children of visible clusters); each list
+    is ordered most-urgent first. Clusters already queued are promoted if
+    they now fall in a more urgent tier.
 
     Args:
         visible_cluster_ids: IDs of clusters currently visible
         cluster_members: Mapping from cluster ID to member node IDs
         precomputer: The precomputer instance
+        near_pointer_cluster_ids: Clusters closest to the pointer/hover
+        speculative_cluster_ids: Likely next expansions
 
     Returns:
         Number of clusters queued for precomputation
     """
     queued = 0
+    tiers = (
+        (PRIORITY_VISIBLE, visible_cluster_ids),
+        (PRIORITY_NEAR_POINTER, near_pointer_cluster_ids or []),
+        (PRIORITY_SPECULATIVE, speculative_cluster_ids or []),
+    )
 
-    for i, cluster_id in enumerate(visible_cluster_ids):
-        if cluster_id in cluster_members:
-            # Higher priority for clusters visible earlier (top of list)
-            priority = len(visible_cluster_ids) - i
-
+    for tier, cluster_ids in tiers:
+        for rank, cluster_id in enumerate(cluster_ids):
+            if cluster_id not in cluster_members:
+                continue
             if precomputer.enqueue(
                 cluster_id=cluster_id,
                 member_node_ids=cluster_members[cluster_id],
-                priority=priority,
+                priority=precompute_priority(tier, rank),
             ):
                 queued += 1
 
@@ -25,6 +25,9 @@ from typing import Dict, List, Optional, Set, Tuple
 import numpy as np
 from scipy import sparse
 
+from src.graph.cluster_edges import cluster_connectivity, labels_from_members
+from src.graph.hierarchy.local_subgraph import LocalSubgraph
+
 logger = logging.getLogger(__name__)
 
 
@@ -224,51 +227,32 @@ def compute_edge_separation_fast(
     adjacency: sparse.spmatrix,
     node_id_to_idx: Dict[str, int],
     _adj_coo=None,
+    _subgraph: Optional[LocalSubgraph] = None,
 ) -> Tuple[float, int, int]:
-    """Fast version of edge separation using index sets.
+    """Fast version of edge separation via one sparse Cᵀ A C product.
 
-    Optimized for large clusters by avoiding string lookups in inner loop.
+    Counts each stored edge (i, j) with i < j between members once. The
+    product runs on CSR; _adj_coo is still accepted from callers that share
+    a precomputed COO but is no longer needed. With _subgraph (the parent
+    cluster's LocalSubgraph) the product runs on the sliced submatrix.
     """
     if len(sub_clusters) <= 1:
         return (0.5, 0, 0)
 
-    # Build index-based cluster membership
-    all_member_indices: Set[int] = set()
-    idx_to_cluster: Dict[int, int] = {}
-
-    for cluster_idx, members in enumerate(sub_clusters):
-        for nid in members:
-            if nid in node_id_to_idx:
-                idx = node_id_to_idx[nid]
-                all_member_indices.add(idx)
-                idx_to_cluster[idx] = cluster_idx
-
-    # Count edges
-    intra_edges = 0
-    inter_edges = 0
-
-    adj_coo = _adj_coo if _adj_coo is not None else adjacency.tocoo()
-
-    for i, j in zip(adj_coo.row, adj_coo.col):
-        if i not in all_member_indices or j not in all_member_indices:
-            continue
-        if i >= j:  # Only count each edge once
-            continue
-
-        ci = idx_to_cluster.get(i, -1)
-        cj = idx_to_cluster.get(j, -1)
-
-        if ci == cj and ci >= 0:
-            intra_edges += 1
-        elif ci >= 0 and cj >= 0:
-            inter_edges += 1
-
-    total_edges = intra_edges + inter_edges
-    if total_edges == 0:
+    if _subgraph is not None:
+        matrix, labels = _subgraph.matrix, _subgraph.labels_for(sub_clusters)
+    else:
+        matrix = adjacency
+        labels = labels_from_members(sub_clusters, node_id_to_idx, adjacency.shape[0])
+    if not (labels >= 0).any():
         return (0.5, 0, 0)
+    connectivity = cluster_connectivity(matrix, labels, len(sub_clusters), upper=True)
 
-    score = intra_edges / total_edges
-    return (score, intra_edges, inter_edges)
+    intra_edges = connectivity.intra_edges
+    inter_edges = connectivity.inter_edges
+    if intra_edges + inter_edges == 0:
+        return (0.5, 0, 0)
+    return (connectivity.separation, intra_edges, inter_edges)
 
 
 def compute_tag_coherence(
@@ -344,6 +328,7 @@ def compute_structure_score(
     node_tags: Optional[Dict[str, Set[str]]] = None,
     weights: Optional[StructureScoreWeights] = None,
     _adj_coo=None,
+    _subgraph: Optional[LocalSubgraph] = None,
 ) -> StructureScoreBreakdown:
     """Compute overall structure score for an expansion result.
 
@@ -393,7 +378,7 @@ def compute_structure_score(
     fragmentation_ratio = compute_fragmentation_ratio(cluster_sizes, total_members)
 
     edge_sep_score, intra_edges, inter_edges = compute_edge_separation_fast(
-        sub_clusters, adjacency, node_id_to_idx, _adj_coo=_adj_coo
+        sub_clusters, adjacency, node_id_to_idx, _adj_coo=_adj_coo, _subgraph=_subgraph,
     )
 
     tag_coherence = compute_tag_coherence(sub_clusters, node_tags)
@@ -14,16 +14,22 @@ to individual accounts when no more structure exists.
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import networkx as nx
 import numpy as np
 from scipy import sparse
 
+from src.graph.hierarchy.local_subgraph import LocalSubgraph
+
 logger = logging.getLogger(__name__)
 
+# Threads evaluate_all_strategies uses to run independent strategies
+STRATEGY_WORKERS = 4
+
 
 class ExpansionStrategy(Enum):
     """Available expansion strategies."""
@@ -77,7 +83,7 @@ def compute_local_metrics(
     linkage_matrix: Optional[np.ndarray] = None,
     dendrogram_node: int = -1,
     n_micro: int = 0,
-    _adj_coo=None,
+    _subgraph: Optional[LocalSubgraph] = None,
 ) -> LocalStructureMetrics:
     """Compute structural metrics for a cluster's local neighborhood.
 
@@ -90,6 +96,7 @@ def compute_local_metrics(
         linkage_matrix: Optional Ward linkage matrix
         dendrogram_node: Dendrogram node index (-1 if virtual/local cluster)
         n_micro: Number of micro-clusters (for dendrogram traversal)
+        _subgraph: Precomputed LocalSubgraph of the members (built if None)
 
     Returns:
         LocalStructureMetrics with computed values
@@ -103,31 +110,17 @@ def compute_local_metrics(
             n_bridge_nodes=0, bridge_ratio=0, has_dendrogram_children=False
         )
 
-    # Build subgraph
-    member_indices = [node_id_to_idx[nid] for nid in member_node_ids if nid in node_id_to_idx]
-    idx_set = set(member_indices)
-    idx_to_nid = {node_id_to_idx[nid]: nid for nid in member_node_ids if nid in node_id_to_idx}
-
-    # Count edges and compute degrees
-    adj_coo = _adj_coo if _adj_coo is not None else adjacency.tocoo()
-    edges = []
-    degrees = {nid: 0 for nid in member_node_ids}
-
-    for i, j in zip(adj_coo.row, adj_coo.col):
-        if i in idx_set and j in idx_set and i != j:
-            src_nid = idx_to_nid.get(i)
-            tgt_nid = idx_to_nid.get(j)
-            if src_nid and tgt_nid:
-                edges.append((src_nid, tgt_nid))
-                degrees[src_nid] = degrees.get(src_nid, 0) + 1
-
-    n_edges = len(edges) // 2  # Undirected, counted twice
+    local = _subgraph if _subgraph is not None else LocalSubgraph(member_node_ids, adjacency, node_id_to_idx)
+
+    # Count edges and out-degrees (self-loops excluded)
+    degrees = dict(zip(member_node_ids, local.member_values(local.out_degrees)))
+
+    n_edges = local.n_edges  # Undirected, counted twice
     max_edges = n * (n - 1) / 2
     density = n_edges / max_edges if max_edges > 0 else 0
 
     # Count mutual edges (bidirectional)
-    edge_set = set(edges)
-    mutual_count = sum(1 for (a, b) in edges if (b, a) in edge_set) // 2
+    mutual_count = local.n_mutual_edges
     mutual_ratio = mutual_count / n_edges if n_edges > 0 else 0
 
     # Degree statistics
@@ -429,7 +422,7 @@ def execute_core_periphery(
     adjacency: sparse.spmatrix,
     node_id_to_idx: Dict[str, int],
     degree_threshold: float,
-    _adj_coo=None,
+    _subgraph: Optional[LocalSubgraph] = None,
 ) -> List[List[str]]:
     """Split cluster into core (high-degree) and periphery (low-degree).
 
@@ -443,18 +436,8 @@ def execute_core_periphery(
         [core_members, periphery_members]
     """
     # Compute degrees within cluster
-    member_set = set(member_node_ids)
-    idx_set = {node_id_to_idx[nid] for nid in member_node_ids if nid in node_id_to_idx}
-    idx_to_nid = {node_id_to_idx[nid]: nid for nid in member_node_ids if nid in node_id_to_idx}
-
-    degrees = {nid: 0 for nid in member_node_ids}
-    adj_coo = _adj_coo if _adj_coo is not None else adjacency.tocoo()
-
-    for i, j in zip(adj_coo.row, adj_coo.col):
-        if i in idx_set and j in idx_set:
-            src_nid = idx_to_nid.get(i)
-            if src_nid:
-                degrees[src_nid] = degrees.get(src_nid, 0) + 1
+    local = _subgraph if _subgraph is not None else LocalSubgraph(member_node_ids, adjacency, node_id_to_idx)
+    degrees = dict(zip(member_node_ids, local.member_values(local.out_degrees)))
 
     core = [nid for nid in member_node_ids if degrees.get(nid, 0) >= degree_threshold]
     periphery = [nid for nid in member_node_ids if degrees.get(nid, 0) < degree_threshold]
@@ -473,7 +456,7 @@ def execute_mutual_components(
     member_node_ids: List[str],
     adjacency: sparse.spmatrix,
     node_id_to_idx: Dict[str, int],
-    _adj_coo=None,
+    _subgraph: Optional[LocalSubgraph] = None,
 ) -> List[List[str]]:
     """Find connected components of the mutual (bidirectional) edge subgraph.
 
@@ -485,31 +468,17 @@ def execute_mutual_components(
     Returns:
         List of connected component member lists
     """
-    # Build mutual-edge subgraph
-    member_indices = [node_id_to_idx[nid] for nid in member_node_ids if nid in node_id_to_idx]
-    idx_set = set(member_indices)
-    idx_to_nid = {node_id_to_idx[nid]: nid for nid in member_node_ids if nid in node_id_to_idx}
-
-    G = nx.Graph()
-    G.add_nodes_from(member_node_ids)
-
-    adj_coo = _adj_coo if _adj_coo is not None else adjacency.tocoo()
-    edge_set = set()
-
-    for i, j in zip(adj_coo.row, adj_coo.col):
-        if i in idx_set and j in idx_set and i != j:
-            edge_set.add((i, j))
-
-    # Add only mutual edges
-    for i, j in edge_set:
-        if (j, i) in edge_set:
-            src = idx_to_nid.get(i)
-            tgt = idx_to_nid.get(j)
-            if src and tgt and not G.has_edge(src, tgt):
-                G.add_edge(src, tgt)
-
-    # Find connected components
-    components = list(nx.connected_components(G))
+    local = _subgraph if _subgraph is not None else LocalSubgraph(member_node_ids, adjacency, node_id_to_idx)
+    _, labels = local.mutual_components
+
+    # Group members by component in member order; members missing from the
+    # index are isolated vertices.
+    grouped: Dict[Tuple[str, int], List[str]] = {}
+    for k, nid in enumerate(member_node_ids):
+        pos = local.position.get(nid)
+        key = ("component", int(labels[pos])) if pos is not None else ("isolated", k)
+        grouped.setdefault(key, []).append(nid)
+    components = list(grouped.values())
 
     if len(components) <= 1:
         # No meaningful split from mutuals
@@ -570,7 +539,7 @@ def execute_sample_individuals(
     node_id_to_idx: Dict[str, int],
     sample_size: int = 15,
     method: str = "by_degree",
-    _adj_coo=None,
+    _subgraph: Optional[LocalSubgraph] = None,
 ) -> List[List[str]]:
     """Sample top N individuals by some metric, rest become overflow cluster.
 
@@ -586,18 +555,8 @@ def execute_sample_individuals(
     """
     if method == "by_degree":
         # Compute in-degree within cluster
-        member_indices = [node_id_to_idx[nid] for nid in member_node_ids if nid in node_id_to_idx]
-        idx_set = set(member_indices)
-        idx_to_nid = {node_id_to_idx[nid]: nid for nid in member_node_ids if nid in node_id_to_idx}
-
-        degrees = {nid: 0 for nid in member_node_ids}
-        adj_coo = _adj_coo if _adj_coo is not None else adjacency.tocoo()
-
-        for i, j in zip(adj_coo.row, adj_coo.col):
-            if i in idx_set and j in idx_set:
-                tgt = idx_to_nid.get(j)
-                if tgt:
-                    degrees[tgt] = degrees.get(tgt, 0) + 1
+        local = _subgraph if _subgraph is not None else LocalSubgraph(member_node_ids, adjacency, node_id_to_idx)
+        degrees = dict(zip(member_node_ids, local.member_values(local.in_degrees)))
 
         sorted_nodes = sorted(member_node_ids, key=lambda nid: degrees.get(nid, 0), reverse=True)
     else:
@@ -620,7 +579,7 @@ def execute_louvain_local(
     adjacency: sparse.spmatrix,
     node_id_to_idx: Dict[str, int],
     resolution: float = 1.0,
-    _adj_coo=None,
+    _subgraph: Optional[LocalSubgraph] = None,
 ) -> List[List[str]]:
     """Execute local Louvain community detection on the induced subgraph.
 
@@ -635,21 +594,13 @@ def execute_louvain_local(
     """
     from community import community_louvain
 
-    # Build induced subgraph
-    member_indices = [node_id_to_idx[nid] for nid in member_node_ids if nid in node_id_to_idx]
-    idx_set = set(member_indices)
-    idx_to_nid = {node_id_to_idx[nid]: nid for nid in member_node_ids if nid in node_id_to_idx}
+    # Build induced subgraph (each stored edge i -> j with i < j)
+    local = _subgraph if _subgraph is not None else LocalSubgraph(member_node_ids, adjacency, node_id_to_idx)
 
     G = nx.Graph()
     G.add_nodes_from(member_node_ids)
-
-    adj_coo = _adj_coo if _adj_coo is not None else adjacency.tocoo()
-    for i, j, w in zip(adj_coo.row, adj_coo.col, adj_coo.data):
-        if i in idx_set and j in idx_set and i < j:
-            src = idx_to_nid.get(i)
-            tgt = idx_to_nid.get(j)
-            if src and tgt:
-                G.add_edge(src, tgt, weight=float(w))
+    sources, targets, edge_weights = local.upper_edges()
+    G.add_weighted_edges_from(zip(sources, targets, edge_weights))
 
     if G.number_of_edges() == 0:
         return [member_node_ids]
@@ -685,6 +636,7 @@ def evaluate_all_strategies(
     n_micro: int = 0,
     weights: Optional["StructureScoreWeights"] = None,
     max_sub_clusters: int = 50,
+    max_workers: Optional[int] = None,
 ) -> List["ScoredStrategy"]:
     """Execute all applicable strategies and score their results.
 
@@ -706,6 +658,8 @@ def evaluate_all_strategies(
             Strategies exceeding this are excluded before ranking so that
             degenerate or budget-violating outputs cannot be selected.
             Defaults to 50 (generous multiple of any realistic UI budget).
+        max_workers: Threads used to run strategies concurrently
+            (default STRATEGY_WORKERS; 1 runs them serially).
 
     Returns:
         List of ScoredStrategy objects, ranked by score (best first)
@@ -724,12 +678,10 @@ def evaluate_all_strategies(
 
     n = len(member_node_ids)
     total_members = n
-    scored_strategies: List[ScoredStrategy] = []
 
-    # Compute COO representation once; reused by every strategy and scoring call
-    # to avoid redundant sparse matrix format conversion (~3-4 ms per tocoo() on
-    # the full 295k-edge matrix, called 7+ times per evaluate_all_strategies).
-    adj_coo = adjacency.tocoo()
+    # Slice the cluster's induced subgraph once; every strategy and every
+    # structure score reads degrees, mutual edges and components from it.
+    local = LocalSubgraph(member_node_ids, adjacency, node_id_to_idx)
 
     # Compute local metrics to determine which strategies are applicable
     metrics = compute_local_metrics(
@@ -741,60 +693,33 @@ def evaluate_all_strategies(
         linkage_matrix=linkage_matrix,
         dendrogram_node=dendrogram_node,
         n_micro=n_micro,
-        _adj_coo=adj_coo,
+        _subgraph=local,
     )
 
+    # (strategy, executor, only score if it actually split)
+    candidates: List[Tuple[ExpansionStrategy, Callable[[], List[List[str]]], bool]] = []
+
     # Strategy 1: INDIVIDUALS (only for small clusters)
     if n <= 20:
-        start = time.time()
-        sub_clusters = [[nid] for nid in member_node_ids]
-        elapsed = int((time.time() - start) * 1000)
-
-        score = compute_structure_score(
-            sub_clusters=sub_clusters,
-            total_members=total_members,
-            adjacency=adjacency,
-            node_id_to_idx=node_id_to_idx,
-            node_tags=node_tags,
-            weights=weights,
-            _adj_coo=adj_coo,
-        )
-
-        scored_strategies.append(ScoredStrategy(
-            strategy_name=ExpansionStrategy.INDIVIDUALS.value,
-            sub_clusters=sub_clusters,
-            score=score,
-            execution_time_ms=elapsed,
+        candidates.append((
+            ExpansionStrategy.INDIVIDUALS,
+            lambda: [[nid] for nid in member_node_ids],
+            False,
         ))
 
     # Strategy 2: SAMPLE_INDIVIDUALS (for larger clusters without structure)
     if n > 15:
-        start = time.time()
-        sub_clusters = execute_sample_individuals(
-            member_node_ids=member_node_ids,
-            adjacency=adjacency,
-            node_id_to_idx=node_id_to_idx,
-            sample_size=15,
-            method="by_degree",
-            _adj_coo=adj_coo,
-        )
-        elapsed = int((time.time() - start) * 1000)
-
-        score = compute_structure_score(
-            sub_clusters=sub_clusters,
-            total_members=total_members,
-            adjacency=adjacency,
-            node_id_to_idx=node_id_to_idx,
-            node_tags=node_tags,
-            weights=weights,
-            _adj_coo=adj_coo,
-        )
-
-        scored_strategies.append(ScoredStrategy(
-            strategy_name=ExpansionStrategy.SAMPLE_INDIVIDUALS.value,
-            sub_clusters=sub_clusters,
-            score=score,
-            execution_time_ms=elapsed,
+        candidates.append((
+            ExpansionStrategy.SAMPLE_INDIVIDUALS,
+            lambda: execute_sample_individuals(
+                member_node_ids=member_node_ids,
+                adjacency=adjacency,
+                node_id_to_idx=node_id_to_idx,
+                sample_size=15,
+                method="by_degree",
+                _subgraph=local,
+            ),
+            False,
         ))
 
     # Strategy 3: TAG_SPLIT (if tags exist with diversity)
@@ -805,89 +730,42 @@ def evaluate_all_strategies(
                 tag_counts[tag] = tag_counts.get(tag, 0) + 1
 
         if tag_counts:
-            start = time.time()
-            sub_clusters = execute_tag_split(
-                member_node_ids=member_node_ids,
-                node_tags=node_tags,
-                tag_counts=tag_counts,
-            )
-            elapsed = int((time.time() - start) * 1000)
-
-            score = compute_structure_score(
-                sub_clusters=sub_clusters,
-                total_members=total_members,
-                adjacency=adjacency,
-                node_id_to_idx=node_id_to_idx,
-                node_tags=node_tags,
-                weights=weights,
-                _adj_coo=adj_coo,
-            )
-
-            scored_strategies.append(ScoredStrategy(
-                strategy_name=ExpansionStrategy.TAG_SPLIT.value,
-                sub_clusters=sub_clusters,
-                score=score,
-                execution_time_ms=elapsed,
+            candidates.append((
+                ExpansionStrategy.TAG_SPLIT,
+                lambda: execute_tag_split(
+                    member_node_ids=member_node_ids,
+                    node_tags=node_tags,
+                    tag_counts=tag_counts,
+                ),
+                False,
             ))
 
     # Strategy 4: CORE_PERIPHERY (if degree variance is high)
     if n > 10 and metrics.degree_cv > 0.5:
-        start = time.time()
-        sub_clusters = execute_core_periphery(
-            member_node_ids=member_node_ids,
-            adjacency=adjacency,
-            node_id_to_idx=node_id_to_idx,
-            degree_threshold=metrics.degree_mean,
-            _adj_coo=adj_coo,
-        )
-        elapsed = int((time.time() - start) * 1000)
-
-        score = compute_structure_score(
-            sub_clusters=sub_clusters,
-            total_members=total_members,
-            adjacency=adjacency,
-            node_id_to_idx=node_id_to_idx,
-            node_tags=node_tags,
-            weights=weights,
-            _adj_coo=adj_coo,
-        )
-
-        scored_strategies.append(ScoredStrategy(
-            strategy_name=ExpansionStrategy.CORE_PERIPHERY.value,
-            sub_clusters=sub_clusters,
-            score=score,
-            execution_time_ms=elapsed,
+        candidates.append((
+            ExpansionStrategy.CORE_PERIPHERY,
+            lambda: execute_core_periphery(
+                member_node_ids=member_node_ids,
+                adjacency=adjacency,
+                node_id_to_idx=node_id_to_idx,
+                degree_threshold=metrics.degree_mean,
+                _subgraph=local,
+            ),
+            False,
         ))
 
     # Strategy 5: MUTUAL_COMPONENTS (if mutual edges exist)
     if metrics.mutual_ratio > 0.1 and n > 5:
-        start = time.time()
-        sub_clusters = execute_mutual_components(
-            member_node_ids=member_node_ids,
-            adjacency=adjacency,
-            node_id_to_idx=node_id_to_idx,
-            _adj_coo=adj_coo,
-        )
-        elapsed = int((time.time() - start) * 1000)
-
-        # Only score if it actually split
-        if len(sub_clusters) > 1:
-            score = compute_structure_score(
-                sub_clusters=sub_clusters,
-                total_members=total_members,
+        candidates.append((
+            ExpansionStrategy.MUTUAL_COMPONENTS,
+            lambda: execute_mutual_components(
+                member_node_ids=member_node_ids,
                 adjacency=adjacency,
                 node_id_to_idx=node_id_to_idx,
-                node_tags=node_tags,
-                weights=weights,
-                _adj_coo=adj_coo,
-            )
-
-            scored_strategies.append(ScoredStrategy(
-                strategy_name=ExpansionStrategy.MUTUAL_COMPONENTS.value,
-                sub_clusters=sub_clusters,
-                score=score,
-                execution_time_ms=elapsed,
-            ))
+                _subgraph=local,
+            ),
+            True,
+        ))
 
     # Strategy 6: BRIDGE_EXTRACTION (if bridge nodes exist)
     if metrics.bridge_ratio > 0.1 and soft_memberships:
@@ -903,62 +781,65 @@ def evaluate_all_strategies(
                         bridge_nodes.append(nid)
 
         if bridge_nodes:
-            start = time.time()
-            sub_clusters = execute_bridge_extraction(
-                member_node_ids=member_node_ids,
-                bridge_nodes=bridge_nodes,
-            )
-            elapsed = int((time.time() - start) * 1000)
-
-            score = compute_structure_score(
-                sub_clusters=sub_clusters,
-                total_members=total_members,
-                adjacency=adjacency,
-                node_id_to_idx=node_id_to_idx,
-                node_tags=node_tags,
-                weights=weights,
-                _adj_coo=adj_coo,
-            )
-
-            scored_strategies.append(ScoredStrategy(
-                strategy_name=ExpansionStrategy.BRIDGE_EXTRACTION.value,
-                sub_clusters=sub_clusters,
-                score=score,
-                execution_time_ms=elapsed,
+            candidates.append((
+                ExpansionStrategy.BRIDGE_EXTRACTION,
+                lambda: execute_bridge_extraction(
+                    member_node_ids=member_node_ids,
+                    bridge_nodes=bridge_nodes,
+                ),
+                False,
             ))
 
     # Strategy 7: LOUVAIN (if edges exist)
     if metrics.n_edges > 0 and n > 5:
         resolution = 1.0 + np.log10(max(10, n)) / 2
+        candidates.append((
+            ExpansionStrategy.LOUVAIN,
+            lambda: execute_louvain_local(
+                member_node_ids=member_node_ids,
+                adjacency=adjacency,
+                node_id_to_idx=node_id_to_idx,
+                resolution=resolution,
+                _subgraph=local,
+            ),
+            True,
+        ))
 
+    def run(candidate) -> Optional[ScoredStrategy]:
+        strategy, execute, require_split = candidate
         start = time.time()
-        sub_clusters = execute_louvain_local(
-            member_node_ids=member_node_ids,
+        sub_clusters = execute()
+        elapsed = int((time.time() - start) * 1000)
+
+        if require_split and len(sub_clusters) <= 1:
+            return None
+        score = compute_structure_score(
+            sub_clusters=sub_clusters,
+            total_members=total_members,
             adjacency=adjacency,
             node_id_to_idx=node_id_to_idx,
-            resolution=resolution,
-            _adj_coo=adj_coo,
+            node_tags=node_tags,
+            weights=weights,
+            _subgraph=local,
+        )
+        return ScoredStrategy(
+            strategy_name=strategy.value,
+            sub_clusters=sub_clusters,
+            score=score,
+            execution_time_ms=elapsed,
         )
-        elapsed = int((time.time() - start) * 1000)
-
-        # Only score if it actually split
-        if len(sub_clusters) > 1:
-            score = compute_structure_score(
-                sub_clusters=sub_clusters,
-                total_members=total_members,
-                adjacency=adjacency,
-                node_id_to_idx=node_id_to_idx,
-                node_tags=node_tags,
-                weights=weights,
-                _adj_coo=adj_coo,
-            )
 
-            scored_strategies.append(ScoredStrategy(
-                strategy_name=ExpansionStrategy.LOUVAIN.value,
-                sub_clusters=sub_clusters,
-                score=score,
-                execution_time_ms=elapsed,
-            ))
+    # Strategies are independent once the subgraph exists; results keep the
+    # candidate order so ranking ties break the same way as a serial run.
+    workers = STRATEGY_WORKERS if max_workers is None else max_workers
+    if workers > 1 and len(candidates) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(workers, len(candidates)), thread_name_prefix="expansion-strategy",
+        ) as pool:
+            results = list(pool.map(run, candidates))
+    else:
+        results = [run(candidate) for candidate in candidates]
+    scored_strategies: List[ScoredStrategy] = [r for r in results if r is not None]
 
     # Remove strategies that exceed the sub-cluster budget cap.
     # This is a safety net: individual strategies (e.g. mutual_components) may
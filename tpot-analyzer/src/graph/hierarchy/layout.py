@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional
 
 import numpy as np
 
+from src.graph.cluster_edges import as_csr, cluster_connectivity, community_edge_factors
 from src.graph.hierarchy.models import HierarchicalCluster, HierarchicalEdge
 
 logger = logging.getLogger(__name__)
@@ -52,61 +53,47 @@ def compute_hierarchical_edges(
     When louvain_weight > 0, edges between nodes in the same Louvain community
     are boosted, while edges between different communities are reduced.
     """
-    # Build mapping: micro_cluster -> cluster_id
-    micro_to_cluster: Dict[int, str] = {}
+    # Cluster index per micro-cluster (last cluster wins on overlap), then per node
+    micro_labels = np.asarray(micro_labels, dtype=np.int64)
+    n_micro = int(micro_labels.max()) + 1 if len(micro_labels) else 0
     for c in clusters:
-        for micro_idx in c.member_micro_indices:
-            micro_to_cluster[micro_idx] = c.id
-    
-    # Build Louvain labels array if available
-    louvain_labels: Optional[np.ndarray] = None
+        if c.member_micro_indices:
+            n_micro = max(n_micro, max(c.member_micro_indices) + 1)
+    micro_to_cluster = np.full(n_micro, -1, dtype=np.int64)
+    for k, c in enumerate(clusters):
+        micro_to_cluster[list(c.member_micro_indices)] = k
+    node_cluster = micro_to_cluster[micro_labels]
+
+    adjacency = as_csr(adjacency)
+    edge_weights = None
     if louvain_communities and louvain_weight > 0:
         louvain_labels = np.array([
-            louvain_communities.get(str(nid), -1) 
+            louvain_communities.get(str(nid), -1)
             for nid in node_ids
         ])
-    
-    # Count edges between clusters (with optional Louvain weighting)
-    edge_counts: Dict[Tuple[str, str], float] = {}
-    
-    if hasattr(adjacency, "tocoo"):
-        coo = adjacency.tocoo()
-        rows, cols = coo.row, coo.col
-    else:
-        rows, cols = np.nonzero(adjacency)
-    
-    for i, j in zip(rows, cols):
-        micro_i = micro_labels[i]
-        micro_j = micro_labels[j]
-        cluster_i = micro_to_cluster.get(micro_i)
-        cluster_j = micro_to_cluster.get(micro_j)
-        if cluster_i and cluster_j and cluster_i != cluster_j:
-            key = (cluster_i, cluster_j) if cluster_i < cluster_j else (cluster_j, cluster_i)
-            
-            # Apply Louvain fusion factor
-            weight = 1.0
-            if louvain_labels is not None:
-                same_community = louvain_labels[i] == louvain_labels[j] and louvain_labels[i] != -1
-                if same_community:
-                    weight = 1.0 + louvain_weight  # Boost same-community edges
-                else:
-                    weight = max(0.0, 1.0 - louvain_weight)  # Reduce cross-community edges
-            
-            edge_counts[key] = edge_counts.get(key, 0) + weight
-    
-    # Get cluster sizes
-    sizes = {c.id: c.size for c in clusters}
-    
+        edge_weights = community_edge_factors(adjacency, louvain_labels, louvain_weight)
+
+    connectivity = cluster_connectivity(
+        adjacency, node_cluster, len(clusters), edge_weights=edge_weights,
+    )
+
     # Build edges with connectivity
     edges = []
-    for (src, tgt), count in edge_counts.items():
-        size_product = sizes[src] * sizes[tgt]
-        connectivity = count / np.sqrt(size_product) if size_product > 0 else 0
+    rows, cols, weights, _ = connectivity.undirected_pairs()
+    for a, b, count in zip(rows.tolist(), cols.tolist(), weights.tolist()):
+        first, second = clusters[a], clusters[b]
+        if first.id == second.id:
+            continue
+        src, tgt = (first, second) if first.id < second.id else (second, first)
+        size_product = src.size * tgt.size
+        connectivity_value = count / np.sqrt(size_product) if size_product > 0 else 0
         edges.append(HierarchicalEdge(
-            source_id=src,
-            target_id=tgt,
+            source_id=src.id,
+            target_id=tgt.id,
             raw_count=int(round(count)),  # Raw count may be fractional with fusion
-            connectivity=connectivity,
+            connectivity=connectivity_value,
         ))
-    
+
+    edges.sort(key=lambda e: (e.source_id, e.target_id))
     return edges
+
@@ -3,14 +3,22 @@
 When a cluster is too large to meaningfully split using the global dendrogram
 (because it's part of a densely-connected core), we use Louvain community
 detection on the subgraph to find natural sub-communities.
+
+Results are cached in two tiers: a small in-process LRU and, once
+configure_local_expansion_store() has been called, a size-bounded SQLite
+LRU that survives restarts and is shared by all workers on the host.
 """
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
+import sqlite3
+import threading
 import time
 from collections import OrderedDict
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
 import networkx as nx
@@ -39,6 +47,11 @@ _CACHE_MAX_SIZE = 50  # Max cached expansions
 _CACHE_TTL_SECONDS = 3600  # 1 hour TTL
 _cache_timestamps: Dict[Tuple[str, float], float] = {}
 
+# Persistent tier (see LocalExpansionStore)
+DEFAULT_STORE_MAX_BYTES = 256 * 1024 * 1024
+STORE_FORMAT_VERSION = 1
+_store: Optional["LocalExpansionStore"] = None
+
 
 @dataclass
 class LocalExpansionResult:
@@ -52,6 +65,191 @@ class LocalExpansionResult:
     compute_time_ms: int
 
 
+class LocalExpansionStore:
+    """SQLite-backed LRU of local expansion results, bounded by payload bytes.
+
+    Rows are keyed by (member digest, resolution, graph version); a new graph
+    version simply stops matching old rows, which then age out through
+    eviction. Each call opens its own connection, so one store can be used
+    from several threads and the file from several processes.
+    """
+
+    def __init__(self, db_path: Path, graph_version: str, max_bytes: int = DEFAULT_STORE_MAX_BYTES):
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self.db_path = Path(db_path)
+        self.graph_version = graph_version
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+        self._errors = 0
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=10.0)
+
+    def _init_db(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS local_expansions (
+                    member_digest TEXT NOT NULL,
+                    resolution REAL NOT NULL,
+                    graph_version TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (member_digest, resolution, graph_version)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_local_expansions_access
+                ON local_expansions(last_access)
+                """
+            )
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def get(self, member_digest: str, resolution: float) -> Optional[LocalExpansionResult]:
+        key = (member_digest, resolution, self.graph_version)
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    """
+                    SELECT payload FROM local_expansions
+                    WHERE member_digest = ? AND resolution = ? AND graph_version = ?
+                    """,
+                    key,
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        """
+                        UPDATE local_expansions SET last_access = ?
+                        WHERE member_digest = ? AND resolution = ? AND graph_version = ?
+                        """,
+                        (time.time(), *key),
+                    )
+            if row is None:
+                self._count("_misses")
+                return None
+            payload = json.loads(row[0])
+            if payload.get("format") != STORE_FORMAT_VERSION:
+                self._count("_misses")
+                return None
+            result = LocalExpansionResult(**payload["result"])
+        except (sqlite3.Error, ValueError, KeyError, TypeError) as exc:
+            self._count("_errors")
+            logger.warning("Local expansion store read failed (%s): %s", self.db_path, exc)
+            return None
+        self._count("_hits")
+        return result
+
+    def put(self, member_digest: str, resolution: float, result: LocalExpansionResult) -> None:
+        payload = json.dumps({"format": STORE_FORMAT_VERSION, "result": asdict(result)})
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO local_expansions
+                        (member_digest, resolution, graph_version, payload, size_bytes, created_at, last_access)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (member_digest, resolution, self.graph_version, payload, size, now, now),
+                )
+                evicted = self._evict(conn)
+        except sqlite3.Error as exc:
+            self._count("_errors")
+            logger.warning("Local expansion store write failed (%s): %s", self.db_path, exc)
+            return
+        self._count("_writes")
+        if evicted:
+            self._count("_evictions", evicted)
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """Delete least recently used rows until the payload total fits."""
+        total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM local_expansions").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        victims = []
+        for rowid, size in conn.execute(
+            "SELECT rowid, size_bytes FROM local_expansions ORDER BY last_access ASC"
+        ):
+            if total <= self.max_bytes:
+                break
+            victims.append((rowid,))
+            total -= size
+        conn.executemany("DELETE FROM local_expansions WHERE rowid = ?", victims)
+        return len(victims)
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM local_expansions")
+
+    def get_stats(self) -> Dict:
+        try:
+            with self._connect() as conn:
+                entries, total = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM local_expansions"
+                ).fetchone()
+        except sqlite3.Error:
+            entries, total = None, None
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "path": str(self.db_path),
+                "graph_version": self.graph_version,
+                "entries": entries,
+                "bytes": total,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "writes": self._writes,
+                "evictions": self._evictions,
+                "errors": self._errors,
+            }
+
+
+def configure_local_expansion_store(
+    db_path: Optional[Path],
+    graph_version: str = "",
+    max_bytes: int = DEFAULT_STORE_MAX_BYTES,
+) -> Optional[LocalExpansionStore]:
+    """Attach (or with db_path=None, detach) the persistent result store.
+
+    Call when the graph is (re)loaded; the in-process tier is dropped so it
+    cannot serve results computed on the previous graph.
+    """
+    global _store
+    _local_expansion_cache.clear()
+    _cache_timestamps.clear()
+    _store = LocalExpansionStore(db_path, graph_version, max_bytes) if db_path is not None else None
+    return _store
+
+
+def get_local_expansion_stats() -> Dict:
+    """Hit/miss/eviction counters for both cache tiers."""
+    return {
+        "memory_entries": len(_local_expansion_cache),
+        "memory_max_entries": _CACHE_MAX_SIZE,
+        "store": _store.get_stats() if _store is not None else None,
+    }
+
+
 def _get_resolution_for_target(target_children: int) -> float:
     """Get Louvain resolution that approximately yields target_children communities."""
     # Find closest target in our mapping
@@ -70,6 +268,14 @@ def _get_cache_key(member_node_ids: List[str], resolution: float) -> Tuple[str,
     return (id_hash, resolution)
 
 
+def _member_digest(member_node_ids: List[str], adjacency) -> str:
+    """Digest of the sorted member IDs and the adjacency's shape and nnz."""
+    digest = hashlib.sha1()
+    digest.update(f"{adjacency.shape[0]}x{adjacency.shape[1]}:{getattr(adjacency, 'nnz', 0)}|".encode())
+    digest.update(",".join(sorted(member_node_ids)).encode())
+    return digest.hexdigest()
+
+
 def _check_cache(key: Tuple[str, float]) -> Optional[LocalExpansionResult]:
     """Check if result is in cache and not expired."""
     if key not in _local_expansion_cache:
@@ -120,7 +326,8 @@ def expand_cluster_locally(
         LocalExpansionResult with sub-cluster assignments
 
     Note:
-        Results are cached by (member_ids_hash, resolution) for up to 1 hour.
+        Results are cached by (member_ids_hash, resolution) for up to 1 hour
+        in process, and in the persistent store when one is configured.
     """
     t_start = time.time()
 
@@ -146,6 +353,18 @@ def expand_cluster_locally(
         )
         return cached
 
+    store = _store
+    if store is not None:
+        member_digest = _member_digest(member_node_ids, adjacency)
+        stored = store.get(member_digest, resolution)
+        if stored is not None:
+            logger.info(
+                "Local expansion store HIT: hash=%s, resolution=%.2f, %d communities",
+                member_digest[:8], resolution, stored.n_communities
+            )
+            _store_cache(cache_key, stored)
+            return stored
+
     # Build subgraph
     member_set = set(member_node_ids)
     member_indices = [node_id_to_idx[nid] for nid in member_node_ids if nid in node_id_to_idx]
@@ -259,6 +478,8 @@ def expand_cluster_locally(
 
     # Store in cache for future requests
     _store_cache(cache_key, result)
+    if store is not None:
+        store.put(member_digest, resolution, result)
     logger.debug(
         "Local expansion cached: hash=%s, resolution=%.2f",
         cache_key[0][:8], resolution
@@ -0,0 +1,117 @@
+"""Per-cluster induced subgraph shared by expansion strategies.
+
+evaluate_all_strategies runs up to seven strategies plus a structure score
+for each result, and every one of them used to rescan the full adjacency to
+find the cluster's internal edges. LocalSubgraph slices A[idx][:, idx] once
+and caches the derived pieces (degrees, mutual-edge mask, mutual components)
+for all of them.
+
+Local positions follow ascending global index, so "i < j" and the CSR entry
+order mean the same thing locally as they do on the full matrix.
+"""
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+from src.graph.cluster_edges import as_csr
+
+
+class LocalSubgraph:
+    """Induced subgraph of one cluster's members.
+
+    Usage:
+        local = LocalSubgraph(member_node_ids, adjacency, node_id_to_idx)
+        degrees = local.member_values(local.out_degrees)
+    """
+
+    def __init__(
+        self,
+        member_node_ids: Sequence[str],
+        adjacency: sparse.spmatrix,
+        node_id_to_idx: Dict[str, int],
+    ):
+        self.member_node_ids = list(member_node_ids)
+        global_idx = {nid: node_id_to_idx[nid] for nid in self.member_node_ids if nid in node_id_to_idx}
+        self.indices = np.array(sorted(set(global_idx.values())), dtype=np.int64)
+
+        # Local position -> node id (the last member mapped to an index wins)
+        local_of_global = {int(g): k for k, g in enumerate(self.indices)}
+        self.node_ids: List[str] = [""] * len(self.indices)
+        for nid, g in global_idx.items():
+            self.node_ids[local_of_global[g]] = nid
+        self.position: Dict[str, int] = {nid: local_of_global[g] for nid, g in global_idx.items()}
+
+        self.matrix: sparse.csr_matrix = as_csr(adjacency)[self.indices][:, self.indices].tocsr()
+        self.matrix.sort_indices()
+
+    @property
+    def n(self) -> int:
+        return len(self.indices)
+
+    @cached_property
+    def pattern(self) -> sparse.csr_matrix:
+        """Binary edge pattern without self-loops."""
+        coo = self.matrix.tocoo()
+        keep = coo.row != coo.col
+        return sparse.csr_matrix(
+            (np.ones(int(keep.sum())), (coo.row[keep], coo.col[keep])), shape=self.matrix.shape,
+        )
+
+    @cached_property
+    def out_degrees(self) -> np.ndarray:
+        return np.diff(self.pattern.indptr)
+
+    @cached_property
+    def in_degrees(self) -> np.ndarray:
+        return np.bincount(self.pattern.indices, minlength=self.n)
+
+    @cached_property
+    def mutual(self) -> sparse.csr_matrix:
+        """Symmetric mask of edges present in both directions."""
+        return self.pattern.multiply(self.pattern.T).tocsr()
+
+    @property
+    def n_edges(self) -> int:
+        """Directed edges / 2, i.e. undirected edges of a symmetric graph."""
+        return self.pattern.nnz // 2
+
+    @property
+    def n_mutual_edges(self) -> int:
+        return self.mutual.nnz // 2
+
+    @cached_property
+    def mutual_components(self) -> Tuple[int, np.ndarray]:
+        """(n_components, local component label) of the mutual-edge graph."""
+        return connected_components(self.mutual, directed=False)
+
+    def member_values(self, values: np.ndarray, default=0) -> List:
+        """Per-member values (in member order) of a local per-node array."""
+        values = values.tolist()
+        return [
+            values[self.position[nid]] if nid in self.position else default
+            for nid in self.member_node_ids
+        ]
+
+    def upper_edges(self) -> Tuple[List[str], List[str], List[float]]:
+        """(source, target, weight) for stored entries with i < j, in CSR order."""
+        coo = self.matrix.tocoo()
+        keep = coo.row < coo.col
+        names = np.array(self.node_ids, dtype=object)
+        return (
+            names[coo.row[keep]].tolist(),
+            names[coo.col[keep]].tolist(),
+            coo.data[keep].astype(float).tolist(),
+        )
+
+    def labels_for(self, sub_clusters: Sequence[Sequence[str]]) -> np.ndarray:
+        """Local cluster index per node for a split of the members (-1 = none)."""
+        labels = np.full(self.n, -1, dtype=np.int64)
+        for cluster_idx, members in enumerate(sub_clusters):
+            local = [self.position[nid] for nid in members if nid in self.position]
+            labels[local] = cluster_idx
+        return labels
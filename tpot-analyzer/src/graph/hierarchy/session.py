@@ -0,0 +1,374 @@
+"""View sessions: state reused between hierarchical view builds.
+
+An expand or collapse click changes a handful of visible clusters, but a
+from-scratch build_hierarchical_view repeats fcluster/leader search, member
+aggregation and representative-handle selection for every cluster and
+re-scans the full adjacency for inter-cluster edges. A ViewSession, kept by
+the API per (ego, lens, granularity), holds:
+
+- the base cut (dendrogram leaders) per effective granularity
+- per-dendrogram-node aggregates (members, centroid, handles, ego flag)
+- inter-cluster edge counts between the previously visible clusters
+
+so a build only aggregates clusters that are new to the visible set and only
+computes edge rows for those. Edge counts are read from a micro-cluster level
+matrix laid out in dendrogram leaf order, where every cluster's micro-clusters
+form one contiguous block.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.cluster.hierarchy import fcluster
+
+from src.graph.cluster_edges import as_csr, cluster_connectivity, community_edge_factors
+from src.graph.hierarchy.layout import compute_hierarchical_edges
+from src.graph.hierarchy.models import HierarchicalCluster, HierarchicalEdge
+from src.graph.hierarchy.traversal import (
+    DendrogramIndex,
+    find_cluster_leaders,
+    get_dendrogram_index,
+)
+
+logger = logging.getLogger(__name__)
+
+MAX_AGGREGATES = 512  # Dendrogram nodes whose aggregates a session keeps
+MAX_EDGE_STATES = 4  # Louvain fusion settings a session keeps edge state for
+
+
+@dataclass
+class ClusterAggregate:
+    """Per-dendrogram-node data that does not change between builds."""
+
+    member_micro_indices: List[int]
+    member_node_ids: List[str]
+    centroid: np.ndarray
+    representative_handles: List[str]
+    contains_ego: bool
+
+
+class _EdgeState:
+    """Inter-cluster edge counts for one Louvain fusion setting.
+
+    pairs maps every pair of visible dendrogram nodes joined by at least one
+    edge (either direction) to its fused weight and raw edge multiplicity,
+    matching compute_hierarchical_edges.
+    """
+
+    def __init__(self, session: "ViewSession", louvain_communities, louvain_weight: float):
+        index = session.index
+        micro_labels = np.asarray(session.micro_labels, dtype=np.int64)
+        n_micro = session.n_micro
+
+        adjacency = as_csr(session.adjacency)
+        edge_weights = None
+        self.fused = bool(louvain_communities) and louvain_weight > 0
+        if self.fused:
+            labels = np.array([louvain_communities.get(str(nid), -1) for nid in session.node_ids])
+            edge_weights = community_edge_factors(adjacency, labels, louvain_weight)
+
+        # Re-index micro-clusters by leaf position so subtrees are row blocks.
+        position = index.start[:n_micro]
+        connectivity = cluster_connectivity(
+            adjacency, position[micro_labels], n_micro, edge_weights=edge_weights,
+        )
+        self.weighted = (connectivity.weights + connectivity.weights.T).tocsr()
+        if self.fused:
+            self.multiplicity = (connectivity.counts + connectivity.counts.T).tocsr()
+        else:
+            self.multiplicity = self.weighted
+
+        self.visible: Set[int] = set()
+        self.pairs: Dict[Tuple[int, int], Tuple[float, float]] = {}
+
+    def update(self, index: DendrogramIndex, visible: Set[int]) -> int:
+        """Bring pair counts up to date for a new visible set.
+
+        Returns the number of clusters whose edge rows were computed.
+        """
+        stale = self.visible - visible
+        if stale:
+            self.pairs = {k: v for k, v in self.pairs.items() if k[0] not in stale and k[1] not in stale}
+        added = sorted(visible - self.visible)
+        if added:
+            nodes = np.array(sorted(visible), dtype=np.int64)
+            starts, ends = index.start[nodes], index.end[nodes]
+            for node in added:
+                start, end = index.start[node], index.end[node]
+                weight = _block_sums(self.weighted, start, end, starts, ends)
+                count = weight if self.multiplicity is self.weighted else _block_sums(
+                    self.multiplicity, start, end, starts, ends)
+                for other, w, c in zip(nodes.tolist(), weight.tolist(), count.tolist()):
+                    if other != node and c > 0:
+                        self.pairs[(min(node, other), max(node, other))] = (w, c)
+        self.visible = set(visible)
+        return len(added)
+
+
+def _block_sums(matrix: sp.csr_matrix, start: int, end: int,
+                starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Sum of matrix[start:end, s:e] for every (s, e) block."""
+    row = np.asarray(matrix[start:end].sum(axis=0)).ravel()
+    cumulative = np.concatenate(([0.0], np.cumsum(row)))
+    return cumulative[ends] - cumulative[starts]
+
+
+class ViewSession:
+    """Caches reused across build_hierarchical_view calls for one view.
+
+    A session is bound to one spectral result, adjacency, metadata dict and
+    ego; build_hierarchical_view ignores (and replaces) a session whose
+    inputs do not match. Methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        linkage_matrix: np.ndarray,
+        micro_labels: np.ndarray,
+        micro_centroids: np.ndarray,
+        node_ids: np.ndarray,
+        adjacency,
+        node_metadata: Dict[str, Dict],
+        ego_node_id: Optional[str] = None,
+        max_aggregates: int = MAX_AGGREGATES,
+    ):
+        self.linkage_matrix = linkage_matrix
+        self.micro_labels = micro_labels
+        self.micro_centroids = micro_centroids
+        self.node_ids = node_ids
+        self.adjacency = adjacency
+        self.node_metadata = node_metadata
+        self.ego_node_id = ego_node_id
+        self.n_micro = len(micro_centroids)
+        self.index = get_dendrogram_index(linkage_matrix, self.n_micro) or DendrogramIndex(
+            linkage_matrix, self.n_micro
+        )
+
+        self._lock = threading.RLock()
+        self._max_aggregates = max_aggregates
+        self._aggregates: OrderedDict[int, ClusterAggregate] = OrderedDict()
+        self._base_cuts: Dict[int, Tuple[int, ...]] = {}
+        self._edge_states: OrderedDict[Tuple, _EdgeState] = OrderedDict()
+        self._node_id_to_idx: Optional[Dict[str, int]] = None
+        self._micro_to_nodes: Optional[Dict[int, List[int]]] = None
+        self._in_degrees: Optional[np.ndarray] = None
+        self._in_degrees_done = False
+        self._ego_micro: Optional[int] = None
+        self._ego_done = False
+
+        self.builds = 0
+        self.aggregates_reused = 0
+        self.aggregates_computed = 0
+        self.edge_rows_computed = 0
+
+    def matches(
+        self,
+        linkage_matrix: np.ndarray,
+        micro_labels: np.ndarray,
+        micro_centroids: np.ndarray,
+        node_ids: np.ndarray,
+        adjacency,
+        node_metadata: Dict[str, Dict],
+        ego_node_id: Optional[str],
+    ) -> bool:
+        """True if this session was built for exactly these inputs."""
+        return (
+            linkage_matrix is self.linkage_matrix
+            # Callers may rebuild a default labels array (np.arange) per request.
+            and (micro_labels is self.micro_labels or np.array_equal(micro_labels, self.micro_labels))
+            and micro_centroids is self.micro_centroids
+            and node_ids is self.node_ids
+            and adjacency is self.adjacency
+            and node_metadata is self.node_metadata
+            and ego_node_id == self.ego_node_id
+        )
+
+    @property
+    def node_id_to_idx(self) -> Dict[str, int]:
+        with self._lock:
+            if self._node_id_to_idx is None:
+                self._node_id_to_idx = {str(nid): i for i, nid in enumerate(self.node_ids)}
+            return self._node_id_to_idx
+
+    @property
+    def micro_to_nodes(self) -> Dict[int, List[int]]:
+        """micro-cluster -> node indices (ascending)."""
+        with self._lock:
+            if self._micro_to_nodes is None:
+                labels = np.asarray(self.micro_labels)
+                order = np.argsort(labels, kind="stable")
+                uniques, first = np.unique(labels[order], return_index=True)
+                groups = np.split(order, first[1:])
+                self._micro_to_nodes = {
+                    int(m): group.tolist() for m, group in zip(uniques.tolist(), groups)
+                }
+            return self._micro_to_nodes
+
+    @property
+    def in_degrees(self) -> Optional[np.ndarray]:
+        with self._lock:
+            if not self._in_degrees_done:
+                self._in_degrees_done = True
+                if self.adjacency is not None:
+                    try:
+                        self._in_degrees = np.array(self.adjacency.sum(axis=0)).ravel()
+                    except Exception:
+                        self._in_degrees = None
+            return self._in_degrees
+
+    @property
+    def ego_micro(self) -> Optional[int]:
+        with self._lock:
+            if not self._ego_done:
+                self._ego_done = True
+                if self.ego_node_id is not None:
+                    ego_indices = np.where(self.node_ids == self.ego_node_id)[0]
+                    if len(ego_indices):
+                        self._ego_micro = int(self.micro_labels[ego_indices[0]])
+            return self._ego_micro
+
+    def base_cut(self, granularity: int) -> Set[int]:
+        """Dendrogram leaders of the fcluster cut into `granularity` clusters."""
+        with self._lock:
+            leaders = self._base_cuts.get(granularity)
+            if leaders is None:
+                labels = fcluster(self.linkage_matrix, t=granularity, criterion="maxclust")
+                label_to_leader = find_cluster_leaders(self.linkage_matrix, labels, self.n_micro)
+                leaders = tuple(sorted(label_to_leader.values()))
+                self._base_cuts[granularity] = leaders
+            return set(leaders)
+
+    def get_aggregate(self, dend_node: int) -> Optional[ClusterAggregate]:
+        with self._lock:
+            aggregate = self._aggregates.get(dend_node)
+            if aggregate is not None:
+                self._aggregates.move_to_end(dend_node)
+                self.aggregates_reused += 1
+            return aggregate
+
+    def put_aggregate(self, dend_node: int, aggregate: ClusterAggregate) -> None:
+        with self._lock:
+            self._aggregates[dend_node] = aggregate
+            self._aggregates.move_to_end(dend_node)
+            self.aggregates_computed += 1
+            while len(self._aggregates) > self._max_aggregates:
+                self._aggregates.popitem(last=False)
+
+    def edges(
+        self,
+        clusters: List[HierarchicalCluster],
+        louvain_communities: Optional[Dict[str, int]] = None,
+        louvain_weight: float = 0.0,
+    ) -> List[HierarchicalEdge]:
+        """compute_hierarchical_edges for the visible dendrogram clusters,
+        reusing counts for pairs that were already visible last build."""
+        dendrogram = [c for c in clusters if c.dendrogram_node >= 0 and c.member_micro_indices]
+        nodes = [c.dendrogram_node for c in dendrogram]
+        if self.adjacency is None or not self._is_partition(nodes):
+            # Overlapping subtrees: fall back to the per-edge scan, whose
+            # last-cluster-wins micro mapping we do not replicate here.
+            return compute_hierarchical_edges(
+                clusters, self.micro_labels, self.adjacency, self.node_ids,
+                louvain_communities, louvain_weight,
+            )
+
+        fused = bool(louvain_communities) and louvain_weight > 0
+        key = (id(louvain_communities), louvain_weight) if fused else None
+        with self._lock:
+            state = self._edge_states.get(key)
+            if state is None:
+                state = _EdgeState(self, louvain_communities if fused else None, louvain_weight)
+                self._edge_states[key] = state
+                while len(self._edge_states) > MAX_EDGE_STATES:
+                    self._edge_states.popitem(last=False)
+            self._edge_states.move_to_end(key)
+            self.edge_rows_computed += state.update(self.index, set(nodes))
+            pairs = list(state.pairs.items())
+
+        by_node = {c.dendrogram_node: c for c in dendrogram}
+        edges = []
+        for (a, b), (weight, _) in pairs:
+            first, second = by_node[a], by_node[b]
+            src, tgt = (first, second) if first.id < second.id else (second, first)
+            size_product = src.size * tgt.size
+            edges.append(HierarchicalEdge(
+                source_id=src.id,
+                target_id=tgt.id,
+                raw_count=int(round(weight)),
+                connectivity=weight / np.sqrt(size_product) if size_product > 0 else 0,
+            ))
+        edges.sort(key=lambda e: (e.source_id, e.target_id))
+        return edges
+
+    def _is_partition(self, nodes: Iterable[int]) -> bool:
+        """True if no visible subtree contains another."""
+        ordered = sorted(nodes, key=lambda n: self.index.start[n])
+        for prev, node in zip(ordered, ordered[1:]):
+            if self.index.start[node] < self.index.end[prev]:
+                return False
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "builds": self.builds,
+                "aggregates": len(self._aggregates),
+                "aggregates_reused": self.aggregates_reused,
+                "aggregates_computed": self.aggregates_computed,
+                "edge_rows_computed": self.edge_rows_computed,
+                "base_cuts": len(self._base_cuts),
+            }
+
+
+def resolve_session(
+    session: Optional[ViewSession],
+    linkage_matrix: np.ndarray,
+    micro_labels: np.ndarray,
+    micro_centroids: np.ndarray,
+    node_ids: np.ndarray,
+    adjacency,
+    node_metadata: Dict[str, Dict],
+    ego_node_id: Optional[str] = None,
+) -> ViewSession:
+    """session if it was built for these inputs, otherwise a fresh one."""
+    args = (linkage_matrix, micro_labels, micro_centroids, node_ids, adjacency, node_metadata, ego_node_id)
+    if session is not None and session.matches(*args):
+        return session
+    return ViewSession(*args)
+
+
+class ViewSessionStore:
+    """LRU of ViewSessions keyed by the caller (e.g. (ego, lens, granularity))."""
+
+    def __init__(self, max_sessions: int = 16):
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict[Tuple, ViewSession] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[ViewSession]:
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+            return session
+
+    def put(self, key: Tuple, session: ViewSession) -> None:
+        with self._lock:
+            self._sessions[key] = session
+            self._sessions.move_to_end(key)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
@@ -1,10 +1,154 @@
-"""Tree traversal utilities for dendrogram navigation."""
+"""Tree traversal utilities for dendrogram navigation.
+
+The module-level helpers take a scipy linkage matrix. They delegate to a
+DendrogramIndex built once per linkage array (and cached), so parent,
+sibling, size and descendant queries are O(1) and a subtree's leaves are a
+contiguous slice of the left-to-right leaf order.
+"""
 from __future__ import annotations
 
+import threading
+import weakref
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple, Set
 import numpy as np
 from scipy.cluster.hierarchy import leaders
 
+# Linkage arrays whose index is kept alive (one per spectral result/lens).
+INDEX_CACHE_SIZE = 8
+
+
+class DendrogramIndex:
+    """Precomputed navigation arrays for a binary dendrogram.
+
+    Node ids follow scipy: 0..n_leaves-1 are leaves, n_leaves + i is the
+    node created by linkage row i. Leaves are laid out in left-to-right
+    (depth-first) order so every subtree occupies leaf_order[start:end].
+    """
+
+    def __init__(self, linkage_matrix: np.ndarray, n_leaves: Optional[int] = None):
+        linkage_matrix = np.asarray(linkage_matrix)
+        n_rows = linkage_matrix.shape[0]
+        if n_leaves is None:
+            n_leaves = n_rows + 1
+        if n_rows != n_leaves - 1:
+            raise ValueError(
+                f"linkage has {n_rows} rows, expected {n_leaves - 1} for {n_leaves} leaves"
+            )
+        self.n_leaves = n_leaves
+        n_nodes = 2 * n_leaves - 1
+        self.n_nodes = n_nodes
+        self.root = n_nodes - 1
+
+        self.left = np.full(n_nodes, -1, dtype=np.int64)
+        self.right = np.full(n_nodes, -1, dtype=np.int64)
+        if n_rows:
+            self.left[n_leaves:] = linkage_matrix[:, 0].astype(np.int64)
+            self.right[n_leaves:] = linkage_matrix[:, 1].astype(np.int64)
+
+        self.parent = np.full(n_nodes, -1, dtype=np.int64)
+        internal = np.arange(n_leaves, n_nodes)
+        self.parent[self.left[n_leaves:]] = internal
+        self.parent[self.right[n_leaves:]] = internal
+
+        self.sibling = np.full(n_nodes, -1, dtype=np.int64)
+        self.sibling[self.left[n_leaves:]] = self.right[n_leaves:]
+        self.sibling[self.right[n_leaves:]] = self.left[n_leaves:]
+
+        # Children always have smaller ids than their parent, so one pass in
+        # row order is bottom-up and one in reverse row order is top-down.
+        size = np.ones(n_nodes, dtype=np.int64)
+        left, right = self.left.tolist(), self.right.tolist()
+        size_list = size.tolist()
+        for node in range(n_leaves, n_nodes):
+            size_list[node] = size_list[left[node]] + size_list[right[node]]
+        start_list = [0] * n_nodes
+        for node in range(n_nodes - 1, n_leaves - 1, -1):
+            start_list[left[node]] = start_list[node]
+            start_list[right[node]] = start_list[node] + size_list[left[node]]
+        self.size = np.array(size_list, dtype=np.int64)
+        self.start = np.array(start_list, dtype=np.int64)
+        self.end = self.start + self.size
+
+        self.leaf_order = np.empty(n_leaves, dtype=np.int64)
+        self.leaf_order[self.start[:n_leaves]] = np.arange(n_leaves)
+
+    def contains(self, node_idx: int) -> bool:
+        return 0 <= node_idx < self.n_nodes
+
+    def children(self, node_idx: int) -> Optional[Tuple[int, int]]:
+        if node_idx < self.n_leaves or not self.contains(node_idx):
+            return None
+        return int(self.left[node_idx]), int(self.right[node_idx])
+
+    def parent_of(self, node_idx: int) -> Optional[int]:
+        if not self.contains(node_idx):
+            return None
+        parent = int(self.parent[node_idx])
+        return parent if parent >= 0 else None
+
+    def sibling_of(self, node_idx: int) -> Optional[int]:
+        if not self.contains(node_idx):
+            return None
+        sibling = int(self.sibling[node_idx])
+        return sibling if sibling >= 0 else None
+
+    def subtree_size(self, node_idx: int) -> int:
+        return int(self.size[node_idx]) if self.contains(node_idx) else 1
+
+    def subtree_nodes(self, node_idx: int) -> np.ndarray:
+        """Ids of node_idx and every node below it (leaves and internal)."""
+        start, end = self.start[node_idx], self.end[node_idx]
+        internal = np.arange(self.n_leaves, node_idx + 1) if node_idx >= self.n_leaves else np.empty(0, np.int64)
+        internal = internal[(self.start[internal] >= start) & (self.end[internal] <= end)]
+        return np.concatenate([self.leaf_order[start:end], internal])
+
+    def leaf_range(self, node_idx: int) -> Tuple[int, int]:
+        """[start, end) of the node's leaves within leaf_order."""
+        return int(self.start[node_idx]), int(self.end[node_idx])
+
+    def leaves(self, node_idx: int) -> np.ndarray:
+        """Leaf ids under node_idx, left to right (a view into leaf_order)."""
+        if not self.contains(node_idx):
+            return np.array([node_idx], dtype=np.int64)
+        return self.leaf_order[self.start[node_idx]:self.end[node_idx]]
+
+    def is_descendant(self, node_idx: int, ancestor_idx: int) -> bool:
+        """True if node_idx is ancestor_idx or lies in its subtree."""
+        if node_idx == ancestor_idx:
+            return True
+        if not (self.contains(node_idx) and self.contains(ancestor_idx)):
+            return False
+        return bool(
+            self.start[ancestor_idx] <= self.start[node_idx]
+            and self.end[node_idx] <= self.end[ancestor_idx]
+        )
+
+
+_index_cache: "OrderedDict[int, Tuple[weakref.ref, int, DendrogramIndex]]" = OrderedDict()
+_index_lock = threading.Lock()
+
+
+def get_dendrogram_index(linkage_matrix: np.ndarray, n_leaves: int) -> Optional[DendrogramIndex]:
+    """Cached DendrogramIndex for this linkage array, or None if n_leaves
+    does not match its shape (callers then fall back to direct scans)."""
+    if not isinstance(linkage_matrix, np.ndarray) or linkage_matrix.ndim != 2:
+        return None
+    if linkage_matrix.shape[0] != n_leaves - 1:
+        return None
+    key = id(linkage_matrix)
+    with _index_lock:
+        hit = _index_cache.get(key)
+        if hit is not None and hit[0]() is linkage_matrix and hit[1] == n_leaves:
+            _index_cache.move_to_end(key)
+            return hit[2]
+    index = DendrogramIndex(linkage_matrix, n_leaves)
+    with _index_lock:
+        _index_cache[key] = (weakref.ref(linkage_matrix), n_leaves, index)
+        while len(_index_cache) > INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
+
 
 def get_dendrogram_id(node_idx: int) -> str:
     """Convert dendrogram node index to string ID."""
@@ -30,6 +174,9 @@ def get_children(linkage_matrix: np.ndarray, node_idx: int, n_leaves: int) -> Op
 
 def get_parent(linkage_matrix: np.ndarray, node_idx: int, n_leaves: int) -> Optional[int]:
     """Get parent of a dendrogram node."""
+    index = get_dendrogram_index(linkage_matrix, n_leaves)
+    if index is not None:
+        return index.parent_of(node_idx)
     for i, row in enumerate(linkage_matrix):
         if int(row[0]) == node_idx or int(row[1]) == node_idx:
             return n_leaves + i
@@ -37,6 +184,9 @@ def get_parent(linkage_matrix: np.ndarray, node_idx: int, n_leaves: int) -> Opti
 
 def get_subtree_leaves(linkage_matrix: np.ndarray, node_idx: int, n_leaves: int) -> List[int]:
     """Get all leaf indices under this dendrogram node."""
+    index = get_dendrogram_index(linkage_matrix, n_leaves)
+    if index is not None and index.contains(node_idx):
+        return index.leaves(node_idx).tolist()
     if node_idx < n_leaves:
         return [node_idx]
     children = get_children(linkage_matrix, node_idx, n_leaves)
@@ -51,6 +201,12 @@ def subtree_size(linkage_matrix: np.ndarray, node_idx: int, n_leaves: int, memo:
     """Compute number of leaves under a dendrogram node (cached)."""
     if node_idx in memo:
         return memo[node_idx]
+    index = get_dendrogram_index(linkage_matrix, n_leaves)
+    if index is not None and index.contains(node_idx):
+        # Fill memo for the whole subtree, as the recursive version does.
+        nodes = index.subtree_nodes(node_idx)
+        memo.update(zip(nodes.tolist(), index.size[nodes].tolist()))
+        return memo[node_idx]
     if node_idx < n_leaves:
         memo[node_idx] = 1
         return 1
@@ -64,6 +220,9 @@ def subtree_size(linkage_matrix: np.ndarray, node_idx: int, n_leaves: int, memo:
 
 def get_siblings(linkage_matrix: np.ndarray, node_idx: int, n_leaves: int) -> Optional[int]:
     """Get sibling of a dendrogram node."""
+    index = get_dendrogram_index(linkage_matrix, n_leaves)
+    if index is not None:
+        return index.sibling_of(node_idx)
     parent = get_parent(linkage_matrix, node_idx, n_leaves)
     if parent is None:
         return None
@@ -77,6 +236,9 @@ def is_descendant(linkage_matrix: np.ndarray, node_idx: int, ancestor_idx: int,
     """Check if node_idx is a descendant of ancestor_idx (or equal to it)."""
     if node_idx == ancestor_idx:
         return True
+    index = get_dendrogram_index(linkage_matrix, n_leaves)
+    if index is not None and index.contains(node_idx) and index.contains(ancestor_idx):
+        return index.is_descendant(node_idx, ancestor_idx)
     if ancestor_idx < n_leaves:
         # Ancestor is a leaf, can only be descendant if equal
         return False
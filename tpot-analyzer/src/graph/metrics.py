@@ -8,6 +8,7 @@ from typing import Dict, Iterable, Optional, Tuple
 import networkx as nx
 from networkx.exception import PowerIterationFailedConvergence
 
+from src.graph.csr_graph import CSRGraph
 from src.performance_profiler import profile_phase
 
 logger = logging.getLogger(__name__)
@@ -218,7 +219,18 @@ def compute_personalized_pagerank(
             )
 
         try:
-            if not seeds:
+            if isinstance(graph, CSRGraph):
+                # Snapshot graphs are unweighted; CSRGraph mirrors nx.pagerank.
+                personalization = (
+                    {seed: 1.0 / len(seeds) for seed in seeds if seed in graph} if seeds else None
+                )
+                result = graph.pagerank(
+                    alpha=alpha,
+                    personalization=personalization,
+                    max_iter=max_iter,
+                    tol=tol,
+                )
+            elif not seeds:
                 result = nx.pagerank(
                     graph,
                     alpha=alpha,
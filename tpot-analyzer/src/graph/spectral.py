@@ -4,20 +4,25 @@ from __future__ import annotations
 import json
 import logging
 import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 from scipy.cluster.hierarchy import linkage, fcluster
-from scipy.sparse import csr_matrix
-from scipy.sparse.linalg import eigsh, ArpackNoConvergence
+from scipy.sparse import csr_matrix, diags, identity
+from scipy.sparse.linalg import eigsh, lobpcg, ArpackNoConvergence
 from sklearn.cluster import Birch
 from sklearn.metrics import adjusted_rand_score
 
 logger = logging.getLogger(__name__)
 
+EIGENSOLVERS = ("arpack", "shift_invert", "lobpcg")
+PRECONDITIONERS = ("jacobi", "amg", "none")
+
 
 @dataclass
 class SpectralConfig:
@@ -28,8 +33,15 @@ class SpectralConfig:
     eigensolver_maxiter: int = 5000
     linkage_method: str = "ward"
     stability_runs: int = 1  # >=2 enables stability ARI check
+    stability_workers: int = 1  # >1 runs the perturbed re-clusterings in a process pool
+    stability_noise: float = 0.001  # std of the Gaussian perturbation
+    stability_seed: int = 0  # run i draws noise from stability_seed + i
     max_linkage_nodes: int = 12000  # above this, use approximate method
     birch_threshold: float = 0.3  # BIRCH clustering threshold
+    eigensolver: str = "arpack"  # arpack | shift_invert | lobpcg
+    preconditioner: str = "jacobi"  # lobpcg only: jacobi | amg (needs pyamg) | none
+    lobpcg_tol: float = 1e-6  # LOBPCG stopping tolerance on ||Lx - λx||
+    shift_invert_sigma: float = -1e-3  # shift below 0 keeps L - σI positive definite
 
 
 @dataclass
@@ -44,6 +56,8 @@ class SpectralResult:
     # For approximate mode (large graphs):
     micro_labels: Optional[np.ndarray] = None  # (n_nodes,) micro-cluster assignments
     micro_centroids: Optional[np.ndarray] = None  # (n_micro, n_dims)
+    # Raw eigenvectors before row normalization; warm start for the next run
+    eigenvectors: Optional[np.ndarray] = None  # (n_nodes, n_dims)
 
 
 def _row_normalize(matrix: np.ndarray) -> np.ndarray:
@@ -75,13 +89,190 @@ def compute_normalized_laplacian(adjacency: csr_matrix) -> csr_matrix:
     return L
 
 
+def _trivial_eigenvector(adjacency: csr_matrix) -> np.ndarray:
+    """D^{1/2}·1 normalized: the eigenvalue-0 eigenvector of L_sym."""
+    A = (adjacency + adjacency.T) / 2
+    degrees = np.array(A.sum(axis=1)).flatten()
+    degrees[degrees == 0] = 1
+    vec = np.sqrt(degrees)
+    return vec / np.linalg.norm(vec)
+
+
+def warm_start_block(
+    previous: SpectralResult,
+    node_ids: np.ndarray,
+    k: int,
+    trivial: np.ndarray,
+    seed: int = 0,
+) -> Tuple[np.ndarray, int]:
+    """Initial (n_nodes × k) eigenvector block from a previous result.
+
+    Column 0 is the trivial eigenvector; the rest are the previous
+    eigenvectors (or, for results saved without them, the row-normalized
+    embedding) aligned to node_ids by id. Nodes and columns the previous
+    result lacks get small random values so the block stays full rank.
+
+    Returns the block and the number of nodes matched.
+    """
+    n = len(node_ids)
+    previous_vectors = previous.eigenvectors if previous.eigenvectors is not None else previous.embedding
+    index = {str(nid): i for i, nid in enumerate(previous.node_ids)}
+    rows = np.array([index.get(str(nid), -1) for nid in node_ids], dtype=np.int64)
+    matched = rows >= 0
+
+    rng = np.random.default_rng(seed)
+    block = rng.normal(scale=1e-3 / np.sqrt(max(n, 1)), size=(n, k))
+    block[:, 0] = trivial
+    cols = min(k - 1, previous_vectors.shape[1])
+    block[matched, 1 : cols + 1] += previous_vectors[rows[matched], :cols]
+    return block, int(matched.sum())
+
+
+def _lobpcg_preconditioner(L: csr_matrix, name: str):
+    """(preconditioner, name actually used) for LOBPCG on L."""
+    if name == "amg":
+        try:
+            import pyamg
+        except ImportError:
+            logger.warning("pyamg not installed; using Jacobi preconditioner for LOBPCG")
+            name = "jacobi"
+        else:
+            # Small shift so the (singular) Laplacian has an AMG hierarchy
+            shifted = (L + 1e-3 * identity(L.shape[0], format="csr")).tocsr()
+            return pyamg.smoothed_aggregation_solver(shifted).aspreconditioner(), "amg"
+    if name == "jacobi":
+        diagonal = L.diagonal()
+        return diags(1.0 / np.where(diagonal > 0, diagonal, 1.0)), "jacobi"
+    return None, "none"
+
+
+def _run_eigensolver(
+    solver: str,
+    L: csr_matrix,
+    k: int,
+    cfg: SpectralConfig,
+    initial_block: Optional[np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
+    """Smallest k eigenpairs of L with one backend; info records timing."""
+    info: Dict[str, Any] = {"solver": solver}
+    start = time.time()
+    # ARPACK takes a single start vector; the block's sum spans all of it.
+    v0 = initial_block.sum(axis=1) if initial_block is not None else None
+    if solver == "lobpcg":
+        M, info["preconditioner"] = _lobpcg_preconditioner(L, cfg.preconditioner)
+        info["setup_seconds"] = time.time() - start
+        X = initial_block
+        if X is None:
+            X = np.random.default_rng(0).normal(size=(L.shape[0], k))
+            X[:, 0] = 1.0
+        with warnings.catch_warnings():
+            # Non-convergence is judged from the residuals below.
+            warnings.simplefilter("ignore", UserWarning)
+            vals, vecs = lobpcg(
+                L, X, M=M, tol=cfg.lobpcg_tol, maxiter=cfg.eigensolver_maxiter, largest=False,
+            )
+        residuals = np.linalg.norm(L @ vecs - vecs * vals, axis=0)
+        info["max_residual"] = float(residuals.max())
+        # Slack for the recomputed residual; misses by more fall back to ARPACK.
+        info["converged"] = bool(info["max_residual"] <= 10 * cfg.lobpcg_tol)
+    else:
+        kwargs: Dict[str, Any] = {"which": "SM"}
+        if solver == "shift_invert":
+            # Largest eigenvalues of (L - σI)^-1 are the smallest of L.
+            kwargs = {"sigma": cfg.shift_invert_sigma, "which": "LM"}
+        try:
+            vals, vecs = eigsh(
+                L,
+                k=k,
+                tol=cfg.eigensolver_tol,
+                maxiter=cfg.eigensolver_maxiter,
+                v0=v0,
+                return_eigenvectors=True,
+                **kwargs,
+            )
+            info["converged"] = True
+        except ArpackNoConvergence as exc:
+            logger.warning("ARPACK (%s) did not fully converge: %s", solver, exc)
+            vals, vecs = exc.eigenvalues, exc.eigenvectors
+            info["converged"] = False
+    info["seconds"] = time.time() - start
+    return vals, vecs, info
+
+
+# Per-worker state for stability runs, set once by _init_stability_worker.
+_STABILITY: Dict[str, Any] = {}
+
+
+def _init_stability_worker(points: np.ndarray, cfg: SpectralConfig, normalize: bool) -> None:
+    _STABILITY.update(points=points, cfg=cfg, normalize=normalize)
+
+
+def _stability_worker_cut(seed: int) -> np.ndarray:
+    return _perturbed_cut(_STABILITY["points"], _STABILITY["cfg"], _STABILITY["normalize"], seed)
+
+
+def _perturbed_cut(points: np.ndarray, cfg: SpectralConfig, normalize: bool, seed: int) -> np.ndarray:
+    """Flat clusters of a re-linked, noise-perturbed copy of points."""
+    noise = np.random.default_rng(seed).normal(0, cfg.stability_noise, points.shape)
+    noisy = points + noise.astype(points.dtype)
+    if normalize:
+        noisy = _row_normalize(noisy)
+    noisy_linkage = linkage(noisy, method=cfg.linkage_method)
+    return fcluster(noisy_linkage, t=min(50, noisy.shape[0]), criterion="maxclust")
+
+
+def compute_stability(
+    points: np.ndarray,
+    linkage_matrix: np.ndarray,
+    cfg: SpectralConfig,
+    node_labels: Optional[np.ndarray] = None,
+    normalize: bool = True,
+) -> List[float]:
+    """ARI between the base 50-cluster cut and cuts of perturbed re-linkages.
+
+    points are what linkage_matrix was built on: the node embedding in
+    direct mode, or the micro-cluster centroids in approximate mode, where
+    node_labels (node -> micro-cluster) lifts both cuts to nodes so the
+    score stays comparable between modes. Run i uses seed
+    cfg.stability_seed + i, so serial and pooled runs give the same scores.
+    """
+    t = min(50, points.shape[0])
+    base_cut = fcluster(linkage_matrix, t=t, criterion="maxclust")
+    seeds = [cfg.stability_seed + i for i in range(cfg.stability_runs - 1)]
+
+    if cfg.stability_workers <= 1 or len(seeds) <= 1:
+        cuts = [_perturbed_cut(points, cfg, normalize, seed) for seed in seeds]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(cfg.stability_workers, len(seeds)),
+            initializer=_init_stability_worker,
+            initargs=(points, cfg, normalize),
+        ) as pool:
+            cuts = list(pool.map(_stability_worker_cut, seeds))
+
+    if node_labels is not None:
+        base_cut = base_cut[node_labels]
+        cuts = [cut[node_labels] for cut in cuts]
+    return [adjusted_rand_score(base_cut, cut) for cut in cuts]
+
+
 def compute_spectral_embedding(
     adjacency: csr_matrix,
     node_ids: Iterable[str],
     config: Optional[SpectralConfig] = None,
+    previous: Optional[SpectralResult] = None,
 ) -> SpectralResult:
-    """Compute spectral embedding and linkage for clustering."""
+    """Compute spectral embedding and linkage for clustering.
+
+    previous: An earlier result for (nearly) the same graph. Its eigenvectors
+        seed the eigensolver, which then needs far fewer iterations after
+        a small graph refresh.
+    """
     cfg = config or SpectralConfig()
+    if cfg.eigensolver not in EIGENSOLVERS:
+        raise ValueError(f"eigensolver must be one of {EIGENSOLVERS}, got {cfg.eigensolver!r}")
+    if cfg.preconditioner not in PRECONDITIONERS:
+        raise ValueError(f"preconditioner must be one of {PRECONDITIONERS}, got {cfg.preconditioner!r}")
     node_ids = np.array(list(node_ids))
 
     metrics: Dict[str, Any] = {}
@@ -101,28 +292,41 @@ def compute_spectral_embedding(
 
     # Eigendecomposition (k = n_dims + 1, drop first)
     start = time.time()
+    attempts: List[Dict[str, Any]] = []
+    solver_used = cfg.eigensolver
     if n_nodes <= 2:
         # tiny graphs: fall back to dense eigh
         vals, vecs = np.linalg.eigh(L.toarray())
         converged = True
+        solver_used = "dense"
     else:
         k = min(cfg.n_dims + 1, max(1, n_nodes - 1))  # ARPACK requires k < N
-        try:
-            vals, vecs = eigsh(
-                L,
-                k=k,
-                which="SM",
-                tol=cfg.eigensolver_tol,
-                maxiter=cfg.eigensolver_maxiter,
-                return_eigenvectors=True,
+        initial_block = None
+        if previous is not None:
+            initial_block, matched = warm_start_block(
+                previous, node_ids, k, _trivial_eigenvector(adjacency),
             )
-            converged = True
-        except ArpackNoConvergence as exc:
-            logger.warning("ARPACK did not fully converge: %s", exc)
-            vals, vecs = exc.eigenvalues, exc.eigenvectors
-            converged = False
+            metrics["eigensolver_warm_start_matched"] = matched
+            logger.info("Warm-starting eigensolver from previous result (%d/%d nodes matched)", matched, n_nodes)
+        try:
+            vals, vecs, info = _run_eigensolver(cfg.eigensolver, L, k, cfg, initial_block)
+            attempts.append(info)
+        except Exception as exc:
+            if cfg.eigensolver == "arpack":
+                raise
+            logger.warning("%s eigensolver failed: %s", cfg.eigensolver, exc)
+            attempts.append({"solver": cfg.eigensolver, "error": str(exc), "seconds": time.time() - start})
+            info = {"converged": False}
+        if cfg.eigensolver != "arpack" and not info["converged"]:
+            logger.warning("%s did not converge; falling back to ARPACK", cfg.eigensolver)
+            vals, vecs, info = _run_eigensolver("arpack", L, k, cfg, initial_block)
+            attempts.append(info)
+            solver_used = "arpack"
+        converged = info["converged"]
     metrics["eigensolver_time_seconds"] = time.time() - start
     metrics["eigensolver_converged"] = converged
+    metrics["eigensolver_used"] = solver_used
+    metrics["eigensolver_attempts"] = attempts
 
     # Sort and drop trivial eigenvector
     idx = np.argsort(vals)
@@ -137,7 +341,8 @@ def compute_spectral_embedding(
     else:
         metrics["eigenvalue_gap"] = 0.0
 
-    embedding = _row_normalize(eigenvectors.astype(np.float32))
+    eigenvectors = eigenvectors.astype(np.float32)
+    embedding = _row_normalize(eigenvectors)
 
     # Hierarchical clustering on embedding
     start = time.time()
@@ -191,23 +396,25 @@ def compute_spectral_embedding(
     # Stability check (optional)
     stability_mean = 1.0
     stability_std = 0.0
-    if cfg.stability_runs and cfg.stability_runs > 1 and n_nodes <= cfg.max_linkage_nodes:
-        # Only run stability check for direct linkage (expensive otherwise)
-        base_labels = fcluster(
-            linkage_matrix,
-            t=min(50, embedding.shape[0]),
-            criterion="maxclust",
-        )
-        ari_scores = []
-        for _ in range(cfg.stability_runs - 1):
-            noise = np.random.normal(0, 0.001, embedding.shape)
-            noisy_embed = _row_normalize(embedding + noise.astype(np.float32))
-            noisy_linkage = linkage(noisy_embed, method=cfg.linkage_method)
-            cut = fcluster(noisy_linkage, t=min(50, noisy_embed.shape[0]), criterion="maxclust")
-            ari_scores.append(adjusted_rand_score(base_labels, cut))
+    stability_mode = "off"
+    if cfg.stability_runs and cfg.stability_runs > 1:
+        start = time.time()
+        if micro_labels is None:
+            stability_mode = "direct"
+            ari_scores = compute_stability(embedding, linkage_matrix, cfg)
+        else:
+            # Re-linking all nodes is what approximate mode avoids; perturb
+            # and re-link the micro-cluster centroids instead.
+            stability_mode = "micro_centroids"
+            ari_scores = compute_stability(
+                micro_centroids, linkage_matrix, cfg, node_labels=micro_labels, normalize=False,
+            )
         if ari_scores:
             stability_mean = float(np.mean(ari_scores))
             stability_std = float(np.std(ari_scores))
+        metrics["stability_time_seconds"] = time.time() - start
+        metrics["stability_workers"] = cfg.stability_workers
+    metrics["stability_mode"] = stability_mode
     metrics["stability_ari_mean"] = stability_mean
     metrics["stability_ari_std"] = stability_std
 
@@ -218,10 +425,15 @@ def compute_spectral_embedding(
         "n_nodes": len(node_ids),
         "n_dims": cfg.n_dims,
         "method": "normalized_laplacian",
-        "eigensolver": "arpack",
+        "eigensolver": solver_used,
         "eigensolver_params": {
             "tol": cfg.eigensolver_tol,
             "maxiter": cfg.eigensolver_maxiter,
+            "requested": cfg.eigensolver,
+            "preconditioner": cfg.preconditioner,
+            "lobpcg_tol": cfg.lobpcg_tol,
+            "shift_invert_sigma": cfg.shift_invert_sigma,
+            "warm_start": previous is not None,
         },
         "linkage_method": cfg.linkage_method,
         "approximate_clustering": n_nodes > cfg.max_linkage_nodes,
@@ -236,6 +448,7 @@ def compute_spectral_embedding(
         metadata=metadata,
         micro_labels=micro_labels,
         micro_centroids=micro_centroids.astype(np.float32) if micro_centroids is not None else None,
+        eigenvectors=eigenvectors,
     )
 
 
@@ -253,6 +466,8 @@ def save_spectral_result(result: SpectralResult, base_path: Path) -> None:
         save_dict["micro_labels"] = result.micro_labels
     if result.micro_centroids is not None:
         save_dict["micro_centroids"] = result.micro_centroids
+    if result.eigenvectors is not None:
+        save_dict["eigenvectors"] = result.eigenvectors
     
     np.savez_compressed(
         base_path.with_suffix(".spectral.npz"),
@@ -272,6 +487,7 @@ def load_spectral_result(base_path: Path) -> SpectralResult:
     # NpzFile doesn't have .get(), check keys explicitly
     micro_labels = data["micro_labels"] if "micro_labels" in data.files else None
     micro_centroids = data["micro_centroids"] if "micro_centroids" in data.files else None
+    eigenvectors = data["eigenvectors"] if "eigenvectors" in data.files else None
 
     return SpectralResult(
         embedding=data["embedding"],
@@ -281,4 +497,5 @@ def load_spectral_result(base_path: Path) -> SpectralResult:
         metadata=metadata,
         micro_labels=micro_labels,
         micro_centroids=micro_centroids,
+        eigenvectors=eigenvectors,
     )
@@ -0,0 +1,261 @@
+"""Bootstrap runner for propagation — streaming stats + optional process pool.
+
+Each bootstrap iteration re-runs propagation with a different 20% seed
+holdout. Instead of stacking every (n_nodes, K) score matrix and taking
+percentiles at the end, iterations are folded into BootstrapStats as they
+finish:
+
+- mean / std via Welford online moments
+- 2.5 / 97.5 percentiles via an order-statistic tail sketch: only the
+  ceil(q * (N - 1)) + 2 smallest (and largest) values per cell are kept,
+  which is all np.percentile's linear interpolation ever looks at. The
+  result is exact, and memory is a few (n, K) planes instead of N.
+
+With n_workers > 1 iterations run in a process pool. The CSR adjacency is
+published once through multiprocessing.shared_memory and rebuilt zero-copy
+in each worker, so it is never pickled per task.
+"""
+from __future__ import annotations
+
+import math
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import scipy.sparse as sp
+
+from src.propagation.types import PprWarmState, PropagationConfig
+
+BOOTSTRAP_HOLDOUT_FRACTION = 0.2
+
+
+class BootstrapStats:
+    """Online mean/std and exact tail percentiles over (n, K) score matrices.
+
+    The expected number of samples must be known up front so the tail
+    sketch can be sized; percentiles are only valid once all are added.
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        n_samples: int,
+        percentiles: tuple[float, float] = (2.5, 97.5),
+    ):
+        if n_samples < 1:
+            raise ValueError("n_samples must be >= 1")
+        self.shape = tuple(shape)
+        self.n_samples = n_samples
+        self.percentiles = percentiles
+        self.count = 0
+        self._mean = np.zeros(self.shape, dtype=np.float64)
+        self._m2 = np.zeros(self.shape, dtype=np.float64)
+
+        # Buffer depth needed so both interpolation neighbours are retained.
+        low_q, high_q = percentiles
+        self._low_k = min(n_samples, int(math.floor(low_q / 100 * (n_samples - 1))) + 2)
+        self._high_k = min(n_samples, n_samples - int(math.floor(high_q / 100 * (n_samples - 1))))
+        self._low = np.empty(self.shape + (0,), dtype=np.float64)   # ascending, k smallest
+        self._high = np.empty(self.shape + (0,), dtype=np.float64)  # ascending, k largest
+
+    def add(self, scores: np.ndarray) -> None:
+        """Fold one bootstrap score matrix into the running statistics."""
+        x = np.asarray(scores, dtype=np.float64)
+        if x.shape != self.shape:
+            raise ValueError(f"Expected scores of shape {self.shape}, got {x.shape}")
+        if self.count >= self.n_samples:
+            raise ValueError(f"BootstrapStats sized for {self.n_samples} samples")
+
+        self.count += 1
+        delta = x - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (x - self._mean)
+
+        low = np.sort(np.concatenate([self._low, x[..., None]], axis=-1), axis=-1)
+        self._low = low[..., : self._low_k]
+        high = np.sort(np.concatenate([self._high, x[..., None]], axis=-1), axis=-1)
+        self._high = high[..., -self._high_k:]
+
+    @property
+    def mean(self) -> np.ndarray:
+        return self._mean.copy()
+
+    @property
+    def std(self) -> np.ndarray:
+        """Population std (ddof=0), matching np.std's default."""
+        if self.count == 0:
+            return np.zeros(self.shape, dtype=np.float64)
+        return np.sqrt(np.maximum(self._m2 / self.count, 0.0))
+
+    def percentile(self, q: float) -> np.ndarray:
+        """Exact np.percentile(samples, q, axis=0) for the configured tails."""
+        if self.count != self.n_samples:
+            raise RuntimeError(
+                f"Percentiles need all {self.n_samples} samples, have {self.count}"
+            )
+        if q not in self.percentiles:
+            raise ValueError(f"Percentile {q} not tracked (tracked: {self.percentiles})")
+
+        n = self.n_samples
+        pos = q / 100 * (n - 1)
+        lo = int(math.floor(pos))
+        frac = pos - lo
+        hi = min(lo + 1, n - 1)
+
+        if q == self.percentiles[0]:
+            buf, offset = self._low, 0
+        else:
+            buf, offset = self._high, n - self._high_k
+        v_lo = buf[..., lo - offset]
+        v_hi = buf[..., hi - offset]
+        return v_lo + frac * (v_hi - v_lo)
+
+
+# ---------------------------------------------------------------------------
+# Shared-memory CSR
+# ---------------------------------------------------------------------------
+
+class SharedCSR:
+    """Publish a CSR matrix's arrays in shared memory for worker processes.
+
+    Usage:
+        with SharedCSR(adjacency) as shared:
+            pool = ProcessPoolExecutor(initializer=..., initargs=(shared.spec,))
+    """
+
+    _PARTS = ("data", "indices", "indptr")
+
+    def __init__(self, matrix: sp.csr_matrix):
+        matrix = sp.csr_matrix(matrix)
+        self._blocks: list[SharedMemory] = []
+        arrays = {}
+        for part in self._PARTS:
+            src = getattr(matrix, part)
+            shm = SharedMemory(create=True, size=max(src.nbytes, 1))
+            self._blocks.append(shm)
+            np.ndarray(src.shape, dtype=src.dtype, buffer=shm.buf)[:] = src
+            arrays[part] = (shm.name, src.shape, src.dtype.str)
+        self.spec = {"shape": matrix.shape, "arrays": arrays}
+
+    def close(self) -> None:
+        for shm in self._blocks:
+            shm.close()
+            shm.unlink()
+        self._blocks = []
+
+    def __enter__(self) -> SharedCSR:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach_csr(spec: dict) -> tuple[sp.csr_matrix, list[SharedMemory]]:
+    """Rebuild a CSR matrix over shared buffers without copying.
+
+    The returned SharedMemory handles must stay referenced for as long as
+    the matrix is in use.
+    """
+    handles = []
+    parts = {}
+    for part, (name, shape, dtype) in spec["arrays"].items():
+        shm = SharedMemory(name=name)
+        handles.append(shm)
+        parts[part] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    matrix = sp.csr_matrix(
+        (parts["data"], parts["indices"], parts["indptr"]),
+        shape=spec["shape"],
+        copy=False,
+    )
+    return matrix, handles
+
+
+# Per-worker state, set once by _init_worker.
+_WORKER: dict = {}
+
+
+def _init_worker(spec: dict, node_ids: np.ndarray, config: PropagationConfig,
+                 seed_eligibility: bool, db_path, warm_state: PprWarmState | None) -> None:
+    adjacency, handles = attach_csr(spec)
+    _WORKER.update(
+        adjacency=adjacency,
+        handles=handles,
+        node_ids=node_ids,
+        config=config,
+        seed_eligibility=seed_eligibility,
+        db_path=db_path,
+        warm_state=warm_state,
+    )
+
+
+def _worker_iteration(holdout_seed: int) -> np.ndarray:
+    return _bootstrap_iteration(
+        _WORKER["adjacency"], _WORKER["node_ids"], _WORKER["config"],
+        holdout_seed, _WORKER["seed_eligibility"], _WORKER["db_path"],
+        _WORKER["warm_state"],
+    )
+
+
+def _bootstrap_iteration(
+    adjacency: sp.csr_matrix,
+    node_ids: np.ndarray,
+    config: PropagationConfig,
+    holdout_seed: int,
+    seed_eligibility: bool,
+    db_path,
+    warm_state: PprWarmState | None = None,
+) -> np.ndarray:
+    """One bootstrap draw: community columns of a 20%-holdout propagation."""
+    from src.propagation.engine import _propagate_once
+
+    res, _ = _propagate_once(
+        adjacency, node_ids, config,
+        holdout_fraction=BOOTSTRAP_HOLDOUT_FRACTION,
+        holdout_seed=holdout_seed,
+        seed_eligibility=seed_eligibility,
+        db_path=db_path,
+        warm_state=warm_state,
+    )
+    return res.memberships[:, : len(res.community_ids)]
+
+
+def run_bootstrap(
+    adjacency: sp.csr_matrix,
+    node_ids: np.ndarray,
+    config: PropagationConfig,
+    n_bootstrap: int,
+    n_communities: int,
+    holdout_seed: int = 42,
+    seed_eligibility: bool = True,
+    db_path=None,
+    n_workers: int = 1,
+    warm_state: PprWarmState | None = None,
+) -> BootstrapStats:
+    """Run n_bootstrap holdout propagations and stream them into BootstrapStats.
+
+    Iteration i uses holdout_seed + i, so serial and parallel runs draw the
+    same holdouts (mean/std may differ in the last bits from summation order).
+    """
+    stats = BootstrapStats((adjacency.shape[0], n_communities), n_bootstrap)
+    seeds = [holdout_seed + i for i in range(n_bootstrap)]
+
+    if n_workers <= 1:
+        for i, seed in enumerate(seeds):
+            print(f"  Bootstrap Iteration {i+1}/{n_bootstrap}...")
+            stats.add(_bootstrap_iteration(
+                adjacency, node_ids, config, seed, seed_eligibility, db_path, warm_state,
+            ))
+        return stats
+
+    print(f"  Using {n_workers} worker processes (shared-memory adjacency)")
+    with SharedCSR(adjacency) as shared:
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker,
+            initargs=(shared.spec, node_ids, config, seed_eligibility, db_path, warm_state),
+        ) as pool:
+            futures = [pool.submit(_worker_iteration, seed) for seed in seeds]
+            for done, future in enumerate(as_completed(futures), start=1):
+                stats.add(future.result())
+                print(f"  Bootstrap Iteration {done}/{n_bootstrap} done")
+    return stats
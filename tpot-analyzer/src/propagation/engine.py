@@ -25,7 +25,8 @@ import numpy as np
 import scipy.sparse as sp
 
 from src.config import DEFAULT_ARCHIVE_DB
-from src.propagation.types import PropagationConfig, PropagationResult
+from src.propagation.incremental import align_warm_state, local_push_block
+from src.propagation.types import PprWarmState, PropagationConfig, PropagationResult
 
 
 def multiclass_entropy(memberships: np.ndarray) -> np.ndarray:
@@ -42,12 +43,40 @@ def multiclass_entropy(memberships: np.ndarray) -> np.ndarray:
     return raw_entropy / max_entropy if max_entropy > 0 else raw_entropy
 
 
+def build_transition_matrix(adj: sp.csr_matrix) -> sp.csr_matrix:
+    """Build P^T, the transposed row-stochastic transition matrix used by PPR.
+
+    Shared by every PPR solve on the same graph, so callers that run several
+    solves (global PR + one per class) should build it once and pass it in.
+    """
+    # We walk backwards to find people who *follow* the community.
+    # A_ij means i follows j. We want probability to flow from j to i.
+    # So we use adj.T as the transition structure.
+    adj_T = adj.T.tocsr()
+
+    # Compute out-degrees
+    out_degrees = np.array(adj_T.sum(axis=1)).flatten()
+
+    # Handle sink nodes (nodes with 0 out-degree in the reversed graph, i.e., no followers)
+    # They will artificially drain probability mass. We add a small epsilon or self-loop.
+    out_degrees[out_degrees == 0] = 1.0
+
+    # Transition matrix P (row stochastic)
+    inv_D = sp.diags(1.0 / out_degrees)
+    P = inv_D @ adj_T
+
+    # Transpose for power iteration: x_{k+1} = (1-alpha) P^T x_k + alpha * v
+    return P.T.tocsr()
+
+
 def compute_ppr(
     adj: sp.csr_matrix,
     teleport_vector: np.ndarray | None = None,
     alpha: float = 0.15,
     max_iter: int = 200,
-    tol: float = 1e-6
+    tol: float = 1e-6,
+    transition: sp.csr_matrix | None = None,
+    x0: np.ndarray | None = None,
 ) -> tuple[np.ndarray, int, bool]:
     """Compute Directed Personalized PageRank via Power Iteration.
     
@@ -55,30 +84,14 @@ def compute_ppr(
         adj: Sparse adjacency matrix (n_nodes x n_nodes).
         teleport_vector: Vector of restart probabilities. If None, uniform (Global PR).
         alpha: Teleport probability.
+        transition: Precomputed output of build_transition_matrix(adj).
+        x0: Initial iterate (e.g. a previous run's solution). Defaults to v.
     
     Returns:
         (ppr_vector, iterations, converged)
     """
     n = adj.shape[0]
-    
-    # We walk backwards to find people who *follow* the community.
-    # A_ij means i follows j. We want probability to flow from j to i.
-    # So we use adj.T as the transition structure.
-    adj_T = adj.T.tocsr()
-    
-    # Compute out-degrees
-    out_degrees = np.array(adj_T.sum(axis=1)).flatten()
-    
-    # Handle sink nodes (nodes with 0 out-degree in the reversed graph, i.e., no followers)
-    # They will artificially drain probability mass. We add a small epsilon or self-loop.
-    out_degrees[out_degrees == 0] = 1.0
-    
-    # Transition matrix P (row stochastic)
-    inv_D = sp.diags(1.0 / out_degrees)
-    P = inv_D @ adj_T
-    
-    # Transpose for power iteration: x_{k+1} = (1-alpha) P^T x_k + alpha * v
-    PT = P.T.tocsr()
+    PT = transition if transition is not None else build_transition_matrix(adj)
     
     if teleport_vector is None:
         v = np.ones(n, dtype=np.float64) / n
@@ -90,7 +103,7 @@ def compute_ppr(
         else:
             v = np.ones(n, dtype=np.float64) / n
             
-    x = v.copy()
+    x = v.copy() if x0 is None else np.asarray(x0, dtype=np.float64).copy()
     
     converged = False
     iters = 0
@@ -107,6 +120,75 @@ def compute_ppr(
     return x, iters, converged
 
 
+def compute_ppr_block(
+    adj: sp.csr_matrix,
+    teleport_matrix: np.ndarray,
+    alpha: float = 0.15,
+    max_iter: int = 200,
+    tol: float = 1e-6,
+    transition: sp.csr_matrix | None = None,
+    x0: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute PPR for many teleport vectors at once (one column per class).
+
+    Runs the same power iteration as compute_ppr, but on an (n_nodes x m)
+    block so each step is a single sparse x dense-block product. Convergence
+    is tracked per column; converged columns are frozen and drop out of the
+    remaining iterations, so column j ends exactly where compute_ppr would.
+
+    Columns with zero total teleport weight are returned as all-zero with
+    0 iterations (the caller decides what an empty class means).
+
+    x0 (n_nodes x m) warm-starts the iteration, e.g. from a previous run's
+    solution; it defaults to the normalized teleport matrix.
+
+    Returns:
+        (ppr_matrix (n_nodes, m), iterations (m,), converged (m,))
+    """
+    PT = transition if transition is not None else build_transition_matrix(adj)
+    V = np.asarray(teleport_matrix, dtype=np.float64)
+    if V.ndim != 2 or V.shape[0] != adj.shape[0]:
+        raise ValueError(
+            f"teleport_matrix must be (n_nodes, m), got {V.shape} for {adj.shape[0]} nodes"
+        )
+    m = V.shape[1]
+
+    col_sums = V.sum(axis=0)
+    nonempty = col_sums > 0
+    V = V.copy()
+    V[:, nonempty] /= col_sums[nonempty]
+
+    if x0 is None:
+        X = V.copy()
+    else:
+        X = np.array(x0, dtype=np.float64)
+        if X.shape != V.shape:
+            raise ValueError(f"x0 must have shape {V.shape}, got {X.shape}")
+        X[:, ~nonempty] = 0.0
+    iterations = np.zeros(m, dtype=np.int64)
+    converged = ~nonempty
+    active = np.flatnonzero(nonempty)
+
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        if active.size == m:
+            X_active, V_active = X, V
+        else:
+            X_active, V_active = X[:, active], V[:, active]
+
+        X_next = (1 - alpha) * (PT @ X_active) + alpha * V_active
+        diff = np.abs(X_next - X_active).sum(axis=0)
+
+        X[:, active] = X_next
+        iterations[active] += 1
+        done = diff < tol
+        converged[active[done]] = True
+        active = active[~done]
+
+    return X, iterations, converged
+
+
 def load_community_labels(
     node_ids: np.ndarray,
     config: PropagationConfig,
@@ -236,11 +318,17 @@ def propagate(
     seed_eligibility: bool = True,
     db_path=None,
     n_bootstrap: int = 0,
+    n_workers: int = 1,
+    warm_state: PprWarmState | None = None,
 ) -> tuple[PropagationResult, dict | None]:
     """Run Directed PPR + Lift label propagation.
     
     If n_bootstrap > 0, performs multiple runs with different seed subsets
-    to estimate stability and confidence intervals.
+    to estimate stability and confidence intervals. n_workers > 1 runs the
+    bootstrap iterations in a process pool sharing the adjacency.
+
+    warm_state (see io.load_warm_state) warm-starts every PPR solve from a
+    previous run; results are identical up to solver tolerance.
     """
     n_nodes = adjacency.shape[0]
 
@@ -257,30 +345,27 @@ def propagate(
     K = len(community_ids)
 
     if n_bootstrap > 0:
+        from src.propagation.bootstrap import run_bootstrap
+
         print(f"\n--- Running Bootstrap ({n_bootstrap} iterations, 20% holdout) ---")
-        bootstrap_scores = [] # list of (n, K) arrays
-        
-        # We perform bootstrap only for communities (not "none")
-        for i in range(n_bootstrap):
-            print(f"  Bootstrap Iteration {i+1}/{n_bootstrap}...")
-            # Use 20% holdout for bootstrap stability even if global holdout is different
-            res, _ = _propagate_once(
-                adjacency, node_ids, config,
-                holdout_fraction=0.2, # Constant for stability check
-                holdout_seed=holdout_seed + i,
-                seed_eligibility=seed_eligibility,
-                db_path=db_path
-            )
-            # Store only the community memberships (first K columns)
-            bootstrap_scores.append(res.memberships[:, :K])
-            
-        bootstrap_scores = np.array(bootstrap_scores) # (n_bootstrap, n, K)
+        # We perform bootstrap only for communities (not "none"). Scores are
+        # folded into streaming stats so memory does not grow with n_bootstrap.
+        stats = run_bootstrap(
+            adjacency, node_ids, config,
+            n_bootstrap=n_bootstrap,
+            n_communities=K,
+            holdout_seed=holdout_seed,
+            seed_eligibility=seed_eligibility,
+            db_path=db_path,
+            n_workers=n_workers,
+            warm_state=warm_state,
+        )
         
         # Calculate stats
-        mean_memberships = np.mean(bootstrap_scores, axis=0)
-        stds = np.std(bootstrap_scores, axis=0)
-        ci_low = np.percentile(bootstrap_scores, 2.5, axis=0)
-        ci_high = np.percentile(bootstrap_scores, 97.5, axis=0)
+        mean_memberships = stats.mean
+        stds = stats.std
+        ci_low = stats.percentile(2.5)
+        ci_high = stats.percentile(97.5)
         
         # Stability = 1 - (std / mean)
         # Avoid division by zero
@@ -294,7 +379,8 @@ def propagate(
             holdout_fraction=holdout_fraction,
             holdout_seed=holdout_seed,
             seed_eligibility=seed_eligibility,
-            db_path=db_path
+            db_path=db_path,
+            warm_state=warm_state,
         )
         
         # Merge bootstrap stats into final result
@@ -311,7 +397,8 @@ def propagate(
             holdout_fraction=holdout_fraction,
             holdout_seed=holdout_seed,
             seed_eligibility=seed_eligibility,
-            db_path=db_path
+            db_path=db_path,
+            warm_state=warm_state,
         )
 
 
@@ -323,8 +410,13 @@ def _propagate_once(
     holdout_seed: int = 42,
     seed_eligibility: bool = True,
     db_path=None,
+    warm_state: PprWarmState | None = None,
 ) -> tuple[PropagationResult, dict | None]:
-    """Single-run core logic."""
+    """Single-run core logic.
+
+    warm_state (a previous run's converged PPR) turns the solve into a local
+    push on the residual plus a short warm-started polish.
+    """
     n_nodes = adjacency.shape[0]
 
     boundary, labeled_idx, community_ids, community_names, community_colors, holdout_info, raw_seed_weights = (
@@ -353,45 +445,61 @@ def _propagate_once(
     degrees = out_deg + in_deg
     low_degree_unlabeled = (degrees < config.min_degree_for_assignment) & ~labeled_mask
 
+    # The transition matrix is shared by the null model and every class solve.
+    transition = build_transition_matrix(adjacency)
+
+    class_ids = list(community_ids) + ["__none__"]
+    teleport = np.zeros((n_nodes, n_classes), dtype=np.float64)
+    teleport[labeled_idx] = boundary
+    col_sums = teleport.sum(axis=0)
+    empty_classes = col_sums == 0
+    teleport[:, ~empty_classes] /= col_sums[~empty_classes]
+
+    global_x0 = ppr_x0 = None
+    if warm_state is not None:
+        global_x0, ppr_x0 = align_warm_state(
+            warm_state, node_ids, class_ids, teleport, config.alpha,
+        )
+        if ppr_x0 is None:
+            print("Warm state not reusable (alpha or node set changed) — cold start")
+
     print("\nComputing Global PageRank (Null Model)...")
     t0 = time.perf_counter()
-    global_pr, g_iters, g_conv = compute_ppr(adjacency, teleport_vector=None, alpha=config.alpha)
+    raw_global_pr, g_iters, g_conv = compute_ppr(
+        adjacency, teleport_vector=None, alpha=config.alpha, transition=transition,
+        x0=global_x0,
+    )
     print(f"Global PR: {g_iters} iters, {time.perf_counter() - t0:.2f}s")
     
     # Avoid division by zero when calculating Lift
-    global_pr = np.clip(global_pr, 1e-12, None)
+    global_pr = np.clip(raw_global_pr, 1e-12, None)
 
-    memberships = np.zeros((n_nodes, n_classes), dtype=np.float64)
-    converged_list = []
-    iterations_list = []
-
-    print("\nComputing Directed PPR per community...")
+    print("\nComputing Directed PPR per community (block solve)...")
     t_solve_start = time.perf_counter()
-    
-    for c in range(n_classes):
+
+    for c in np.flatnonzero(empty_classes):
         class_name = community_names[c] if c < K else "__none__"
-        
-        teleport = np.zeros(n_nodes, dtype=np.float64)
-        teleport[labeled_idx] = boundary[:, c]
-        
-        if teleport.sum() == 0:
-            warnings.warn(f"Community {class_name} has 0 boundary weight! Skipping.")
-            memberships[:, c] = 0.0
-            converged_list.append(True)
-            iterations_list.append(0)
-            continue
+        warnings.warn(f"Community {class_name} has 0 boundary weight! Skipping.")
 
-        ppr_c, iters, conv = compute_ppr(adjacency, teleport_vector=teleport, alpha=config.alpha)
-        
-        # Lift = PPR_c / Global_PR
-        lift_c = ppr_c / global_pr
-        
-        memberships[:, c] = lift_c
-        converged_list.append(conv)
-        iterations_list.append(iters)
+    if ppr_x0 is not None:
+        ppr_x0, _, push_rounds = local_push_block(
+            transition, teleport, ppr_x0, alpha=config.alpha,
+        )
+        print(f"  Warm start: {push_rounds} local push rounds")
+
+    ppr, iterations, converged = compute_ppr_block(
+        adjacency, teleport, alpha=config.alpha, transition=transition, x0=ppr_x0,
+    )
 
-        status = "ok" if conv else "NOT converged"
-        print(f"  Class {c:2d} ({class_name:25s}): {iters:4d} iters, max lift = {lift_c.max():.1f}x")
+    # Lift = PPR_c / Global_PR (empty classes stay all-zero)
+    memberships = ppr / global_pr[:, None]
+    converged_list = [bool(c) for c in converged]
+    iterations_list = [int(i) for i in iterations]
+
+    for c in np.flatnonzero(~empty_classes):
+        class_name = community_names[c] if c < K else "__none__"
+        print(f"  Class {c:2d} ({class_name:25s}): {iterations_list[c]:4d} iters, "
+              f"max lift = {memberships[:, c].max():.1f}x")
 
     t_solve = time.perf_counter() - t_solve_start
     print(f"Total solve time: {t_solve:.2f}s")
@@ -457,5 +565,12 @@ def _propagate_once(
         config=config,
         solve_time_seconds=t_solve,
         seed_neighbor_counts=seed_neighbor_counts,
+        warm_state=PprWarmState(
+            node_ids=np.asarray(node_ids),
+            class_ids=class_ids,
+            alpha=config.alpha,
+            ppr=ppr,
+            global_pr=raw_global_pr,
+        ),
     )
     return result, holdout_info
@@ -0,0 +1,320 @@
+"""Persistent on-disk cache for TypedGraph, keyed by an archive DB fingerprint.
+
+Every propagation / spectral / CV script rebuilds the same typed matrices from
+archive_tweets.db. This module stores them once per archive state:
+
+    <db dir>/typed_graph_cache/<load-types key>/
+        manifest.json           version, fingerprint, node count, edge types
+        node_ids.npy            sorted account IDs (matrix row/col order)
+        <type>.indptr.npy       CSR arrays per edge type, one .npy each so
+        <type>.indices.npy      they can be memory-mapped on load
+        <type>.data.npy
+
+The cache key is cheap so hits stay near-instant: row count and max rowid
+of each source table plus the schema version (like
+SnapshotManifest.cache_row_counts). The manifest also records the DB file
+state (size, mtime_ns, SQLite change counter, and the same for the -wal
+file) and a content checksum of the source tables. While the file state is
+unchanged the key alone decides a hit. When the key matches but the file
+changed — DELETE FROM plus reinsert, an edge re-pointed in place, or an
+unrelated write such as a community label edit — the content checksum is
+recomputed once: equal means a hit (and the recorded file state is
+refreshed), different means a rebuild.
+
+Each column checksum is an exact integer sum weighted by rowid modulo a
+prime, so a changed endpoint or weight and two swapped rows both move it;
+a float sum would miss both for 19-digit account ids.
+
+Bump CACHE_VERSION whenever TypedGraph.from_archive changes how edges or
+weights are derived.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import scipy.sparse as sp
+
+from src.data.adjacency import save_array_dir
+from src.propagation.typed_graph import TypedGraph
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 4
+CACHE_DIRNAME = "typed_graph_cache"
+
+# Source table(s) behind each edge type. account_following always defines
+# the node universe, so it is part of every fingerprint.
+EDGE_TYPE_TABLES = {
+    "follow": ("account_following",),
+    "reply": ("signed_reply",),
+    "like": ("account_engagement_agg",),
+    "rt": ("account_engagement_agg",),
+    "cofollowed": ("cofollowed_similarity",),
+    "quote": ("quote_graph",),
+    "mention": ("mention_graph",),
+    "follower": ("account_followers",),
+}
+
+
+# Modulus for the per-column checksums: a prime below 2**31, so the product
+# of two residues fits in SQLite's 64-bit integers and the sum cannot overflow.
+_CHECKSUM_PRIME = 2_147_483_647
+# Fixed-point scale for REAL columns, so weight changes survive the integer sum.
+_REAL_SCALE = 1_000_000
+
+
+def _text_checksum(value: str) -> int:
+    return zlib.crc32(value.encode("utf-8"))
+
+
+def _column_checksum_sql(col: str) -> str:
+    """Exact integer checksum of one column, weighted by rowid.
+
+    Integers and numeric-string ids are used as-is (19-digit ids fit in
+    int64), REALs in fixed point and any other text by its CRC32.
+    """
+    value = (
+        f"CASE typeof(\"{col}\") "
+        f"WHEN 'integer' THEN \"{col}\" "
+        f"WHEN 'real' THEN CAST(\"{col}\" * {_REAL_SCALE} AS INTEGER) "
+        f"WHEN 'text' THEN CASE WHEN CAST(CAST(\"{col}\" AS INTEGER) AS TEXT) = \"{col}\" "
+        f"THEN CAST(\"{col}\" AS INTEGER) ELSE _fp_text(\"{col}\") END "
+        f"ELSE length(\"{col}\") END"
+    )
+    p = _CHECKSUM_PRIME
+    return f"COUNT(\"{col}\"), SUM((({value}) % {p}) * (rowid % {p}) % {p})"
+
+
+def _source_tables(load_types: set[str]) -> list[str]:
+    tables = {"account_following"}
+    for etype in load_types:
+        tables.update(EDGE_TYPE_TABLES.get(etype, ()))
+    return sorted(tables)
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    return bool(conn.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name=?", (table,)
+    ).fetchone()[0])
+
+
+def archive_fingerprint(db_path: Path, load_types: set[str]) -> dict:
+    """Row count and max rowid per source table, and the schema version.
+
+    This is the cache key and only reads table b-tree sizes, never rows.
+    Missing tables map to None, so creating one later changes the key.
+    """
+    conn = sqlite3.connect(str(db_path))
+    try:
+        fingerprint: dict = {
+            "schema_version": conn.execute("PRAGMA schema_version").fetchone()[0],
+            "tables": {},
+        }
+        for table in _source_tables(load_types):
+            if not _table_exists(conn, table):
+                fingerprint["tables"][table] = None
+                continue
+            count, max_rowid = conn.execute(f"SELECT COUNT(*), MAX(rowid) FROM {table}").fetchone()
+            fingerprint["tables"][table] = [count, max_rowid]
+    finally:
+        conn.close()
+    return fingerprint
+
+
+def archive_content_checksum(db_path: Path, load_types: set[str]) -> dict:
+    """Non-NULL count and integer-exact checksum of every source column.
+
+    Scans every row (see _column_checksum_sql), so it only runs when the
+    archive file changed but the fingerprint did not.
+    """
+    conn = sqlite3.connect(str(db_path))
+    conn.create_function("_fp_text", 1, _text_checksum, deterministic=True)
+    try:
+        checksum: dict = {}
+        for table in _source_tables(load_types):
+            if not _table_exists(conn, table):
+                checksum[table] = None
+                continue
+            columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+            sums = ", ".join(_column_checksum_sql(col) for col in columns)
+            column_sums = conn.execute(f"SELECT {sums} FROM {table}").fetchone()
+            checksum[table] = {col: list(column_sums[2 * i:2 * i + 2]) for i, col in enumerate(columns)}
+    finally:
+        conn.close()
+    return checksum
+
+
+def archive_file_state(db_path: Path) -> dict:
+    """Size, mtime_ns and SQLite file change counter of the DB and its -wal file."""
+    db_path = Path(db_path)
+    state = {}
+    for name, path in (("db", db_path), ("wal", db_path.with_name(db_path.name + "-wal"))):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            state[name] = None
+            continue
+        entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        if name == "db":
+            # Header bytes 24..27: bumped by every commit in rollback-journal
+            # mode, which mtime alone can miss within one timestamp tick.
+            with open(path, "rb") as handle:
+                header = handle.read(28)
+            entry["change_counter"] = int.from_bytes(header[24:28], "big") if len(header) == 28 else None
+        state[name] = entry
+    return state
+
+
+def cache_dir_for(db_path: Path, load_types: set[str], cache_root: Optional[Path] = None) -> Path:
+    """Cache directory for one (archive, load_types) combination."""
+    root = Path(cache_root) if cache_root is not None else Path(db_path).parent / CACHE_DIRNAME
+    key = hashlib.sha1(",".join(sorted(load_types)).encode()).hexdigest()[:12]
+    return root / key
+
+
+def save_typed_graph(
+    graph: TypedGraph,
+    cache_dir: Path,
+    fingerprint: dict,
+    db_path: Path,
+    file_state: Optional[dict] = None,
+    content_checksum: Optional[dict] = None,
+) -> None:
+    """Write graph + manifest atomically (see src.data.adjacency.save_array_dir).
+
+    file_state and content_checksum should be taken before the graph was
+    read, so writes that land during the build are caught on the next load.
+    """
+    arrays = {"node_ids": np.array(graph.node_ids, dtype=str)}
+    edge_types = {}
+    for etype, mat in graph._matrices.items():
+        mat = mat.tocsr()
+        for part in ("indptr", "indices", "data"):
+            arrays[f"{etype}.{part}"] = getattr(mat, part)
+        edge_types[etype] = int(mat.nnz)
+
+    manifest = {
+        "version": CACHE_VERSION,
+        "fingerprint": fingerprint,
+        "file_state": file_state,
+        "content_checksum": content_checksum,
+        "n_nodes": graph.n,
+        "edge_types": edge_types,
+        "db_path": str(db_path),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+    save_array_dir(cache_dir, arrays, "manifest.json", manifest)
+
+
+def _read_manifest(cache_dir: Path) -> Optional[dict]:
+    manifest_path = Path(cache_dir) / "manifest.json"
+    if not manifest_path.exists():
+        return None
+    try:
+        return json.loads(manifest_path.read_text())
+    except (OSError, ValueError) as exc:
+        logger.warning("Unreadable TypedGraph cache manifest %s: %s", manifest_path, exc)
+        return None
+
+
+def _refresh_file_state(cache_dir: Path, manifest: dict, file_state: dict) -> None:
+    """Record the archive's new file state after a content checksum matched."""
+    manifest = dict(manifest, file_state=file_state)
+    manifest_path = Path(cache_dir) / "manifest.json"
+    tmp_path = manifest_path.with_name(f"manifest.json.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(manifest, indent=2, default=str))
+        os.replace(tmp_path, manifest_path)
+    except OSError as exc:
+        logger.warning("Could not refresh TypedGraph cache manifest %s: %s", manifest_path, exc)
+        tmp_path.unlink(missing_ok=True)
+
+
+def load_typed_graph(cache_dir: Path, fingerprint: dict, mmap: bool = True) -> Optional[TypedGraph]:
+    """Load a cached graph if its manifest matches; None on miss or mismatch.
+
+    Only the version and fingerprint are checked here; load_typed_graph_cached
+    also checks the archive file state. With mmap=True the CSR arrays are
+    memory-mapped copy-on-write, so loading is near-instant and pages are
+    shared through the OS page cache.
+    """
+    cache_dir = Path(cache_dir)
+    manifest = _read_manifest(cache_dir)
+    if manifest is None:
+        return None
+    if manifest.get("version") != CACHE_VERSION or manifest.get("fingerprint") != fingerprint:
+        return None
+
+    mmap_mode = "c" if mmap else None
+    try:
+        node_ids = np.load(cache_dir / "node_ids.npy").tolist()
+        graph = TypedGraph(node_ids)
+        n = graph.n
+        for etype in manifest["edge_types"]:
+            parts = {
+                part: np.load(cache_dir / f"{etype}.{part}.npy", mmap_mode=mmap_mode)
+                for part in ("indptr", "indices", "data")
+            }
+            graph.set(etype, sp.csr_matrix(
+                (parts["data"], parts["indices"], parts["indptr"]), shape=(n, n), copy=False,
+            ))
+    except (OSError, ValueError) as exc:
+        logger.warning("Corrupt TypedGraph cache %s: %s", cache_dir, exc)
+        return None
+    return graph
+
+
+def load_typed_graph_cached(
+    db_path: Path,
+    load_types: Optional[set[str]] = None,
+    cache_root: Optional[Path] = None,
+    mmap: bool = True,
+) -> TypedGraph:
+    """TypedGraph.from_archive, served from the on-disk cache when fresh."""
+    if load_types is None:
+        load_types = set(TypedGraph.EDGE_TYPES)
+    db_path = Path(db_path)
+
+    fingerprint = archive_fingerprint(db_path, load_types)
+    file_state = archive_file_state(db_path)
+    cache_dir = cache_dir_for(db_path, load_types, cache_root)
+
+    content_checksum = None
+    manifest = _read_manifest(cache_dir)
+    fresh = (
+        manifest is not None
+        and manifest.get("version") == CACHE_VERSION
+        and manifest.get("fingerprint") == fingerprint
+    )
+    if fresh and manifest.get("file_state") != file_state:
+        content_checksum = archive_content_checksum(db_path, load_types)
+        fresh = manifest.get("content_checksum") == content_checksum
+        if fresh:
+            _refresh_file_state(cache_dir, manifest, file_state)
+
+    graph = load_typed_graph(cache_dir, fingerprint, mmap=mmap) if fresh else None
+    if graph is not None:
+        print(f"  TypedGraph cache hit: {cache_dir}")
+        graph.print_summary()
+        return graph
+
+    print(f"  TypedGraph cache miss — rebuilding from {db_path.name}")
+    if content_checksum is None:
+        content_checksum = archive_content_checksum(db_path, load_types)
+    graph = TypedGraph.from_archive(db_path, load_types=load_types)
+    try:
+        save_typed_graph(graph, cache_dir, fingerprint, db_path, file_state, content_checksum)
+        print(f"  TypedGraph cached: {cache_dir}")
+    except OSError as exc:
+        logger.warning("Could not write TypedGraph cache %s: %s", cache_dir, exc)
+    return graph
@@ -8,7 +8,9 @@ from pathlib import Path
 import numpy as np
 import scipy.sparse as sp
 
-from src.propagation.types import PropagationResult
+from src.propagation.types import PprWarmState, PropagationResult
+
+WARM_STATE_FILENAME = "community_propagation.warm.npz"
 
 
 def save_results(result: PropagationResult, output_dir: Path) -> Path:
@@ -47,6 +49,8 @@ def save_results(result: PropagationResult, output_dir: Path) -> Path:
 
     np.savez_compressed(str(archive_path), **save_arrays)
     np.savez_compressed(str(active_path), **save_arrays)
+    if result.warm_state is not None:
+        save_warm_state(result.warm_state, output_dir)
 
     print(f"\nResults saved:")
     print(f"  Archive: {archive_path}")
@@ -56,10 +60,49 @@ def save_results(result: PropagationResult, output_dir: Path) -> Path:
     return active_path
 
 
+def save_warm_state(state: PprWarmState, output_dir: Path) -> Path:
+    """Save converged PPR columns + global PR next to community_propagation.npz.
+
+    Stored uncompressed in float64 — the next run uses them as its starting
+    iterate, so precision loss would cost extra iterations.
+    """
+    path = output_dir / WARM_STATE_FILENAME
+    np.savez(
+        str(path),
+        node_ids=np.asarray(state.node_ids),
+        class_ids=np.array(state.class_ids),
+        alpha=np.array(state.alpha),
+        ppr=state.ppr.astype(np.float64),
+        global_pr=state.global_pr.astype(np.float64),
+    )
+    print(f"  Warm state: {path}")
+    return path
+
+
+def load_warm_state(output_dir: Path) -> PprWarmState | None:
+    """Load the warm-start state saved by the last run, or None if absent/unreadable."""
+    path = output_dir / WARM_STATE_FILENAME
+    if not path.exists():
+        return None
+    try:
+        with np.load(str(path), allow_pickle=False) as data:
+            return PprWarmState(
+                node_ids=data["node_ids"],
+                class_ids=[str(c) for c in data["class_ids"]],
+                alpha=float(data["alpha"]),
+                ppr=data["ppr"],
+                global_pr=data["global_pr"],
+            )
+    except (OSError, KeyError, ValueError) as exc:
+        print(f"  Ignoring unreadable warm state {path}: {exc}")
+        return None
+
+
 def build_adjacency_from_archive(
     db_path: Path,
     weighted: bool = True,
     edge_weights: dict[str, float] | None = None,
+    use_cache: bool = True,
 ) -> tuple[sp.csr_matrix, list[str]]:
     """Build adjacency matrix from archive_tweets.db using TypedGraph.
 
@@ -74,12 +117,17 @@ def build_adjacency_from_archive(
         weighted: If True, load all edge types. If False, follow-only.
         edge_weights: Per-type weights for combination. Defaults to
             DEFAULT_EDGE_WEIGHTS from typed_graph.py.
+        use_cache: Serve the typed matrices from the on-disk TypedGraph
+            cache (rebuilt automatically when the archive changes).
     """
     from src.propagation.typed_graph import TypedGraph
 
     load_types = None if weighted else {"follow"}
     print(f"\nBuilding adjacency from {db_path.name}...")
-    graph = TypedGraph.from_archive(db_path, load_types=load_types)
+    if use_cache:
+        graph = TypedGraph.from_archive_cached(db_path, load_types=load_types)
+    else:
+        graph = TypedGraph.from_archive(db_path, load_types=load_types)
 
     adj = graph.combine(weights=edge_weights)
     print(f"\n  Combined graph: {graph.n:,} nodes, {adj.nnz:,} edges")
@@ -27,6 +27,7 @@ from pathlib import Path
 from typing import Optional
 
 import numpy as np
+import pandas as pd
 import scipy.sparse as sp
 
 
@@ -43,12 +44,16 @@ DEFAULT_EDGE_WEIGHTS = {
     "follower": 0.0,  # not combined by default — used for reciprocity queries
 }
 
+# Rows fetched from SQLite per chunk in from_archive.
+LOAD_CHUNK_ROWS = 500_000
+
 
 class TypedGraph:
     """Multi-relational graph with separate adjacency matrices per edge type.
 
     Usage:
         graph = TypedGraph.from_archive(db_path)
+        graph = TypedGraph.from_archive_cached(db_path)  # reuse on-disk cache
         adj = graph.combine()                    # single matrix for propagation
         adj = graph.combine({"follow": 1, "reply": 0.8})  # custom weights
         follow_mat = graph.get("follow")         # single edge type
@@ -185,87 +190,79 @@ class TypedGraph:
         mutuals = len(outbound & inbound)
         return mutuals / len(inbound)
 
+    @classmethod
+    def from_archive_cached(
+        cls,
+        db_path: Path,
+        load_types: Optional[set[str]] = None,
+        cache_root: Optional[Path] = None,
+    ) -> "TypedGraph":
+        """Like from_archive, but reuses the on-disk cache while the archive
+        fingerprint is unchanged. See graph_cache.py."""
+        from src.propagation.graph_cache import load_typed_graph_cached
+
+        return load_typed_graph_cached(db_path, load_types=load_types, cache_root=cache_root)
+
     @classmethod
     def from_archive(
         cls,
         db_path: Path,
         load_types: Optional[set[str]] = None,
+        chunk_rows: int = LOAD_CHUNK_ROWS,
     ) -> "TypedGraph":
         """Build a TypedGraph from archive_tweets.db.
 
+        account_following is scanned once and factorized into the sorted
+        node list plus follow-edge codes. Other tables are streamed in chunks
+        of chunk_rows, with each chunk's account IDs mapped to node indices
+        through a hash index, and every matrix is built directly from the
+        resulting arrays.
+        Duplicate (src, tgt) rows are summed, as with scipy's COO input.
+
         Args:
             db_path: Path to archive_tweets.db.
             load_types: Which edge types to load. None = all available.
+            chunk_rows: Rows fetched from SQLite per chunk.
         """
         if load_types is None:
             load_types = set(cls.EDGE_TYPES)
 
         conn = sqlite3.connect(str(db_path))
 
-        # 1. Discover all node IDs from follow graph
+        # 1. Discover all node IDs from follow graph (one scan, which also
+        #    yields the follow edges as codes into the sorted node list)
         print("  Loading node IDs from account_following...")
-        sources = set(
-            r[0] for r in conn.execute(
-                "SELECT DISTINCT account_id FROM account_following"
-            ).fetchall()
-        )
-        targets = set(
-            r[0] for r in conn.execute(
-                "SELECT DISTINCT following_account_id FROM account_following"
-            ).fetchall()
+        node_ids, follow_rows, follow_cols, n_sources, n_targets = _factorize_follow_graph(
+            conn, chunk_rows,
         )
-        all_nodes = sorted(sources | targets)
-        graph = cls(all_nodes)
-        print(f"  Nodes: {graph.n:,} ({len(sources):,} sources, {len(targets):,} targets)")
+        graph = cls(node_ids)
+        node_index = pd.Index(node_ids, dtype=object)
+        print(f"  Nodes: {graph.n:,} ({n_sources:,} sources, {n_targets:,} targets)")
+
+        def load(sql: str, value_dtypes: tuple = ()) -> list[np.ndarray]:
+            return _fetch_edge_arrays(conn, sql, node_index, value_dtypes, chunk_rows)
 
         # 2. Follow edges
         if "follow" in load_types:
             print("  Loading follow edges...")
-            follows = conn.execute(
-                "SELECT account_id, following_account_id FROM account_following"
-            ).fetchall()
-            rows, cols, vals = [], [], []
-            for src, tgt in follows:
-                i = graph.node_idx.get(src)
-                j = graph.node_idx.get(tgt)
-                if i is not None and j is not None:
-                    rows.append(i)
-                    cols.append(j)
-                    vals.append(1.0)
-            mat = sp.csr_matrix(
-                (np.array(vals, dtype=np.float32), (rows, cols)),
-                shape=(graph.n, graph.n),
-            )
+            mat = _edges_to_csr(follow_rows, follow_cols, np.ones(len(follow_rows)), graph.n)
             graph.set("follow", mat)
             print(f"    {mat.nnz:,} follow edges")
+        del follow_rows, follow_cols
 
         # 3. Reply edges (from signed_reply)
         if "reply" in load_types:
             try:
-                exists = conn.execute(
-                    "SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name='signed_reply'"
-                ).fetchone()[0]
-                if exists:
+                if _table_exists(conn, "signed_reply"):
                     print("  Loading signed reply edges...")
-                    reply_data = conn.execute(
-                        "SELECT replier_id, author_id, reply_count, heuristic FROM signed_reply"
-                    ).fetchall()
-                    rows, cols, vals = [], [], []
-                    for replier, author, count, heuristic in reply_data:
-                        i = graph.node_idx.get(replier)
-                        j = graph.node_idx.get(author)
-                        if i is not None and j is not None:
-                            w = min(count / 5.0, 1.0)
-                            if heuristic == "author_liked":
-                                w *= 1.5
-                            rows.append(i)
-                            cols.append(j)
-                            vals.append(w)
-                    if vals:
-                        mat = sp.csr_matrix(
-                            (np.array(vals, dtype=np.float32), (rows, cols)),
-                            shape=(graph.n, graph.n),
-                        )
+                    rows, cols, count, heuristic = load(
+                        "SELECT replier_id, author_id, reply_count, heuristic FROM signed_reply",
+                        (np.float64, object),
+                    )
+                    w = np.minimum(count / 5.0, 1.0)
+                    w[heuristic == "author_liked"] *= 1.5
+                    if len(w):
+                        mat = _edges_to_csr(rows, cols, w, graph.n)
                         graph.set("reply", mat)
                         print(f"    {mat.nnz:,} reply edges")
             except Exception as e:
@@ -274,50 +271,30 @@ class TypedGraph:
         # 4. Like and RT edges (from account_engagement_agg)
         if "like" in load_types or "rt" in load_types:
             try:
-                exists = conn.execute(
-                    "SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name='account_engagement_agg'"
-                ).fetchone()[0]
-                if exists:
+                if _table_exists(conn, "account_engagement_agg"):
                     print("  Loading engagement edges (like + RT)...")
-                    eng_data = conn.execute(
+                    rows, cols, likes, rts = load(
                         "SELECT source_id, target_id, like_count, rt_count "
-                        "FROM account_engagement_agg"
-                    ).fetchall()
+                        "FROM account_engagement_agg",
+                        (np.float64, np.float64),
+                    )
 
                     if "like" in load_types:
-                        like_rows, like_cols, like_vals = [], [], []
-                        for src, tgt, likes, rts in eng_data:
-                            if likes and likes > 0:
-                                i = graph.node_idx.get(src)
-                                j = graph.node_idx.get(tgt)
-                                if i is not None and j is not None:
-                                    like_rows.append(i)
-                                    like_cols.append(j)
-                                    like_vals.append(min(likes / 50.0, 1.0))
-                        if like_vals:
-                            mat = sp.csr_matrix(
-                                (np.array(like_vals, dtype=np.float32),
-                                 (like_rows, like_cols)),
-                                shape=(graph.n, graph.n),
+                        keep = likes > 0
+                        if keep.any():
+                            mat = _edges_to_csr(
+                                rows[keep], cols[keep],
+                                np.minimum(likes[keep] / 50.0, 1.0), graph.n,
                             )
                             graph.set("like", mat)
                             print(f"    {mat.nnz:,} like edges")
 
                     if "rt" in load_types:
-                        rt_rows, rt_cols, rt_vals = [], [], []
-                        for src, tgt, likes, rts in eng_data:
-                            if rts and rts > 0:
-                                i = graph.node_idx.get(src)
-                                j = graph.node_idx.get(tgt)
-                                if i is not None and j is not None:
-                                    rt_rows.append(i)
-                                    rt_cols.append(j)
-                                    rt_vals.append(min(rts / 10.0, 1.0))
-                        if rt_vals:
-                            mat = sp.csr_matrix(
-                                (np.array(rt_vals, dtype=np.float32),
-                                 (rt_rows, rt_cols)),
-                                shape=(graph.n, graph.n),
+                        keep = rts > 0
+                        if keep.any():
+                            mat = _edges_to_csr(
+                                rows[keep], cols[keep],
+                                np.minimum(rts[keep] / 10.0, 1.0), graph.n,
                             )
                             graph.set("rt", mat)
                             print(f"    {mat.nnz:,} RT edges")
@@ -327,10 +304,7 @@ class TypedGraph:
         # 5. Co-followed similarity (undirected)
         if "cofollowed" in load_types:
             try:
-                exists = conn.execute(
-                    "SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name='cofollowed_similarity'"
-                ).fetchone()[0]
-                if exists:
+                if _table_exists(conn, "cofollowed_similarity"):
                     cofollowed_cols = {
                         r[1] for r in conn.execute(
                             "PRAGMA table_info(cofollowed_similarity)"
@@ -352,24 +326,19 @@ class TypedGraph:
                     )
 
                     print("  Loading co-followed similarity edges...")
-                    cf_data = conn.execute(
+                    rows, cols, shared = load(
                         f"SELECT {id1_col}, {id2_col}, {shared_col} "
-                        "FROM cofollowed_similarity"
-                    ).fetchall()
-                    rows, cols, vals = [], [], []
-                    for id1, id2, shared in cf_data:
-                        i = graph.node_idx.get(id1)
-                        j = graph.node_idx.get(id2)
-                        if i is not None and j is not None:
-                            w = min(shared / 20.0, 1.0)
-                            # Undirected
-                            rows.extend([i, j])
-                            cols.extend([j, i])
-                            vals.extend([w, w])
-                    if vals:
-                        mat = sp.csr_matrix(
-                            (np.array(vals, dtype=np.float32), (rows, cols)),
-                            shape=(graph.n, graph.n),
+                        "FROM cofollowed_similarity",
+                        (np.float64,),
+                    )
+                    w = np.minimum(shared / 20.0, 1.0)
+                    if len(w):
+                        # Undirected
+                        mat = _edges_to_csr(
+                            np.concatenate([rows, cols]),
+                            np.concatenate([cols, rows]),
+                            np.concatenate([w, w]),
+                            graph.n,
                         )
                         graph.set("cofollowed", mat)
                         print(f"    {mat.nnz:,} co-followed edges (undirected)")
@@ -379,27 +348,14 @@ class TypedGraph:
         # 6. Quote edges (from quote_graph)
         if "quote" in load_types:
             try:
-                exists = conn.execute(
-                    "SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name='quote_graph'"
-                ).fetchone()[0]
-                if exists:
+                if _table_exists(conn, "quote_graph"):
                     print("  Loading quote edges...")
-                    quote_data = conn.execute(
-                        "SELECT source_id, target_id, quote_count FROM quote_graph"
-                    ).fetchall()
-                    rows, cols, vals = [], [], []
-                    for src, tgt, count in quote_data:
-                        i = graph.node_idx.get(src)
-                        j = graph.node_idx.get(tgt)
-                        if i is not None and j is not None:
-                            rows.append(i)
-                            cols.append(j)
-                            vals.append(min(count / 5.0, 1.0))
-                    if vals:
-                        mat = sp.csr_matrix(
-                            (np.array(vals, dtype=np.float32), (rows, cols)),
-                            shape=(graph.n, graph.n),
-                        )
+                    rows, cols, count = load(
+                        "SELECT source_id, target_id, quote_count FROM quote_graph",
+                        (np.float64,),
+                    )
+                    if len(rows):
+                        mat = _edges_to_csr(rows, cols, np.minimum(count / 5.0, 1.0), graph.n)
                         graph.set("quote", mat)
                         print(f"    {mat.nnz:,} quote edges")
             except Exception as e:
@@ -408,27 +364,14 @@ class TypedGraph:
         # 7. Mention edges (from mention_graph)
         if "mention" in load_types:
             try:
-                exists = conn.execute(
-                    "SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name='mention_graph'"
-                ).fetchone()[0]
-                if exists:
+                if _table_exists(conn, "mention_graph"):
                     print("  Loading mention edges...")
-                    mention_data = conn.execute(
-                        "SELECT source_id, target_id, mention_count FROM mention_graph"
-                    ).fetchall()
-                    rows, cols, vals = [], [], []
-                    for src, tgt, count in mention_data:
-                        i = graph.node_idx.get(src)
-                        j = graph.node_idx.get(tgt)
-                        if i is not None and j is not None:
-                            rows.append(i)
-                            cols.append(j)
-                            vals.append(min(count / 10.0, 1.0))
-                    if vals:
-                        mat = sp.csr_matrix(
-                            (np.array(vals, dtype=np.float32), (rows, cols)),
-                            shape=(graph.n, graph.n),
-                        )
+                    rows, cols, count = load(
+                        "SELECT source_id, target_id, mention_count FROM mention_graph",
+                        (np.float64,),
+                    )
+                    if len(rows):
+                        mat = _edges_to_csr(rows, cols, np.minimum(count / 10.0, 1.0), graph.n)
                         graph.set("mention", mat)
                         print(f"    {mat.nnz:,} mention edges")
             except Exception as e:
@@ -437,27 +380,14 @@ class TypedGraph:
         # 8. Follower edges (from account_followers — inbound follows)
         if "follower" in load_types:
             try:
-                exists = conn.execute(
-                    "SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name='account_followers'"
-                ).fetchone()[0]
-                if exists:
+                if _table_exists(conn, "account_followers"):
                     print("  Loading follower edges (inbound)...")
-                    follower_data = conn.execute(
-                        "SELECT account_id, follower_account_id FROM account_followers"
-                    ).fetchall()
-                    rows, cols, vals = [], [], []
-                    for account, follower in follower_data:
-                        i = graph.node_idx.get(follower)
-                        j = graph.node_idx.get(account)
-                        if i is not None and j is not None:
-                            rows.append(i)
-                            cols.append(j)
-                            vals.append(1.0)
-                    if vals:
-                        mat = sp.csr_matrix(
-                            (np.array(vals, dtype=np.float32), (rows, cols)),
-                            shape=(graph.n, graph.n),
-                        )
+                    # Stored follower→account (row→col)
+                    rows, cols = load(
+                        "SELECT follower_account_id, account_id FROM account_followers"
+                    )
+                    if len(rows):
+                        mat = _edges_to_csr(rows, cols, np.ones(len(rows)), graph.n)
                         graph.set("follower", mat)
                         print(f"    {mat.nnz:,} follower edges (inbound)")
             except Exception as e:
@@ -466,3 +396,120 @@ class TypedGraph:
         conn.close()
         graph.print_summary()
         return graph
+
+
+# ---------------------------------------------------------------------------
+# Bulk SQLite → NumPy loading helpers
+# ---------------------------------------------------------------------------
+
+def _table_exists(conn: sqlite3.Connection, name: str) -> bool:
+    return bool(conn.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name=?", (name,)
+    ).fetchone()[0])
+
+
+def _as_id_index(ids) -> pd.Index:
+    """IDs as an object Index of strings (the node key type); None stays None."""
+    ids = pd.Index(ids, dtype=object)
+    if ids.inferred_type != "string":
+        ids = pd.Index([None if v is None else str(v) for v in ids], dtype=object)
+    return ids
+
+
+def _factorize_follow_graph(
+    conn: sqlite3.Connection, chunk_rows: int,
+) -> tuple[list, np.ndarray, np.ndarray, int, int]:
+    """Scan account_following once into (node_ids, rows, cols, n_sources, n_targets).
+
+    node_ids is the sorted union of both ID columns; rows/cols index into it.
+    pd.factorize hashes each ID once, so there are no SELECT DISTINCT sorts
+    and no per-edge string compares. Rows with a NULL endpoint are dropped.
+    """
+    cursor = conn.execute("SELECT account_id, following_account_id FROM account_following")
+    sources, targets = [], []
+    while True:
+        chunk = cursor.fetchmany(chunk_rows)
+        if not chunk:
+            break
+        src, tgt = zip(*chunk)
+        sources.append(np.array(src, dtype=object))
+        targets.append(np.array(tgt, dtype=object))
+    n_edges = sum(len(part) for part in sources)
+    ids = _as_id_index(np.concatenate(sources + targets) if n_edges else np.empty(0, dtype=object))
+    codes, uniques = pd.factorize(ids, sort=True)
+    codes = codes.astype(np.int64, copy=False)
+    rows, cols = codes[:n_edges], codes[n_edges:]
+    n_sources = len(np.unique(rows[rows >= 0]))
+    n_targets = len(np.unique(cols[cols >= 0]))
+    keep = (rows >= 0) & (cols >= 0)
+    return list(uniques), rows[keep], cols[keep], n_sources, n_targets
+
+
+def _lookup_indices(node_index: pd.Index, ids) -> np.ndarray:
+    """Map IDs to positions in node_index via its hash table; -1 where absent."""
+    if len(ids) == 0:
+        return np.empty(0, dtype=np.int64)
+    return node_index.get_indexer(_as_id_index(ids)).astype(np.int64, copy=False)
+
+
+def _fetch_edge_arrays(
+    conn: sqlite3.Connection,
+    sql: str,
+    node_index: pd.Index,
+    value_dtypes: tuple = (),
+    chunk_rows: int = LOAD_CHUNK_ROWS,
+) -> list[np.ndarray]:
+    """Stream (src_id, tgt_id, *values) rows into index + value arrays.
+
+    IDs are mapped to node indices chunk by chunk so the string columns
+    never need to be held for the whole table. Rows whose endpoints are not
+    nodes, or whose numeric values are all NULL, are dropped; a NULL in one
+    numeric column of an otherwise valid row reads as 0, so e.g. a missing
+    rt_count does not discard the row's like_count.
+
+    Returns [src_idx, tgt_idx, *value_arrays].
+    """
+    cursor = conn.execute(sql)
+    n_values = len(value_dtypes)
+    parts: list[list[np.ndarray]] = [[] for _ in range(2 + n_values)]
+    while True:
+        chunk = cursor.fetchmany(chunk_rows)
+        if not chunk:
+            break
+        columns = list(zip(*chunk))
+        src = _lookup_indices(node_index, columns[0])
+        tgt = _lookup_indices(node_index, columns[1])
+        keep = (src >= 0) & (tgt >= 0)
+        present = None
+        values = []
+        for k, dtype in enumerate(value_dtypes):
+            col = columns[2 + k]
+            if dtype is object:
+                arr = np.array(col, dtype=object)
+            else:
+                arr = np.array(col, dtype=dtype)  # NULL -> nan
+                not_null = ~np.isnan(arr)
+                present = not_null if present is None else present | not_null
+                arr = np.nan_to_num(arr, nan=0.0)
+            values.append(arr)
+        if present is not None:
+            keep &= present
+        parts[0].append(src[keep])
+        parts[1].append(tgt[keep])
+        for k, arr in enumerate(values):
+            parts[2 + k].append(arr[keep])
+
+    dtypes = (np.int64, np.int64) + tuple(value_dtypes)
+    return [
+        np.concatenate(p) if p else np.empty(0, dtype=d)
+        for p, d in zip(parts, dtypes)
+    ]
+
+
+def _edges_to_csr(
+    rows: np.ndarray, cols: np.ndarray, vals: np.ndarray, n: int,
+) -> sp.csr_matrix:
+    return sp.csr_matrix(
+        (np.asarray(vals, dtype=np.float32), (rows, cols)),
+        shape=(n, n),
+    )
@@ -76,3 +76,19 @@ class PropagationResult:
     seed_neighbor_counts: np.ndarray | None = None  # (n_nodes, K) int — only in independent mode
     stability: np.ndarray | None = None             # (n_nodes, K) float [0, 1] — bootstrap stability
     confidence_intervals: np.ndarray | None = None  # (n_nodes, K, 2) float — [low, high] bounds
+    warm_state: PprWarmState | None = None           # converged PPR, reused by the next run
+
+
+@dataclass
+class PprWarmState:
+    """Converged PPR solution of a previous run, used as a warm start.
+
+    Columns are keyed by class_ids (K community IDs + "__none__") and rows by
+    node_ids, so a later run can re-align them after communities or graph
+    nodes are added or removed.
+    """
+    node_ids: np.ndarray     # (n_nodes,) account IDs matching ppr rows
+    class_ids: list[str]     # (K+1,) column keys
+    alpha: float             # teleport probability the solution was computed with
+    ppr: np.ndarray          # (n_nodes, K+1) float64 — raw PPR columns (before Lift)
+    global_pr: np.ndarray    # (n_nodes,) float64 — null-model PageRank
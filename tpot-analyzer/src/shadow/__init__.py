@@ -8,10 +8,13 @@ from .enricher import (
     SeedAccount,
     ShadowEnrichmentConfig,
 )
+from .scheduler import EnrichmentScheduler, SchedulerConfig
 
 __all__ = [
     "EnrichmentPolicy",
+    "EnrichmentScheduler",
     "HybridShadowEnricher",
+    "SchedulerConfig",
     "ShadowEnrichmentConfig",
     "SeedAccount",
 ]
@@ -16,6 +16,10 @@ Score formula (before time normalisation):
 All five signals are independently normalised to [0, 1] before weighting.
 Accounts with missing data receive conservative defaults that still rank
 them *above* well-understood accounts (unknown = high uncertainty = priority).
+
+Novelty and MMR work on (n, K) membership matrices, so a whole enrichment
+frontier of tens of thousands of candidates can be ranked in one pass; large
+scraped sets switch novelty to an approximate KD-tree nearest-neighbour query.
 """
 from __future__ import annotations
 
@@ -23,9 +27,10 @@ import logging
 import sqlite3
 import statistics
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, Iterator, List, Optional, Sequence
 
 import numpy as np
+from scipy.spatial import cKDTree
 
 from .enricher import SeedAccount
 from ..data.shadow_store import ShadowStore
@@ -44,6 +49,19 @@ _SCRAPE_TIME_CAP = 3600.0
 # Number of recent successful runs to use for expected scrape time
 _RECENT_RUNS = 3
 
+# Ids per "IN (...)" query; SQLite caps the number of bound parameters.
+_SQL_CHUNK = 900
+
+# Candidate rows per block of the exact (candidates x scraped) similarity
+# product, bounding its memory to _NOVELTY_BLOCK x n_scraped floats.
+_NOVELTY_BLOCK = 2048
+
+# Scraped sets at least this large use the approximate KD-tree novelty.
+_ANN_MIN_SCRAPED = 4096
+# KD-tree query slack: the neighbour found is within (1 + eps) of the true
+# nearest distance, so novelty is at most (1 + eps)^2 times the exact value.
+_ANN_EPS = 0.05
+
 
 # ---------------------------------------------------------------------------
 # Dataclasses
@@ -96,6 +114,11 @@ def _safe_div(a: float, b: float, fallback: float = 0.0) -> float:
     return a / b if b > 0 else fallback
 
 
+def _chunks(ids: List[str], size: int = _SQL_CHUNK) -> Iterator[List[str]]:
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
 def _normalize_array(arr: np.ndarray) -> np.ndarray:
     """Min-max normalise a 1-D array to [0, 1]; returns zeros if range is 0."""
     lo, hi = arr.min(), arr.max()
@@ -169,18 +192,18 @@ def _fetch_entropy_boundary(
     if not candidate_ids:
         return {}
 
-    placeholders = ",".join("?" * len(candidate_ids))
-    rows = community_conn.execute(
-        f"SELECT account_id, weight FROM community_membership"
-        f" WHERE run_id = ? AND account_id IN ({placeholders})"
-        f" ORDER BY account_id, weight DESC",
-        [run_id, *candidate_ids],
-    ).fetchall()
-
     # Group by account
     by_account: Dict[str, List[float]] = {}
-    for account_id, weight in rows:
-        by_account.setdefault(account_id, []).append(float(weight))
+    for chunk in _chunks(candidate_ids):
+        placeholders = ",".join("?" * len(chunk))
+        rows = community_conn.execute(
+            f"SELECT account_id, weight FROM community_membership"
+            f" WHERE run_id = ? AND account_id IN ({placeholders})"
+            f" ORDER BY account_id, weight DESC",
+            [run_id, *chunk],
+        ).fetchall()
+        for account_id, weight in rows:
+            by_account.setdefault(account_id, []).append(float(weight))
 
     result: Dict[str, tuple[float, float]] = {}
     for aid in candidate_ids:
@@ -222,33 +245,37 @@ def _fetch_followers(
     from sqlalchemy.sql import text as sa_text
 
     def _op(engine):
-        placeholders = ",".join(f":id{i}" for i in range(len(candidate_ids)))
-        params = {f"id{i}": aid for i, aid in enumerate(candidate_ids)}
+        found: Dict[str, Optional[int]] = {}
         with engine.connect() as conn:
-            rows = conn.execute(
-                sa_text(
-                    f"SELECT account_id, followers_count FROM shadow_account"
-                    f" WHERE account_id IN ({placeholders})"
-                ),
-                params,
-            ).fetchall()
-        return {r[0]: r[1] for r in rows}
+            for chunk in _chunks(candidate_ids):
+                placeholders = ",".join(f":id{i}" for i in range(len(chunk)))
+                params = {f"id{i}": aid for i, aid in enumerate(chunk)}
+                rows = conn.execute(
+                    sa_text(
+                        f"SELECT account_id, followers_count FROM shadow_account"
+                        f" WHERE account_id IN ({placeholders})"
+                    ),
+                    params,
+                ).fetchall()
+                found.update((r[0], r[1]) for r in rows)
+        return found
 
     result = shadow_store._execute_with_retry("fetch_followers", _op)
 
     # Fill in missing accounts from archive account_followers table
     missing = [aid for aid in candidate_ids if result.get(aid) is None]
     if missing and community_conn is not None:
-        placeholders = ",".join("?" * len(missing))
-        rows = community_conn.execute(
-            f"SELECT account_id, COUNT(*) FROM account_followers"
-            f" WHERE account_id IN ({placeholders})"
-            f" GROUP BY account_id",
-            missing,
-        ).fetchall()
-        for aid, count in rows:
-            if result.get(aid) is None:
-                result[aid] = int(count)
+        for chunk in _chunks(missing):
+            placeholders = ",".join("?" * len(chunk))
+            rows = community_conn.execute(
+                f"SELECT account_id, COUNT(*) FROM account_followers"
+                f" WHERE account_id IN ({placeholders})"
+                f" GROUP BY account_id",
+                chunk,
+            ).fetchall()
+            for aid, count in rows:
+                if result.get(aid) is None:
+                    result[aid] = int(count)
         n_filled = sum(1 for aid in missing if result.get(aid) is not None)
         if n_filled:
             LOGGER.debug(
@@ -275,19 +302,21 @@ def _fetch_scrape_times(
     from sqlalchemy.sql import text as sa_text
 
     def _op(engine):
-        placeholders = ",".join(f":id{i}" for i in range(len(candidate_ids)))
-        params = {f"id{i}": aid for i, aid in enumerate(candidate_ids)}
+        rows = []
         with engine.connect() as conn:
-            rows = conn.execute(
-                sa_text(
-                    f"SELECT seed_account_id, duration_seconds"
-                    f" FROM scrape_run_metrics"
-                    f" WHERE seed_account_id IN ({placeholders})"
-                    f"   AND skipped = 0"
-                    f" ORDER BY seed_account_id, run_at DESC",
-                ),
-                params,
-            ).fetchall()
+            for chunk in _chunks(candidate_ids):
+                placeholders = ",".join(f":id{i}" for i in range(len(chunk)))
+                params = {f"id{i}": aid for i, aid in enumerate(chunk)}
+                rows.extend(conn.execute(
+                    sa_text(
+                        f"SELECT seed_account_id, duration_seconds"
+                        f" FROM scrape_run_metrics"
+                        f" WHERE seed_account_id IN ({placeholders})"
+                        f"   AND skipped = 0"
+                        f" ORDER BY seed_account_id, run_at DESC",
+                    ),
+                    params,
+                ).fetchall())
         return rows
 
     rows = shadow_store._execute_with_retry("fetch_scrape_times", _op)
@@ -332,16 +361,16 @@ def _fetch_coverage_boost(
     community_size: Dict[str, int] = {r[0]: int(r[1]) for r in sizes_rows}
 
     # Get each candidate's communities
-    placeholders = ",".join("?" * len(candidate_ids))
-    assign_rows = community_conn.execute(
-        f"SELECT account_id, community_id FROM community_account"
-        f" WHERE account_id IN ({placeholders})",
-        candidate_ids,
-    ).fetchall()
-
     by_account: Dict[str, List[int]] = {}
-    for aid, cid in assign_rows:
-        by_account.setdefault(aid, []).append(community_size.get(cid, 1))
+    for chunk in _chunks(candidate_ids):
+        placeholders = ",".join("?" * len(chunk))
+        assign_rows = community_conn.execute(
+            f"SELECT account_id, community_id FROM community_account"
+            f" WHERE account_id IN ({placeholders})",
+            chunk,
+        ).fetchall()
+        for aid, cid in assign_rows:
+            by_account.setdefault(aid, []).append(community_size.get(cid, 1))
 
     result: Dict[str, float] = {}
     for aid in candidate_ids:
@@ -353,34 +382,105 @@ def _fetch_coverage_boost(
     return result
 
 
-def _build_membership_vectors(
+def _membership_matrix(
     community_conn: sqlite3.Connection,
     run_id: str,
     account_ids: List[str],
     k: int,
-) -> Dict[str, np.ndarray]:
-    """Return {account_id: normalised K-dim membership vector}."""
-    if not account_ids or k == 0:
-        return {}
-
-    placeholders = ",".join("?" * len(account_ids))
-    rows = community_conn.execute(
-        f"SELECT account_id, community_idx, weight FROM community_membership"
-        f" WHERE run_id = ? AND account_id IN ({placeholders})",
-        [run_id, *account_ids],
-    ).fetchall()
+) -> np.ndarray:
+    """Return the (len(account_ids), K) matrix of L2-normalised memberships.
 
-    vectors: Dict[str, np.ndarray] = {aid: np.zeros(k) for aid in account_ids}
-    for aid, cidx, w in rows:
-        if aid in vectors and 0 <= cidx < k:
-            vectors[aid][cidx] = float(w)
+    Accounts without membership rows get an all-zero row.
+    """
+    matrix = np.zeros((len(account_ids), max(k, 1)))
+    if not account_ids or k == 0:
+        return matrix
+
+    row_of = {aid: i for i, aid in enumerate(account_ids)}
+    rows: List[int] = []
+    cols: List[int] = []
+    vals: List[float] = []
+    for chunk in _chunks(account_ids):
+        placeholders = ",".join("?" * len(chunk))
+        for aid, cidx, w in community_conn.execute(
+            f"SELECT account_id, community_idx, weight FROM community_membership"
+            f" WHERE run_id = ? AND account_id IN ({placeholders})",
+            [run_id, *chunk],
+        ):
+            if 0 <= cidx < k:
+                rows.append(row_of[aid])
+                cols.append(cidx)
+                vals.append(float(w))
+    matrix[rows, cols] = vals
+    return _normalize_rows(matrix)
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalise each row; all-zero rows stay zero."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix, dtype=float), where=norms > _EPS)
+
+
+def _stack_vectors(ids: Sequence[str], vectors: Dict[str, np.ndarray], k: int) -> np.ndarray:
+    """(len(ids), K) matrix of per-account vectors; missing ids are zero rows."""
+    matrix = np.zeros((len(ids), max(k, 1)))
+    for row, aid in enumerate(ids):
+        vec = vectors.get(aid)
+        if vec is not None:
+            matrix[row] = vec
+    return matrix
+
+
+def _max_similarity(
+    candidates: np.ndarray,
+    scraped: np.ndarray,
+    approximate: bool = False,
+) -> np.ndarray:
+    """Max cosine similarity of each candidate row to any scraped row.
+
+    Exact mode takes the (candidates x scraped) product in row blocks.
+    Approximate mode finds each candidate's nearest scraped vector in a
+    KD-tree: for unit vectors ||a - b||^2 = 2 - 2 cos(a, b), so the nearest
+    neighbour by distance is the most similar one.
+    """
+    if not approximate:
+        best = np.empty(len(candidates))
+        for start in range(0, len(candidates), _NOVELTY_BLOCK):
+            block = candidates[start:start + _NOVELTY_BLOCK]
+            best[start:start + len(block)] = (block @ scraped.T).max(axis=1)
+        return best
+
+    scraped = _normalize_rows(scraped)
+    nonzero = np.linalg.norm(scraped, axis=1) > _EPS
+    tree = cKDTree(scraped[nonzero])
+    distances, _ = tree.query(_normalize_rows(candidates), k=1, eps=_ANN_EPS)
+    best = 1.0 - distances ** 2 / 2.0
+    if not nonzero.all():
+        best = np.maximum(best, 0.0)  # a zero scraped vector has similarity 0
+    return best
+
+
+def _novelty_scores(
+    candidates: np.ndarray,
+    scraped: np.ndarray,
+    approximate: Optional[bool] = None,
+) -> np.ndarray:
+    """Per-candidate novelty — 1 minus max cosine sim to the scraped rows.
+
+    Candidates with no community data (zero rows) get novelty = 1.0, as do
+    all candidates when the scraped set has no community data. approximate
+    None picks the KD-tree path once the scraped set reaches _ANN_MIN_SCRAPED.
+    """
+    novelty = np.ones(len(candidates))
+    if len(candidates) == 0 or len(scraped) == 0 or not np.any(scraped):
+        return novelty
 
-    # L2-normalise
-    for aid in vectors:
-        norm = np.linalg.norm(vectors[aid])
-        if norm > _EPS:
-            vectors[aid] = vectors[aid] / norm
-    return vectors
+    if approximate is None:
+        approximate = len(scraped) >= _ANN_MIN_SCRAPED
+    known = np.any(candidates != 0, axis=1)
+    max_sim = _max_similarity(candidates[known], scraped, approximate=approximate)
+    novelty[known] = np.clip(1.0 - max_sim, 0.0, 1.0)
+    return novelty
 
 
 def _compute_novelty(
@@ -389,44 +489,70 @@ def _compute_novelty(
     scraped_ids: List[str],
     scraped_vectors: Dict[str, np.ndarray],
     k: int,
+    approximate: Optional[bool] = None,
 ) -> Dict[str, float]:
     """Return {account_id: novelty} — 1 minus max cosine sim to scraped set.
 
-    Accounts with no community data get novelty = 1.0 (fully novel).
+    Dict front-end of _novelty_scores; vectors must be L2-normalised.
     """
     if not candidate_ids:
         return {}
+    novelty = _novelty_scores(
+        _stack_vectors(candidate_ids, candidate_vectors, k),
+        _stack_vectors(scraped_ids, scraped_vectors, k),
+        approximate=approximate,
+    )
+    return {aid: float(novelty[i]) for i, aid in enumerate(candidate_ids)}
 
-    # Build candidate matrix
-    C = np.stack([candidate_vectors[aid] for aid in candidate_ids])  # (n_cand, K)
-
-    if not scraped_ids or not any(
-        np.any(scraped_vectors[aid] != 0) for aid in scraped_ids if aid in scraped_vectors
-    ):
-        return {aid: 1.0 for aid in candidate_ids}
 
-    S = np.stack([
-        scraped_vectors.get(aid, np.zeros(k)) for aid in scraped_ids
-    ])  # (n_scraped, K)
+# ---------------------------------------------------------------------------
+# MMR selection
+# ---------------------------------------------------------------------------
 
-    # cosine sim: both matrices are already L2-normalised
-    sim_matrix = C @ S.T  # (n_cand, n_scraped)
-    max_sim = sim_matrix.max(axis=1)  # (n_cand,)
-    novelty_vals = np.clip(1.0 - max_sim, 0.0, 1.0)
+def _mmr_order(
+    relevance: np.ndarray,
+    vectors: np.ndarray,
+    top_k: int,
+    lambda_mmr: float,
+) -> np.ndarray:
+    """Greedy MMR over rows: indices of the top_k picks in selection order.
 
-    result: Dict[str, float] = {}
-    for i, aid in enumerate(candidate_ids):
-        if np.all(candidate_vectors[aid] == 0):
-            result[aid] = 1.0  # no community data → fully novel
+    Each pick maximises λ * relevance_i − (1 − λ) * max_{j ∈ selected} v_i · v_j.
+    The running max-similarity vector is updated with one mat-vec per pick,
+    so the cost is O(top_k × n × K). Ties go to the lowest row index.
+    """
+    n = len(relevance)
+    top_k = min(top_k, n)
+    if top_k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    rows = np.arange(n)
+    gain = lambda_mmr * np.asarray(relevance, dtype=float)
+    redundancy = np.zeros(n)
+    values = gain.copy()
+    picks = np.empty(top_k, dtype=np.int64)
+    for step in range(top_k):
+        best = int(np.argmax(values))
+        picks[step] = rows[best]
+        if step == top_k - 1:
+            break
+        gain[best] = -np.inf
+        sims = vectors @ vectors[best]
+        if step:
+            np.maximum(redundancy, sims, out=redundancy)
         else:
-            result[aid] = float(novelty_vals[i])
-    return result
+            redundancy = sims
+        np.subtract(gain, (1.0 - lambda_mmr) * redundancy, out=values)
+        # Drop picked rows once they are half the arrays, keeping row order.
+        remaining = n - step - 1
+        if 2 * remaining < len(rows):
+            keep = np.isfinite(gain)
+            rows, gain, redundancy, values, vectors = (
+                rows[keep], gain[keep], redundancy[keep], values[keep], vectors[keep],
+            )
+    return picks
 
 
-# ---------------------------------------------------------------------------
-# MMR selection
-# ---------------------------------------------------------------------------
-
 def _mmr_select(
     candidates: List[SeedAccount],
     scores: Dict[str, float],
@@ -438,44 +564,23 @@ def _mmr_select(
     """Greedy MMR: iteratively pick candidate maximising
         λ * score_i − (1 − λ) * max_{j ∈ selected} cosine_sim(i, j).
 
-    Complexity: O(top_k × n) — acceptable for n ≤ 500.
+    Candidates not picked within top_k follow in their input order.
     """
-    top_k = min(top_k, len(candidates))
-    if top_k <= 0:
-        return []
-
-    remaining = list(candidates)
-    selected: List[SeedAccount] = []
-    selected_vectors: List[np.ndarray] = []
-
-    for _ in range(top_k):
-        if not remaining:
-            break
-
-        best_seed = None
-        best_val = float("-inf")
-
-        for seed in remaining:
-            relevance = scores.get(seed.account_id, 0.0)
-            v = membership_vectors.get(seed.account_id, np.zeros(k))
-
-            if selected_vectors:
-                sims = np.array([float(v @ sv) for sv in selected_vectors])
-                redundancy = float(sims.max())
-            else:
-                redundancy = 0.0
-
-            mmr_val = lambda_mmr * relevance - (1.0 - lambda_mmr) * redundancy
-            if mmr_val > best_val:
-                best_val = mmr_val
-                best_seed = seed
-
-        if best_seed is not None:
-            selected.append(best_seed)
-            selected_vectors.append(membership_vectors.get(best_seed.account_id, np.zeros(k)))
-            remaining = [s for s in remaining if s.account_id != best_seed.account_id]
-
-    # Append any remaining candidates (if top_k == len(candidates) this won't trigger)
+    unique: List[SeedAccount] = []
+    seen = set()
+    for seed in candidates:
+        if seed.account_id not in seen:
+            seen.add(seed.account_id)
+            unique.append(seed)
+    ids = [s.account_id for s in unique]
+
+    picks = _mmr_order(
+        np.array([scores.get(aid, 0.0) for aid in ids], dtype=float),
+        _stack_vectors(ids, membership_vectors, k),
+        top_k,
+        lambda_mmr,
+    )
+    selected = [unique[i] for i in picks]
     selected_ids = {s.account_id for s in selected}
     selected.extend(s for s in candidates if s.account_id not in selected_ids)
     return selected
@@ -493,6 +598,7 @@ def score_candidates(
     weights: Optional[AcquisitionWeights] = None,
     top_k: Optional[int] = None,
     lambda_mmr: float = 0.7,
+    approximate_novelty: Optional[bool] = None,
 ) -> List[SeedAccount]:
     """Return candidates ranked by acquisition score, MMR-diversified.
 
@@ -504,6 +610,8 @@ def score_candidates(
         weights:         Custom signal weights (default: AcquisitionWeights()).
         top_k:           Return only the top-k accounts; None = all ranked.
         lambda_mmr:      MMR trade-off: 1.0 = pure relevance, 0.0 = max diversity.
+        approximate_novelty: KD-tree novelty (True), exact (False), or None
+                         to decide by scraped-set size (_ANN_MIN_SCRAPED).
 
     Returns:
         Candidates in descending score order, diversified by MMR.
@@ -512,7 +620,12 @@ def score_candidates(
         return []
 
     w = weights or AcquisitionWeights()
-    candidate_list = list(candidates)
+    candidate_list: List[SeedAccount] = []
+    seen = set()
+    for seed in candidates:
+        if seed.account_id not in seen:
+            seen.add(seed.account_id)
+            candidate_list.append(seed)
     candidate_ids = [c.account_id for c in candidate_list]
 
     # ── Resolve NMF run ──────────────────────────────────────────────────────
@@ -543,22 +656,16 @@ def score_candidates(
     # 4. Coverage boost (Layer 2)
     coverage_raw = _fetch_coverage_boost(community_conn, candidate_ids)
 
-    # 5. Membership vectors (for novelty + MMR)
+    # 5. Membership matrix (for novelty + MMR), one row per candidate
     if resolved_run_id:
-        cand_vectors = _build_membership_vectors(
+        cand_matrix = _membership_matrix(
             community_conn, resolved_run_id, candidate_ids, k
         )
     else:
-        cand_vectors = {aid: np.zeros(max(k, 1)) for aid in candidate_ids}
+        cand_matrix = np.zeros((len(candidate_ids), max(k, 1)))
 
     # Novelty: compare candidates against already-scraped accounts
-    # "Scraped" = accounts that appear in scrape_run_metrics with skipped=False
-    scraped_ids_in_batch = [
-        aid for aid in candidate_ids
-        if aid in scrape_times and scrape_times[aid] < _SCRAPE_TIME_CAP
-        # proxy: accounts with at least one real run have a measured time
-    ]
-    # Strictly: accounts with a row in scrape_run_metrics (not proxy-estimated)
+    # "Scraped" = accounts with a row in scrape_run_metrics (not proxy-estimated)
     # We distinguish via comparing with proxy formula
     known_follower_vals = [v for v in followers_map.values() if v is not None]
     median_f = statistics.median(known_follower_vals) if known_follower_vals else 500
@@ -571,10 +678,9 @@ def score_candidates(
         ))
         return abs(scrape_times.get(aid, proxy) - proxy) < 0.5
 
-    actual_scraped = [aid for aid in candidate_ids if not _is_proxy(aid)]
-    novelty_map = _compute_novelty(
-        candidate_ids, cand_vectors,
-        actual_scraped, cand_vectors, k,
+    scraped_mask = np.array([not _is_proxy(aid) for aid in candidate_ids], dtype=bool)
+    novelty_arr = _novelty_scores(
+        cand_matrix, cand_matrix[scraped_mask], approximate=approximate_novelty,
     )
 
     # ── Normalise signals ─────────────────────────────────────────────────────
@@ -591,8 +697,7 @@ def score_candidates(
     influence_arr = np.log1p(raw_followers)
     influence_arr = _normalize_array(influence_arr)
 
-    # novelty — already in [0, 1]
-    novelty_arr = np.array([novelty_map[aid] for aid in candidate_ids])
+    # novelty — already in [0, 1] (computed above)
 
     # coverage_boost — normalise within batch
     coverage_arr = np.array([coverage_raw[aid] for aid in candidate_ids])
@@ -610,50 +715,42 @@ def score_candidates(
     time_arr = np.array([scrape_times[aid] for aid in candidate_ids])
     final_scores = raw_scores / time_arr  # per second of expected cost
 
-    score_map: Dict[str, float] = {
-        aid: float(final_scores[i]) for i, aid in enumerate(candidate_ids)
-    }
-
     LOGGER.debug(
         "Score distribution — min=%.4f  max=%.4f  mean=%.4f",
         final_scores.min(), final_scores.max(), final_scores.mean(),
     )
 
-    # ── Sort by final score descending ────────────────────────────────────────
-    sorted_candidates = sorted(
-        candidate_list,
-        key=lambda s: score_map.get(s.account_id, 0.0),
-        reverse=True,
-    )
+    # ── Sort by final score descending (stable: ties keep input order) ───────
+    by_score = np.argsort(-final_scores, kind="stable")
 
     # ── MMR diversification ───────────────────────────────────────────────────
-    effective_k = top_k if top_k is not None else len(sorted_candidates)
-    result = _mmr_select(
-        sorted_candidates,
-        score_map,
-        cand_vectors,
-        effective_k,
-        lambda_mmr,
-        k,
-    )
+    effective_k = top_k if top_k is not None else len(candidate_list)
+    picks = by_score[_mmr_order(
+        final_scores[by_score], cand_matrix[by_score], effective_k, lambda_mmr,
+    )]
+    picked = np.zeros(len(candidate_list), dtype=bool)
+    picked[picks] = True
+    order = np.concatenate([picks, by_score[~picked[by_score]]])
+    result = [candidate_list[i] for i in order]
 
     LOGGER.info(
         "Acquisition scorer: ranked %d candidates (top_k=%s, λ_mmr=%.2f)",
         len(result), top_k, lambda_mmr,
     )
     if LOGGER.isEnabledFor(logging.DEBUG):
-        for rank, seed in enumerate(result[:10], 1):
+        for rank, i in enumerate(order[:10], 1):
+            seed = candidate_list[i]
             LOGGER.debug(
                 "  #%d %s  score=%.5f  entropy=%.3f  boundary=%.3f"
                 "  novelty=%.3f  influence=%.3f  coverage=%.3f  time=%.0fs",
                 rank, seed.username or seed.account_id,
-                score_map.get(seed.account_id, 0.0),
-                entropy_boundary[seed.account_id][0],
-                entropy_boundary[seed.account_id][1],
-                novelty_map[seed.account_id],
-                float(influence_arr[candidate_ids.index(seed.account_id)]),
-                float(coverage_arr[candidate_ids.index(seed.account_id)]),
-                scrape_times[seed.account_id],
+                float(final_scores[i]),
+                entropy_arr[i],
+                boundary_arr[i],
+                novelty_arr[i],
+                float(influence_arr[i]),
+                float(coverage_arr[i]),
+                time_arr[i],
             )
 
     return result
@@ -0,0 +1,500 @@
+"""Multi-session enrichment scheduler.
+
+HybridShadowEnricher.enrich walks the seed list through one browser, so a
+few thousand seeds take days even though most of that time is spent
+waiting on page loads and politeness delays. EnrichmentScheduler runs N
+sessions instead, each with its own SeleniumWorker (driver + cookie jar),
+pulling seeds from one shared queue:
+
+- Politeness: every page visit (a worker fetch_* call: profile, following,
+  followers, list members) takes a token from the session's own RateBudget
+  and from a global one shared by all sessions, and each session still
+  pauses user_pause_seconds after a scraped seed. Seeds skipped from the
+  database cost nothing, and N sessions stay inside the same global rate
+  as a single one would.
+- Write-through batching: sessions write through a BatchedShadowWriter
+  that buffers accounts, edges, discoveries and scrape metrics and
+  flushes them to ShadowStore in one serialized batch, instead of every
+  session committing its own small transactions against SQLite. Reads
+  still go to the store, except edge_summary_for_seed: the per-seed
+  summary is built right after the seed's own edges are buffered, so the
+  writer overlays its pending edges on the stored rows rather than
+  forcing a flush per seed.
+
+Usage:
+    scheduler = EnrichmentScheduler(
+        store, config, SchedulerConfig(cookie_paths=[jar_a, jar_b], global_visits_per_hour=240),
+    )
+    summary = scheduler.run(seeds)
+"""
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from ..data.shadow_store import (
+    ScrapeRunMetrics,
+    ShadowAccount,
+    ShadowDiscovery,
+    ShadowEdge,
+    ShadowStore,
+    summarize_seed_edges,
+)
+from .enricher import (
+    EnrichmentPolicy,
+    HybridShadowEnricher,
+    SeedAccount,
+    ShadowEnrichmentConfig,
+    selenium_config_for,
+)
+from .selenium_worker import SeleniumConfig, SeleniumWorker
+from .x_api_client import XAPIClient, XAPIClientConfig
+
+LOGGER = logging.getLogger(__name__)
+
+# Rows per store call when a batch is flushed; keeps multi-row INSERTs
+# under SQLite's bound-parameter limit.
+_WRITE_CHUNK = 2000
+
+WorkerFactory = Callable[[SeleniumConfig], SeleniumWorker]
+
+
+@dataclass
+class SchedulerConfig:
+    """Sessions and politeness budgets for EnrichmentScheduler."""
+
+    cookie_paths: List[Path]               # one browser session per cookie jar
+    session_visits_per_hour: Optional[float] = None  # per-session cap (None = unlimited)
+    global_visits_per_hour: Optional[float] = None   # cap across all sessions
+    write_batch_size: int = 5000           # buffered rows that trigger a flush
+
+    def __post_init__(self) -> None:
+        if not self.cookie_paths:
+            raise ValueError("SchedulerConfig needs at least one cookie path")
+        if self.write_batch_size <= 0:
+            raise ValueError("write_batch_size must be positive")
+        for name in ("session_visits_per_hour", "global_visits_per_hour"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive or None")
+
+
+class SessionStopped(RuntimeError):
+    """Raised inside a session when the scheduler stops while it waits for budget."""
+
+
+class RateBudget:
+    """Thread-safe token bucket allowing ``per_hour`` acquisitions per hour.
+
+    The bucket starts full with ``burst`` tokens. acquire blocks until a
+    token is available, waking early (and returning False) if stop is set.
+    """
+
+    def __init__(self, per_hour: float, burst: int = 1, clock: Callable[[], float] = time.monotonic):
+        if per_hour <= 0:
+            raise ValueError("per_hour must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = per_hour / 3600.0
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self.waited_seconds = 0.0
+
+    def _reserve(self) -> float:
+        """Take a token if one is available; else return seconds until one is."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self.rate
+
+    def acquire(self, stop: Optional[threading.Event] = None) -> bool:
+        stop = stop or threading.Event()
+        while True:
+            wait = self._reserve()
+            if wait <= 0.0:
+                return True
+            self.waited_seconds += wait
+            if stop.wait(wait):
+                return False
+
+
+class BatchedShadowWriter:
+    """ShadowStore proxy that buffers enrichment writes and flushes in batches.
+
+    upsert_accounts / upsert_edges / upsert_discoveries / record_scrape_metrics
+    are buffered; every other attribute (reads, list writes) goes straight to
+    the wrapped store, so reads only see flushed data. The exception is
+    edge_summary_for_seed, which also counts pending edges. Flushes write
+    accounts, then edges, discoveries and metrics, one batch at a time
+    across threads.
+
+    Buffered accounts are merged into one upsert, which only resolves
+    username duplicates against rows already stored. A pending batch is
+    therefore flushed first whenever an incoming account would resolve to a
+    different account id for a username already buffered, preserving the
+    shadow:username -> canonical id merge of sequential writes.
+    """
+
+    def __init__(self, store: ShadowStore, batch_size: int = 5000):
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self._store = store
+        self.batch_size = batch_size
+        self._lock = threading.RLock()
+        self._accounts: List[ShadowAccount] = []
+        self._edges: List[ShadowEdge] = []
+        self._discoveries: List[ShadowDiscovery] = []
+        self._metrics: List[ScrapeRunMetrics] = []
+        self._usernames: Dict[str, str] = {}
+        self._edge_keys: Set[Tuple[str, str, str]] = set()
+        self.flushes = 0
+        self.rows_written = 0
+
+    def __getattr__(self, name: str):
+        return getattr(self._store, name)
+
+    @property
+    def pending(self) -> int:
+        return len(self._accounts) + len(self._edges) + len(self._discoveries) + len(self._metrics)
+
+    def upsert_accounts(self, accounts: Sequence[ShadowAccount]) -> int:
+        with self._lock:
+            if any(
+                self._usernames.get((a.username or "").lower(), a.account_id) != a.account_id
+                for a in accounts
+            ):
+                self._flush_locked()
+            for account in accounts:
+                if account.username:
+                    self._usernames[account.username.lower()] = account.account_id
+            self._accounts.extend(accounts)
+            self._flush_if_full()
+        return len(accounts)
+
+    def upsert_edges(self, edges: Sequence[ShadowEdge]) -> int:
+        with self._lock:
+            keys = [(e.source_id, e.target_id, e.direction) for e in edges]
+            unseen = [e for e, key in zip(edges, keys) if key not in self._edge_keys]
+            new_count = self._store.count_new_edges(unseen)
+            self._edge_keys.update(keys)
+            self._edges.extend(edges)
+            self._flush_if_full()
+        return new_count
+
+    def edge_summary_for_seed(self, account_id: str) -> Dict[str, int]:
+        """Summary over stored edges with pending ones applied on top.
+
+        Pending edges replace stored rows with the same key, matching what
+        upsert_edges will do on flush.
+        """
+        with self._lock:
+            pending = [e for e in self._edges if account_id in (e.source_id, e.target_id)]
+            if not pending:
+                return self._store.edge_summary_for_seed(account_id)
+            rows = {
+                (row["source_id"], row["target_id"], row["direction"]): row
+                for row in self._store.fetch_edges_for_account(account_id)
+            }
+            for edge in pending:
+                rows[(edge.source_id, edge.target_id, edge.direction)] = {
+                    "source_id": edge.source_id,
+                    "target_id": edge.target_id,
+                    "metadata": edge.metadata,
+                }
+        return summarize_seed_edges(account_id, rows.values())
+
+    def upsert_discoveries(self, discoveries: Sequence[ShadowDiscovery]) -> int:
+        with self._lock:
+            self._discoveries.extend(discoveries)
+            self._flush_if_full()
+        return len(discoveries)
+
+    def record_scrape_metrics(self, metrics: ScrapeRunMetrics) -> int:
+        with self._lock:
+            self._metrics.append(metrics)
+            self._flush_if_full()
+        return 0
+
+    def flush(self) -> int:
+        """Write everything buffered; returns the number of rows written."""
+        with self._lock:
+            return self._flush_locked()
+
+    def _flush_if_full(self) -> None:
+        if self.pending >= self.batch_size:
+            self._flush_locked()
+
+    def _flush_locked(self) -> int:
+        accounts, edges, discoveries, metrics = (
+            self._accounts, self._edges, self._discoveries, self._metrics,
+        )
+        total = len(accounts) + len(edges) + len(discoveries) + len(metrics)
+        if not total:
+            return 0
+
+        # Buffers are cleared only after every write succeeds; the upserts
+        # are idempotent, so a retried flush rewrites the rows that did land.
+        start = time.perf_counter()
+        try:
+            for write, rows in (
+                (self._store.upsert_accounts, accounts),
+                (self._store.upsert_edges, edges),
+                (self._store.upsert_discoveries, discoveries),
+                (self._store.record_scrape_metrics_many, metrics),
+            ):
+                for offset in range(0, len(rows), _WRITE_CHUNK):
+                    write(rows[offset:offset + _WRITE_CHUNK])
+        except Exception:
+            LOGGER.error(
+                "Batched shadow write failed; keeping %d accounts, %d edges, %d discoveries, "
+                "%d metrics buffered for the next flush",
+                len(accounts), len(edges), len(discoveries), len(metrics),
+            )
+            raise
+        self._accounts, self._edges, self._discoveries, self._metrics = [], [], [], []
+        self._usernames.clear()
+        self._edge_keys.clear()
+        self.flushes += 1
+        self.rows_written += total
+        LOGGER.info(
+            "Flushed shadow batch: %d accounts, %d edges, %d discoveries, %d metrics in %.2fs",
+            len(accounts), len(edges), len(discoveries), len(metrics),
+            time.perf_counter() - start,
+        )
+        return total
+
+
+class _PoliteWorker:
+    """Worker proxy that takes budget tokens before every fetch_* page visit."""
+
+    def __init__(self, worker: SeleniumWorker, budgets: Sequence[RateBudget], stop: threading.Event):
+        self._worker = worker
+        self._budgets = list(budgets)
+        self._stop = stop
+        self.visits = 0
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._worker, name)
+        if not name.startswith("fetch_") or not callable(attr):
+            return attr
+
+        def visit(*args, **kwargs):
+            for budget in self._budgets:
+                if not budget.acquire(self._stop):
+                    raise SessionStopped(f"scheduler stopped before {name}")
+            self.visits += 1
+            return attr(*args, **kwargs)
+        return visit
+
+
+class _LockedAPIClient:
+    """Serializes calls to one XAPIClient shared by all sessions."""
+
+    def __init__(self, client: XAPIClient):
+        self._client = client
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+        return call
+
+
+@dataclass
+class _Session:
+    index: int
+    enricher: HybridShadowEnricher
+    worker: _PoliteWorker
+    budget: Optional[RateBudget]
+    seeds_done: int = 0
+    errors: int = 0
+    thread: Optional[threading.Thread] = field(default=None, repr=False)
+
+
+class EnrichmentScheduler:
+    """Drives several enrichment sessions from one shared seed queue.
+
+    Sessions run with first-scrape confirmation and manual-login waits
+    disabled, since several browsers cannot share one terminal prompt.
+    worker_factory builds each session's worker from its SeleniumConfig
+    (tests pass a replaying fake).
+    """
+
+    def __init__(
+        self,
+        store: ShadowStore,
+        config: ShadowEnrichmentConfig,
+        scheduler_config: SchedulerConfig,
+        policy: Optional[EnrichmentPolicy] = None,
+        worker_factory: WorkerFactory = SeleniumWorker,
+    ) -> None:
+        self._store = store
+        self._config = config
+        self._scheduler_config = scheduler_config
+        self._policy = policy
+        self._worker_factory = worker_factory
+        self._stop = threading.Event()
+        self._sessions: List[_Session] = []
+        self._global_budget = (
+            RateBudget(scheduler_config.global_visits_per_hour)
+            if scheduler_config.global_visits_per_hour
+            else None
+        )
+        self.writer = BatchedShadowWriter(store, batch_size=scheduler_config.write_batch_size)
+
+    def _build_sessions(self) -> List[_Session]:
+        api_client = None
+        if self._config.bearer_token:
+            api_client = _LockedAPIClient(XAPIClient(XAPIClientConfig(
+                bearer_token=self._config.bearer_token,
+                rate_state_path=self._config.rate_state_path,
+            )))
+        per_session = self._scheduler_config.session_visits_per_hour
+        sessions = []
+        for index, cookie_path in enumerate(self._scheduler_config.cookie_paths):
+            session_config = replace(
+                self._config,
+                selenium_cookies_path=cookie_path,
+                confirm_first_scrape=False,
+                wait_for_manual_login=False,
+            )
+            budget = RateBudget(per_session) if per_session else None
+            worker = _PoliteWorker(
+                self._worker_factory(selenium_config_for(session_config)),
+                [b for b in (budget, self._global_budget) if b is not None],
+                self._stop,
+            )
+            enricher = HybridShadowEnricher(
+                self.writer,
+                session_config,
+                self._policy,
+                selenium_worker=worker,
+                api_client=api_client,
+            )
+            sessions.append(_Session(index, enricher, worker, budget))
+        return sessions
+
+    def run(self, seeds: Sequence[SeedAccount]) -> Dict[str, Dict[str, object]]:
+        """Enrich all seeds across the sessions; returns the merged summary."""
+        self._stop.clear()
+        seed_queue: "queue.Queue[Tuple[int, SeedAccount]]" = queue.Queue()
+        for position, seed in enumerate(seeds, start=1):
+            seed_queue.put((position, seed))
+        summary: Dict[str, Dict[str, object]] = {}
+        summary_lock = threading.Lock()
+
+        self._sessions = self._build_sessions()
+        LOGGER.info(
+            "Starting scheduled enrichment: %d seeds across %d sessions",
+            len(seeds), len(self._sessions),
+        )
+        start = time.perf_counter()
+        for session in self._sessions:
+            session.thread = threading.Thread(
+                target=self._session_loop,
+                args=(session, seed_queue, len(seeds), summary, summary_lock),
+                name=f"enrich-session-{session.index}",
+                daemon=True,
+            )
+            session.thread.start()
+
+        try:
+            for session in self._sessions:
+                while session.thread.is_alive():
+                    session.thread.join(timeout=0.5)
+        except KeyboardInterrupt:
+            LOGGER.warning("Interrupted; letting sessions finish their current seed")
+            self.stop()
+            for session in self._sessions:
+                session.thread.join()
+        finally:
+            try:
+                self.writer.flush()
+            finally:
+                for session in self._sessions:
+                    session.enricher.quit()
+
+        LOGGER.info(
+            "Scheduled enrichment finished in %.1fs: %s",
+            time.perf_counter() - start,
+            ", ".join(f"session {s.index}: {s.seeds_done} seeds" for s in self._sessions),
+        )
+        return summary
+
+    def stop(self) -> None:
+        """Stop handing out seeds and abort in-progress scrolls."""
+        self._stop.set()
+        for session in self._sessions:
+            session.enricher.request_shutdown()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "sessions": [
+                {
+                    "index": s.index,
+                    "seeds_done": s.seeds_done,
+                    "page_visits": s.worker.visits,
+                    "errors": s.errors,
+                    "budget_wait_seconds": round(s.budget.waited_seconds, 3) if s.budget else 0.0,
+                }
+                for s in self._sessions
+            ],
+            "global_budget_wait_seconds": (
+                round(self._global_budget.waited_seconds, 3) if self._global_budget else 0.0
+            ),
+            "flushes": self.writer.flushes,
+            "rows_written": self.writer.rows_written,
+        }
+
+    def _session_loop(
+        self,
+        session: _Session,
+        seed_queue: "queue.Queue[Tuple[int, SeedAccount]]",
+        total_seeds: int,
+        summary: Dict[str, Dict[str, object]],
+        summary_lock: threading.Lock,
+    ) -> None:
+        pause = self._config.user_pause_seconds
+        while not self._stop.is_set():
+            try:
+                position, seed = seed_queue.get_nowait()
+            except queue.Empty:
+                return
+
+            local: Dict[str, Dict[str, object]] = {}
+            try:
+                scraped = session.enricher._enrich_seed(seed, position, total_seeds, local)
+            except SessionStopped:
+                return
+            except Exception as exc:
+                session.errors += 1
+                scraped = False
+                LOGGER.exception("Session %d failed on @%s", session.index, seed.username)
+                local[seed.account_id] = {
+                    "username": seed.username,
+                    "error": "session_exception",
+                    "reason": str(exc),
+                }
+            session.seeds_done += 1
+            with summary_lock:
+                summary.update(local)
+
+            if scraped and pause > 0 and self._stop.wait(pause):
+                return
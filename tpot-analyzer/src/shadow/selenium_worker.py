@@ -14,7 +14,7 @@ import time
 from datetime import datetime
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set
+from typing import Callable, Container, Dict, List, Optional, Set
 from urllib.parse import urlparse
 
 from selenium import webdriver
@@ -26,6 +26,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from urllib3.exceptions import MaxRetryError, NewConnectionError
 
+from .user_cells import UserCellFields, clean_bio_text, handle_from_href, parse_user_cells
+
 
 LOGGER = logging.getLogger(__name__)
 
@@ -85,6 +87,8 @@ class SeleniumConfig:
     chrome_binary: Optional[Path] = None
     require_confirmation: bool = True
     retry_delays: List[float] = field(default_factory=lambda: [5.0, 15.0, 60.0])
+    # Read list cells from one page_source per scroll instead of per-cell WebDriver calls
+    bulk_dom_extraction: bool = False
 
 
 @dataclass
@@ -592,22 +596,13 @@ class SeleniumWorker:
             starting_seen = len(discovered)
 
             # Extract users from current viewport
-            try:
-                timeline_section = self._driver.find_element(By.CSS_SELECTOR, 'section[role="region"]')
-                user_cells = timeline_section.find_elements(By.CSS_SELECTOR, '[data-testid="UserCell"]')
-            except Exception as exc:
-                LOGGER.warning("[list_members] Could not find timeline section on scroll %s: %s", scroll_round, exc)
-                user_cells = []
-
-            for cell in user_cells:
-                handle = self._extract_handle(cell)
-                if not handle:
-                    continue
-                display_name = self._extract_display_name(cell) or handle
-                bio = self._extract_bio(cell)
+            for cell in self._read_user_cells("list_members", scroll_round, seen=discovered):
+                handle = cell.handle
+                display_name = cell.display_name or handle
+                bio = cell.bio
                 profile_url = f"https://x.com/{handle}"
-                website = self._extract_website(cell)
-                profile_image_url = self._extract_profile_image_url(cell)
+                website = cell.website
+                profile_image_url = cell.profile_image_url
 
                 if handle not in discovered:
                     extraction_counter += 1
@@ -1101,37 +1096,15 @@ class SeleniumWorker:
             scroll_round += 1
             LOGGER.debug("[%s] scroll #%s (collected=%s)", list_type, scroll_round, len(discovered))
 
-            # CRITICAL FIX: Scope UserCell search to main timeline only, exclude sidebar recommendations
-            # Find the main timeline section (already verified to exist in line 301)
-            try:
-                timeline_section = self._driver.find_element(By.CSS_SELECTOR, 'section[role="region"]')
-                # Search for UserCells ONLY within the main timeline, not the entire page
-                user_cells = timeline_section.find_elements(By.CSS_SELECTOR, '[data-testid="UserCell"]')
-            except Exception as exc:
-                LOGGER.warning("[%s] Could not find timeline section on scroll %s: %s", list_type, scroll_round, exc)
-                user_cells = []
-            if LOGGER.isEnabledFor(logging.DEBUG):
-                sample_html = (
-                    user_cells[0].get_attribute("outerHTML")[:500]
-                    if user_cells
-                    else "NONE"
-                )
-                LOGGER.debug(
-                    "[%s] found %s user cells; sample HTML: %s",
-                    list_type,
-                    len(user_cells),
-                    sample_html,
-                )
+            user_cells = self._read_user_cells(list_type, scroll_round, seen=discovered)
             if not user_cells:
                 LOGGER.debug("[%s] no user cells found on scroll %s", list_type, scroll_round)
             for cell in user_cells:
-                handle = self._extract_handle(cell)
-                if not handle:
-                    continue
-                display_name = self._extract_display_name(cell) or handle
-                bio = self._extract_bio(cell)
-                website = self._extract_website(cell)
-                profile_image_url = self._extract_profile_image_url(cell)
+                handle = cell.handle
+                display_name = cell.display_name or handle
+                bio = cell.bio
+                website = cell.website
+                profile_image_url = cell.profile_image_url
                 profile_url = f"https://x.com/{handle}"
 
                 existing = discovered.get(handle)
@@ -1276,22 +1249,19 @@ class SeleniumWorker:
                     LOGGER.debug("[RETRY %s] scroll #%s (collected=%s)", list_type, retry_scroll_round, len(retry_discovered))
 
                     # Extract users from current viewport
-                    try:
-                        timeline_section = self._driver.find_element(By.CSS_SELECTOR, 'section[role="region"]')
-                        user_cells = timeline_section.find_elements(By.CSS_SELECTOR, '[data-testid="UserCell"]')
-                    except Exception as exc:
-                        LOGGER.warning("[RETRY %s] Could not find timeline: %s", list_type, exc)
-                        user_cells = []
+                    user_cells = self._read_user_cells(
+                        list_type, retry_scroll_round, seen=retry_discovered, retry=True,
+                    )
 
                     for cell in user_cells:
-                        handle = self._extract_handle(cell)
-                        if not handle or handle in retry_discovered:
+                        handle = cell.handle
+                        if handle in retry_discovered:
                             continue
 
-                        display_name = self._extract_display_name(cell) or handle
-                        bio = self._extract_bio(cell)
-                        website = self._extract_website(cell)
-                        profile_image_url = self._extract_profile_image_url(cell)
+                        display_name = cell.display_name or handle
+                        bio = cell.bio
+                        website = cell.website
+                        profile_image_url = cell.profile_image_url
 
                         retry_extraction_counter += 1
                         bio_preview = (bio[:77] + "...") if bio and len(bio) > 80 else bio
@@ -1356,6 +1326,61 @@ class SeleniumWorker:
             profile_overview=final_overview,
         )
 
+    def _read_user_cells(
+        self,
+        list_type: str,
+        scroll_round: int,
+        *,
+        seen: Container[str],
+        retry: bool = False,
+    ) -> List[UserCellFields]:
+        """Fields of the UserCells currently rendered in the main timeline.
+
+        With bulk_dom_extraction the page is read with a single page_source
+        call and parsed locally, skipping handles already in ``seen``.
+        Otherwise every cell is queried over WebDriver; ``seen`` is ignored
+        so duplicates can still fill fields missing from the first capture.
+        """
+        assert self._driver is not None
+        label = f"RETRY {list_type}" if retry else list_type
+        if self._config.bulk_dom_extraction:
+            try:
+                source = self._driver.page_source
+            except (ConnectionRefusedError, MaxRetryError, NewConnectionError) as exc:
+                LOGGER.warning("Driver connection lost reading page source (likely pause/shutdown): %s", exc)
+                raise KeyboardInterrupt("Driver connection lost") from exc
+            cells = parse_user_cells(source, seen=seen)
+            LOGGER.debug("[%s] parsed %s new user cells from page source", label, len(cells))
+            return cells
+
+        # CRITICAL FIX: Scope UserCell search to main timeline only, exclude sidebar recommendations
+        try:
+            timeline_section = self._driver.find_element(By.CSS_SELECTOR, 'section[role="region"]')
+            # Search for UserCells ONLY within the main timeline, not the entire page
+            elements = timeline_section.find_elements(By.CSS_SELECTOR, '[data-testid="UserCell"]')
+        except Exception as exc:
+            LOGGER.warning("[%s] Could not find timeline section on scroll %s: %s", label, scroll_round, exc)
+            return []
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            sample_html = elements[0].get_attribute("outerHTML")[:500] if elements else "NONE"
+            LOGGER.debug("[%s] found %s user cells; sample HTML: %s", label, len(elements), sample_html)
+
+        cells: List[UserCellFields] = []
+        for element in elements:
+            handle = self._extract_handle(element)
+            if not handle:
+                continue
+            if retry and handle in seen:
+                continue
+            cells.append(UserCellFields(
+                handle=handle,
+                display_name=self._extract_display_name(element),
+                bio=self._extract_bio(element),
+                website=self._extract_website(element),
+                profile_image_url=self._extract_profile_image_url(element),
+            ))
+        return cells
+
     def _apply_delay(self, label: str, *, short: bool = False) -> None:
         low = 0.5 if short else self._config.action_delay_min
         high = 1.5 if short else self._config.action_delay_max
@@ -1432,27 +1457,7 @@ class SeleniumWorker:
 
     @staticmethod
     def _handle_from_href(href: str | None) -> str | None:
-        if not href:
-            return None
-        cleaned = href.strip()
-        if not cleaned:
-            return None
-        if cleaned.startswith("/"):
-            cleaned = cleaned.lstrip("/")
-        elif "twitter.com" in cleaned:
-            cleaned = cleaned.split("twitter.com/")[-1]
-        elif "x.com" in cleaned:
-            cleaned = cleaned.split("x.com/")[-1]
-        # else: bare username or other format - try to parse as-is
-
-        cleaned = cleaned.split("?")[0].split("#")[0].rstrip("/")
-        if not cleaned or "/" in cleaned:
-            return None
-        if cleaned.startswith("@"):  # defensive; some anchors include @ prefix
-            cleaned = cleaned[1:]
-        if not cleaned or cleaned.startswith("i") or len(cleaned) >= 40:
-            return None
-        return cleaned
+        return handle_from_href(href)
 
     @staticmethod
     def _clean_bio_text(bio: str) -> str:
@@ -1462,30 +1467,7 @@ class SeleniumWorker:
         These appear at the start of the bio text, typically followed by whitespace or another badge.
         We need to be careful not to strip legitimate user content like "Following my dreams".
         """
-        if not bio:
-            return bio
-
-        import re
-
-        # Twitter badges are typically standalone at the start, followed by:
-        # - newline (\n)
-        # - another badge
-        # - end of string (when bio is empty)
-        # - significant whitespace (multiple spaces)
-
-        cleaned = bio.strip()
-
-        # Pattern: "Follows you" or "Following" at start, followed by newline, another badge, or end
-        # Use \s{2,} to match 2+ spaces (Twitter often uses multiple spaces between badges and content)
-        pattern = r'^(Follows you|Following)(\s{2,}|\n|(?=Follows you)|(?=Following)|$)'
-
-        # Keep removing badges until none remain
-        prev_cleaned = None
-        while prev_cleaned != cleaned:
-            prev_cleaned = cleaned
-            cleaned = re.sub(pattern, '', cleaned, flags=re.MULTILINE).strip()
-
-        return cleaned
+        return clean_bio_text(bio)
 
     def _extract_bio(self, cell) -> Optional[str]:
         from selenium.common.exceptions import StaleElementReferenceException
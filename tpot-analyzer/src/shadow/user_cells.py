@@ -0,0 +1,279 @@
+"""Bulk UserCell extraction from captured list-page HTML.
+
+Reading a follower/following cell over WebDriver costs one remote call per
+lookup: the anchors, their hrefs, the name spans, the bio node, the images.
+Across a long list that dominates the scrape. parse_user_cells reads the
+same fields from a single page_source string in-process, so a scroll step
+costs one round-trip no matter how many cells are rendered. It needs no
+browser, so it also runs against snapshots saved by
+SeleniumWorker._save_page_snapshot.
+
+Parsing uses the stdlib HTMLParser. Only elements inside a UserCell that
+sits in the main timeline (the first ``section[role="region"]``) are kept,
+matching the live scope that excludes sidebar recommendations. Field rules
+mirror the SeleniumWorker._extract_* helpers.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Container, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Elements that never have children or an end tag.
+_VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+})
+# Elements whose rendered text starts on a new line (approximates WebElement.text).
+_BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5",
+    "h6", "header", "li", "main", "nav", "ol", "p", "pre", "section", "table",
+    "tr", "ul",
+})
+_HIDDEN_TAGS = frozenset({"script", "style", "template", "noscript"})
+_BADGE_PATTERN = re.compile(r"^(Follows you|Following)(\s{2,}|\n|(?=Follows you)|(?=Following)|$)", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class UserCellFields:
+    """Fields read from one UserCell; the same ones SeleniumWorker extracts live."""
+
+    handle: str
+    display_name: Optional[str] = None
+    bio: Optional[str] = None
+    website: Optional[str] = None
+    profile_image_url: Optional[str] = None
+
+
+@dataclass
+class _Node:
+    tag: str
+    attrs: Dict[str, str]
+    depth: int
+    children: List[Union["_Node", str]] = field(default_factory=list)
+
+    def iter(self) -> Iterator["_Node"]:
+        """Descendant elements in document order (excluding self)."""
+        for child in self.children:
+            if isinstance(child, _Node):
+                yield child
+                yield from child.iter()
+
+    def find_all(self, tag: Optional[str] = None, **attrs: str) -> List["_Node"]:
+        return [
+            node for node in self.iter()
+            if (tag is None or node.tag == tag)
+            and all(node.attrs.get(name.replace("_", "-")) == value for name, value in attrs.items())
+        ]
+
+    @property
+    def text(self) -> str:
+        """Rendered-ish text: block elements on their own lines, blank lines dropped."""
+        parts: List[str] = []
+        self._collect_text(parts)
+        lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+    def _collect_text(self, parts: List[str]) -> None:
+        if self.tag in _HIDDEN_TAGS:
+            return
+        if self.tag == "br":
+            parts.append("\n")
+            return
+        block = self.tag in _BLOCK_TAGS
+        if block:
+            parts.append("\n")
+        for child in self.children:
+            if isinstance(child, _Node):
+                child._collect_text(parts)
+            else:
+                parts.append(child)
+        if block:
+            parts.append("\n")
+
+
+class _UserCellCollector(HTMLParser):
+    """Build small element trees for the UserCells of the main timeline only."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.cells: List[_Node] = []
+        self._open_tags: List[str] = []
+        self._region_depth: Optional[int] = None
+        self._region_seen = False
+        self._cell_path: List[_Node] = []
+
+    def handle_starttag(self, tag: str, attrs: Sequence[Tuple[str, Optional[str]]]) -> None:
+        attr_map = {name: value or "" for name, value in attrs}
+        void = tag in _VOID_TAGS
+        depth = len(self._open_tags) + (0 if void else 1)
+
+        node: Optional[_Node] = None
+        if self._cell_path:
+            node = _Node(tag, attr_map, depth)
+            self._cell_path[-1].children.append(node)
+        elif self._region_depth is not None and attr_map.get("data-testid") == "UserCell":
+            node = _Node(tag, attr_map, depth)
+            self.cells.append(node)
+
+        if void:
+            return
+        self._open_tags.append(tag)
+        if node is not None:
+            self._cell_path.append(node)
+        if (
+            not self._region_seen
+            and tag == "section"
+            and attr_map.get("role") == "region"
+        ):
+            self._region_seen = True
+            self._region_depth = depth
+
+    def handle_endtag(self, tag: str) -> None:
+        # Close back to the matching open tag; stray end tags are ignored.
+        for idx in range(len(self._open_tags) - 1, -1, -1):
+            if self._open_tags[idx] == tag:
+                break
+        else:
+            return
+        del self._open_tags[idx:]
+        depth = len(self._open_tags)
+        while self._cell_path and self._cell_path[-1].depth > depth:
+            self._cell_path.pop()
+        if self._region_depth is not None and self._region_depth > depth:
+            self._region_depth = None
+
+    def handle_data(self, data: str) -> None:
+        if self._cell_path:
+            self._cell_path[-1].children.append(data)
+
+
+def handle_from_href(href: Optional[str]) -> Optional[str]:
+    """Profile handle from a profile link, or None for any other kind of link."""
+    if not href:
+        return None
+    cleaned = href.strip()
+    if not cleaned:
+        return None
+    if cleaned.startswith("/"):
+        cleaned = cleaned.lstrip("/")
+    elif "twitter.com" in cleaned:
+        cleaned = cleaned.split("twitter.com/")[-1]
+    elif "x.com" in cleaned:
+        cleaned = cleaned.split("x.com/")[-1]
+    # else: bare username or other format - try to parse as-is
+
+    cleaned = cleaned.split("?")[0].split("#")[0].rstrip("/")
+    if not cleaned or "/" in cleaned:
+        return None
+    if cleaned.startswith("@"):  # defensive; some anchors include @ prefix
+        cleaned = cleaned[1:]
+    if not cleaned or cleaned.startswith("i") or len(cleaned) >= 40:
+        return None
+    return cleaned
+
+
+def clean_bio_text(bio: str) -> str:
+    """Strip leading "Follows you" / "Following" badges from bio text."""
+    if not bio:
+        return bio
+    cleaned = bio.strip()
+    # Keep removing badges until none remain
+    prev_cleaned = None
+    while prev_cleaned != cleaned:
+        prev_cleaned = cleaned
+        cleaned = _BADGE_PATTERN.sub("", cleaned).strip()
+    return cleaned
+
+
+def _cell_handle(cell: _Node, text: str) -> Optional[str]:
+    for anchor in cell.find_all("a"):
+        handle = handle_from_href(anchor.attrs.get("href"))
+        if handle:
+            return handle
+    for token in text.split():
+        if token.startswith("@"):
+            return token[1:]
+    return None
+
+
+def _cell_display_name(cell: _Node, lines: List[str]) -> Optional[str]:
+    for username_div in cell.find_all("div", data_testid="UserName")[:1]:
+        for span in username_div.find_all("span"):
+            value = span.text.strip()
+            if value and not value.startswith("@") and len(value) <= 80:
+                return value
+    if lines and not lines[0].startswith("@"):
+        return lines[0]
+    return None
+
+
+def _cell_bio(cell: _Node, lines: List[str]) -> Optional[str]:
+    bio_nodes = cell.find_all("div", data_testid="UserDescription")
+    if bio_nodes and bio_nodes[0].text.strip():
+        return clean_bio_text(bio_nodes[0].text.strip())
+
+    for i, line in enumerate(lines):
+        if line.startswith("@"):
+            # Bio starts after the handle and potentially a "Follow" line
+            start = i + 2 if i + 1 < len(lines) and lines[i + 1] in {"Follow", "Following"} else i + 1
+            if start < len(lines):
+                return clean_bio_text(" ".join(lines[start:]))
+            break
+    return None
+
+
+def _cell_website(cell: _Node) -> Optional[str]:
+    anchors = cell.find_all("a", data_testid="UserUrl") or [
+        a for a in cell.find_all("a") if "href" in a.attrs
+    ]
+    for anchor in anchors:
+        href = anchor.attrs.get("href", "").strip()
+        if not href or href.startswith("/"):
+            continue
+        host = href.split("://", 1)[-1].split("/", 1)[0].lower()
+        # Raw hrefs are relative or absolute; skip internal links either way.
+        if "twitter.com" in href or host == "x.com" or host.endswith(".x.com"):
+            continue
+        return href
+    return None
+
+
+def _cell_profile_image_url(cell: _Node) -> Optional[str]:
+    for img in cell.find_all("img"):
+        src = img.attrs.get("src", "").strip()
+        if src and ("twimg.com" in src or "profile_images" in src):
+            return src
+    return None
+
+
+def parse_user_cells(html: str, seen: Container[str] = ()) -> List[UserCellFields]:
+    """Fields of every main-timeline UserCell in html, in document order.
+
+    Cells whose handle is in ``seen`` (or repeats an earlier cell) are
+    skipped before their remaining fields are read, so callers can pass
+    the handles already captured on previous scroll steps.
+    """
+    collector = _UserCellCollector()
+    collector.feed(html)
+    collector.close()
+
+    results: List[UserCellFields] = []
+    emitted = set()
+    for cell in collector.cells:
+        text = cell.text
+        handle = _cell_handle(cell, text)
+        if not handle or handle in seen or handle in emitted:
+            continue
+        emitted.add(handle)
+        lines = text.split("\n")
+        results.append(UserCellFields(
+            handle=handle,
+            display_name=_cell_display_name(cell, lines),
+            bio=_cell_bio(cell, lines),
+            website=_cell_website(cell),
+            profile_image_url=_cell_profile_image_url(cell),
+        ))
+    return results
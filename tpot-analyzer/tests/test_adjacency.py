@@ -0,0 +1,106 @@
+"""Tests for the memory-mapped adjacency cache (src/data/adjacency.py)."""
+from __future__ import annotations
+
+import json
+import mmap
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+import scipy.sparse as sp
+
+from src.api.cluster.state import _load_or_build_adjacency
+from src.data.adjacency import (
+    load_adjacency_cache,
+    load_adjacency_mmap,
+    mmap_cache_path,
+    save_adjacency_mmap,
+)
+from src.graph.observation_model import ObservationWeightingConfig
+
+
+def _is_mapped(array: np.ndarray) -> bool:
+    base = array
+    while base is not None:
+        if isinstance(base, (np.memmap, mmap.mmap)):
+            return True
+        base = getattr(base, "base", None)
+    return False
+
+
+@pytest.fixture
+def adjacency() -> sp.csr_matrix:
+    rows = np.array([0, 0, 1, 2, 3])
+    cols = np.array([1, 2, 2, 0, 1])
+    return sp.csr_matrix((np.ones(5), (rows, cols)), shape=(4, 4))
+
+
+def test_round_trip_is_memory_mapped(tmp_path, adjacency):
+    cache_dir = tmp_path / "adjacency_matrix_cache.csr"
+    save_adjacency_mmap(adjacency, cache_dir, stats={"mode": "off"}, fingerprint={"k": 1})
+
+    loaded, stats = load_adjacency_mmap(cache_dir, {"k": 1})
+    assert all(_is_mapped(part) for part in (loaded.indptr, loaded.indices, loaded.data))
+    assert (loaded != adjacency).nnz == 0
+    assert stats == {"mode": "off"}
+    assert json.loads((cache_dir / "header.json").read_text())["nnz"] == adjacency.nnz
+
+
+def test_fingerprint_or_version_mismatch_is_a_miss(tmp_path, adjacency):
+    cache_dir = tmp_path / "adj.csr"
+    save_adjacency_mmap(adjacency, cache_dir, fingerprint={"k": 1})
+    assert load_adjacency_mmap(cache_dir, {"k": 2}) is None
+
+    header = json.loads((cache_dir / "header.json").read_text())
+    header["version"] = 0
+    (cache_dir / "header.json").write_text(json.dumps(header))
+    assert load_adjacency_mmap(cache_dir) is None
+
+
+def test_concurrent_saves_stage_in_separate_dirs(tmp_path, adjacency):
+    cache_dir = tmp_path / "adj.csr"
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(
+            lambda k: save_adjacency_mmap(adjacency * (k + 1), cache_dir, fingerprint={"k": 1}),
+            range(8),
+        ))
+
+    loaded, _ = load_adjacency_mmap(cache_dir, {"k": 1})
+    assert loaded.nnz == adjacency.nnz
+    assert len(set(loaded.data.tolist())) == 1  # all parts from one writer
+    assert [p.name for p in tmp_path.iterdir()] == ["adj.csr"]
+
+
+def test_load_adjacency_cache_prefers_mmap_and_falls_back_to_pickle(tmp_path, adjacency):
+    pkl_path = tmp_path / "adjacency_matrix_cache.pkl"
+    with open(pkl_path, "wb") as handle:
+        pickle.dump({"adjacency": adjacency * 2}, handle)
+    assert load_adjacency_cache(pkl_path).sum() == 2 * adjacency.sum()
+
+    save_adjacency_mmap(adjacency, mmap_cache_path(pkl_path))
+    assert load_adjacency_cache(pkl_path).sum() == adjacency.sum()
+
+
+def test_cluster_adjacency_rebuilds_only_when_sources_change(tmp_path, monkeypatch):
+    edges_path = tmp_path / "graph_snapshot.edges.parquet"
+    pd.DataFrame({"source": ["a", "b"], "target": ["b", "c"]}).to_parquet(edges_path)
+    node_ids = np.array(["a", "b", "c"])
+    cache_dir = tmp_path / "adjacency_matrix_cache.csr"
+    config = ObservationWeightingConfig()
+
+    first, stats = _load_or_build_adjacency(edges_path, node_ids, cache_dir, obs_config=config)
+    assert stats["cache_hit"] is False
+    assert first.nnz == 2
+
+    monkeypatch.setattr(pd, "read_parquet", lambda *a, **k: pytest.fail("edges re-read on cache hit"))
+    second, stats = _load_or_build_adjacency(edges_path, node_ids, cache_dir, obs_config=config)
+    assert stats["cache_hit"] is True
+    assert (second != first).nnz == 0
+    monkeypatch.undo()
+
+    pd.DataFrame({"source": ["a", "b", "c"], "target": ["b", "c", "a"]}).to_parquet(edges_path)
+    third, stats = _load_or_build_adjacency(edges_path, node_ids, cache_dir, obs_config=config)
+    assert stats["cache_hit"] is False
+    assert third.nnz == 3
@@ -5,6 +5,7 @@ Covers:
 - POST /api/signals/feedback — valid submission, malformed payload, missing fields
 - GET /api/signals/quality — basic report request
 - GET /api/metrics/performance — performance diagnostics
+- GET /api/metrics/cache — response cache counters
 - GET /api/analysis/status — background job status
 - POST /api/analysis/run — background job start + conflict detection
 - Error paths — all validation rejection paths return 400 with descriptive messages
@@ -445,6 +446,23 @@ class TestPerformanceMetrics:
         assert "discovery_entries" in payload["cache"]
 
 
+class TestCacheMetrics:
+    """Tests for the GET /api/metrics/cache endpoint."""
+
+    def test_reports_per_namespace_counters(self, analysis_app, client):
+        cache_manager = analysis_app.config["CACHE_MANAGER"]
+        cache_manager.set_graph_response("k", "payload")
+        cache_manager.get_graph_response("k")
+        cache_manager.get_discovery_result("missing")
+
+        resp = client.get("/api/metrics/cache")
+        assert resp.status_code == 200
+        payload = resp.get_json()
+        assert payload["total_bytes"] == len("payload")
+        assert payload["namespaces"]["graph"]["hits"] == 1
+        assert payload["namespaces"]["discovery"]["misses"] == 1
+
+
 # =============================================================================
 # GET /api/analysis/status + POST /api/analysis/run
 # =============================================================================
@@ -26,3 +26,106 @@ def test_cache_manager_clear_all_clears_both_caches():
     assert cache.get_discovery_result("disc:key") is None
     assert cache.graph_cache_size() == 0
     assert cache.discovery_cache_size() == 0
+
+
+def test_cache_manager_evicts_least_recently_used_when_over_byte_budget():
+    cache = CacheManager(graph_max_bytes=10)
+    cache.set_graph_response("a", "xxxx")
+    cache.set_graph_response("b", "yyyy")
+    assert cache.get_graph_response("a") == "xxxx"  # a is now most recent
+
+    cache.set_graph_response("c", "zzzz")
+
+    assert cache.get_graph_response("b") is None
+    assert cache.get_graph_response("a") == "xxxx"
+    stats = cache.stats()["namespaces"]["graph"]
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == 8
+    assert stats["entries"] == 2
+
+
+def test_cache_manager_rejects_entries_larger_than_budget():
+    cache = CacheManager(graph_max_bytes=4)
+    cache.set_graph_response("small", "ok")
+    cache.set_graph_response("huge", "x" * 100)
+
+    assert cache.get_graph_response("huge") is None
+    assert cache.get_graph_response("small") == "ok"
+    assert cache.stats()["namespaces"]["graph"]["rejections"] == 1
+
+
+def test_cache_manager_expires_entries_after_namespace_ttl(monkeypatch):
+    cache = CacheManager(discovery_ttl_seconds=10)
+    now = [1000.0]
+    monkeypatch.setattr("src.api.services.cache_manager.time.time", lambda: now[0])
+    cache.set_discovery_result("k", {"recommendations": []})
+
+    now[0] += 5
+    assert cache.get_discovery_result("k") == {"recommendations": []}
+    now[0] += 10
+    assert cache.get_discovery_result("k") is None
+
+    stats = cache.stats()["namespaces"]["discovery"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["expirations"] == 1
+    assert cache.discovery_cache_size() == 0
+
+
+def test_cache_manager_invalidates_entries_from_older_snapshot_version():
+    version = ["v1"]
+    cache = CacheManager(version_provider=lambda: version[0], version_check_interval=0)
+    cache.set_graph_response("k", "payload")
+    assert cache.get_graph_response("k") == "payload"
+
+    version[0] = "v2"
+
+    assert cache.get_graph_response("k") is None
+    stats = cache.stats()
+    assert stats["snapshot_version"] == "v2"
+    assert stats["namespaces"]["graph"]["invalidations"] == 1
+
+
+def test_version_change_notifies_owner_once():
+    version = ["v1"]
+    changes = []
+    cache = CacheManager(
+        version_provider=lambda: version[0],
+        version_check_interval=0,
+        on_version_change=lambda old, new: changes.append((old, new)),
+    )
+    cache.get_graph_response("k")
+    assert changes == []  # first observed version is not a change
+
+    version[0] = "v2"
+    cache.get_graph_response("k")
+    cache.set_graph_response("k", "payload")
+    assert changes == [("v1", "v2")]
+
+
+def test_server_reloads_snapshot_graph_on_version_change(monkeypatch):
+    from src.api import server, snapshot_loader
+
+    class _Loader:
+        version = "v1"
+        cleared = 0
+
+        def snapshot_version(self):
+            return self.version
+
+        def clear_cache(self):
+            self.cleared += 1
+
+    loader = _Loader()
+    monkeypatch.setattr(snapshot_loader, "get_snapshot_loader", lambda *a, **k: loader)
+    app = server.create_app()
+    cache = app.config["CACHE_MANAGER"]
+    cache._version_check_interval = 0
+
+    cache.get_graph_response("k")
+    app.config["SNAPSHOT_GRAPH"] = object()
+    loader.version = "v2"
+    cache.get_graph_response("k")
+
+    assert "SNAPSHOT_GRAPH" not in app.config
+    assert loader.cleared == 1
@@ -0,0 +1,83 @@
+"""Tests for src/graph/cluster_edges.py - indicator-matrix edge aggregation."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from src.graph.cluster_edges import (
+    cluster_connectivity,
+    community_edge_factors,
+    labels_from_members,
+)
+
+
+@pytest.fixture
+def graph():
+    adjacency = sp.random(60, 60, density=0.08, format="csr", random_state=11)
+    labels = np.random.default_rng(5).integers(-1, 4, size=60)
+    return adjacency, labels
+
+
+def _loop_counts(adjacency, labels, k, upper=False):
+    counts = np.zeros((k, k))
+    coo = adjacency.tocoo()
+    for i, j in zip(coo.row, coo.col):
+        if labels[i] < 0 or labels[j] < 0 or (upper and i >= j):
+            continue
+        counts[labels[i], labels[j]] += 1
+    return counts
+
+
+@pytest.mark.parametrize("upper", [False, True])
+def test_counts_match_per_edge_loop(graph, upper):
+    adjacency, labels = graph
+    result = cluster_connectivity(adjacency, labels, 4, upper=upper)
+
+    expected = _loop_counts(adjacency, labels, 4, upper=upper)
+    np.testing.assert_array_equal(result.counts.toarray(), expected)
+    assert result.intra_edges == int(np.trace(expected))
+    assert result.inter_edges == int(expected.sum() - np.trace(expected))
+    np.testing.assert_array_equal(result.sizes, np.bincount(labels[labels >= 0], minlength=4))
+
+
+def test_dense_adjacency_matches_sparse(graph):
+    adjacency, labels = graph
+    dense = cluster_connectivity(adjacency.toarray(), labels, 4)
+    assert (dense.counts != cluster_connectivity(adjacency, labels, 4).counts).nnz == 0
+
+
+def test_densities():
+    # Cluster 0 = {0, 1, 2} fully connected one way, cluster 1 = {3}
+    adjacency = sp.csr_matrix(np.array([
+        [0, 1, 1, 1],
+        [0, 0, 1, 0],
+        [0, 0, 0, 0],
+        [0, 0, 0, 0],
+    ]))
+    result = cluster_connectivity(adjacency, np.array([0, 0, 0, 1]))
+
+    np.testing.assert_allclose(result.intra_density(), [3 / 6, 0.0])
+    assert result.inter_density()[0, 1] == pytest.approx(1 / 3)
+    assert result.separation == pytest.approx(3 / 4)
+
+
+def test_fused_pairs_keep_zero_weight_edges():
+    adjacency = sp.csr_matrix(np.array([[0, 1], [0, 0]]))
+    factors = community_edge_factors(adjacency, np.array([0, 1]), 1.0)
+    result = cluster_connectivity(adjacency, np.array([0, 1]), edge_weights=factors)
+
+    rows, cols, weights, counts = result.undirected_pairs()
+    assert (rows.tolist(), cols.tolist()) == ([0], [1])
+    assert weights.tolist() == [0.0]
+    assert counts.tolist() == [1.0]
+
+
+def test_labels_from_members_last_cluster_wins():
+    labels = labels_from_members([["a", "b"], ["b", "zz"]], {"a": 0, "b": 1, "c": 2}, 3)
+    assert labels.tolist() == [0, 1, -1]
+
+
+def test_label_length_mismatch_raises():
+    with pytest.raises(ValueError):
+        cluster_connectivity(sp.eye(3, format="csr"), np.array([0, 1]))
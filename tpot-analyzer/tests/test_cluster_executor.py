@@ -0,0 +1,169 @@
+"""Tests for src/api/cluster/executor.py - coalescing, cancellable view builds."""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import CancelledError
+
+import numpy as np
+import pytest
+from flask import Flask
+from scipy import sparse
+from scipy.cluster.hierarchy import linkage
+
+from src.api.cluster.executor import LatencyHistogram, ViewBuildExecutor, ViewQueueFull
+from src.api.cluster_routes import cluster_bp
+from src.graph.hierarchy import BuildCancelled, build_hierarchical_view
+
+TIMEOUT = 10
+
+
+@pytest.fixture
+def executor():
+    executor = ViewBuildExecutor(max_workers=1, max_queue=2)
+    yield executor
+    executor.shutdown(wait=False)
+
+
+def _blocking(started: threading.Event, release: threading.Event, result="done"):
+    def build(cancel_event):
+        started.set()
+        release.wait(TIMEOUT)
+        return result
+    return build
+
+
+def test_identical_keys_share_one_build(executor):
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def build(cancel_event):
+        calls.append(1)
+        return _blocking(started, release)(cancel_event)
+
+    first = executor.submit("k", build, client_id="a")
+    second = executor.submit("k", build, client_id="b")
+    assert first is second
+
+    release.set()
+    assert first.result(TIMEOUT) == "done"
+    assert len(calls) == 1
+    assert executor.stats()["coalesced"] == 1
+
+
+def test_newer_request_drops_queued_build(executor):
+    started, release = threading.Event(), threading.Event()
+    blocker = executor.submit("busy", _blocking(started, release), client_id="other")
+    assert started.wait(TIMEOUT)
+
+    ran = []
+    stale = executor.submit("old", lambda cancel: ran.append("old"), client_id="a")
+    fresh = executor.submit("new", lambda cancel: "new", client_id="a")
+    assert stale.cancelled()
+
+    release.set()
+    assert blocker.result(TIMEOUT) == "done"
+    assert fresh.result(TIMEOUT) == "new"
+    assert ran == []
+    stats = executor.stats()
+    assert stats["superseded"] == 1
+    assert stats["queue_depth"] == 0
+
+
+def test_newer_request_cancels_running_build(executor):
+    started, stopped = threading.Event(), threading.Event()
+
+    def build(cancel_event):
+        started.set()
+        if cancel_event.wait(TIMEOUT):
+            stopped.set()
+            raise BuildCancelled("stale")
+        return "finished"
+
+    stale = executor.submit("old", build, client_id="a")
+    assert started.wait(TIMEOUT)
+    fresh = executor.submit("new", lambda cancel: "new", client_id="a")
+
+    with pytest.raises(CancelledError):
+        stale.result(TIMEOUT)
+    assert fresh.result(TIMEOUT) == "new"
+    assert stopped.is_set()
+    assert executor.stats()["cancelled"] == 1
+
+
+def test_shared_build_survives_one_client_moving_on(executor):
+    started, release = threading.Event(), threading.Event()
+    shared = executor.submit("k", _blocking(started, release), client_id="a")
+    executor.submit("k", _blocking(started, release), client_id="b")
+    executor.submit("other", lambda cancel: None, client_id="a")
+
+    release.set()
+    assert shared.result(TIMEOUT) == "done"
+
+
+def test_queue_full_rejects(executor):
+    started, release = threading.Event(), threading.Event()
+    executor.submit("busy", _blocking(started, release))
+    assert started.wait(TIMEOUT)
+    executor.submit("q1", lambda cancel: None)
+    executor.submit("q2", lambda cancel: None)
+
+    with pytest.raises(ViewQueueFull):
+        executor.submit("q3", lambda cancel: None)
+    release.set()
+    assert executor.stats()["rejected"] == 1
+
+
+def test_failures_reach_every_waiter(executor):
+    def build(cancel_event):
+        raise KeyError("boom")
+
+    future = executor.submit("k", build)
+    with pytest.raises(KeyError):
+        future.result(TIMEOUT)
+    assert executor.stats()["failed"] == 1
+
+
+def test_anonymous_requests_leave_no_client_entries(executor):
+    for i in range(20):
+        future = executor.submit(f"k{i}", lambda cancel: "ok")
+        assert future.result(TIMEOUT) == "ok"
+        executor.release(f"k{i}", None)
+    assert executor.stats()["clients"] == 0
+
+
+def test_histogram_buckets():
+    histogram = LatencyHistogram(buckets=(10, 100, float("inf")))
+    for value in (5, 50, 500, 10):
+        histogram.observe(value)
+    data = histogram.to_dict()
+    assert [b["count"] for b in data["buckets"]] == [2, 1, 1]
+    assert data["buckets"][-1]["le"] == "inf"
+    assert data["count"] == 4
+    assert data["sum_ms"] == 565
+
+
+def test_builder_stops_when_cancelled():
+    rng = np.random.default_rng(0)
+    centroids = rng.normal(size=(8, 2))
+    cancel_event = threading.Event()
+    cancel_event.set()
+    with pytest.raises(BuildCancelled):
+        build_hierarchical_view(
+            linkage_matrix=linkage(centroids, method="ward"),
+            micro_labels=np.repeat(np.arange(8), 2),
+            micro_centroids=centroids,
+            node_ids=np.array([f"n{i}" for i in range(16)]),
+            adjacency=sparse.eye(16, format="csr"),
+            node_metadata={},
+            base_granularity=4,
+            cancel_event=cancel_event,
+        )
+
+
+def test_metrics_endpoint():
+    app = Flask(__name__)
+    app.register_blueprint(cluster_bp)
+    resp = app.test_client().get("/api/clusters/metrics")
+    assert resp.status_code == 200
+    data = resp.get_json()
+    assert {"queue_depth", "running", "queue_wait_ms", "build_ms"} <= set(data)
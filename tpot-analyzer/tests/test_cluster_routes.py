@@ -8,6 +8,7 @@ These tests verify:
 """
 from __future__ import annotations
 
+import threading
 import time
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Set
@@ -19,6 +20,7 @@ from flask import Flask
 from scipy import sparse
 from scipy.cluster.hierarchy import linkage
 
+from src.api.cluster.executor import ViewBuildExecutor
 from src.api.cluster_routes import (
     ClusterCache,
     CacheEntry,
@@ -205,17 +207,29 @@ class TestClusterCache:
         assert cache.get(("b",)) is None
         assert cache.get(("c",)) is not None
 
-    def test_inflight_tracking(self):
-        """Inflight futures can be tracked."""
-        cache = ClusterCache()
-        key = ("test",)
-        future = MagicMock()
+    def test_concurrent_misses_coalesce_in_executor(self):
+        """Concurrent builds of one cache key share the executor's future."""
+        executor = ViewBuildExecutor(max_workers=1)
+        key = _make_cache_key(25, None, set())
+        release = threading.Event()
+        calls = []
+
+        def build(cancel_event):
+            calls.append(1)
+            release.wait(5)
+            return {"clusters": []}
 
-        cache.inflight_set(key, future)
-        assert cache.inflight_get(key) is future
+        try:
+            first = executor.submit(key, build, client_id="tab-1")
+            second = executor.submit(key, build, client_id="tab-2")
+            assert first is second
 
-        cache.inflight_clear(key)
-        assert cache.inflight_get(key) is None
+            release.set()
+            assert first.result(5) == {"clusters": []}
+            assert len(calls) == 1
+            assert executor.stats()["coalesced"] == 1
+        finally:
+            executor.shutdown(wait=False)
 
 
 # =============================================================================
@@ -388,6 +402,51 @@ class TestGetClustersEndpoint:
             assert data1["positions"] == data2["positions"]
             assert data1["meta"]["budget"] == data2["meta"]["budget"]
 
+    def test_newer_request_from_same_tab_cancels_older_build(
+        self, app, mock_spectral_result, mock_adjacency, mock_node_metadata
+    ):
+        """A tab's clientId (as graph-explorer's fetchClusterView sends it) supersedes its stale build."""
+        from src.api.cluster import views
+
+        real_build = views.build_hierarchical_view
+        started = threading.Event()
+        cancelled = []
+
+        def build(**kwargs):
+            if kwargs["base_granularity"] == 5:
+                started.set()
+                cancelled.append(kwargs["cancel_event"].wait(5))
+            return real_build(**kwargs)
+
+        def frontend_get(n, req_id):
+            # Same query shape as fetchClusterView in graph-explorer/src/data.js
+            return app.test_client().get(
+                f"/api/clusters?n={n}&wl=0.00&expand_depth=0.50&reqId={req_id}&clientId=tab-1"
+            )
+
+        responses = {}
+        executor = ViewBuildExecutor(max_workers=2)
+        with patch("src.api.cluster.state._spectral_result", mock_spectral_result), \
+             patch("src.api.cluster.state._adjacency", mock_adjacency), \
+             patch("src.api.cluster.state._node_metadata", mock_node_metadata), \
+             patch("src.api.cluster.state._label_store", None), \
+             patch("src.api.cluster.state._louvain_communities", {}), \
+             patch("src.api.cluster.state._cache", ClusterCache()), \
+             patch("src.api.cluster.state._view_executor", executor), \
+             patch.object(views, "build_hierarchical_view", build):
+            older = threading.Thread(target=lambda: responses.update(old=frontend_get(5, "old")))
+            older.start()
+            assert started.wait(5)
+
+            newer = frontend_get(6, "new")
+            older.join(5)
+
+        executor.shutdown(wait=True)
+        assert newer.status_code == 200
+        assert responses["old"].status_code == 409
+        assert cancelled == [True]
+        assert executor.stats()["superseded"] == 1
+
 
 class TestGetClusterMembersEndpoint:
     """Tests for GET /api/clusters/<id>/members."""
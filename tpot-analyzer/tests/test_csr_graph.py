@@ -0,0 +1,88 @@
+"""Tests for the read-only CSRGraph serving-path graph."""
+from __future__ import annotations
+
+import networkx as nx
+import pyarrow as pa
+import pytest
+
+from src.graph.csr_graph import CSRGraph
+from src.graph.metrics import compute_personalized_pagerank
+
+
+@pytest.fixture
+def nx_graph():
+    graph = nx.DiGraph()
+    graph.add_node("a", username="alice", num_followers=10)
+    graph.add_node("b", username="bob")
+    graph.add_node("c", username="carol", num_followers=3)
+    graph.add_node("d")
+    graph.add_edges_from([("a", "b"), ("b", "a"), ("a", "c"), ("c", "d"), ("d", "b")])
+    return graph
+
+
+@pytest.fixture
+def csr_graph(nx_graph):
+    return CSRGraph.from_networkx(nx_graph)
+
+
+def test_neighbour_queries_match_networkx(nx_graph, csr_graph):
+    assert csr_graph.number_of_nodes() == nx_graph.number_of_nodes()
+    assert csr_graph.number_of_edges() == nx_graph.number_of_edges()
+    for node in nx_graph:
+        assert set(csr_graph.successors(node)) == set(nx_graph.successors(node))
+        assert set(csr_graph.predecessors(node)) == set(nx_graph.predecessors(node))
+        assert csr_graph.in_degree(node) == nx_graph.in_degree(node)
+        assert csr_graph.out_degree(node) == nx_graph.out_degree(node)
+    assert dict(csr_graph.in_degree()) == dict(nx_graph.in_degree())
+    assert set(csr_graph.edges()) == set(nx_graph.edges())
+    assert csr_graph.has_edge("a", "c") and not csr_graph.has_edge("c", "a")
+    assert not csr_graph.has_edge("a", "missing")
+
+
+def test_node_views_expose_attributes(nx_graph, csr_graph):
+    assert "a" in csr_graph and "z" not in csr_graph
+    assert "a" in csr_graph.nodes
+    assert len(csr_graph.nodes) == 4
+    assert list(csr_graph.nodes()) == list(nx_graph.nodes())
+    assert dict(csr_graph.nodes(data=True)) == dict(nx_graph.nodes(data=True))
+    assert csr_graph.nodes["b"] == {"username": "bob"}
+    with pytest.raises(nx.NetworkXError):
+        csr_graph.successors("z")
+
+
+def test_subgraph_returns_networkx_induced_subgraph(nx_graph, csr_graph):
+    sub = csr_graph.subgraph(["a", "b", "c", "z"])
+    expected = nx_graph.subgraph(["a", "b", "c"])
+
+    assert isinstance(sub, nx.DiGraph)
+    assert set(sub.edges()) == set(expected.edges())
+    assert dict(sub.nodes(data=True)) == dict(expected.nodes(data=True))
+
+
+def test_from_arrow_dedups_edges_and_adds_unknown_endpoints():
+    nodes = pa.table({"node_id": ["1", "2"], "name": ["one", "two"]})
+    edges = pa.table({
+        "source": ["1", "1", "2", None],
+        "target": ["2", "2", "3", "1"],
+        "label": ["first", "second", None, "x"],
+    })
+    graph = CSRGraph.from_arrow(
+        nodes, edges, node_attr_columns={"username": "name"}, edge_attr_columns=["label"],
+    )
+
+    assert graph.number_of_nodes() == 3
+    assert graph.number_of_edges() == 2
+    assert graph.nodes["3"] == {}
+    assert graph.get_edge_data("1", "2") == {"label": "second"}
+    assert graph.get_edge_data("2", "3") == {}
+    assert graph.get_edge_data("2", "1", default="none") == "none"
+
+
+@pytest.mark.parametrize("seeds", [[], ["a"], ["a", "d"]])
+def test_pagerank_matches_networkx(nx_graph, csr_graph, seeds):
+    expected = compute_personalized_pagerank(nx_graph, seeds=seeds, alpha=0.85)
+    actual = compute_personalized_pagerank(csr_graph, seeds=seeds, alpha=0.85)
+
+    assert actual.keys() == expected.keys()
+    for node, score in expected.items():
+        assert actual[node] == pytest.approx(score, abs=1e-6)
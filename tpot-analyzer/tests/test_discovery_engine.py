@@ -0,0 +1,72 @@
+"""Tests for batched discovery scoring (src/graph/discovery_engine.py)."""
+from __future__ import annotations
+
+import networkx as nx
+import pytest
+
+from src.graph.discovery_engine import DiscoveryEngine
+from src.graph.scoring import score_candidate
+
+
+def _reference_scores(graph, candidates, seeds, pagerank, weights, cutoff=3):
+    undirected = graph.to_undirected()
+    precomputed = {
+        seed: dict(nx.single_source_shortest_path_length(undirected, seed, cutoff=cutoff))
+        for seed in seeds
+        if seed in undirected
+    }
+    return [
+        score_candidate(graph, c, seeds, pagerank, weights, undirected, precomputed_distances=precomputed)
+        for c in candidates
+    ]
+
+
+@pytest.fixture
+def random_graph():
+    graph = nx.gnp_random_graph(120, 0.04, directed=True, seed=7)
+    graph = nx.relabel_nodes(graph, lambda i: f"n{i}")
+    for i, node in enumerate(graph.nodes):
+        if i % 3:
+            graph.nodes[node]["community"] = i % 4
+    return graph
+
+
+@pytest.mark.parametrize("seeds", [["n0"], ["n0", "n5", "n17"], ["n3", "missing"]])
+def test_batch_scores_match_per_candidate_scoring(random_graph, seeds):
+    pagerank = nx.pagerank(random_graph)
+    weights = {"neighbor_overlap": 0.5, "pagerank": 0.2, "community": 0.2, "path_distance": 0.1}
+    candidates = [n for n in random_graph.nodes if n not in seeds]
+
+    expected = _reference_scores(random_graph, candidates, seeds, pagerank, weights)
+    actual = DiscoveryEngine(random_graph, seeds, pagerank).score_candidates(candidates, weights)
+
+    for exp, act in zip(expected, actual):
+        assert act["candidate"] == exp["candidate"]
+        assert act["composite_score"] == exp["composite_score"]
+        assert act["scores"] == pytest.approx(exp["scores"])
+        assert act["details"]["distance"] == exp["details"]["distance"]
+        assert act["details"]["pagerank"] == exp["details"]["pagerank"]
+        assert act["details"]["community"] == exp["details"]["community"]
+        exp_overlap, act_overlap = exp["details"]["overlap"], act["details"]["overlap"]
+        assert act_overlap["raw_count"] == exp_overlap["raw_count"]
+        assert act_overlap["seed_details"] == exp_overlap["seed_details"]
+        assert act_overlap["normalized"] == pytest.approx(exp_overlap["normalized"])
+        assert set(act_overlap["overlapping_accounts"]) <= set(random_graph.predecessors(act["candidate"]))
+
+
+def test_multi_source_bfs_respects_cutoff_and_direction():
+    graph = nx.DiGraph([("s", "a"), ("b", "a"), ("b", "c"), ("c", "d")])
+    engine = DiscoveryEngine(graph, ["s"], {}, max_distance=2)
+    dist = dict(zip(engine.nodes, engine.distances[0].tolist()))
+
+    # Edges are traversed undirected; d is 4 hops away, beyond the cutoff.
+    assert dist == {"s": 0, "a": 1, "b": 2, "c": -1, "d": -1}
+
+
+def test_unknown_candidates_get_empty_breakdown():
+    graph = nx.DiGraph([("s", "a")])
+    [result] = DiscoveryEngine(graph, ["s"], {"a": 1.0}).score_candidates(["ghost"])
+
+    assert result["details"]["overlap"]["raw_count"] == 0
+    assert result["details"]["distance"]["min_distance"] is None
+    assert result["scores"]["pagerank"] == 0.0
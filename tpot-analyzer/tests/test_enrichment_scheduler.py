@@ -0,0 +1,290 @@
+"""Tests for src/shadow/scheduler.py - multi-session enrichment scheduling.
+
+Sessions run against ReplayWorker, which serves profiles and list captures
+from JSON files saved per username instead of driving a browser.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+import pytest
+from sqlalchemy import create_engine
+
+from src.data.shadow_store import ShadowAccount, ShadowEdge, ShadowStore
+from src.shadow.enricher import SeedAccount, ShadowEnrichmentConfig
+from src.shadow.scheduler import (
+    BatchedShadowWriter,
+    EnrichmentScheduler,
+    RateBudget,
+    SchedulerConfig,
+)
+from src.shadow.selenium_worker import (
+    CapturedUser,
+    ProfileOverview,
+    SeleniumConfig,
+    UserListCapture,
+)
+
+
+class ReplayWorker:
+    """SeleniumWorker stand-in replaying <fixture_dir>/<username>.json."""
+
+    def __init__(self, config: SeleniumConfig, fixture_dir: Path, visits: List[tuple]):
+        self.config = config
+        self._fixture_dir = fixture_dir
+        self._visits = visits
+
+    def _load(self, username: str, kind: str) -> dict:
+        self._visits.append((time.monotonic(), self.config.cookies_path.name, kind, username))
+        return json.loads((self._fixture_dir / f"{username}.json").read_text())
+
+    def _capture(self, username: str, list_type: str) -> UserListCapture:
+        data = self._load(username, list_type)
+        entries = [CapturedUser(**entry) for entry in data.get(list_type, [])]
+        return UserListCapture(
+            list_type=list_type,
+            entries=entries,
+            claimed_total=len(entries),
+            page_url=f"https://x.com/{username}/{list_type}",
+        )
+
+    def fetch_profile_overview(self, username: str):
+        data = self._load(username, "profile")
+        if data.get("error"):
+            raise RuntimeError(data["error"])
+        return ProfileOverview(**data["profile"])
+
+    def fetch_following(self, username: str) -> UserListCapture:
+        return self._capture(username, "following")
+
+    def fetch_followers(self, username: str) -> UserListCapture:
+        return self._capture(username, "followers")
+
+    def fetch_followers_you_follow(self, username: str) -> UserListCapture:
+        return self._capture(username, "followers_you_follow")
+
+    def fetch_verified_followers(self, username: str) -> UserListCapture:
+        return self._capture(username, "verified_followers")
+
+    def set_pause_callback(self, callback) -> None:
+        pass
+
+    def set_shutdown_callback(self, callback) -> None:
+        pass
+
+    def quit(self) -> None:
+        pass
+
+
+def _write_fixtures(fixture_dir: Path, n_seeds: int, broken: tuple = ()) -> List[SeedAccount]:
+    seeds = []
+    for i in range(n_seeds):
+        username = f"seed{i}"
+        following = [{"username": f"f{i}_{j}", "bio": "bio"} for j in range(3)]
+        followers = [{"username": f"r{i}_{j}", "bio": "bio"} for j in range(2)]
+        payload = {
+            "profile": {
+                "username": username,
+                "display_name": username.title(),
+                "bio": "seed bio",
+                "location": None,
+                "website": None,
+                "followers_total": len(followers),
+                "following_total": len(following),
+            },
+            "following": following,
+            "followers": followers,
+        }
+        if username in broken:
+            payload["error"] = "replayed page failed"
+        (fixture_dir / f"{username}.json").write_text(json.dumps(payload))
+        seeds.append(SeedAccount(account_id=str(1000 + i), username=username))
+    return seeds
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> ShadowStore:
+    return ShadowStore(create_engine(f"sqlite:///{tmp_path / 'shadow.db'}"))
+
+
+def _scheduler(tmp_path, store, visits, n_sessions=3, **scheduler_kwargs):
+    fixture_dir = tmp_path / "fixtures"
+    fixture_dir.mkdir(exist_ok=True)
+    config = ShadowEnrichmentConfig(
+        selenium_cookies_path=tmp_path / "unused.pkl",
+        user_pause_seconds=0.0,
+        include_followers_you_follow=False,
+    )
+    scheduler = EnrichmentScheduler(
+        store,
+        config,
+        SchedulerConfig(
+            cookie_paths=[tmp_path / f"jar{i}.pkl" for i in range(n_sessions)],
+            **scheduler_kwargs,
+        ),
+        worker_factory=lambda cfg: ReplayWorker(cfg, fixture_dir, visits),
+    )
+    return scheduler, fixture_dir
+
+
+def test_sessions_share_queue_and_persist(tmp_path, store):
+    visits: List[tuple] = []
+    scheduler, fixture_dir = _scheduler(tmp_path, store, visits, write_batch_size=40)
+    seeds = _write_fixtures(fixture_dir, 9)
+
+    summary = scheduler.run(seeds)
+
+    assert set(summary) == {s.account_id for s in seeds}
+    assert all("error" not in entry for entry in summary.values())
+    # Every seed visited exactly once, spread over the per-session cookie jars
+    profile_visits = [v for v in visits if v[2] == "profile"]
+    assert sorted(v[3] for v in profile_visits) == sorted(s.username for s in seeds)
+    assert {v[1] for v in visits} <= {"jar0.pkl", "jar1.pkl", "jar2.pkl"}
+
+    stats = scheduler.stats()
+    assert sum(s["seeds_done"] for s in stats["sessions"]) == 9
+    assert stats["flushes"] >= 2  # batch size forces intermediate flushes
+    assert len(store.fetch_edges()) == 9 * 5
+    with store._engine.connect() as conn:
+        n_metrics = conn.exec_driver_sql("SELECT COUNT(*) FROM scrape_run_metrics").scalar()
+    assert n_metrics == 9
+
+
+def test_seed_edge_summary_counts_unflushed_edges(tmp_path, store):
+    visits: List[tuple] = []
+    scheduler, fixture_dir = _scheduler(tmp_path, store, visits, n_sessions=2)
+    seeds = _write_fixtures(fixture_dir, 4)
+
+    summary = scheduler.run(seeds)
+
+    assert scheduler.stats()["flushes"] == 1  # everything stayed buffered until the end
+    for seed in seeds:
+        assert summary[seed.account_id]["edge_summary"] == {"following": 3, "followers": 2, "total": 5}
+        assert store.edge_summary_for_seed(seed.account_id) == summary[seed.account_id]["edge_summary"]
+
+
+def test_global_budget_spaces_page_visits(tmp_path, store):
+    visits: List[tuple] = []
+    scheduler, fixture_dir = _scheduler(
+        tmp_path, store, visits, n_sessions=3, global_visits_per_hour=20 * 3600,
+    )
+    seeds = _write_fixtures(fixture_dir, 3)
+
+    scheduler.run(seeds)
+
+    # Each replayed fetch logs one visit; the shared bucket allows 20/s.
+    times = sorted(v[0] for v in visits)
+    fetches = sum(s["page_visits"] for s in scheduler.stats()["sessions"])
+    assert fetches == len(times) >= 9
+    assert times[-1] - times[0] >= (fetches - 1) / 20 * 0.9
+
+
+def test_failed_seed_does_not_stop_session(tmp_path, store):
+    visits: List[tuple] = []
+    scheduler, fixture_dir = _scheduler(tmp_path, store, visits, n_sessions=2)
+    seeds = _write_fixtures(fixture_dir, 4, broken=("seed1",))
+
+    summary = scheduler.run(seeds)
+
+    assert summary["1001"]["error"] == "session_exception"
+    assert all("error" not in summary[s.account_id] for s in seeds if s.username != "seed1")
+    assert sum(s["errors"] for s in scheduler.stats()["sessions"]) == 1
+
+
+def test_stop_while_waiting_for_budget(tmp_path, store):
+    visits: List[tuple] = []
+    scheduler, fixture_dir = _scheduler(
+        tmp_path, store, visits, n_sessions=1, global_visits_per_hour=1,
+    )
+    seeds = _write_fixtures(fixture_dir, 2)
+
+    runner = threading.Thread(target=scheduler.run, args=(seeds,))
+    runner.start()
+    deadline = time.monotonic() + 5
+    while scheduler.stats()["global_budget_wait_seconds"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    scheduler.stop()
+    runner.join(timeout=5)
+
+    assert not runner.is_alive()
+    assert len(visits) == 1  # only the first token was available
+
+
+def test_rate_budget_refills_over_time():
+    now = [0.0]
+    budget = RateBudget(per_hour=3600, burst=2, clock=lambda: now[0])
+
+    assert budget._reserve() == 0.0
+    assert budget._reserve() == 0.0
+    assert budget._reserve() == pytest.approx(1.0)
+    now[0] += 0.5
+    assert budget._reserve() == pytest.approx(0.5)
+    now[0] += 0.5
+    assert budget._reserve() == 0.0
+
+
+def test_writer_flushes_before_username_merge(tmp_path):
+    fetched = datetime(2025, 1, 1)
+
+    def account(account_id, username):
+        return ShadowAccount(
+            account_id, username, None, None, None, None, None, 5, 5, "selenium", fetched,
+        )
+
+    writes = [
+        ("upsert_accounts", [account("shadow:bob", "bob"), account("1", "alice")]),
+        ("upsert_edges", [ShadowEdge("1", "shadow:bob", "outbound", "selenium", fetched)]),
+        ("upsert_accounts", [account("2", "Bob")]),
+    ]
+    sequential = ShadowStore(create_engine(f"sqlite:///{tmp_path / 'seq.db'}"))
+    batched_store = ShadowStore(create_engine(f"sqlite:///{tmp_path / 'batch.db'}"))
+    writer = BatchedShadowWriter(batched_store, batch_size=1000)
+    for method, rows in writes:
+        getattr(sequential, method)(rows)
+        getattr(writer, method)(rows)
+    assert writer.flushes == 1  # the "bob" -> "2" merge forced a flush
+    writer.flush()
+
+    def snapshot(s: ShadowStore):
+        accounts = sorted((a["account_id"], a["username"]) for a in s.fetch_accounts())
+        edges = sorted((e["source_id"], e["target_id"]) for e in s.fetch_edges())
+        return accounts, edges
+
+    assert snapshot(batched_store) == snapshot(sequential)
+    assert ("1", "2") in snapshot(batched_store)[1]
+
+
+def test_failed_flush_keeps_rows_for_next_flush(tmp_path):
+    fetched = datetime(2025, 1, 1)
+    store = ShadowStore(create_engine(f"sqlite:///{tmp_path / 'shadow.db'}"))
+    real_upsert_edges = store.upsert_edges
+    failures = [RuntimeError("database is locked")]
+
+    def flaky_upsert_edges(edges):
+        if failures:
+            raise failures.pop()
+        return real_upsert_edges(edges)
+
+    store.upsert_edges = flaky_upsert_edges
+    writer = BatchedShadowWriter(store, batch_size=1000)
+    writer.upsert_accounts([
+        ShadowAccount("1", "alice", None, None, None, None, None, 5, 5, "selenium", fetched),
+    ])
+    writer.upsert_edges([
+        ShadowEdge("1", "2", "outbound", "selenium", fetched),
+        ShadowEdge("3", "1", "inbound", "selenium", fetched),
+    ])
+
+    with pytest.raises(RuntimeError):
+        writer.flush()
+    assert writer.pending == 3
+
+    assert writer.flush() == 3
+    assert writer.pending == 0
+    assert sorted((e["source_id"], e["target_id"]) for e in store.fetch_edges()) == [("1", "2"), ("3", "1")]
+    assert [a["account_id"] for a in store.fetch_accounts()] == ["1"]
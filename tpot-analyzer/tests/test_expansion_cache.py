@@ -5,12 +5,17 @@ import scipy.sparse as sp
 import numpy as np
 
 from src.graph.hierarchy.expansion_cache import (
+    PRIORITY_SPECULATIVE,
+    PRIORITY_VISIBLE,
     ExpansionCache,
+    ExpansionDiskCache,
     CachedExpansion,
     get_expansion_cache,
     reset_expansion_cache,
     compute_and_cache_expansion,
     ExpansionPrecomputer,
+    expansion_key,
+    precompute_priority,
     trigger_precompute_for_visible_clusters,
 )
 from src.graph.hierarchy.expansion_scoring import (
@@ -455,3 +460,120 @@ class TestTriggerPrecompute:
         )
 
         assert queued == 1
+
+
+class TestExpansionDiskCache:
+    """Tests for the write-through disk layer."""
+
+    def _strategies(self):
+        return [
+            ScoredStrategy(
+                strategy_name="louvain",
+                sub_clusters=[["a", "b"], ["c"]],
+                score=StructureScoreBreakdown(total_score=0.7, reason="ok"),
+                execution_time_ms=12,
+            )
+        ]
+
+    def test_survives_restart(self, tmp_path):
+        """A fresh cache over the same directory serves earlier results."""
+        key = expansion_key(["c", "a", "b"])
+        first = ExpansionCache(disk=ExpansionDiskCache(tmp_path, "v1"))
+        first.put("d_5", 3, self._strategies(), 40, disk_key=key)
+
+        second = ExpansionCache(disk=ExpansionDiskCache(tmp_path, "v1"))
+        result = second.get("d_9", disk_key=expansion_key(["a", "b", "c"]))
+        assert result is not None
+        assert result.cluster_id == "d_9"
+        assert result.best_strategy.score.total_score == 0.7
+        assert result.best_strategy.sub_clusters == [["a", "b"], ["c"]]
+        # Promoted into memory
+        assert second.get("d_9") is result
+        assert second.get_stats()["disk_hits"] == 1
+
+    def test_disk_entries_expire_with_ttl(self, tmp_path, monkeypatch):
+        key = expansion_key(["a", "b", "c"])
+        ExpansionCache(disk=ExpansionDiskCache(tmp_path, "v1")).put(
+            "d_5", 3, self._strategies(), 40, disk_key=key,
+        )
+        written = time.time()
+
+        fresh = ExpansionCache(ttl_seconds=60, disk=ExpansionDiskCache(tmp_path, "v1"))
+        monkeypatch.setattr(time, "time", lambda: written + 30)
+        promoted = fresh.get("d_5", disk_key=key)
+        assert promoted is not None
+        assert promoted.computed_at <= written  # TTL keeps counting from the write
+
+        # Promotion does not restart the clock in memory either
+        monkeypatch.setattr(time, "time", lambda: written + 90)
+        assert fresh.get("d_5") is None
+
+        restarted = ExpansionCache(ttl_seconds=60, disk=ExpansionDiskCache(tmp_path, "v1"))
+        assert restarted.get("d_5", disk_key=key) is None
+        assert restarted.get_stats()["disk"]["expired"] == 1
+        assert not restarted.disk._path(key).exists()
+
+    def test_new_spectral_version_starts_cold(self, tmp_path):
+        key = expansion_key(["a", "b"])
+        ExpansionCache(disk=ExpansionDiskCache(tmp_path, "v1")).put("d_1", 2, [], 0, disk_key=key)
+        assert ExpansionCache(disk=ExpansionDiskCache(tmp_path, "v2")).get("d_1", disk_key=key) is None
+
+    def test_key_depends_on_adjacency_shape(self):
+        members = ["a", "b"]
+        assert expansion_key(members, sp.csr_matrix((3, 3))) != expansion_key(members, sp.csr_matrix((4, 4)))
+
+
+class TestPooledPrecompute:
+    """End-to-end precomputation through the worker pool."""
+
+    @pytest.fixture
+    def graph(self):
+        rng = np.random.RandomState(0)
+        n = 40
+        dense = (rng.random_sample((n, n)) < 0.15).astype(float)
+        adjacency = sp.csr_matrix(np.maximum(dense, dense.T))
+        node_ids = [f"n{i}" for i in range(n)]
+        return adjacency, node_ids, {nid: i for i, nid in enumerate(node_ids)}
+
+    @pytest.mark.parametrize("use_processes", [False, True])
+    def test_precomputes_into_disk_cache(self, graph, tmp_path, use_processes):
+        adjacency, node_ids, node_id_to_idx = graph
+        cache = ExpansionCache(disk=ExpansionDiskCache(tmp_path, "v1"))
+        precomputer = ExpansionPrecomputer(
+            adjacency=adjacency,
+            node_id_to_idx=node_id_to_idx,
+            cache=cache,
+            max_workers=2,
+            use_processes=use_processes,
+        )
+        members = {"c1": node_ids[:20], "c2": node_ids[20:], "c3": node_ids[::2]}
+        precomputer.start()
+        try:
+            trigger_precompute_for_visible_clusters(["c1", "c2"], members, precomputer,
+                                                    speculative_cluster_ids=["c3"])
+            assert precomputer.wait_idle(timeout=60)
+        finally:
+            precomputer.stop()
+
+        assert precomputer.get_stats()["completed"] == 3
+        restarted = ExpansionCache(disk=ExpansionDiskCache(tmp_path, "v1"))
+        for cluster_id, member_ids in members.items():
+            assert restarted.get(cluster_id, expansion_key(member_ids, adjacency)) is not None
+
+    def test_tiers_order_and_promotion(self, graph):
+        adjacency, node_ids, node_id_to_idx = graph
+        precomputer = ExpansionPrecomputer(adjacency, node_id_to_idx, cache=ExpansionCache())
+        members = {cid: node_ids[i:i + 5] for i, cid in enumerate(["v0", "v1", "p0", "s0"])}
+
+        trigger_precompute_for_visible_clusters(
+            ["v0", "v1"], members, precomputer,
+            near_pointer_cluster_ids=["p0"], speculative_cluster_ids=["s0"],
+        )
+        # s0 becomes visible: promoted ahead of the pointer tier
+        assert precomputer.enqueue("s0", members["s0"], precompute_priority(PRIORITY_VISIBLE, 2))
+        assert not precomputer.enqueue("v0", members["v0"], precompute_priority(PRIORITY_SPECULATIVE))
+        assert precomputer.get_queue_size() == 4
+
+        order = [precomputer._get_next_request().cluster_id for _ in range(4)]
+        assert order == ["v0", "v1", "s0", "p0"]
+        assert precomputer._get_next_request() is None
@@ -655,6 +655,41 @@ class TestEvaluateAllStrategies:
         assert len(ranked_no_cap) >= 1
         assert len(ranked_with_cap) >= 1
 
+    def test_concurrent_matches_serial(self, community_graph):
+        """Running strategies on worker threads must not change the ranking."""
+        from src.graph.hierarchy.expansion_strategy import evaluate_all_strategies
+
+        adjacency, node_ids, node_id_to_idx = community_graph
+
+        serial = evaluate_all_strategies(node_ids, adjacency, node_id_to_idx, max_workers=1)
+        concurrent = evaluate_all_strategies(node_ids, adjacency, node_id_to_idx, max_workers=4)
+
+        assert [(s.strategy_name, s.sub_clusters, s.score.total_score) for s in serial] == [
+            (s.strategy_name, s.sub_clusters, s.score.total_score) for s in concurrent
+        ]
+
+
+class TestLocalSubgraph:
+    """Tests for the shared per-cluster subgraph."""
+
+    def test_degrees_and_mutual_edges(self):
+        from src.graph.hierarchy.local_subgraph import LocalSubgraph
+
+        # 0<->1 mutual, 1->2, 2->2 self-loop, 3 outside the cluster
+        rows, cols = [0, 1, 1, 2, 2], [1, 0, 2, 2, 3]
+        adjacency = sp.csr_matrix((np.ones(5), (rows, cols)), shape=(4, 4))
+        node_id_to_idx = {f"n{i}": i for i in range(4)}
+        members = ["n2", "n0", "n1", "missing"]
+
+        local = LocalSubgraph(members, adjacency, node_id_to_idx)
+
+        assert local.member_values(local.out_degrees) == [0, 1, 2, 0]
+        assert local.member_values(local.in_degrees) == [1, 1, 1, 0]
+        assert local.n_mutual_edges == 1
+        n_components, _ = local.mutual_components
+        assert n_components == 2
+        assert local.upper_edges() == (["n0", "n1"], ["n1", "n2"], [1.0, 1.0])
+
 
 class TestExecuteLouvainLocal:
     """Tests for local Louvain execution."""
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 import networkx as nx
 import pandas as pd
 import pytest
+from sqlalchemy import create_engine
 
+from src.data.lazy_json import LazyJSONDict
+from src.data.shadow_store import ShadowAccount, ShadowEdge, ShadowStore
 from src.graph.builder import build_graph_from_frames
 
 
@@ -109,3 +114,49 @@ def test_filter_min_followers():
         min_followers=1,
     )
     assert "c" not in result.directed
+
+
+@pytest.mark.unit
+def test_shadow_injection_streams_store(tmp_path):
+    store = ShadowStore(create_engine(f"sqlite:///{tmp_path / 'shadow.db'}"))
+    fetched = datetime(2025, 1, 1, 12, 0, 0)
+    store.upsert_accounts([
+        ShadowAccount(
+            account_id="shadow:new",
+            username="new",
+            display_name="New",
+            bio=None,
+            location=None,
+            website=None,
+            profile_image_url=None,
+            followers_count=7,
+            following_count=None,
+            source_channel="selenium",
+            fetched_at=fetched,
+            scrape_stats={"pages": 2},
+        ),
+    ])
+    store.upsert_edges([
+        ShadowEdge("shadow:user_a", "shadow:new", "outbound", "selenium", fetched, metadata={"list_type": "following"}),
+        ShadowEdge("shadow:new", "b", "outbound", "selenium", fetched),
+    ])
+
+    accounts, profiles, followers, following = make_frames()
+    result = build_graph_from_frames(
+        accounts=accounts,
+        profiles=profiles,
+        followers=followers,
+        following=following,
+        mutual_only=False,
+        include_shadow=True,
+        shadow_store=store,
+    )
+    graph = result.directed
+    assert graph.nodes["shadow:new"]["num_followers"] == 7
+    assert graph.nodes["shadow:new"]["shadow_scrape_stats"] == {"pages": 2}
+    # shadow:user_a is remapped onto the archive node "a"
+    metadata = graph.edges["a", "shadow:new"]["metadata"]
+    assert isinstance(metadata, LazyJSONDict)
+    assert metadata["list_type"] == "following"
+    assert graph.edges["shadow:new", "b"]["metadata"] is None
+    assert graph.edges["shadow:new", "b"]["fetched_at"] == fetched
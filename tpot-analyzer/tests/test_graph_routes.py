@@ -1,6 +1,7 @@
 """Tests for graph API routes (/api/graph-data, /api/graph/settings)."""
 from __future__ import annotations
 
+import gzip
 import json
 from dataclasses import dataclass
 from typing import Optional
@@ -10,8 +11,10 @@ import networkx as nx
 import pytest
 from flask import Flask
 
+from src.api.graph_payload import EncodedPayload
 from src.api.routes.graph import graph_bp
 from src.api.services.cache_manager import CacheManager
+from src.graph.csr_graph import CSRGraph
 
 
 # ---------------------------------------------------------------------------
@@ -68,6 +71,13 @@ def graph_app_no_propagate() -> Flask:
     return app
 
 
+@pytest.fixture(autouse=True)
+def no_snapshot():
+    """Default to the cache.db rebuild path; snapshot tests patch this explicitly."""
+    with patch("src.api.routes.graph._load_snapshot_graph", return_value=None) as mock_load:
+        yield mock_load
+
+
 @pytest.fixture
 def client(graph_app: Flask):
     return graph_app.test_client()
@@ -271,6 +281,75 @@ class TestGraphDataCaching:
         assert mock_build.call_count == 2
 
 
+# ---------------------------------------------------------------------------
+# GET /api/graph-data -- served from the in-memory snapshot
+# ---------------------------------------------------------------------------
+
+def _make_snapshot_graph() -> CSRGraph:
+    G = nx.DiGraph()
+    G.add_node("a", username="alice", shadow=False)
+    G.add_node("b", username="bob", shadow=False)
+    G.add_node("s", username="shadowy", shadow=True)
+    G.add_edges_from([("a", "b"), ("b", "a"), ("s", "a"), ("a", "s")])
+    return CSRGraph.from_networkx(G)
+
+
+class TestGraphDataFromSnapshot:
+    """Filtered views come from the snapshot without touching cache.db."""
+
+    @patch("src.api.routes.graph.build_graph")
+    def test_snapshot_view_skips_build_graph(self, mock_build, no_snapshot, client):
+        no_snapshot.return_value = _make_snapshot_graph()
+
+        resp = client.get("/api/graph-data?include_shadow=false")
+
+        assert resp.status_code == 200
+        mock_build.assert_not_called()
+        payload = json.loads(resp.data)
+        assert {n["id"] for n in payload["nodes"]} == {"a", "b"}
+        assert {(e["source"], e["target"]) for e in payload["edges"]} == {("a", "b"), ("b", "a")}
+        assert all(e["mutual"] for e in payload["edges"])
+
+    def test_min_followers_prunes_low_in_degree_nodes(self, no_snapshot, client):
+        no_snapshot.return_value = _make_snapshot_graph()
+
+        payload = json.loads(client.get("/api/graph-data?include_shadow=false&min_followers=2").data)
+
+        assert payload["nodes"] == []
+        assert payload["edges"] == []
+
+    def test_min_followers_only_prunes_archive_nodes(self, no_snapshot, client):
+        """Like build_graph, which prunes before injecting shadow data."""
+        no_snapshot.return_value = _make_snapshot_graph()
+
+        payload = json.loads(client.get("/api/graph-data?min_followers=2").data)
+
+        # a/b have one archive follower each and are pruned; the shadow
+        # node survives and its edges keep "a" as an endpoint.
+        assert sorted(n["id"] for n in payload["nodes"]) == ["a", "s"]
+        assert {(e["source"], e["target"]) for e in payload["edges"]} == {("s", "a"), ("a", "s")}
+
+        payload = json.loads(client.get("/api/graph-data?min_followers=1").data)
+        assert sorted(n["id"] for n in payload["nodes"]) == ["a", "b", "s"]
+
+    def test_gzip_body_served_when_accepted(self, no_snapshot, graph_app):
+        no_snapshot.return_value = _make_snapshot_graph()
+        client = graph_app.test_client()
+
+        with patch("src.api.graph_payload.MIN_COMPRESS_BYTES", 0):
+            resp = client.get("/api/graph-data", headers={"Accept-Encoding": "gzip"})
+
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in resp.headers["Vary"]
+        assert json.loads(gzip.decompress(resp.data))["meta"]["node_count"] == 3
+
+        cached = graph_app.config["CACHE_MANAGER"].get_graph_response("True_False_0")
+        assert isinstance(cached, EncodedPayload)
+        plain = client.get("/api/graph-data")
+        assert "Content-Encoding" not in plain.headers
+        assert json.loads(plain.data)["meta"]["node_count"] == 3
+
+
 # ---------------------------------------------------------------------------
 # GET /api/graph/settings
 # ---------------------------------------------------------------------------
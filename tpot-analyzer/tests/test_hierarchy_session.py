@@ -0,0 +1,116 @@
+"""Tests for src/graph/hierarchy/session.py - view state reused across builds."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scipy import sparse
+from scipy.cluster.hierarchy import linkage
+
+from src.graph.hierarchy.builder import build_hierarchical_view
+from src.graph.hierarchy.layout import compute_hierarchical_edges
+from src.graph.hierarchy.session import ViewSession, ViewSessionStore, resolve_session
+
+
+def _edge_tuples(edges):
+    return sorted((e.source_id, e.target_id, e.raw_count, round(e.connectivity, 9)) for e in edges)
+
+
+@pytest.fixture
+def setup():
+    rng = np.random.default_rng(7)
+    n_micro, n_nodes = 24, 240
+    micro_centroids = rng.normal(size=(n_micro, 3))
+    micro_labels = rng.integers(0, n_micro, size=n_nodes)
+    node_ids = np.array([f"n{i}" for i in range(n_nodes)])
+    adjacency = sparse.random(n_nodes, n_nodes, density=0.03, format="csr", random_state=3)
+    adjacency.data[:] = 1.0
+    node_metadata = {nid: {"username": nid, "num_followers": i} for i, nid in enumerate(node_ids)}
+    return {
+        "linkage_matrix": linkage(micro_centroids, method="ward"),
+        "micro_labels": micro_labels,
+        "micro_centroids": micro_centroids,
+        "node_ids": node_ids,
+        "adjacency": adjacency,
+        "node_metadata": node_metadata,
+    }
+
+
+def _session(setup, ego=None):
+    return ViewSession(
+        setup["linkage_matrix"], setup["micro_labels"], setup["micro_centroids"],
+        setup["node_ids"], setup["adjacency"], setup["node_metadata"], ego,
+    )
+
+
+class TestSessionEdges:
+
+    @pytest.mark.parametrize("louvain_weight", [0.0, 0.5])
+    def test_matches_per_edge_scan(self, setup, louvain_weight):
+        communities = {nid: i % 3 for i, nid in enumerate(setup["node_ids"])}
+        view = build_hierarchical_view(**setup, base_granularity=8, budget=40)
+        session = _session(setup)
+
+        edges = session.edges(view.clusters, communities, louvain_weight)
+        expected = compute_hierarchical_edges(
+            view.clusters, setup["micro_labels"], setup["adjacency"], setup["node_ids"],
+            communities, louvain_weight,
+        )
+        assert _edge_tuples(edges) == _edge_tuples(expected)
+
+
+class TestSessionReuse:
+
+    def test_expand_matches_fresh_build_and_reuses_state(self, setup):
+        session = _session(setup)
+        first = build_hierarchical_view(**setup, base_granularity=6, budget=40, session=session)
+        target = max(first.clusters, key=lambda c: c.size).id
+        rows_before = session.edge_rows_computed
+
+        reused = build_hierarchical_view(
+            **setup, base_granularity=6, budget=40, expanded_ids={target}, session=session,
+        )
+        fresh = build_hierarchical_view(**setup, base_granularity=6, budget=40, expanded_ids={target})
+
+        assert [c.id for c in reused.clusters] == [c.id for c in fresh.clusters]
+        assert [c.member_node_ids for c in reused.clusters] == [c.member_node_ids for c in fresh.clusters]
+        assert _edge_tuples(reused.edges) == _edge_tuples(fresh.edges)
+        stats = session.stats()
+        assert stats["aggregates_reused"] > 0
+        # Local children carry no dendrogram edges, so no rows are recomputed.
+        assert stats["edge_rows_computed"] == rows_before
+
+    def test_refined_cut_recomputes_only_new_rows(self, setup):
+        session = _session(setup)
+        coarse = build_hierarchical_view(**setup, base_granularity=6, budget=40, session=session)
+        rows_before = session.edge_rows_computed
+
+        fine = build_hierarchical_view(**setup, base_granularity=10, budget=40, session=session)
+        fresh = build_hierarchical_view(**setup, base_granularity=10, budget=40)
+
+        assert _edge_tuples(fine.edges) == _edge_tuples(fresh.edges)
+        added = {c.id for c in fine.clusters} - {c.id for c in coarse.clusters}
+        assert added
+        assert session.edge_rows_computed - rows_before == len(added)
+
+    def test_resolve_session_replaces_stale_session(self, setup):
+        session = _session(setup)
+        assert resolve_session(session, *_args(setup)) is session
+
+        other = dict(setup, adjacency=setup["adjacency"].copy())
+        assert resolve_session(session, *_args(other)) is not session
+
+
+def _args(setup, ego=None):
+    return (
+        setup["linkage_matrix"], setup["micro_labels"], setup["micro_centroids"],
+        setup["node_ids"], setup["adjacency"], setup["node_metadata"], ego,
+    )
+
+
+def test_store_evicts_least_recent(setup):
+    store = ViewSessionStore(max_sessions=2)
+    for key in ("a", "b", "c"):
+        store.put(key, _session(setup))
+    assert store.get("a") is None
+    assert store.get("c") is not None
+    assert len(store) == 2
@@ -9,9 +9,11 @@ import numpy as np
 import pytest
 
 from src.graph.hierarchy.traversal import (
+    DendrogramIndex,
     find_cluster_leaders,
     get_children,
     get_dendrogram_id,
+    get_dendrogram_index,
     get_node_idx,
     get_parent,
     get_siblings,
@@ -356,3 +358,52 @@ class TestFindClusterLeaders:
         leaders = find_cluster_leaders(asymmetric_linkage, labels, n_leaves)
         assert leaders[1] == 6  # Contains 0,1,2
         assert leaders[2] == 7  # Contains 3,4
+
+
+class TestDendrogramIndex:
+    """DendrogramIndex agrees with a direct walk of the linkage matrix."""
+
+    @pytest.fixture
+    def random_linkage(self) -> np.ndarray:
+        from scipy.cluster.hierarchy import linkage
+        rng = np.random.default_rng(7)
+        return linkage(rng.normal(size=(40, 3)), method="ward")
+
+    def test_leaf_ranges_match_scipy_pre_order(self, random_linkage):
+        from scipy.cluster.hierarchy import to_tree
+        index = DendrogramIndex(random_linkage)
+        _, nodes = to_tree(random_linkage, rd=True)
+        for node in nodes:
+            assert index.leaves(node.id).tolist() == node.pre_order()
+            start, end = index.leaf_range(node.id)
+            assert end - start == index.subtree_size(node.id) == node.count
+
+    def test_parent_sibling_and_descendant(self, random_linkage):
+        n_leaves = len(random_linkage) + 1
+        index = DendrogramIndex(random_linkage)
+        parents = {}
+        for i, (left, right, _, _) in enumerate(random_linkage):
+            parents[int(left)] = parents[int(right)] = n_leaves + i
+        root = 2 * n_leaves - 2
+        assert index.parent_of(root) is None
+        assert index.sibling_of(root) is None
+        for node, parent in parents.items():
+            assert index.parent_of(node) == parent
+            left, right = index.children(parent)
+            assert index.sibling_of(node) == (right if node == left else left)
+
+        leaves_of = {node: set(index.leaves(node).tolist()) for node in range(root + 1)}
+        for node in range(root + 1):
+            for ancestor in range(root + 1):
+                expected = leaves_of[node] <= leaves_of[ancestor]
+                assert index.is_descendant(node, ancestor) == expected
+
+    def test_rejects_mismatched_leaf_count(self, simple_linkage):
+        with pytest.raises(ValueError):
+            DendrogramIndex(simple_linkage, n_leaves=5)
+        assert get_dendrogram_index(simple_linkage, 5) is None
+
+    def test_index_is_cached_per_linkage_array(self, simple_linkage):
+        index = get_dendrogram_index(simple_linkage, 4)
+        assert get_dendrogram_index(simple_linkage, 4) is index
+        assert get_dendrogram_index(simple_linkage.copy(), 4) is not index
@@ -22,6 +22,7 @@ def _build_args(tmp_path, *, center):
         headless=True,
         chrome_binary=None,
         max_scrolls=1,
+        bulk_dom_extraction=False,
         delay_min=0.0,
         delay_max=0.0,
         retry_attempts=1,
@@ -41,6 +42,9 @@ def _build_args(tmp_path, *, center):
         acquisition_k=None,
         mmr_lambda=0.7,
         acquisition_run_id=None,
+        session_cookies=[],
+        session_visits_per_hour=None,
+        global_visits_per_hour=None,
     )
 
 
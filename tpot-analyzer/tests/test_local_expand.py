@@ -7,6 +7,10 @@ from src.graph.hierarchy.local_expand import (
     expand_cluster_locally,
     should_use_local_expansion,
     LARGE_CLUSTER_FRACTION,
+    LocalExpansionResult,
+    LocalExpansionStore,
+    configure_local_expansion_store,
+    get_local_expansion_stats,
     _local_expansion_cache,
     _cache_timestamps,
 )
@@ -261,3 +265,73 @@ class TestExpandClusterLocally:
         assert len(_local_expansion_cache) == 2
         # Results should differ
         assert result_low.resolution_used != result_high.resolution_used
+
+
+class TestLocalExpansionStore:
+    """Tests for the persistent SQLite tier."""
+
+    @pytest.fixture
+    def graph(self):
+        rng = np.random.RandomState(3)
+        n = 60
+        dense = (rng.random_sample((n, n)) < 0.2).astype(float)
+        adjacency = sp.csr_matrix(np.triu(dense, 1) + np.triu(dense, 1).T)
+        node_ids = [f"node_{i}" for i in range(n)]
+        return adjacency, node_ids, {nid: i for i, nid in enumerate(node_ids)}
+
+    @pytest.fixture(autouse=True)
+    def detach_store(self):
+        yield
+        configure_local_expansion_store(None)
+
+    def test_result_survives_restart(self, graph, tmp_path, monkeypatch):
+        adjacency, node_ids, node_id_to_idx = graph
+        configure_local_expansion_store(tmp_path / "local.db", "v1")
+        first = expand_cluster_locally(node_ids, adjacency, node_id_to_idx)
+        assert first.success
+
+        # A restart drops the in-process tier; the store must answer.
+        configure_local_expansion_store(tmp_path / "local.db", "v1")
+        monkeypatch.setattr(
+            "src.graph.hierarchy.local_expand.louvain_communities",
+            lambda *a, **k: pytest.fail("recomputed after restart"),
+        )
+        second = expand_cluster_locally(node_ids, adjacency, node_id_to_idx)
+
+        assert second.sub_clusters == first.sub_clusters
+        stats = get_local_expansion_stats()["store"]
+        assert stats["hits"] == 1
+        assert stats["entries"] == 1
+
+    def test_graph_version_change_is_a_miss(self, graph, tmp_path):
+        adjacency, node_ids, node_id_to_idx = graph
+        configure_local_expansion_store(tmp_path / "local.db", "v1")
+        expand_cluster_locally(node_ids, adjacency, node_id_to_idx)
+
+        store = configure_local_expansion_store(tmp_path / "local.db", "v2")
+        expand_cluster_locally(node_ids, adjacency, node_id_to_idx)
+
+        assert store.get_stats()["misses"] == 1
+        assert store.get_stats()["entries"] == 2
+
+    def test_evicts_least_recently_used_by_size(self, tmp_path):
+        result = LocalExpansionResult(
+            success=True, reason="OK", sub_clusters=[["a"] * 50],
+            resolution_used=1.0, n_communities=1, compute_time_ms=1,
+        )
+        store = LocalExpansionStore(tmp_path / "local.db", "v1", max_bytes=1000)
+        store.put("first", 1.0, result)
+        store.put("second", 1.0, result)
+        assert store.get("first", 1.0) is not None  # refresh "first"
+        store.put("third", 1.0, result)
+
+        assert store.get("second", 1.0) is None
+        assert store.get("first", 1.0) is not None
+        assert store.get("third", 1.0) is not None
+        stats = store.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["bytes"] <= 1000
+
+    def test_rejects_non_positive_budget(self, tmp_path):
+        with pytest.raises(ValueError):
+            LocalExpansionStore(tmp_path / "local.db", "v1", max_bytes=0)
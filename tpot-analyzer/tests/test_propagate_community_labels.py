@@ -21,6 +21,7 @@ from src.propagation import (
     PropagationResult,
     multiclass_entropy,
 )
+from src.propagation.bootstrap import BootstrapStats, SharedCSR, attach_csr
 
 
 # ---------------------------------------------------------------------------
@@ -657,3 +658,217 @@ class TestIndependentMode:
             assert snc_8.sum() == 0, (
                 f"Node 8 has no direct seed neighbors, should have 0 counts, got {snc_8.sum()}"
             )
+
+
+# ---------------------------------------------------------------------------
+# TestBlockPPR: batched multi-class solver
+# ---------------------------------------------------------------------------
+
+class TestBlockPPR:
+    """compute_ppr_block must match per-column compute_ppr."""
+
+    def test_matches_per_column_solver(self):
+        from src.propagation.engine import compute_ppr, compute_ppr_block
+
+        adj, _ = _build_toy_graph()
+        n = adj.shape[0]
+        teleport = np.zeros((n, 3), dtype=np.float64)
+        teleport[[0, 1], 0] = 1.0
+        teleport[[2, 3], 1] = 0.5
+        teleport[[4, 5, 7], 2] = [1.0, 2.0, 0.5]
+
+        block, iters, converged = compute_ppr_block(adj, teleport, alpha=0.15)
+
+        for c in range(3):
+            ppr_c, iters_c, conv_c = compute_ppr(adj, teleport_vector=teleport[:, c], alpha=0.15)
+            np.testing.assert_allclose(block[:, c], ppr_c, atol=1e-12)
+            assert iters[c] == iters_c
+            assert converged[c] == conv_c
+
+    def test_empty_column_is_zero_and_frozen(self):
+        from src.propagation.engine import compute_ppr_block
+
+        adj, _ = _build_toy_graph()
+        teleport = np.zeros((adj.shape[0], 2), dtype=np.float64)
+        teleport[0, 0] = 1.0
+
+        block, iters, converged = compute_ppr_block(adj, teleport)
+
+        assert np.all(block[:, 1] == 0.0)
+        assert iters[1] == 0
+        assert converged[1]
+        assert block[:, 0].sum() == pytest.approx(1.0, abs=1e-6)
+
+    def test_rejects_mismatched_shape(self):
+        from src.propagation.engine import compute_ppr_block
+
+        adj, _ = _build_toy_graph()
+        with pytest.raises(ValueError):
+            compute_ppr_block(adj, np.ones((adj.shape[0] + 1, 2)))
+
+
+# ---------------------------------------------------------------------------
+# Bootstrap: streaming stats + process pool
+# ---------------------------------------------------------------------------
+
+class TestBootstrapStats:
+    """Streaming mean/std/percentiles must match the stacked numpy reference."""
+
+    @pytest.mark.parametrize("n_samples", [1, 2, 5, 41, 50])
+    def test_matches_numpy_reference(self, n_samples):
+        rng = np.random.default_rng(n_samples)
+        samples = rng.gamma(2.0, size=(n_samples, 7, 3))
+
+        stats = BootstrapStats((7, 3), n_samples)
+        for s in samples:
+            stats.add(s)
+
+        np.testing.assert_allclose(stats.mean, samples.mean(axis=0), atol=1e-12)
+        np.testing.assert_allclose(stats.std, samples.std(axis=0), atol=1e-12)
+        np.testing.assert_allclose(stats.percentile(2.5), np.percentile(samples, 2.5, axis=0), atol=1e-12)
+        np.testing.assert_allclose(stats.percentile(97.5), np.percentile(samples, 97.5, axis=0), atol=1e-12)
+
+    def test_sketch_depth_is_bounded(self):
+        stats = BootstrapStats((4, 2), 50)
+        for _ in range(50):
+            stats.add(np.random.rand(4, 2))
+        # Only a handful of order statistics kept per tail, not all 50
+        assert stats._low.shape[-1] <= 4
+        assert stats._high.shape[-1] <= 4
+
+    def test_percentile_requires_all_samples(self):
+        stats = BootstrapStats((2, 2), 3)
+        stats.add(np.zeros((2, 2)))
+        with pytest.raises(RuntimeError):
+            stats.percentile(2.5)
+
+    def test_rejects_wrong_shape(self):
+        stats = BootstrapStats((2, 2), 3)
+        with pytest.raises(ValueError):
+            stats.add(np.zeros((3, 2)))
+
+
+class TestParallelBootstrap:
+    """Process-pool bootstrap must agree with the serial runner."""
+
+    def test_shared_csr_roundtrip(self):
+        adj, _ = _build_toy_graph()
+        with SharedCSR(adj) as shared:
+            attached, handles = attach_csr(shared.spec)
+            assert (attached != adj).nnz == 0
+            assert attached.shape == adj.shape
+            del attached
+            for h in handles:
+                h.close()
+
+    def test_parallel_bootstrap_matches_serial(self, tmp_path):
+        adj, node_ids = _build_toy_graph()
+        db_path = tmp_path / "test.db"
+        _build_community_db(db_path, community_sizes={
+            "comm-a": ["node-0", "node-1", "node-6"],
+            "comm-b": ["node-2", "node-3"],
+            "comm-c": ["node-4", "node-5", "node-7"],
+        })
+        config = PropagationConfig(mode="independent")
+
+        from src.propagation import propagate
+
+        serial, _ = propagate(adj, node_ids, config, db_path=db_path, n_bootstrap=3)
+        parallel, _ = propagate(adj, node_ids, config, db_path=db_path, n_bootstrap=3, n_workers=2)
+
+        np.testing.assert_allclose(parallel.memberships, serial.memberships, atol=1e-9)
+        np.testing.assert_allclose(parallel.confidence_intervals, serial.confidence_intervals, atol=1e-9)
+        np.testing.assert_allclose(parallel.stability, serial.stability, atol=1e-9)
+
+
+# ---------------------------------------------------------------------------
+# Warm start + local push
+# ---------------------------------------------------------------------------
+
+class TestWarmStart:
+    """Re-propagation from a saved PPR state must match a cold solve."""
+
+    @pytest.fixture(autouse=True)
+    def setup_graph(self, tmp_path):
+        self.adj, self.node_ids = _build_toy_graph()
+        self.tmp_path = tmp_path
+        self.config = PropagationConfig(mode="independent")
+
+    def _propagate(self, db_path, warm_state=None):
+        from src.propagation import propagate
+
+        result, _ = propagate(self.adj, self.node_ids, self.config, db_path=db_path, warm_state=warm_state)
+        return result
+
+    def test_seed_edit_matches_cold_solve(self):
+        before_db = self.tmp_path / "before.db"
+        after_db = self.tmp_path / "after.db"
+        _build_community_db(before_db)
+        _build_community_db(after_db, community_sizes={
+            "comm-a": ["node-0", "node-1", "node-6"],  # one seed added
+            "comm-b": ["node-2"],                      # one seed removed
+            "comm-c": ["node-4", "node-5"],
+        })
+
+        previous = self._propagate(before_db)
+        cold = self._propagate(after_db)
+        warm = self._propagate(after_db, warm_state=previous.warm_state)
+
+        np.testing.assert_allclose(warm.memberships, cold.memberships, rtol=1e-4, atol=1e-4)
+        assert all(warm.converged)
+        assert sum(warm.cg_iterations) < sum(cold.cg_iterations)
+
+    def test_unchanged_seeds_converge_immediately(self):
+        db_path = self.tmp_path / "same.db"
+        _build_community_db(db_path)
+
+        previous = self._propagate(db_path)
+        warm = self._propagate(db_path, warm_state=previous.warm_state)
+
+        assert max(warm.cg_iterations) <= 1
+        np.testing.assert_allclose(warm.memberships, previous.memberships, rtol=1e-5, atol=1e-5)
+
+    def test_alpha_change_falls_back_to_cold_start(self):
+        from src.propagation.incremental import align_warm_state
+
+        db_path = self.tmp_path / "alpha.db"
+        _build_community_db(db_path)
+        state = self._propagate(db_path).warm_state
+
+        teleport = np.zeros((len(self.node_ids), len(state.class_ids)))
+        assert align_warm_state(state, self.node_ids, state.class_ids, teleport, alpha=0.5) == (None, None)
+
+    def test_local_push_reduces_residual(self):
+        from src.propagation.engine import build_transition_matrix, compute_ppr_block
+        from src.propagation.incremental import local_push_block
+
+        transition = build_transition_matrix(self.adj)
+        n = self.adj.shape[0]
+        before = np.zeros((n, 1))
+        before[[0, 1], 0] = 0.5
+        after = np.zeros((n, 1))
+        after[[0, 1, 6], 0] = 1 / 3
+
+        x_before, _, _ = compute_ppr_block(self.adj, before, transition=transition)
+        x_after, _, _ = compute_ppr_block(self.adj, after, transition=transition)
+        pushed, residual, rounds = local_push_block(transition, after, x_before)
+
+        assert rounds > 0
+        assert np.abs(residual).sum() < 1e-6
+        np.testing.assert_allclose(pushed, x_after, atol=1e-5)
+
+    def test_warm_state_roundtrip(self):
+        from src.propagation.io import load_warm_state, save_warm_state
+
+        db_path = self.tmp_path / "io.db"
+        _build_community_db(db_path)
+        state = self._propagate(db_path).warm_state
+
+        save_warm_state(state, self.tmp_path)
+        loaded = load_warm_state(self.tmp_path)
+
+        assert loaded.class_ids == state.class_ids
+        assert loaded.alpha == pytest.approx(state.alpha)
+        np.testing.assert_array_equal(loaded.node_ids, state.node_ids)
+        np.testing.assert_array_equal(loaded.ppr, state.ppr)
+        assert load_warm_state(self.tmp_path / "missing") is None
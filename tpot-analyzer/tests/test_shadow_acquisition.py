@@ -13,13 +13,16 @@ import numpy as np
 import pytest
 
 from src.shadow.acquisition import (
+    _ANN_EPS,
     AcquisitionWeights,
     CandidateSignals,
     _boundary_signal,
     _compute_novelty,
     _fetch_entropy_boundary,
+    _mmr_order,
     _multiclass_entropy,
     _mmr_select,
+    _novelty_scores,
     score_candidates,
 )
 from src.shadow.enricher import SeedAccount
@@ -271,3 +274,85 @@ def test_score_candidates_returns_ordered():
     assert ids[0] == "uncertain", (
         f"Expected 'uncertain' to rank first, got {ids}"
     )
+
+
+# ---------------------------------------------------------------------------
+# Test 9: matrix MMR — identical picks to the per-candidate reference loop
+# ---------------------------------------------------------------------------
+
+def _reference_mmr(relevance, vectors, top_k, lambda_mmr):
+    remaining = list(range(len(relevance)))
+    selected: List[int] = []
+    for _ in range(top_k):
+        best, best_val = None, float("-inf")
+        for i in remaining:
+            redundancy = max((float(vectors[i] @ vectors[j]) for j in selected), default=0.0)
+            val = lambda_mmr * relevance[i] - (1.0 - lambda_mmr) * redundancy
+            if val > best_val:
+                best, best_val = i, val
+        selected.append(best)
+        remaining.remove(best)
+    return selected
+
+
+@pytest.mark.parametrize("top_k", [40, 300])
+def test_mmr_order_matches_reference(top_k):
+    rng = np.random.default_rng(3)
+    vectors = np.abs(rng.normal(size=(300, 4)))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    relevance = rng.random(300)
+
+    picks = _mmr_order(relevance, vectors, top_k, lambda_mmr=0.6)
+    assert picks.tolist() == _reference_mmr(relevance, vectors, top_k, 0.6)
+
+
+def test_mmr_select_appends_unpicked_in_input_order():
+    seeds = [_seed(aid) for aid in "ABCD"]
+    vectors = {aid: np.array([1.0, 0.0]) for aid in "ABCD"}
+    result = _mmr_select(seeds, {"D": 1.0}, vectors, top_k=1, lambda_mmr=0.7, k=2)
+    assert [s.account_id for s in result] == ["D", "A", "B", "C"]
+
+
+# ---------------------------------------------------------------------------
+# Test 10: approximate (KD-tree) novelty stays within its distance bound
+# ---------------------------------------------------------------------------
+
+def test_approximate_novelty_within_bound():
+    rng = np.random.default_rng(7)
+    candidates = np.abs(rng.normal(size=(400, 5)))
+    candidates /= np.linalg.norm(candidates, axis=1, keepdims=True)
+    candidates[:3] = 0.0  # no community data
+    scraped = np.abs(rng.normal(size=(250, 5)))
+    scraped /= np.linalg.norm(scraped, axis=1, keepdims=True)
+
+    exact = _novelty_scores(candidates, scraped, approximate=False)
+    approx = _novelty_scores(candidates, scraped, approximate=True)
+
+    assert np.all(exact[:3] == 1.0) and np.all(approx[:3] == 1.0)
+    assert np.all(approx >= exact - 1e-9)
+    assert np.all(approx <= (1 + _ANN_EPS) ** 2 * exact + 1e-9)
+
+
+# ---------------------------------------------------------------------------
+# Test 11: score_candidates ranks a frontier larger than one SQL chunk
+# ---------------------------------------------------------------------------
+
+def test_score_candidates_large_frontier():
+    rng = np.random.default_rng(11)
+    n, k = 2500, 3
+    memberships = [
+        (f"a{i}", c, float(w))
+        for i in range(n)
+        for c, w in enumerate(rng.random(k))
+    ]
+    conn = _community_db(memberships=memberships, k=k)
+    store = _shadow_store_mock(
+        followers={f"a{i}": int(rng.integers(10, 5000)) for i in range(n)},
+        scrape_times={f"a{i}": 120.0 for i in range(0, n, 5)},
+    )
+
+    seeds = [_seed(f"a{i}") for i in range(n)]
+    result = score_candidates(seeds, store, conn, run_id="run1", top_k=100)
+
+    assert len(result) == n
+    assert len({s.account_id for s in result}) == n
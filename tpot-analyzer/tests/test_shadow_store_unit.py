@@ -5,6 +5,7 @@ import json
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import List
 from unittest.mock import Mock, patch
 
 import pytest
@@ -882,3 +883,205 @@ class TestDiscoveryOperations:
         discoveries = shadow_store.fetch_discoveries(seed_account_id="shadow:seed1")
         assert len(discoveries) == 1
         assert discoveries[0]["seed_account_id"] == "shadow:seed1"
+
+
+# ==============================================================================
+# Bulk Account Upsert (archive canonical IDs + duplicate merges)
+# ==============================================================================
+def _seed_store(db_path: Path) -> ShadowStore:
+    engine = create_engine(f"sqlite:///{db_path}")
+    store = ShadowStore(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE account (account_id TEXT PRIMARY KEY, username TEXT, "
+            "account_display_name TEXT, num_followers INTEGER, num_following INTEGER)"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO account VALUES ('100', 'ArchiveUser', 'Archive Name', 5000, 10), "
+            "('200', 'other', NULL, 1, 1)"
+        )
+    fetched = datetime(2025, 1, 1)
+    store.upsert_accounts([
+        ShadowAccount(account_id="shadow:dupe", username="dupe", display_name=None, bio="old bio",
+                      location=None, website=None, profile_image_url=None, followers_count=900,
+                      following_count=None, source_channel="selenium", fetched_at=fetched),
+        ShadowAccount(account_id="shadow:chain", username="chain", display_name="Chain", bio=None,
+                      location=None, website=None, profile_image_url=None, followers_count=None,
+                      following_count=None, source_channel="selenium", fetched_at=fetched),
+    ])
+    store.upsert_edges([
+        ShadowEdge(source_id="shadow:dupe", target_id="x", direction="outbound",
+                   source_channel="selenium", fetched_at=fetched),
+        ShadowEdge(source_id="y", target_id="shadow:chain", direction="inbound",
+                   source_channel="selenium", fetched_at=fetched),
+    ])
+    store.upsert_discoveries([
+        ShadowDiscovery(shadow_account_id="shadow:dupe", seed_account_id="seed",
+                        discovered_at=fetched, discovery_method="following"),
+    ])
+    return store
+
+
+def _batch() -> List[ShadowAccount]:
+    fetched = datetime(2025, 2, 1)
+    return [
+        ShadowAccount(account_id="555", username="Dupe", display_name="Dupe", bio=None, location=None,
+                      website=None, profile_image_url=None, followers_count=10, following_count=3,
+                      source_channel="selenium", fetched_at=fetched),
+        ShadowAccount(account_id="shadow:archiveuser", username="archiveuser", display_name=None,
+                      bio=None, location=None, website=None, profile_image_url=None,
+                      followers_count=12, following_count=None, source_channel="selenium",
+                      fetched_at=fetched),
+        ShadowAccount(account_id="777", username="chain", display_name=None, bio=None, location=None,
+                      website=None, profile_image_url=None, followers_count=None, following_count=None,
+                      source_channel="selenium", fetched_at=fetched),
+        ShadowAccount(account_id="shadow:plain", username=None, display_name=None, bio=None,
+                      location=None, website=None, profile_image_url=None, followers_count=None,
+                      following_count=None, source_channel="selenium", fetched_at=fetched),
+    ]
+
+
+def _snapshot(store: ShadowStore):
+    accounts = sorted(
+        (a["account_id"], a["username"], a["display_name"], a["bio"], a["followers_count"], a["following_count"])
+        for a in store.fetch_accounts()
+    )
+    edges = sorted((e["source_id"], e["target_id"], e["direction"]) for e in store.fetch_edges())
+    discoveries = sorted((d["shadow_account_id"], d["seed_account_id"]) for d in store.fetch_discoveries())
+    return accounts, edges, discoveries
+
+
+class TestBulkAccountUpsert:
+    """The set-based upsert must match the per-row _prepare_account_row path."""
+
+    def test_matches_per_row_preparation(self, tmp_path: Path):
+        bulk = _seed_store(tmp_path / "bulk.db")
+        per_row = _seed_store(tmp_path / "per_row.db")
+
+        assert bulk.upsert_accounts(_batch()) == 4
+        with patch.object(
+            ShadowStore,
+            "_prepare_account_rows",
+            lambda self, conn, rows: [self._prepare_account_row(conn, row) for row in rows],
+        ):
+            per_row.upsert_accounts(_batch())
+
+        assert _snapshot(bulk) == _snapshot(per_row)
+
+    def test_archive_and_duplicate_resolution(self, tmp_path: Path):
+        store = _seed_store(tmp_path / "bulk.db")
+        store.upsert_accounts(_batch())
+        accounts, edges, discoveries = _snapshot(store)
+        by_id = {a[0]: a for a in accounts}
+
+        # Archive match by lowercased username -> canonical id + max followers
+        assert by_id["100"][2:] == ("Archive Name", None, 5000, 10)
+        # Duplicate shadow row merged into the incoming id, its edges moved along
+        assert "shadow:dupe" not in by_id
+        assert by_id["555"][3:5] == ("old bio", 900)
+        assert ("555", "x", "outbound") in edges
+        assert ("y", "777", "inbound") in edges
+        assert discoveries == [("555", "seed")]
+
+    def test_username_index_created(self, tmp_path: Path):
+        store = _seed_store(tmp_path / "bulk.db")
+        store.upsert_accounts(_batch())
+        with store._engine.connect() as conn:
+            names = {row[0] for row in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type='index'")}
+        assert {"idx_shadow_account_username", "idx_account_username_lower"} <= names
+
+
+# ==============================================================================
+# Streaming Reader Tests
+# ==============================================================================
+def _streaming_edges() -> List[ShadowEdge]:
+    return [
+        ShadowEdge(
+            source_id=f"s{i}",
+            target_id=f"t{i % 2}",
+            direction="outbound" if i % 2 else "inbound",
+            source_channel="selenium",
+            fetched_at=datetime(2025, 1, 1 + i, 12, 0, 0),
+            weight=float(i),
+            metadata={"rank": i} if i else None,
+        )
+        for i in range(5)
+    ]
+
+
+class TestStreamingReaders:
+    """iter_*_batches and fetch_edge_index must agree with the list readers."""
+
+    def test_edge_batches_are_chunked(self, shadow_store: ShadowStore):
+        shadow_store.upsert_edges(_streaming_edges())
+
+        batches = list(shadow_store.iter_edge_batches(chunk_size=2))
+        assert [batch.num_rows for batch in batches] == [2, 2, 1]
+        rows = [row for batch in batches for row in batch.to_pylist()]
+        expected = {(e["source_id"], e["target_id"], e["direction"]) for e in shadow_store.fetch_edges()}
+        assert {(r["source_id"], r["target_id"], r["direction"]) for r in rows} == expected
+
+    def test_edge_batch_types(self, shadow_store: ShadowStore):
+        shadow_store.upsert_edges(_streaming_edges())
+
+        rows = {
+            row["source_id"]: row
+            for batch in shadow_store.iter_edge_batches(chunk_size=10)
+            for row in batch.to_pylist()
+        }
+        assert json.loads(rows["s3"]["metadata"]) == {"rank": 3}
+        assert rows["s0"]["metadata"] is None
+        assert rows["s2"]["weight"] == 2.0
+        assert rows["s2"]["fetched_at"] == datetime(2025, 1, 3, 12, 0, 0)
+
+    def test_direction_filter(self, shadow_store: ShadowStore):
+        shadow_store.upsert_edges(_streaming_edges())
+
+        batches = list(shadow_store.iter_edge_batches(direction="outbound", chunk_size=1))
+        assert sum(batch.num_rows for batch in batches) == 2
+        assert {d for batch in batches for d in batch.column("direction").to_pylist()} == {"outbound"}
+
+    def test_account_batches(self, shadow_store: ShadowStore):
+        shadow_store.upsert_accounts([
+            ShadowAccount(
+                account_id=f"a{i}",
+                username=f"user{i}",
+                display_name=None,
+                bio=None,
+                location=None,
+                website=None,
+                profile_image_url=None,
+                followers_count=i,
+                following_count=None,
+                source_channel="selenium",
+                fetched_at=datetime(2025, 1, 1, 12, 0, 0),
+            )
+            for i in range(3)
+        ])
+
+        batches = list(shadow_store.iter_account_batches(chunk_size=2))
+        assert [batch.num_rows for batch in batches] == [2, 1]
+        followers = {
+            row["account_id"]: row["followers_count"]
+            for batch in batches for row in batch.to_pylist()
+        }
+        assert followers == {"a0": 0, "a1": 1, "a2": 2}
+
+    def test_invalid_chunk_size(self, shadow_store: ShadowStore):
+        with pytest.raises(ValueError):
+            list(shadow_store.iter_edge_batches(chunk_size=0))
+
+    def test_edge_index(self, shadow_store: ShadowStore):
+        shadow_store.upsert_edges(_streaming_edges())
+
+        index = shadow_store.fetch_edge_index(
+            direction="inbound",
+            node_index={"t0": 0, "s0": 1},
+            remap={"s4": "s0"},
+            chunk_size=1,
+        )
+        # inbound edges: s0->t0, s2->t0, s4->t0 (s4 remapped onto s0)
+        assert index.node_ids == ["t0", "s0", "s2"]
+        assert index.shape == (3, 3)
+        pairs = sorted(zip(index.sources.tolist(), index.targets.tolist()))
+        assert pairs == [(1, 0), (1, 0), (2, 0)]
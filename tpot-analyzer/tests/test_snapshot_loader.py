@@ -0,0 +1,153 @@
+"""Tests for the columnar SnapshotLoader.load_graph path."""
+from __future__ import annotations
+
+import json
+import logging
+import os
+
+import pandas as pd
+import pytest
+
+from src.graph.csr_graph import CSRGraph
+from src.api.snapshot_loader import LazyJSONDict, SnapshotLoader
+from src.data.lazy_json import to_plain
+
+
+def _write_snapshot(tmp_path, nodes: pd.DataFrame, edges: pd.DataFrame) -> SnapshotLoader:
+    nodes.to_parquet(tmp_path / "graph_snapshot.nodes.parquet", index=False)
+    edges.to_parquet(tmp_path / "graph_snapshot.edges.parquet", index=False)
+    return SnapshotLoader(snapshot_dir=tmp_path)
+
+
+@pytest.fixture
+def loader(tmp_path, monkeypatch):
+    nodes = pd.DataFrame({
+        "node_id": ["1", "2", "3"],
+        "username": ["alice", "bob", None],
+        "display_name": ["Alice", None, "Carol"],
+        "num_followers": [10.0, float("nan"), 3.0],
+        "provenance": ["archive", "shadow", "archive"],
+        "shadow": [False, True, False],
+        "fetched_at": [None, "2024-01-01T00:00:00", None],
+    })
+    edges = pd.DataFrame({
+        "source": ["1", "2"],
+        "target": ["2", "3"],
+        "provenance": ["archive", "shadow"],
+        "shadow": [False, True],
+        "direction_label": ["outbound", None],
+        "fetched_at": [None, "2024-01-01T00:00:00"],
+        "metadata": [json.dumps({"list_id": "L1"}), None],
+    })
+    snapshot = _write_snapshot(tmp_path, nodes, edges)
+    monkeypatch.setattr(snapshot, "should_use_snapshot", lambda *a, **k: (True, "test"))
+    return snapshot
+
+
+@pytest.mark.parametrize("backend", ["csr", "networkx"])
+def test_load_graph_builds_nodes_with_filtered_attributes(loader, backend):
+    result = loader.load_graph(load_communities=False, backend=backend)
+    graph = result.directed
+
+    assert set(graph.nodes) == {"1", "2", "3"}
+    assert graph.nodes["1"] == {
+        "username": "alice",
+        "account_display_name": "Alice",
+        "display_name": "Alice",
+        "num_followers": 10.0,
+        "provenance": "archive",
+        "shadow": False,
+    }
+    # NaN followers and None display name are dropped rather than stored.
+    assert "num_followers" not in graph.nodes["2"]
+    assert "display_name" not in graph.nodes["2"]
+    assert graph.nodes["2"]["fetched_at"] == "2024-01-01T00:00:00"
+    assert "username" not in graph.nodes["3"]
+
+
+@pytest.mark.parametrize("backend", ["csr", "networkx"])
+def test_load_graph_builds_edges_with_lazy_metadata(loader, backend):
+    graph = loader.load_graph(load_communities=False, backend=backend).directed
+
+    assert graph.number_of_edges() == 2
+    first = graph.get_edge_data("1", "2")
+    assert first["direction_label"] == "outbound"
+    assert isinstance(first["metadata"], LazyJSONDict)
+    assert first["metadata"]["list_id"] == "L1"
+    assert "metadata" not in graph.get_edge_data("2", "3")
+    assert "direction_label" not in graph.get_edge_data("2", "3")
+
+
+@pytest.mark.parametrize("backend", ["csr", "networkx"])
+def test_load_graph_defaults_missing_optional_columns(tmp_path, monkeypatch, backend):
+    snapshot = _write_snapshot(
+        tmp_path,
+        pd.DataFrame({"node_id": ["a", "b"], "username": ["a", "b"]}),
+        pd.DataFrame({"source": ["a"], "target": ["b"]}),
+    )
+    monkeypatch.setattr(snapshot, "should_use_snapshot", lambda *a, **k: (True, "test"))
+
+    graph = snapshot.load_graph(load_communities=False, backend=backend).directed
+
+    assert graph.nodes["a"]["provenance"] == "archive"
+    assert graph.nodes["a"]["shadow"] is False
+    assert graph.get_edge_data("a", "b") == {"provenance": "archive", "shadow": False}
+
+
+def test_load_graph_is_cached_until_force_reload(loader):
+    first = loader.load_graph(load_communities=False)
+    assert loader.load_graph(load_communities=False) is first
+    assert loader.load_graph(force_reload=True, load_communities=False) is not first
+
+
+def test_clear_cache_forgets_graph_and_backend(loader):
+    loader.load_graph(load_communities=False)
+    loader.clear_cache()
+    assert loader._cached_graph is None
+    assert loader._cached_backend is None
+
+
+def test_load_graph_defaults_to_csr_backend(loader):
+    assert isinstance(loader.load_graph(load_communities=False).directed, CSRGraph)
+    with pytest.raises(ValueError):
+        loader.load_graph(backend="igraph")
+
+
+def test_lazy_json_dict_defers_parsing_and_tolerates_bad_json(caplog):
+    meta = LazyJSONDict('{"a": 1, "b": [2]}')
+    assert repr(meta) == "LazyJSONDict(unparsed)"
+    assert dict(meta) == {"a": 1, "b": [2]}
+    assert meta.to_dict() == {"a": 1, "b": [2]}
+    assert type(to_plain(meta)) is dict
+    assert to_plain(None) is None
+
+    with caplog.at_level(logging.WARNING):
+        broken = LazyJSONDict("{not json", label="x→y")
+        assert len(broken) == 0
+        assert broken.get("a") is None
+    assert "x→y" in caplog.text
+
+
+def test_snapshot_export_serializes_metadata_like_reads():
+    from scripts.refresh_graph_snapshot import _serialize_metadata
+
+    raw = '{"list_type": "following"}'
+    assert _serialize_metadata(LazyJSONDict(raw)) == raw
+    assert _serialize_metadata(LazyJSONDict("{not json")) is None
+    assert _serialize_metadata(LazyJSONDict("{}")) is None
+    assert _serialize_metadata(LazyJSONDict(" { } ")) is None
+    assert _serialize_metadata(LazyJSONDict("[1, 2]")) == '{"value": [1, 2]}'
+    assert _serialize_metadata({}) is None
+    assert _serialize_metadata({"a": 1}) == '{"a": 1}'
+
+
+def test_snapshot_version_tracks_manifest_generated_at(tmp_path):
+    snapshot = SnapshotLoader(snapshot_dir=tmp_path)
+    assert snapshot.snapshot_version() is None
+
+    snapshot.manifest_path.write_text(json.dumps({"generated_at": "2024-01-01T00:00:00"}))
+    assert snapshot.snapshot_version() == "2024-01-01T00:00:00"
+
+    snapshot.manifest_path.write_text(json.dumps({"generated_at": "2024-02-01T00:00:00"}))
+    os.utime(snapshot.manifest_path, ns=(0, snapshot.manifest_path.stat().st_mtime_ns + 1_000_000))
+    assert snapshot.snapshot_version() == "2024-02-01T00:00:00"
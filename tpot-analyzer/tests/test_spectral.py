@@ -1,10 +1,12 @@
 import numpy as np
+import pytest
 from scipy.sparse import csr_matrix
 
 from src.graph.spectral import (
     SpectralConfig,
     compute_normalized_laplacian,
     compute_spectral_embedding,
+    compute_stability,
     load_spectral_result,
     save_spectral_result,
 )
@@ -70,3 +72,75 @@ def test_save_and_load_round_trip(tmp_path):
     assert np.allclose(result.eigenvalues, loaded.eigenvalues)
     assert np.allclose(result.linkage_matrix, loaded.linkage_matrix)
     assert loaded.metadata["n_nodes"] == 2
+
+
+def _block_graph(n=120, blocks=4, seed=0):
+    rng = np.random.default_rng(seed)
+    labels = np.arange(n) % blocks
+    p = np.where(labels[:, None] == labels[None, :], 0.3, 0.02)
+    adj = np.triu(rng.random((n, n)) < p, k=1).astype(float)
+    return csr_matrix(adj + adj.T)
+
+
+@pytest.mark.parametrize("solver", ["shift_invert", "lobpcg"])
+def test_alternative_eigensolvers_match_arpack(solver):
+    adj = _block_graph()
+    node_ids = [f"n{i}" for i in range(adj.shape[0])]
+    baseline = compute_spectral_embedding(adj, node_ids, SpectralConfig(n_dims=6))
+    result = compute_spectral_embedding(adj, node_ids, SpectralConfig(n_dims=6, eigensolver=solver))
+
+    metrics = result.metadata["computation_metrics"]
+    assert metrics["eigensolver_used"] == solver
+    assert metrics["eigensolver_attempts"][0]["seconds"] >= 0
+    assert np.allclose(result.eigenvalues, baseline.eigenvalues, atol=1e-4)
+
+
+def test_warm_start_from_saved_result(tmp_path):
+    adj = _block_graph()
+    node_ids = [f"n{i}" for i in range(adj.shape[0])]
+    cfg = SpectralConfig(n_dims=6, eigensolver="lobpcg")
+    first = compute_spectral_embedding(adj, node_ids, cfg)
+    save_spectral_result(first, tmp_path / "graph_snapshot")
+    previous = load_spectral_result(tmp_path / "graph_snapshot")
+    assert previous.eigenvectors.shape == (len(node_ids), 6)
+
+    # Same graph with the node order shuffled: alignment is by id.
+    order = np.random.default_rng(1).permutation(len(node_ids))
+    shuffled = adj[order][:, order]
+    warm = compute_spectral_embedding(shuffled, [node_ids[i] for i in order], cfg, previous=previous)
+
+    metrics = warm.metadata["computation_metrics"]
+    assert metrics["eigensolver_warm_start_matched"] == len(node_ids)
+    assert warm.metadata["eigensolver_params"]["warm_start"] is True
+    assert np.allclose(warm.eigenvalues, first.eigenvalues, atol=1e-4)
+
+
+def test_unknown_eigensolver_raises():
+    with pytest.raises(ValueError):
+        compute_spectral_embedding(_block_graph(), [f"n{i}" for i in range(120)], SpectralConfig(eigensolver="magma"))
+
+
+def test_pooled_stability_matches_serial():
+    adj = _block_graph()
+    node_ids = [f"n{i}" for i in range(adj.shape[0])]
+    result = compute_spectral_embedding(adj, node_ids, SpectralConfig(n_dims=6, stability_runs=4))
+    assert result.metadata["computation_metrics"]["stability_mode"] == "direct"
+
+    serial = compute_stability(result.embedding, result.linkage_matrix, SpectralConfig(stability_runs=4))
+    pooled = compute_stability(
+        result.embedding, result.linkage_matrix, SpectralConfig(stability_runs=4, stability_workers=2),
+    )
+    assert len(serial) == 3
+    assert pooled == serial
+
+
+def test_stability_runs_on_micro_centroids_in_approximate_mode():
+    adj = _block_graph()
+    node_ids = [f"n{i}" for i in range(adj.shape[0])]
+    cfg = SpectralConfig(n_dims=6, stability_runs=3, max_linkage_nodes=50, birch_threshold=0.2)
+    result = compute_spectral_embedding(adj, node_ids, cfg)
+
+    metrics = result.metadata["computation_metrics"]
+    assert metrics["linkage_method_used"] == "birch_approximate"
+    assert metrics["stability_mode"] == "micro_centroids"
+    assert 0.0 <= metrics["stability_ari_mean"] <= 1.0
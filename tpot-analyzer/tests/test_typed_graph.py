@@ -1,4 +1,5 @@
 """Tests for TypedGraph — multi-relational graph with per-type sparse matrices."""
+import json
 import sqlite3
 
 import numpy as np
@@ -380,6 +381,74 @@ class TestFromArchive:
         assert not graph.has("mention")
         assert not graph.has("follower")
 
+    def test_chunked_load_matches_single_chunk(self, tmp_path):
+        db_path = _create_test_db(tmp_path)
+        whole = TypedGraph.from_archive(db_path)
+        chunked = TypedGraph.from_archive(db_path, chunk_rows=1)
+
+        assert chunked.node_ids == whole.node_ids
+        assert chunked.edge_summary() == whole.edge_summary()
+        for etype in whole.edge_summary():
+            assert (chunked.get(etype) != whole.get(etype)).nnz == 0
+
+    def test_unknown_ids_and_duplicates(self, tmp_path):
+        """Edges to non-follow-graph accounts are dropped; duplicate rows sum."""
+        db_path = _create_test_db(tmp_path)
+        conn = sqlite3.connect(str(db_path))
+        conn.executemany(
+            "INSERT INTO quote_graph VALUES (?, ?, ?, '')",
+            [("a", "zz", 3), ("c", "b", 1), ("c", "b", 2), ("c", "a", None)],
+        )
+        conn.commit()
+        conn.close()
+
+        graph = TypedGraph.from_archive(db_path, load_types={"follow", "quote"}, chunk_rows=2)
+        mat = graph.get("quote")
+        ci, bi, ai = graph.node_idx["c"], graph.node_idx["b"], graph.node_idx["a"]
+        assert mat.nnz == 4  # 3 original + c→b; "zz" and NULL count skipped
+        assert mat[ci, bi] == pytest.approx(0.6, abs=0.01)
+        assert mat[ci, ai] == 0
+
+    def test_null_count_keeps_other_engagement_type(self, tmp_path):
+        """A NULL like_count must not drop the row's RT edge (and vice versa)."""
+        db_path = _create_test_db(tmp_path)
+        conn = sqlite3.connect(str(db_path))
+        conn.executemany(
+            "INSERT INTO account_engagement_agg VALUES (?, ?, ?, ?)",
+            [("c", "a", None, 5), ("a", "c", 25, None), ("b", "a", None, None)],
+        )
+        conn.commit()
+        conn.close()
+
+        graph = TypedGraph.from_archive(db_path, load_types={"follow", "like", "rt"})
+        ai, bi, ci = graph.node_idx["a"], graph.node_idx["b"], graph.node_idx["c"]
+        assert graph.get("rt")[ci, ai] == pytest.approx(0.5)
+        assert graph.get("like")[ci, ai] == 0
+        assert graph.get("like")[ai, ci] == pytest.approx(0.5)
+        assert graph.get("rt")[ai, ci] == 0
+        assert graph.get("like")[bi, ai] == 0 and graph.get("rt")[bi, ai] == 0
+        assert graph.edge_summary()["like"] == 3
+        assert graph.edge_summary()["rt"] == 2
+
+    def test_integer_typed_ids_match_text_ids(self, tmp_path):
+        """IDs stored as INTEGER map onto the same string node keys."""
+        db_path = tmp_path / "ints.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("CREATE TABLE account_following (account_id TEXT, following_account_id TEXT)")
+        conn.executemany(
+            "INSERT INTO account_following VALUES (?, ?)",
+            [("10", "9"), ("9", "10"), ("10", None)],
+        )
+        conn.execute("CREATE TABLE quote_graph (source_id INTEGER, target_id INTEGER, quote_count INTEGER, created_at TEXT)")
+        conn.execute("INSERT INTO quote_graph VALUES (9, 10, 5, '')")
+        conn.commit()
+        conn.close()
+
+        graph = TypedGraph.from_archive(db_path, load_types={"follow", "quote"})
+        assert graph.node_ids == ["10", "9"]
+        assert graph.edge_summary() == {"follow": 2, "quote": 1}
+        assert graph.get("quote")[graph.node_idx["9"], graph.node_idx["10"]] == pytest.approx(1.0)
+
     def test_combine_with_new_edge_types(self, tmp_path):
         db_path = _create_test_db(tmp_path)
         graph = TypedGraph.from_archive(db_path)
@@ -393,3 +462,199 @@ class TestFromArchive:
         quote_only = graph.combine({"quote": 1.0})
         assert quote_only.nnz > 0
         assert follower_only.nnz > 0
+
+
+# ---------------------------------------------------------------------------
+# On-disk cache
+# ---------------------------------------------------------------------------
+
+class TestGraphCache:
+
+    def test_cache_hit_skips_rebuild(self, tmp_path, monkeypatch):
+        db_path = _create_test_db(tmp_path)
+        first = TypedGraph.from_archive_cached(db_path)
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("from_archive should not run on a cache hit")
+
+        monkeypatch.setattr(TypedGraph, "from_archive", classmethod(_fail))
+        second = TypedGraph.from_archive_cached(db_path)
+
+        assert second.node_ids == first.node_ids
+        assert second.edge_summary() == first.edge_summary()
+        for etype in first.edge_summary():
+            assert (second.get(etype) != first.get(etype)).nnz == 0
+
+    def test_rebuilds_when_source_table_changes(self, tmp_path):
+        db_path = _create_test_db(tmp_path)
+        before = TypedGraph.from_archive_cached(db_path)
+
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("INSERT INTO account_following VALUES ('c', 'd')")
+        conn.commit()
+        conn.close()
+
+        after = TypedGraph.from_archive_cached(db_path)
+        assert after.n == before.n + 1
+        assert after.edge_summary()["follow"] == before.edge_summary()["follow"] + 1
+
+    def test_rebuilds_when_table_rewritten_with_same_row_count(self, tmp_path):
+        db_path = _create_test_db(tmp_path)
+        before = TypedGraph.from_archive_cached(db_path)
+
+        # Same shape as the build_*_graph scripts: DELETE FROM + reinsert
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("DELETE FROM mention_graph")
+        conn.executemany(
+            "INSERT INTO mention_graph VALUES (?, ?, ?, '')",
+            [("a", "b", 50), ("a", "c", 2), ("c", "b", 2)],
+        )
+        conn.commit()
+        conn.close()
+
+        after = TypedGraph.from_archive_cached(db_path)
+        fresh = TypedGraph.from_archive(db_path)
+        assert (after.get("mention") != fresh.get("mention")).nnz == 0
+        assert (after.get("mention") != before.get("mention")).nnz > 0
+
+    def test_rebuilds_when_edge_target_updated_in_place(self, tmp_path):
+        db_path = _create_test_db(tmp_path)
+        before = TypedGraph.from_archive_cached(db_path)
+
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(
+            "UPDATE account_following SET following_account_id = 'b' "
+            "WHERE account_id = 'a' AND following_account_id = 'c'"
+        )
+        conn.commit()
+        conn.close()
+
+        after = TypedGraph.from_archive_cached(db_path)
+        fresh = TypedGraph.from_archive(db_path)
+        assert (after.get("follow") != fresh.get("follow")).nnz == 0
+        assert (after.get("follow") != before.get("follow")).nnz > 0
+
+    def test_content_checksum_sees_numeric_id_rewires(self, tmp_path):
+        from src.propagation.graph_cache import archive_content_checksum
+
+        db_path = tmp_path / "ids.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("CREATE TABLE account_following (account_id TEXT, following_account_id TEXT)")
+        base = 1_700_000_000_000_000_000
+        conn.executemany(
+            "INSERT INTO account_following VALUES (?, ?)",
+            [(str(base), str(base + 1)), (str(base + 2), str(base + 3))],
+        )
+        conn.commit()
+        fingerprints = [archive_content_checksum(db_path, {"follow"})]
+
+        # Re-point one edge to an id 5000 away (invisible to a float sum)
+        conn.execute(
+            "UPDATE account_following SET following_account_id = ? WHERE rowid = 1",
+            (str(base + 5001),),
+        )
+        conn.commit()
+        fingerprints.append(archive_content_checksum(db_path, {"follow"}))
+
+        # Swap the two targets (invisible to any unweighted sum)
+        conn.execute(
+            "UPDATE account_following SET following_account_id = "
+            "CASE rowid WHEN 1 THEN ? ELSE ? END",
+            (str(base + 3), str(base + 5001)),
+        )
+        conn.commit()
+        conn.close()
+        fingerprints.append(archive_content_checksum(db_path, {"follow"}))
+
+        assert len({json.dumps(fp) for fp in fingerprints}) == 3
+
+    def test_unchanged_file_hits_without_scanning_rows(self, tmp_path, monkeypatch):
+        import src.propagation.graph_cache as graph_cache
+
+        db_path = _create_test_db(tmp_path)
+        TypedGraph.from_archive_cached(db_path)
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("content checksum should not run for an unchanged file")
+
+        monkeypatch.setattr(graph_cache, "archive_content_checksum", _fail)
+        monkeypatch.setattr(TypedGraph, "from_archive", classmethod(_fail))
+        TypedGraph.from_archive_cached(db_path)
+
+    def test_unrelated_write_rechecks_content_once(self, tmp_path, monkeypatch):
+        import src.propagation.graph_cache as graph_cache
+
+        db_path = _create_test_db(tmp_path)
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("CREATE TABLE community (account_id TEXT, label TEXT)")
+        conn.commit()
+        conn.close()
+        TypedGraph.from_archive_cached(db_path)
+
+        # Community labels live in the same file
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("INSERT INTO community VALUES ('a', 'x')")
+        conn.commit()
+        conn.close()
+
+        calls = []
+        real_checksum = graph_cache.archive_content_checksum
+        monkeypatch.setattr(
+            graph_cache, "archive_content_checksum",
+            lambda *args: calls.append(1) or real_checksum(*args),
+        )
+        monkeypatch.setattr(
+            TypedGraph, "from_archive",
+            classmethod(lambda *a, **k: pytest.fail("rebuilt after an unrelated write")),
+        )
+        TypedGraph.from_archive_cached(db_path)
+        TypedGraph.from_archive_cached(db_path)
+        assert len(calls) == 1
+
+    def test_unrelated_table_does_not_invalidate(self, tmp_path):
+        from src.propagation.graph_cache import archive_fingerprint
+
+        db_path = _create_test_db(tmp_path)
+        before = archive_fingerprint(db_path, {"follow", "quote"})
+
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("INSERT INTO mention_graph VALUES ('a', 'b', 1, '')")
+        conn.commit()
+        conn.close()
+
+        assert archive_fingerprint(db_path, {"follow", "quote"}) == before
+
+    def test_concurrent_saves_do_not_clobber_each_other(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        import src.propagation.graph_cache as graph_cache
+
+        db_path = _create_test_db(tmp_path)
+        types = set(TypedGraph.EDGE_TYPES)
+        graph = TypedGraph.from_archive(db_path)
+        fingerprint = graph_cache.archive_fingerprint(db_path, types)
+        cache_dir = graph_cache.cache_dir_for(db_path, types)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(
+                lambda _: graph_cache.save_typed_graph(graph, cache_dir, fingerprint, db_path),
+                range(8),
+            ))
+
+        loaded = graph_cache.load_typed_graph(cache_dir, fingerprint)
+        assert loaded is not None
+        assert loaded.edge_summary() == graph.edge_summary()
+        assert [p.name for p in cache_dir.parent.iterdir()] == [cache_dir.name]
+
+    def test_version_mismatch_is_a_miss(self, tmp_path, monkeypatch):
+        import src.propagation.graph_cache as graph_cache
+
+        db_path = _create_test_db(tmp_path)
+        types = set(TypedGraph.EDGE_TYPES)
+        TypedGraph.from_archive_cached(db_path)
+        fingerprint = graph_cache.archive_fingerprint(db_path, types)
+        cache_dir = graph_cache.cache_dir_for(db_path, types)
+
+        assert graph_cache.load_typed_graph(cache_dir, fingerprint) is not None
+        monkeypatch.setattr(graph_cache, "CACHE_VERSION", graph_cache.CACHE_VERSION + 1)
+        assert graph_cache.load_typed_graph(cache_dir, fingerprint) is None
@@ -0,0 +1,100 @@
+"""Tests for src/shadow/user_cells.py - offline UserCell extraction."""
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+from src.shadow.selenium_worker import SeleniumWorker
+from src.shadow.user_cells import UserCellFields, parse_user_cells
+
+
+def _cell(handle, name, bio=None, website=None, badge=False):
+    bio_html = (
+        f'<div data-testid="UserDescription"><span>{bio}</span></div>' if bio is not None else ""
+    )
+    website_html = (
+        f'<a data-testid="UserUrl" href="{website}" rel="noopener">{website}</a>' if website else ""
+    )
+    badge_html = '<div><span>Follows you</span></div>' if badge else ""
+    return f"""
+    <div data-testid="cellInnerDiv"><button data-testid="UserCell" role="button">
+      <div><a href="/{handle}" role="link"><img alt="" src="https://pbs.twimg.com/profile_images/1/{handle}_normal.jpg"></a></div>
+      <div data-testid="UserName">
+        <a href="/{handle}" role="link"><div><span><span>{name}</span></span></div></a>
+        <a href="/{handle}" role="link"><div><span>@{handle}</span></div></a>
+        {badge_html}
+      </div>
+      <div><span>Follow</span></div>
+      {bio_html}
+      {website_html}
+    </button></div>"""
+
+
+PAGE = f"""<!DOCTYPE html><html><head><script>var x = "<div data-testid='UserCell'>";</script></head>
+<body><main><div data-testid="primaryColumn">
+<section role="region" aria-labelledby="accessible-list-1"><h1>Followers</h1><div>
+{_cell("alice", "Alice &amp; Co", bio="Building tools<br>for thought", website="https://t.co/abc")}
+{_cell("bob", "Bob", bio="")}
+{_cell("alice", "Alice again")}
+{_cell("carol", "Carol", bio="Research 🌱", badge=True)}
+</div></section></div>
+<aside><section role="region"><div>
+{_cell("sidebar_suggestion", "Who to follow")}
+</div></section></aside>
+</main></body></html>"""
+
+
+def test_parses_main_timeline_cells():
+    cells = parse_user_cells(PAGE)
+
+    assert [c.handle for c in cells] == ["alice", "bob", "carol"]  # sidebar + duplicate dropped
+    alice, bob, carol = cells
+    assert alice == UserCellFields(
+        handle="alice",
+        display_name="Alice & Co",
+        bio="Building tools\nfor thought",
+        website="https://t.co/abc",
+        profile_image_url="https://pbs.twimg.com/profile_images/1/alice_normal.jpg",
+    )
+    # Empty description falls back to the text after the handle/"Follow" lines
+    assert bob.bio is None
+    assert carol.bio == "Research 🌱"
+    assert carol.website is None
+
+
+def test_seen_handles_are_skipped():
+    cells = parse_user_cells(PAGE, seen={"alice", "carol"})
+    assert [c.handle for c in cells] == ["bob"]
+
+
+def test_text_fallbacks_without_testids():
+    html = """<section role="region"><div data-testid="UserCell">
+      <div>Dana Doe</div><div>@dana</div><div>Following</div>
+      <div>Poetry and  maps</div>
+      <a href="/dana/photo"></a><a href="https://x.com/dana"></a>
+    </div></section>"""
+
+    (cell,) = parse_user_cells(html)
+    assert cell.handle == "dana"
+    assert cell.display_name == "Dana Doe"
+    assert cell.bio == "Poetry and maps"
+    assert cell.website is None  # internal links are never a website
+
+
+def test_unclosed_markup_stays_inside_its_cell():
+    html = (
+        '<section role="region"><div data-testid="UserCell"><a href="/erin"><p>Erin</a></div>'
+        '<div data-testid="UserCell"><a href="/frank">Frank</a></div></section>'
+    )
+    assert [c.handle for c in parse_user_cells(html)] == ["erin", "frank"]
+
+
+def test_worker_bulk_mode_reads_page_source_once():
+    worker = SeleniumWorker.__new__(SeleniumWorker)
+    worker._config = Mock(bulk_dom_extraction=True)
+    worker._driver = Mock(page_source=PAGE)
+
+    cells = worker._read_user_cells("followers", 1, seen={"alice": object()})
+
+    assert [c.handle for c in cells] == ["bob", "carol"]
+    worker._driver.find_element.assert_not_called()
+    worker._driver.find_elements.assert_not_called()